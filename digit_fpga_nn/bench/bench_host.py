@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Host-side benchmark suite with stored baselines
+
+Times the hot paths of the host toolchain: IDX loading, weight quantization,
+every export writer, preprocess_mnist_style, UART protocol encode/decode and
+end-to-end host throughput against the simulated board at several baud rates.
+
+Each benchmark records milliseconds per call (best of several repeats) and,
+where it makes sense, images/second. Results are compared against
+baselines.json; a benchmark that is slower than its baseline by more than its
+threshold is reported as a regression and the run exits with status 1.
+
+Usage:
+    python bench_host.py                 # run all, compare to baselines.json
+    python bench_host.py --update        # rewrite baselines.json from this run
+    python bench_host.py --only sim,quant
+    python bench_host.py --json out.json # also save this run's results
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+sys.path.insert(0, str(ROOT / "training"))
+sys.path.insert(0, str(ROOT / "data"))
+sys.path.insert(0, str(ROOT.parent / "vitis" / "mlp" / "handwritten_testing"))
+
+BASELINES = HERE / "baselines.json"
+DEFAULT_THRESHOLD = 0.25   # 25% slower than baseline counts as a regression
+SIM_THRESHOLD = 0.10       # end-to-end runs are dominated by sleeps, keep them tight
+SIM_BAUDS = (9600, 115200, 921600)
+
+def time_call(fn, repeat=5, number=1, warmup=True):
+    """Best-of-repeat wall time of number calls to fn, in ms per call"""
+    if warmup:
+        fn()
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best * 1e3
+
+def write_idx_images(path, images):
+    with open(path, "wb") as f:
+        f.write((2051).to_bytes(4, "big"))
+        for d in images.shape:
+            f.write(int(d).to_bytes(4, "big"))
+        f.write(images.tobytes())
+
+def synthetic_images(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, size=(n, 28, 28), dtype=np.uint8)
+
+def synthetic_weights(seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(0, 0.05, size=(32, 784)).astype(np.float32),
+            rng.normal(0, 0.05, size=(32,)).astype(np.float32),
+            rng.normal(0, 0.3, size=(10, 32)).astype(np.float32),
+            rng.normal(0, 0.3, size=(10,)).astype(np.float32))
+
+# ----------------------------------------------------------------------
+# Benchmarks: each yields (name, ms_per_call, images_per_call or None)
+# ----------------------------------------------------------------------
+def bench_idx(tmp):
+    import load_mnist
+    import sendToNN
+
+    n = 10000
+    path = tmp / "t10k-images.idx3-ubyte"
+    write_idx_images(path, synthetic_images(n))
+    yield "idx/load_mnist.load_images", time_call(lambda: load_mnist.load_images(path)), n
+    yield "idx/sendToNN.load_mnist_images", time_call(lambda: sendToNN.load_mnist_images(path)), n
+
+def bench_quant(tmp):
+    import export_weights_int8
+
+    w1, _, w2, _ = synthetic_weights()
+    yield "quant/to_int8_with_scale_w1", time_call(lambda: export_weights_int8.to_int8_with_scale(w1), number=20), None
+    yield "quant/to_int8_with_scale_w2", time_call(lambda: export_weights_int8.to_int8_with_scale(w2), number=200), None
+
+def bench_export(tmp):
+    import export_memh
+    import export_vivado_coe
+    import export_weights_int8
+
+    w1, b1, w2, _ = synthetic_weights()
+    w1q, s1 = export_weights_int8.to_int8_with_scale(w1)
+    w2q, _ = export_weights_int8.to_int8_with_scale(w2)
+    b1q = np.round(b1 * s1).astype(np.int32)
+
+    yield "export/write_i8_2d_w1", time_call(lambda: export_weights_int8.write_i8_2d(tmp / "weights_w1.h", "w1", w1q)), None
+    yield "export/write_i8_2d_w2", time_call(lambda: export_weights_int8.write_i8_2d(tmp / "weights_w2.h", "w2", w2q), number=20), None
+    yield "export/write_i32_1d_b1", time_call(lambda: export_weights_int8.write_i32_1d(tmp / "weights_b1.h", "b1", b1q), number=20), None
+    yield "export/write_coe_w1", time_call(
+        lambda: export_vivado_coe.write_coe(tmp / "w1_i8.coe", export_vivado_coe.i8_to_hex_list(w1q), values_per_line=32)), None
+    yield "export/write_coe_b1", time_call(
+        lambda: export_vivado_coe.write_coe(tmp / "b1_i32.coe", export_vivado_coe.i32_to_hex_list(b1q), values_per_line=8), number=20), None
+    yield "export/write_mem_8_w1", time_call(lambda: export_memh.write_mem_8(tmp / "w1.mem", w1q)), None
+    yield "export/write_mem_32_b1", time_call(lambda: export_memh.write_mem_32(tmp / "b1.mem", b1q), number=20), None
+
+def bench_preprocess(tmp):
+    try:
+        import batch_send
+    except ImportError as e:
+        print(f"  skipping preprocess: {e}")
+        return
+
+    digits = sorted((ROOT.parent / "vitis" / "mlp" / "handwritten_testing").glob("digit*.png"))
+    yield "preprocess/preprocess_mnist_style", time_call(
+        lambda: [batch_send.preprocess_mnist_style(p) for p in digits], repeat=3) / len(digits), 1
+
+def bench_protocol(tmp):
+    import sendToNN
+
+    img = synthetic_images(1)[0].flatten()
+    lines = ["1", "Command: Classify image", "Ready to receive image (784 bytes)...", "READY",
+             "Received complete image (784 bytes)", "=== Inference Start ===", "Prediction: 3",
+             "Logits: -1241577,-358284,686488,1167986,-1528305,-184215,-357906,-97249,-200916,-497757",
+             "PRED:3", "=== Inference Complete ==="]
+    yield "protocol/encode_image", time_call(lambda: sendToNN.encode_image(img), number=1000), 1
+    yield "protocol/parse_response", time_call(
+        lambda: [sendToNN.parse_prediction(l) for l in lines], number=1000), 1
+
+def bench_sim(tmp, n_images=3):
+    import int_model
+    import sendToNN
+    from sim_device import SimulatedDevice
+
+    weights = int_model.load_weights()
+    images = synthetic_images(n_images, seed=1).reshape(n_images, -1)
+    for baud in SIM_BAUDS:
+        dev = SimulatedDevice(baudrate=baud, weights=weights)
+
+        def run():
+            for img in images:
+                sendToNN.send_command(dev, '1')
+                if sendToNN.send_image_uart(dev, img, verbose=False) is None:
+                    raise RuntimeError(f"simulated device at {baud} baud did not answer")
+
+        yield f"sim/send_image_uart_{baud}", time_call(run, repeat=1, warmup=False) / n_images, 1
+
+SUITES = {
+    "idx": bench_idx,
+    "quant": bench_quant,
+    "export": bench_export,
+    "preprocess": bench_preprocess,
+    "protocol": bench_protocol,
+    "sim": bench_sim,
+}
+
+# ----------------------------------------------------------------------
+# Baselines
+# ----------------------------------------------------------------------
+def run_suites(names):
+    results = {}
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        for suite in names:
+            print(f"[{suite}]")
+            for name, ms, images in SUITES[suite](tmp):
+                entry = {"ms": round(ms, 4)}
+                if images:
+                    entry["images_per_s"] = round(images * 1e3 / ms, 2)
+                results[name] = entry
+                print(f"  {name:<40s} {ms:10.3f} ms")
+    return results
+
+def compare(results, baselines):
+    """Print a comparison table, return the names that regressed"""
+    regressions = []
+    print()
+    print(f"{'benchmark':<40s} {'ms':>10s} {'base ms':>10s} {'delta':>8s} {'img/s':>10s}  status")
+    print("-" * 90)
+    for name, entry in results.items():
+        base = baselines.get(name)
+        ips = entry.get("images_per_s")
+        ips_s = f"{ips:10.2f}" if ips is not None else f"{'':10s}"
+        if base is None:
+            print(f"{name:<40s} {entry['ms']:10.3f} {'-':>10s} {'-':>8s} {ips_s}  new")
+            continue
+        delta = entry["ms"] / base["ms"] - 1.0
+        threshold = base.get("threshold", DEFAULT_THRESHOLD)
+        if delta > threshold:
+            status = f"REGRESSION (> +{threshold:.0%})"
+            regressions.append(name)
+        elif delta < -threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        print(f"{name:<40s} {entry['ms']:10.3f} {base['ms']:10.3f} {delta:+8.1%} {ips_s}  {status}")
+    return regressions
+
+def load_baselines():
+    if not BASELINES.exists():
+        return {}
+    return json.loads(BASELINES.read_text())["benchmarks"]
+
+def save_baselines(results, previous):
+    benchmarks = {}
+    for name, entry in results.items():
+        threshold = previous.get(name, {}).get(
+            "threshold", SIM_THRESHOLD if name.startswith("sim/") else DEFAULT_THRESHOLD)
+        benchmarks[name] = dict(entry, threshold=threshold)
+    for name, entry in previous.items():
+        benchmarks.setdefault(name, entry)
+    meta = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "recorded": time.strftime("%Y-%m-%d"),
+    }
+    BASELINES.write_text(json.dumps({"meta": meta, "benchmarks": benchmarks}, indent=2, sort_keys=True) + "\n")
+    print(f"\nWrote {len(benchmarks)} baselines to {BASELINES}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Host toolchain benchmarks")
+    parser.add_argument("--only", help="comma-separated suites: " + ",".join(SUITES))
+    parser.add_argument("--update", action="store_true", help="rewrite baselines.json")
+    parser.add_argument("--json", help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(SUITES)
+    for n in names:
+        if n not in SUITES:
+            parser.error(f"unknown suite '{n}'")
+
+    results = run_suites(names)
+    baselines = load_baselines()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+    if args.update:
+        save_baselines(results, baselines)
+        return 0
+
+    regressions = compare(results, baselines)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+A/B benchmark: software mlp.c inference vs the nn_core hardware path
+
+Sends the same t10k images to a board running vitis/mlp/mlp.c and a board
+running vitis/mult/src/main.c, and reports per-image agreement, end-to-end
+latency and images/second for each path.
+
+Usage:
+    python ab_bench.py --sw COM6 --hw COM7 -n 100
+    python ab_bench.py --sw COM6 --hw COM7 --start 500 -n 50 --csv ab.csv
+    python ab_bench.py --sim -n 20 --baud 115200
+"""
+
+import argparse
+import csv
+import time
+
+import numpy as np
+
+from sendToNN import FIRMWARES, detect_firmware, load_test_set, open_port, read_responses
+
+def connect(key, port, baudrate, sim):
+    """Open the port for one path and check the firmware behind it"""
+    if sim:
+        from sim_device import NnCoreSimulatedDevice, SimulatedDevice
+        ser = SimulatedDevice(baudrate) if key == "sw" else NnCoreSimulatedDevice(baudrate)
+    else:
+        ser = open_port(port, baudrate)
+
+    expected = FIRMWARES[key]
+    found = detect_firmware(ser)
+    if found is None:
+        print(f"WARNING: no menu reply on {port}, assuming {expected.name}")
+    elif found is not expected:
+        ser.close()
+        raise RuntimeError(f"{port} runs {found.name}, expected {expected.name}")
+    read_responses(ser, timeout=0.5, verbose=False)
+    return ser
+
+def summarize(name, latencies, preds, labels):
+    ok = np.array([p is not None for p in preds])
+    lat = np.array(latencies)
+    correct = sum(p == l for p, l in zip(preds, labels) if p is not None)
+    print(f"{name}")
+    print(f"  answered       : {ok.sum()}/{len(preds)}")
+    print(f"  accuracy       : {correct}/{ok.sum()}" + (f" = {100.0 * correct / ok.sum():.2f}%" if ok.any() else ""))
+    print(f"  latency mean   : {lat.mean() * 1e3:9.1f} ms")
+    print(f"  latency p50/p95: {np.percentile(lat, 50) * 1e3:9.1f} / {np.percentile(lat, 95) * 1e3:.1f} ms")
+    print(f"  throughput     : {len(lat) / lat.sum():9.3f} images/s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Software vs nn_core A/B benchmark")
+    parser.add_argument("--sw", default="COM6", help="port of the board running mlp.c")
+    parser.add_argument("--hw", default="COM7", help="port of the board running mult/main.c")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("-n", "--count", type=int, default=20)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--csv", help="write the per-image table to a CSV file")
+    parser.add_argument("--sim", action="store_true", help="use the simulated devices")
+    args = parser.parse_args()
+
+    if args.sim:
+        try:
+            images, labels, _ = load_test_set()
+        except FileNotFoundError:
+            rng = np.random.default_rng(0)
+            images = rng.integers(0, 256, size=(args.start + args.count, 28, 28), dtype=np.uint8)
+            labels = np.zeros(len(images), dtype=np.uint8)
+    else:
+        images, labels, _ = load_test_set()
+    indices = range(args.start, min(args.start + args.count, len(images)))
+
+    ports = {"sw": connect("sw", args.sw, args.baud, args.sim),
+             "hw": connect("hw", args.hw, args.baud, args.sim)}
+
+    rows = []
+    lat = {"sw": [], "hw": []}
+    preds = {"sw": [], "hw": []}
+    try:
+        for idx in indices:
+            image_flat = images[idx].flatten()
+            row = {"index": idx, "label": int(labels[idx])}
+            for key, ser in ports.items():
+                t0 = time.perf_counter()
+                pred = FIRMWARES[key].classify(ser, image_flat)
+                dt = time.perf_counter() - t0
+                read_responses(ser, timeout=0.2, verbose=False)
+                lat[key].append(dt)
+                preds[key].append(pred)
+                row[f"{key}_pred"] = pred
+                row[f"{key}_ms"] = round(dt * 1e3, 1)
+            row["agree"] = row["sw_pred"] is not None and row["sw_pred"] == row["hw_pred"]
+            rows.append(row)
+            print(f"[{idx:5d}] label={row['label']} sw={row['sw_pred']} ({row['sw_ms']:.0f} ms) "
+                  f"hw={row['hw_pred']} ({row['hw_ms']:.0f} ms) {'agree' if row['agree'] else 'DIFFER'}")
+    except KeyboardInterrupt:
+        print("\nInterrupted, summarizing completed images")
+    finally:
+        for ser in ports.values():
+            ser.close()
+
+    if not rows:
+        return
+
+    lbls = [r["label"] for r in rows]
+    agree = sum(r["agree"] for r in rows)
+    print(f"\n{'='*50}")
+    print(f"Images: {len(rows)}   agreement: {agree}/{len(rows)} = {100.0 * agree / len(rows):.2f}%")
+    for key in ("sw", "hw"):
+        summarize(FIRMWARES[key].name, lat[key], preds[key], lbls)
+    print(f"{'='*50}")
+
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Per-image results written to {args.csv}")
+
+if __name__ == "__main__":
+    main()
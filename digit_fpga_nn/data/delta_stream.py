@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Full frames vs pixel deltas on a stream of similar frames
+
+A camera pointed at a digit produces frames that differ from the previous
+one in a few pixels. mlp.c's command 'D' takes just those pixels (3 bytes
+each) and updates the layer-1 sums it kept from the last image by
+w1[:, i] * (new - old), so both the transfer and layer 1 shrink with the
+number of changed pixels; the answer is the one a full pass gives.
+
+The script sends a frame sequence twice through classify_stream(): every
+frame as a framed '8' image, then with DeltaEncoder ('D' whenever it is
+shorter). It checks that both passes (and int_model, with --check) give
+the same predictions, and reports the changed pixels per frame, bytes on
+the wire, estimated device cycles and the measured frames/s of each pass.
+
+Frames come from --frames (a .npy of shape (T, 784) or (T, 28, 28), or a
+raw file of concatenated 784-byte frames), or are synthesized from t10k
+with --synthetic: each digit is held for --hold frames while --noise
+random pixels flicker by a few levels per frame, like sensor noise.
+
+Usage:
+    python delta_stream.py COM6 --frames recording.npy
+    python delta_stream.py COM6 --synthetic 200 --hold 50 --noise 8 --save synthetic.npy
+    python delta_stream.py --sim --baud 115200 --synthetic 200 --check
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from sendToNN import (INPUT_SIZE, PIPELINE_WINDOW, DeltaEncoder, FramedEncoder, classify_stream,
+                      detect_firmware, fit_image, framed_request, info_input_size, load_test_set,
+                      open_port, query_info, read_responses, set_verbosity, supports_delta,
+                      supports_pipeline)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "training"))
+import int_model  # noqa: E402
+import weights_blob  # noqa: E402
+
+CLOCK_HZ = 100e6   # MicroBlaze clock for the cycle estimate and the simulated compute time
+
+def load_frames(path):
+    """(T, 784) uint8 frames from a .npy recording or a raw file of 784-byte frames"""
+    path = Path(path)
+    frames = np.load(path) if path.suffix == ".npy" else np.fromfile(path, dtype=np.uint8)
+    frames = np.asarray(frames, dtype=np.uint8)
+    if frames.size % INPUT_SIZE:
+        raise SystemExit(f"{path} does not hold whole {INPUT_SIZE}-pixel frames")
+    return frames.reshape(-1, INPUT_SIZE)
+
+def synthesize(images, n, hold, noise, seed=0):
+    """n frames: images[0] for hold frames, then images[1], ..., each frame with noise flickering pixels"""
+    rng = np.random.default_rng(seed)
+    frames = np.empty((n, INPUT_SIZE), dtype=np.uint8)
+    for t in range(n):
+        if t % hold == 0:
+            frame = images[(t // hold) % len(images)].reshape(-1).astype(np.int16)
+        else:
+            frame = frames[t - 1].astype(np.int16)
+            idx = rng.choice(INPUT_SIZE, size=noise, replace=False)
+            frame[idx] += rng.integers(-8, 9, size=noise)
+        frames[t] = np.clip(frame, 0, 255)
+    return frames
+
+def request_sizes(frames):
+    """Per frame: (changed pixels, '8' bytes, bytes DeltaEncoder sends)"""
+    encoder = DeltaEncoder()
+    rows = []
+    for t, frame in enumerate(frames):
+        changed = int(np.count_nonzero(frames[t - 1] != frame)) if t else len(frame)
+        rows.append((changed, len(framed_request(frame)), len(encoder.encode(frame))))
+    return np.array(rows)
+
+def estimated_cycles(frames, per_channel):
+    """Device cycles of the '8' pass and of the DeltaEncoder pass (int_model estimates)"""
+    n_in = frames.shape[1]
+    full = sum(int_model.estimate_cycles(per_channel, n_in))
+    delta = full    # the first frame, and the first 'D' recomputes layer 1
+    encoder = DeltaEncoder()
+    encoder.encode(frames[0])
+    after_full = True
+    for t in range(1, len(frames)):
+        request = encoder.encode(frames[t])
+        if request[:1] == b'D' and not after_full:
+            changed = int(np.count_nonzero(frames[t - 1] != frames[t]))
+            delta += sum(int_model.estimate_delta_cycles(per_channel, changed, n_in))
+        else:
+            delta += full
+        after_full = request[:1] == b'8'
+    return full * len(frames), delta
+
+def run_pass(ser, frames, window, encoder):
+    """(predictions, seconds) of one pass over the frames"""
+    preds = [None] * len(frames)
+    t0 = time.time()
+    for i, pred in classify_stream(ser, frames, window=window, encoder=encoder):
+        preds[i] = pred
+    return preds, time.time() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream similar frames as full images and as pixel deltas")
+    parser.add_argument("port", nargs="?", default="COM6")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("--sim", action="store_true", help="use the simulated device")
+    parser.add_argument("--frames", help="recorded frames: .npy (T, 784) / (T, 28, 28) or raw 784-byte frames")
+    parser.add_argument("--synthetic", type=int, default=100, help="frames to synthesize without --frames")
+    parser.add_argument("--hold", type=int, default=50, help="synthetic frames per digit")
+    parser.add_argument("--noise", type=int, default=8, help="synthetic pixels changing per frame")
+    parser.add_argument("--save", help="write the frame sequence to this .npy")
+    parser.add_argument("--check", action="store_true", help="compare with int_model (compiled-in weights)")
+    args = parser.parse_args()
+
+    if args.frames:
+        frames = load_frames(args.frames)
+    else:
+        images, _, _ = load_test_set()
+        frames = synthesize(images, args.synthetic, args.hold, args.noise)
+    if args.save:
+        np.save(args.save, frames)
+
+    if args.sim:
+        from sim_device import SimulatedDevice
+        ser = SimulatedDevice(args.baud)
+        # Full passes take the estimated compute time, deltas their share of it
+        per_channel = bool(ser.weights.get("QUANT_PER_CHANNEL"))
+        ser.compute_s = sum(int_model.estimate_cycles(per_channel, ser.input_size)) / CLOCK_HZ
+    else:
+        ser = open_port(args.port, args.baud)
+    try:
+        fw = detect_firmware(ser)
+        if fw is not None and fw.supports('9'):
+            set_verbosity(ser, 0)
+        info = query_info(ser) if fw is not None and fw.supports('3') else ""
+        read_responses(ser, timeout=0.5, verbose=False)
+        if not supports_delta(info):
+            raise SystemExit(f"The firmware does not report DELTA ({info or 'no INFO: line'})")
+        window = PIPELINE_WINDOW if supports_pipeline(info) else 1
+        n_in = info_input_size(info)
+        frames = np.stack([fit_image(f, n_in) for f in frames])
+
+        sizes = request_sizes(frames)
+        changed = sizes[1:, 0]
+        per_channel = ",PC" in info
+        full_cycles, delta_cycles = estimated_cycles(frames, per_channel)
+        print(f"{len(frames)} frames of {n_in} pixels, {args.baud} baud, window {window}")
+        if len(changed):
+            print(f"Changed pixels per frame: mean {changed.mean():.1f}, p50 {np.percentile(changed, 50):.0f}, "
+                  f"p95 {np.percentile(changed, 95):.0f}, max {changed.max()}")
+        print(f"Bytes on the wire    : '8' {sizes[:, 1].sum()}, delta {sizes[:, 2].sum()} "
+              f"({sizes[:, 1].sum() / sizes[:, 2].sum():.1f}x less)")
+        print(f"Device cycles (est.) : '8' {full_cycles}, delta {delta_cycles} "
+              f"({full_cycles / delta_cycles:.1f}x less)")
+
+        full_preds, full_s = run_pass(ser, frames, window, FramedEncoder())
+        encoder = DeltaEncoder()
+        delta_preds, delta_s = run_pass(ser, frames, window, encoder)
+        print(f"\n'8' frames           : {len(frames) / full_s:8.2f} frames/s ({full_s:.2f} s)")
+        print(f"Deltas               : {len(frames) / delta_s:8.2f} frames/s ({delta_s:.2f} s), "
+              f"{encoder.sent['D']} 'D' and {encoder.sent['8']} '8' requests")
+        print(f"Speedup              : {full_s / delta_s:.2f}x")
+
+        same = sum(a == b and a is not None for a, b in zip(full_preds, delta_preds))
+        print(f"Same prediction      : {same}/{len(frames)}")
+        failed = same != len(frames)
+        if args.check:
+            weights = ser.weights if args.sim else int_model.load_weights(weights_blob.DEFAULT_WEIGHTS_DIR)
+            ref, _ = int_model.mlp_inference(frames, weights)
+            agree = sum(p == r for p, r in zip(delta_preds, ref))
+            print(f"Agree with int_model : {agree}/{len(frames)}")
+            failed |= agree != len(frames)
+        print(f"\nCheck {'FAILED' if failed else 'PASSED'}")
+        if failed:
+            raise SystemExit(1)
+    finally:
+        ser.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Collect and chart on-device cycle benchmarks
+
+Runs the firmware benchmark command ('5', see run_benchmark() in mlp.c)
+one or more times, appends every result to a JSON-lines history file tagged
+with a label (firmware build, optimization under test, ...) and charts the
+mean cycles per stage with min/max whiskers for every label in the history.
+
+Usage:
+    python device_bench.py COM6 -k 100 --label baseline
+    python device_bench.py COM6 -k 100 --label per-channel --image ../training/img_28x28.bin
+    python device_bench.py --chart-only
+    python device_bench.py --sim --label sim      # against sim_device.py
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from sendToNN import (INPUT_SIZE, open_port, print_bench, read_responses, run_device_benchmark,
+                      send_command, send_image_uart)
+
+STAGES = ("L1", "L2", "AM", "TOT")
+STAGE_NAMES = {"L1": "layer1_forward", "L2": "layer2_forward", "AM": "argmax", "TOT": "total"}
+
+def load_history(path):
+    path = Path(path)
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+def append_history(path, record):
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+def chart(history, out_path, show=False):
+    """Grouped bars: mean cycles per stage for each label, whiskers at min/max"""
+    import matplotlib
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # Latest run per label, in first-seen order
+    latest = {}
+    for rec in history:
+        latest[rec["label"]] = rec
+    labels = list(latest)
+    if not labels:
+        print("No benchmark history to chart")
+        return
+
+    x = np.arange(len(STAGES))
+    width = 0.8 / len(labels)
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    for i, label in enumerate(labels):
+        stages = latest[label]["stages"]
+        lo = np.array([stages[s][0] for s in STAGES])
+        mean = np.array([stages[s][1] for s in STAGES])
+        hi = np.array([stages[s][2] for s in STAGES])
+        ax.bar(x + i * width, mean, width, label=f"{label} (K={latest[label]['K']})",
+               yerr=[mean - lo, hi - mean], capsize=3)
+
+    ax.set_xticks(x + width * (len(labels) - 1) / 2)
+    ax.set_xticklabels([STAGE_NAMES[s] for s in STAGES])
+    ax.set_ylabel("cycles")
+    ax.set_yscale("log")
+    ax.set_title("MicroBlaze RISC-V cycles per stage (mean, min/max)")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=120)
+    print(f"Chart saved to {out_path}")
+    if show:
+        plt.show()
+
+def main():
+    parser = argparse.ArgumentParser(description="On-device cycle benchmark")
+    parser.add_argument("port", nargs="?", default="COM6")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("-k", "--iterations", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=1, help="benchmark commands to send")
+    parser.add_argument("--label", default=time.strftime("%Y-%m-%d %H:%M"))
+    parser.add_argument("--image", help="raw 784-byte image to send before benchmarking")
+    parser.add_argument("--history", default="bench_history.jsonl")
+    parser.add_argument("--chart", default="bench_chart.png")
+    parser.add_argument("--chart-only", action="store_true")
+    parser.add_argument("--show", action="store_true", help="open the chart window")
+    parser.add_argument("--sim", action="store_true", help="use the simulated device")
+    args = parser.parse_args()
+
+    if not args.chart_only:
+        if args.sim:
+            from sim_device import SimulatedDevice
+            ser = SimulatedDevice(baudrate=args.baud)
+            read_responses(ser, timeout=0.5, verbose=False)
+        else:
+            ser = open_port(args.port, args.baud)
+        try:
+            if args.image:
+                img = np.fromfile(args.image, dtype=np.uint8)
+                assert img.size == INPUT_SIZE, f"{args.image} is not {INPUT_SIZE} bytes"
+                send_command(ser, '1')
+                if send_image_uart(ser, img, verbose=False) is None:
+                    print("Failed to load the benchmark image")
+                    return
+                read_responses(ser, timeout=0.5, verbose=False)
+
+            for _ in range(args.runs):
+                result = run_device_benchmark(ser, args.iterations)
+                if result is None:
+                    continue
+                print_bench(result)
+                append_history(args.history, {
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "label": args.label,
+                    "port": "sim" if args.sim else args.port,
+                    "K": result["K"],
+                    "pred": result.get("PRED"),
+                    "stages": result["stages"],
+                })
+                read_responses(ser, timeout=0.5, verbose=False)
+        finally:
+            ser.close()
+
+    chart(load_history(args.history), args.chart, show=args.show)
+
+if __name__ == "__main__":
+    main()
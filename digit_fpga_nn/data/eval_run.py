@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Resumable full test-set evaluation over UART
+
+At 9600 baud the 10k t10k images take hours. Every answer is appended to a
+JSON-lines progress log (flushed and fsynced per image), so a dropped cable,
+a failed image or Ctrl-C loses nothing: rerunning the same command skips the
+indices already answered, evaluates the rest, then retries the images that
+failed. Running accuracy and an ETA are printed as it goes.
+
+The first log line records the firmware fingerprint (see pred_cache.py); a
+log is only resumed against the same firmware and weights.
+
+Usage:
+    python eval_run.py COM6                          # all of t10k -> t10k_eval.jsonl
+    python eval_run.py COM6 --log run2.jsonl --start 5000 -n 1000
+    python eval_run.py --sim sw -n 50 --baud 115200
+    python eval_run.py COM6 --pipeline               # no READY round trip (needs the UART interrupt)
+    python eval_run.py COM6 --verbosity 2            # keep the firmware's per-image debug lines
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from pred_cache import DEFAULT_CACHE, PredictionCache
+from sendToNN import (FIRMWARES, PIPELINE_WINDOW, LatencyTracker, classify_cached, classify_stream,
+                      detect_firmware, load_test_set, open_port, query_info, read_responses,
+                      set_verbosity, supports_pipeline)
+
+DEFAULT_LOG = "t10k_eval.jsonl"
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}h{m:02d}m" if h else f"{m}m{s:02d}s"
+
+def load_progress(path):
+    """
+    Read a progress log
+
+    Returns:
+        (header dict or None, {index: prediction or None}); an answered
+        record for an index wins over failed ones, so a successful retry
+        replaces the failure
+    """
+    header, results = None, {}
+    path = Path(path)
+    if not path.exists():
+        return header, results
+    with open(path) as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue        # torn last line from a killed run
+            if "run" in rec:
+                header = rec["run"]
+            elif results.get(rec["index"]) is None:
+                results[rec["index"]] = rec["pred"]
+    return header, results
+
+class ProgressLog:
+    """Append-only JSON-lines log; every record is on disk before the next image is sent"""
+
+    def __init__(self, path):
+        self.f = open(path, "a")
+
+    def append(self, record):
+        self.f.write(json.dumps(record) + "\n")
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def close(self):
+        self.f.close()
+
+class Tally:
+    """Running accuracy and ETA from the recent per-image link time"""
+
+    def __init__(self, results, labels, remaining):
+        self.correct = sum(p == labels[i] for i, p in results.items() if p is not None)
+        self.answered = sum(p is not None for p in results.values())
+        self.remaining = remaining
+        self.recent = deque(maxlen=50)
+
+    def add(self, pred, label, seconds, cached):
+        self.remaining -= 1
+        if pred is not None:
+            self.answered += 1
+            self.correct += pred == label
+        if not cached:
+            self.recent.append(seconds)
+
+    def line(self):
+        acc = f"{100.0 * self.correct / self.answered:6.2f}%" if self.answered else "   -  "
+        eta = format_duration(np.mean(self.recent) * self.remaining) if self.recent else "-"
+        return f"acc {acc} ({self.correct}/{self.answered})  ETA {eta}"
+
+def evaluate(ser, images, labels, indices, log, results, tally, cache=None, fp=None, attempt=0, latency=None,
+             window=1):
+    """
+    Classify the given indices, logging each answer; returns the indices that failed
+
+    With window > 1 the images the cache does not answer are streamed with
+    classify_stream() (firmware with the interrupt RX ring only).
+    """
+    failed = []
+    n = 0
+
+    def record(idx, pred, dt, cached):
+        nonlocal n
+        n += 1
+        label = int(labels[idx])
+        log.append({"index": int(idx), "label": label, "pred": pred,
+                    "s": round(dt, 3), "cached": cached, "attempt": attempt})
+        results[idx] = pred
+        tally.add(pred, label, dt, cached)
+        if pred is None:
+            failed.append(idx)      # the device was already resynced
+        mark = "FAILED" if pred is None else ("ok" if pred == label else "WRONG")
+        note = " (cached)" if cached else ""
+        print(f"[{n:5d}/{len(indices)}] #{idx:5d} label={label} pred={pred} {mark:6s} "
+              f"{dt * 1e3:6.0f} ms{note}  {tally.line()}")
+
+    if window <= 1:
+        for idx in indices:
+            t0 = time.perf_counter()
+            pred, cached = classify_cached(ser, images[idx].flatten(), cache, fp, verbose=False, latency=latency)
+            record(idx, pred, time.perf_counter() - t0, cached)
+        return failed
+
+    todo = []
+    for idx in indices:
+        hit = cache.get(images[idx].flatten(), fp) if cache is not None else None
+        if hit is not None:
+            record(idx, hit["pred"], 0.0, True)
+        else:
+            todo.append(idx)
+    t0 = time.perf_counter()
+    for k, pred in classify_stream(ser, [images[idx].flatten() for idx in todo], window, latency):
+        idx = todo[k]
+        if pred is not None and cache is not None:
+            cache.put(images[idx].flatten(), fp, {"pred": pred})
+        now = time.perf_counter()
+        record(idx, pred, now - t0, False)      # time between answers
+        t0 = now
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumable test-set evaluation over UART")
+    parser.add_argument("port", nargs="?", default="COM6")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("--log", default=DEFAULT_LOG, help="progress log (resumed if it exists)")
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("-n", "--count", type=int, help="number of images (default: all)")
+    parser.add_argument("--retries", type=int, default=2, help="retry passes over failed images")
+    parser.add_argument("--cache", default=DEFAULT_CACHE)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--sim", choices=tuple(FIRMWARES), help="use a simulated device")
+    parser.add_argument("--pipeline", action="store_true",
+                        help=f"keep {PIPELINE_WINDOW} requests in flight (mlp.c with the UART interrupt)")
+    parser.add_argument("--verbosity", type=int, choices=(0, 1, 2), default=0,
+                        help="firmware chatter for the run (mlp.c '9'; default 0: protocol lines only)")
+    args = parser.parse_args()
+
+    images, labels, img_path = load_test_set()
+    stop = len(images) if args.count is None else min(args.start + args.count, len(images))
+    indices = list(range(args.start, stop))
+
+    if args.sim:
+        from sim_device import NnCoreSimulatedDevice, SimulatedDevice
+        ser = (SimulatedDevice if args.sim == "sw" else NnCoreSimulatedDevice)(args.baud)
+    else:
+        ser = open_port(args.port, args.baud)
+    fw = detect_firmware(ser) or FIRMWARES["sw"]
+    if fw.supports('9') and set_verbosity(ser, args.verbosity) is None:
+        print("Device did not answer '9'; its debug chatter stays on")
+    fp = fw.fingerprint(ser)
+    window = 1
+    if args.pipeline:
+        if fw.supports('3') and supports_pipeline(query_info(ser)):
+            window = PIPELINE_WINDOW
+        else:
+            print("Device has no interrupt RX ring (INFO: lacks RX=IRQ); sending one image at a time")
+    read_responses(ser, timeout=0.5, verbose=False)
+
+    header, results = load_progress(args.log)
+    if header is not None and header["fingerprint"] != fp:
+        ser.close()
+        raise SystemExit(f"{args.log} was recorded against firmware {header['firmware']} "
+                         f"[{header['fingerprint']}], the device is {fw.key} [{fp}]; use another --log")
+    log = ProgressLog(args.log)
+    if header is None:
+        log.append({"run": {"firmware": fw.key, "fingerprint": fp, "images": str(img_path),
+                            "started": time.strftime("%Y-%m-%d %H:%M:%S")}})
+
+    wanted = set(indices)
+    results = {i: p for i, p in results.items() if i in wanted}
+    todo = [i for i in indices if i not in results]
+    retry = [i for i in indices if i in results and results[i] is None]
+    print(f"{fw.name} [{fp}]  log {args.log}")
+    print(f"{len(indices)} images: {len(results) - len(retry)} done, {len(todo)} to go, {len(retry)} to retry")
+
+    cache = None if args.no_cache else PredictionCache(args.cache)
+    tally = Tally(results, labels, len(todo) + len(retry))
+    latency = LatencyTracker()
+    try:
+        failed = retry + evaluate(ser, images, labels, todo, log, results, tally, cache, fp,
+                                  latency=latency, window=window)
+        for attempt in range(1, args.retries + 1):
+            if not failed:
+                break
+            print(f"\nRetry pass {attempt}: {len(failed)} failed images")
+            tally.remaining = len(failed)
+            failed = evaluate(ser, images, labels, failed, log, results, tally, cache, fp, attempt, latency, window)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; progress is in {args.log}, rerun the same command to resume")
+    finally:
+        log.close()
+        if cache is not None:
+            cache.close()
+        ser.close()
+
+    answered = {i: p for i, p in results.items() if p is not None}
+    correct = sum(p == labels[i] for i, p in answered.items())
+    print(f"\n{'='*50}")
+    print(f"Answered: {len(answered)}/{len(indices)}   failed: {len(results) - len(answered)}"
+          f"   not yet run: {len(indices) - len(results)}")
+    if answered:
+        print(f"Accuracy: {correct}/{len(answered)} = {100.0 * correct / len(answered):.2f}%")
+    print(f"{'='*50}")
+
+if __name__ == "__main__":
+    main()
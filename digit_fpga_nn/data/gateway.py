@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+Local inference gateway: one process owns the board, everyone else asks it
+
+Every host script opens the serial port exclusively, so only one of them can
+use the board at a time. gateway.py opens it once and serves a small HTTP
+API on localhost (or a Unix socket):
+
+    POST /classify   body: 784 raw pixel bytes, or JSON {"image": [784 ints]}
+                     (a reduced-resolution board, INFO:196->.., also takes its
+                     own size; 28x28 images are downsampled for it)
+                     headers: X-Client (default: peer address),
+                              X-Deadline-Ms (default --deadline-ms),
+                              X-Backend: device (board or an error, never
+                              the host model; one-shot tools send it)
+                     200 {"pred": d, "backend": "device" | "host", "total_ms": ..}
+    GET  /metrics    queue depth, request counters, throughput, latency
+                     percentiles, batch sizes and device utilization
+
+Requests wait in one FIFO. The device task takes up to --max-batch of them
+at a time and sends them back to back: as '8' framed requests with
+PIPELINE_WINDOW in flight when the firmware has the interrupt RX ring
+(INFO: RX=IRQ), otherwise one '1' + image after another. The serial port is
+only touched from a single worker thread.
+
+While idle the gateway checks on the session every --keepalive seconds: the
+firmware must answer '9' with VERBOSE:0 (or '0' with SYNC), which also puts
+a board that was reset back to quiet mode. The port therefore stays open and
+in step between callers, and one-shot tools (sendToNN.py --zeros / --pixel,
+send.py) use a running gateway instead of opening the port themselves; see
+gateway_client.session_client().
+
+Hybrid scheduling (--offload load, the default): each request goes to the
+board or to a host copy of the integer pipeline (int_model, bit-exact with
+the firmware on the same weights), decided when it arrives:
+    host    the device is not answering (no port, failed resync or
+            keepalive), or the queue ahead of it at the measured service
+            time would take longer than --target-ms or its deadline
+    device  otherwise
+Requests the device fails after they were queued are answered by the host
+model too, so a board that drops out costs latency, not errors; it gets
+requests again once a keepalive succeeds (checked every RECHECK_S while it
+is out). If the board runs uploaded weights (INFO: W=<crc>), the host
+weights must have the same blob CRC, else offloading is switched off; so
+it is for a CASCADE build (INFO: CASCADE=<margin>), whose stage-1 early
+exits the host model does not reproduce.
+--offload never keeps every request on the device, always never uses it.
+A request with X-Backend: device is never offloaded or answered by the host
+after a device failure; it gets 503 if there is no port to queue it on.
+
+Admission control, answered before a request is queued:
+    429  the client already has --client-limit requests queued or running
+    503  the queue holds --queue-limit requests, or the queue ahead of it
+         (at the measured per-image service time) cannot finish before
+         its deadline (device requests only)
+    504  the deadline passed while it was queued or on the device
+    502  the device did not answer it (after a resync) and there is no
+         host model to fall back on
+
+Usage:
+    python gateway.py COM6 --baud 115200
+    python gateway.py /dev/ttyUSB0 --unix /tmp/mlp.sock
+    python gateway.py --sim sw --baud 115200          # in-process simulated board
+    python gateway.py COM6 --target-ms 500            # offload once the board is 0.5 s behind
+    python gateway.py COM6 --offload never            # device only, as before
+    python sim_device.py --pty                         # or a simulated board on a pty:
+    python gateway.py /dev/pts/3 --baud 115200
+    python gateway_client.py -n 200 -c 8               # load test
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+
+import numpy as np
+
+from sendToNN import (FIRMWARES, INPUT_SIZE, PIPELINE_WINDOW, LatencyTracker, cascade_margin,
+                      classify_stream, detect_firmware, fit_image, info_input_size, open_port, query_info, read_responses,
+                      resync, set_verbosity, supports_pipeline)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "training"))
+import int_model  # noqa: E402
+import weights_blob  # noqa: E402
+
+DEFAULT_HTTP_PORT = 8784
+DEFAULT_DEADLINE_MS = 30000
+DEFAULT_KEEPALIVE_S = 30.0
+LATENCY_WINDOW = 1000   # completed requests the latency percentiles cover
+RATE_WINDOW_S = 10.0    # throughput is averaged over this many seconds
+SERVICE_EWMA = 0.2      # weight of the newest batch in the per-image service time
+DEFAULT_TARGET_MS = 2000.0
+OFFLOAD_MODES = ("load", "never", "always")
+BACKENDS = ("any", "device")    # X-Backend values
+RECHECK_S = 5.0         # keepalive interval while the device is not answering
+
+class Rejected(Exception):
+    """A request the gateway answers with an HTTP error instead of a prediction"""
+
+    def __init__(self, status, reason):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+
+class LocalModel:
+    """
+    Host backend: the firmware's integer pipeline in NumPy (int_model)
+
+    Runs on its own thread, so it never waits behind the serial port.
+    """
+
+    def __init__(self, weights):
+        self.weights = weights
+        self.shift = weights.get("SHIFT", int_model.SHIFT)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="host")
+
+    def _classify(self, image):
+        preds, _ = int_model.mlp_inference(image, self.weights, self.shift)
+        return int(preds[0])
+
+    async def classify(self, image):
+        return await asyncio.get_running_loop().run_in_executor(self._pool, self._classify, image)
+
+def local_weights(ser, fw, weights_dir=None):
+    """Weights the board behind ser runs with its compiled-in tables"""
+    if weights_dir:
+        return int_model.load_weights(weights_dir)
+    if hasattr(ser, "weights"):         # SimulatedDevice
+        return ser.weights
+    if fw is not None and fw.key != "sw":
+        weights = int_model.load_weights()      # nn_core: vivado_init, per-tensor only
+        weights.pop("QUANT_PER_CHANNEL", None)
+        return weights
+    return int_model.load_weights(weights_blob.DEFAULT_WEIGHTS_DIR)
+
+def weights_match(info, weights):
+    """False if INFO: reports uploaded weights (W=<crc>) other than these"""
+    uploaded = [f for f in info.split(",") if f.startswith("W=")]
+    if not uploaded:
+        return True
+    blob = weights_blob.pack_blob(weights, weights.get("SHIFT", int_model.SHIFT))
+    return int(uploaded[0][2:], 16) == weights_blob.unpack_blob(blob)[1]
+
+class Request:
+    __slots__ = ("image", "client", "deadline", "future", "device_only", "t_arrival", "t_dispatch")
+
+    def __init__(self, image, client, deadline, future, device_only=False):
+        self.image = image
+        self.client = client
+        self.deadline = deadline
+        self.future = future
+        self.device_only = device_only
+        self.t_arrival = time.monotonic()
+        self.t_dispatch = None
+
+def percentiles_ms(seconds):
+    if not seconds:
+        return None
+    p50, p95, p99 = np.percentile(seconds, (50, 95, 99)) * 1e3
+    return {"p50": round(p50, 1), "p95": round(p95, 1), "p99": round(p99, 1),
+            "max": round(max(seconds) * 1e3, 1)}
+
+class Metrics:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.counts = defaultdict(int)
+        self.queued = deque(maxlen=LATENCY_WINDOW)   # seconds from arrival to dispatch
+        self.total = deque(maxlen=LATENCY_WINDOW)    # seconds from arrival to answer
+        self.done_at = deque()                       # completion times inside RATE_WINDOW_S
+        self.batches = 0
+        self.batched = 0
+        self.busy_s = 0.0
+
+    def completed(self, req, now, backend):
+        self.counts["completed"] += 1
+        self.counts[f"completed_{backend}"] += 1
+        self.queued.append(req.t_dispatch - req.t_arrival)
+        self.total.append(now - req.t_arrival)
+        self.done_at.append(now)
+
+    def throughput(self, now):
+        while self.done_at and self.done_at[0] < now - RATE_WINDOW_S:
+            self.done_at.popleft()
+        return len(self.done_at) / min(RATE_WINDOW_S, max(now - self.started, 1e-3))
+
+class Gateway:
+    """
+    The request queue in front of one device
+
+    Args:
+        ser: Open serial port (or SimulatedDevice), used only from the device thread
+        fw: FirmwareAdapter of the firmware behind it
+        window: Requests kept in flight on the wire; 1 disables pipelining
+        max_batch: Most requests sent back to back before the queue is checked again
+        batch_wait_s: How long the device task lingers for more requests to coalesce
+        queue_limit: Most requests queued at once
+        client_limit: Most requests one client may have queued or on the device
+        keepalive_s: Idle time after which the session is checked (None: never)
+        local: LocalModel to offload to (None: device only); ser may then be
+            None, every request going to the host
+        offload: "load", "never" or "always", see the module docstring
+        target_s: Device latency target of the "load" policy
+        n_in: Input size of the device (INFO:) and the host model; images
+            arrive already fitted to it (route())
+    """
+
+    def __init__(self, ser, fw, window=1, max_batch=16, batch_wait_s=0.002, queue_limit=256, client_limit=32,
+                 keepalive_s=DEFAULT_KEEPALIVE_S, local=None, offload="load", target_s=DEFAULT_TARGET_MS / 1e3,
+                 n_in=INPUT_SIZE):
+        self.ser = ser
+        self.fw = fw
+        self.n_in = n_in
+        self.window = window
+        self.max_batch = max_batch
+        self.batch_wait_s = batch_wait_s
+        self.queue_limit = queue_limit
+        self.client_limit = client_limit
+        self.keepalive_s = keepalive_s
+        self.local = local
+        self.offload = offload if local is not None else "never"
+        self.target_s = target_s
+        self.in_sync = ser is not None
+        self.queue = deque()
+        self.in_flight = 0
+        self.per_client = defaultdict(int)
+        self.service_s = None           # per-image device time, EWMA over batches
+        self.latency = LatencyTracker()
+        self.metrics = Metrics()
+        self._wakeup = asyncio.Event()
+        self._local_tasks = set()
+        self._device = ThreadPoolExecutor(max_workers=1, thread_name_prefix="device")
+
+    def _route(self, deadline, device_only=False):
+        """Backend ("device" or "host") for a new request"""
+        if device_only:
+            if self.ser is None:
+                self.metrics.counts["rejected_no_device"] += 1
+                raise Rejected(503, "no device behind this gateway")
+            return "device"
+        if self.offload == "never":
+            return "device"
+        if self.offload == "always" or self.ser is None:
+            return "host"
+        if not self.in_sync:
+            self.metrics.counts["offload_unavailable"] += 1
+            return "host"
+        if self.service_s is not None:
+            eta = (len(self.queue) + self.in_flight + 1) * self.service_s
+            if eta > min(self.target_s, deadline - time.monotonic()):
+                self.metrics.counts["offload_load"] += 1
+                return "host"
+        return "device"
+
+    def _admit(self, client, deadline, backend):
+        if self.per_client[client] >= self.client_limit:
+            self.metrics.counts["rejected_client"] += 1
+            raise Rejected(429, f"client {client!r} has {self.client_limit} requests outstanding")
+        if backend == "host":
+            return
+        if len(self.queue) >= self.queue_limit:
+            self.metrics.counts["rejected_queue"] += 1
+            raise Rejected(503, "queue full")
+        if self.service_s is not None:
+            eta = (len(self.queue) + self.in_flight + 1) * self.service_s
+            if time.monotonic() + eta > deadline:
+                self.metrics.counts["rejected_deadline"] += 1
+                raise Rejected(503, f"deadline cannot be met, about {eta * 1e3:.0f} ms of work queued")
+
+    async def classify(self, image, client, deadline, device_only=False):
+        """
+        Classify one image on the device or the host; returns (pred, backend), raises Rejected.
+        device_only requests never go to the host model.
+        """
+        backend = self._route(deadline, device_only)
+        self._admit(client, deadline, backend)
+        req = Request(image, client, deadline, asyncio.get_running_loop().create_future(), device_only)
+        if backend == "host":
+            self._start_local(req)
+        else:
+            self.queue.append(req)
+            self._wakeup.set()
+        self.per_client[client] += 1
+        self.metrics.counts["accepted"] += 1
+        try:
+            return await asyncio.wait_for(req.future, timeout=max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            # wait_for cancelled the future, so the device task skips it if still queued
+            self.metrics.counts["expired"] += 1
+            raise Rejected(504, "deadline exceeded") from None
+        finally:
+            self.per_client[client] -= 1
+            if not self.per_client[client]:
+                del self.per_client[client]
+
+    async def run(self):
+        """Device task: drain the queue in batches until cancelled"""
+        loop = asyncio.get_running_loop()
+        if self.ser is None:
+            return
+        while True:
+            if not self.queue:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(),
+                                           timeout=self.keepalive_s if self.in_sync else RECHECK_S)
+                except asyncio.TimeoutError:
+                    try:
+                        self.in_sync = await loop.run_in_executor(self._device, self._keepalive)
+                    except Exception as e:  # port gone: stay on the host, try again later
+                        print(f"WARNING: keepalive failed: {e}")
+                        self.in_sync = False
+                    self.metrics.counts["keepalive"] += 1
+                    continue
+            if self.batch_wait_s and len(self.queue) < self.max_batch:
+                await asyncio.sleep(self.batch_wait_s)
+            batch = []
+            while self.queue and len(batch) < self.max_batch:
+                req = self.queue.popleft()
+                if not req.future.done():
+                    batch.append(req)
+            if not batch:
+                continue
+
+            t0 = time.monotonic()
+            for req in batch:
+                req.t_dispatch = t0
+            self.in_flight = len(batch)
+
+            def deliver(i, pred):
+                loop.call_soon_threadsafe(self._deliver, batch[i], pred)
+            try:
+                await loop.run_in_executor(self._device, self._run_batch, [r.image for r in batch], deliver)
+            except Exception as e:  # serial port errors: fail the batch, keep serving
+                for req in batch:
+                    self._device_failed(req, f"device error: {e}")
+
+            dt = time.monotonic() - t0
+            self.in_flight = 0
+            self.metrics.batches += 1
+            self.metrics.batched += len(batch)
+            self.metrics.busy_s += dt
+            per_image = dt / len(batch)
+            self.service_s = per_image if self.service_s is None else (
+                (1 - SERVICE_EWMA) * self.service_s + SERVICE_EWMA * per_image)
+
+    def _run_batch(self, images, deliver):
+        """Device thread: send the batch back to back, report each answer as it arrives"""
+        if self.window > 1:
+            for i, pred in classify_stream(self.ser, images, window=self.window, latency=self.latency):
+                deliver(i, pred)
+            return
+        for i, image in enumerate(images):
+            pred = self.fw.classify(self.ser, image, latency=self.latency)
+            if pred is None and not resync(self.ser):
+                print("WARNING: no SYNC from the device")
+            deliver(i, pred)
+
+    def _keepalive(self):
+        """Device thread: True if the firmware still answers (and is quiet)"""
+        read_responses(self.ser, timeout=0.05, verbose=False)
+        if self.fw.supports('9'):
+            if set_verbosity(self.ser, 0) == 0:
+                return True
+        if resync(self.ser):
+            return True
+        print("WARNING: device is not answering")
+        return False
+
+    def _deliver(self, req, pred):
+        if req.future.done():
+            return  # its deadline already answered it
+        if pred is None:
+            self._device_failed(req, "no prediction from the device")
+            return
+        self.in_sync = True
+        self.metrics.completed(req, time.monotonic(), "device")
+        req.future.set_result((pred, "device"))
+
+    def _device_failed(self, req, reason):
+        if req.future.done():
+            return
+        self.metrics.counts["failed"] += 1
+        self.in_sync = False    # new requests go to the host until a keepalive succeeds
+        if self.offload == "never" or req.device_only:
+            req.future.set_exception(Rejected(502, reason))
+            return
+        self.metrics.counts["fallback"] += 1
+        self._start_local(req)
+
+    def _start_local(self, req):
+        task = asyncio.ensure_future(self._run_local(req))
+        self._local_tasks.add(task)     # the loop only keeps weak references
+        task.add_done_callback(self._local_tasks.discard)
+
+    async def _run_local(self, req):
+        """Answer req with the host model"""
+        req.t_dispatch = time.monotonic()
+        try:
+            pred = await self.local.classify(req.image)
+        except Exception as e:
+            if not req.future.done():
+                req.future.set_exception(Rejected(500, f"host model error: {e}"))
+            return
+        if not req.future.done():
+            self.metrics.completed(req, time.monotonic(), "host")
+            req.future.set_result((pred, "host"))
+
+    def snapshot(self):
+        """Everything GET /metrics reports"""
+        m = self.metrics
+        now = time.monotonic()
+        return {
+            "firmware": self.fw.name if self.fw else None,
+            "pipeline_window": self.window,
+            "in_sync": self.in_sync,
+            "offload": self.offload,
+            "target_ms": round(self.target_s * 1e3, 1),
+            "uptime_s": round(now - m.started, 1),
+            "queue_depth": len(self.queue),
+            "in_flight": self.in_flight,
+            "clients": dict(self.per_client),
+            "requests": dict(m.counts),
+            "throughput_per_s": round(m.throughput(now), 2),
+            "latency_ms": percentiles_ms(m.total),
+            "queued_ms": percentiles_ms(m.queued),
+            "batches": m.batches,
+            "mean_batch": round(m.batched / m.batches, 2) if m.batches else None,
+            "service_ms_per_image": round(self.service_s * 1e3, 2) if self.service_s else None,
+            "device_busy": round(m.busy_s / max(now - m.started, 1e-3), 3),
+        }
+
+# ----------------------------------------------------------------------
+# HTTP/1.1 front end (keep-alive, Content-Length bodies only)
+# ----------------------------------------------------------------------
+def parse_image(headers, body, n_in=INPUT_SIZE):
+    """The posted image at n_in pixels: 28x28 images are downsampled, n_in-pixel ones kept"""
+    sizes = " or ".join(str(n) for n in sorted({INPUT_SIZE, n_in}, reverse=True))
+    if headers.get("content-type", "").startswith("application/json"):
+        image = np.asarray(json.loads(body)["image"], dtype=np.int64)
+        if image.size not in (INPUT_SIZE, n_in) or image.min() < 0 or image.max() > 255:
+            raise ValueError(f"image must be {sizes} values in 0..255")
+        return fit_image(image.astype(np.uint8), n_in)
+    if len(body) not in (INPUT_SIZE, n_in):
+        raise ValueError(f"body must be {sizes} pixel bytes, got {len(body)}")
+    return fit_image(np.frombuffer(body, dtype=np.uint8), n_in)
+
+async def route(gateway, method, path, headers, body, peer, default_deadline_ms):
+    """(status, JSON payload) for one request"""
+    if method == "GET" and path == "/metrics":
+        return 200, gateway.snapshot()
+    if path != "/classify":
+        return 404, {"error": "not found"}
+    if method != "POST":
+        return 405, {"error": "POST an image to /classify"}
+    try:
+        image = parse_image(headers, body, gateway.n_in)
+        deadline_ms = float(headers.get("x-deadline-ms", default_deadline_ms))
+        backend = headers.get("x-backend", "any").lower()
+        if backend not in BACKENDS:
+            raise ValueError(f"X-Backend must be one of {', '.join(BACKENDS)}")
+    except (ValueError, KeyError, TypeError) as e:
+        gateway.metrics.counts["bad_request"] += 1
+        return 400, {"error": str(e)}
+
+    t0 = time.monotonic()
+    client = headers.get("x-client", peer)
+    try:
+        pred, backend = await gateway.classify(image, client, t0 + deadline_ms / 1e3, backend == "device")
+    except Rejected as e:
+        return e.status, {"error": e.reason}
+    total_ms = (time.monotonic() - t0) * 1e3
+    return 200, {"pred": pred, "backend": backend, "total_ms": round(total_ms, 2)}
+
+async def handle_http(gateway, default_deadline_ms, reader, writer):
+    peer = writer.get_extra_info("peername")
+    peer = peer[0] if isinstance(peer, tuple) else "unix"
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, path, version = request_line.decode("latin-1").split()
+            except ValueError:
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+            status, payload = await route(gateway, method, path.split("?")[0], headers, body,
+                                          peer, default_deadline_ms)
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+            data = json.dumps(payload).encode()
+            writer.write(f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                         f"Content-Type: application/json\r\n"
+                         f"Content-Length: {len(data)}\r\n"
+                         f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(gateway, args):
+    def handler(reader, writer):
+        return handle_http(gateway, args.deadline_ms, reader, writer)
+
+    if args.unix:
+        server = await asyncio.start_unix_server(handler, path=args.unix)
+        where = args.unix
+    else:
+        server = await asyncio.start_server(handler, args.host, args.http_port)
+        where = f"http://{args.host}:{args.http_port}"
+    device_task = asyncio.create_task(gateway.run())
+    device = gateway.fw.name if gateway.ser is not None else "no device"
+    print(f"Serving {device} on {where}  (window {gateway.window}, batch {gateway.max_batch}, "
+          f"offload {gateway.offload})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        device_task.cancel()
+
+def main():
+    parser = argparse.ArgumentParser(description="Share one board between local clients over HTTP")
+    parser.add_argument("port", nargs="?", default="COM6")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("--sim", choices=tuple(FIRMWARES), help="use an in-process simulated device")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--http-port", type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument("--unix", help="serve on this Unix socket path instead of TCP")
+    parser.add_argument("--max-batch", type=int, default=16, help="requests sent back to back per batch")
+    parser.add_argument("--batch-wait-ms", type=float, default=2.0,
+                        help="linger for more requests before sending a short batch")
+    parser.add_argument("--queue-limit", type=int, default=256)
+    parser.add_argument("--client-limit", type=int, default=32, help="outstanding requests per client")
+    parser.add_argument("--deadline-ms", type=float, default=DEFAULT_DEADLINE_MS,
+                        help="deadline of requests without X-Deadline-Ms")
+    parser.add_argument("--no-pipeline", action="store_true", help="one image at a time even with RX=IRQ")
+    parser.add_argument("--keepalive", type=float, default=DEFAULT_KEEPALIVE_S,
+                        help="seconds idle before the session is checked (0: never)")
+    parser.add_argument("--offload", choices=OFFLOAD_MODES, default="load",
+                        help="when requests go to the host integer model instead of the device")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help="offload requests the device queue would not start and finish within this")
+    parser.add_argument("--local-weights", help="weights_*.h directory of the host model "
+                                                "(default: the compiled-in weights of the detected firmware)")
+    args = parser.parse_args()
+
+    ser = fw = None
+    n_in = INPUT_SIZE
+    window = 1
+    try:
+        if args.sim:
+            from sim_device import NnCoreSimulatedDevice, SimulatedDevice
+            ser = (SimulatedDevice if args.sim == "sw" else NnCoreSimulatedDevice)(args.baud)
+        else:
+            ser = open_port(args.port, args.baud)
+    except OSError as e:
+        if args.offload == "never":
+            raise SystemExit(f"Cannot open {args.port}: {e}")
+        print(f"Cannot open {args.port} ({e}); answering from the host model only")
+    if ser is not None:
+        fw = detect_firmware(ser) or FIRMWARES["sw"]
+        if fw.supports('9') and set_verbosity(ser, 0) is None:
+            print("Device did not answer '9'; its debug chatter stays on")
+        info = query_info(ser) if fw.supports('3') else ""
+        n_in = info_input_size(info)
+        if n_in != INPUT_SIZE:
+            print(f"Device takes {n_in}-pixel images; 28x28 requests are downsampled")
+        if not args.no_pipeline and supports_pipeline(info):
+            window = PIPELINE_WINDOW
+        read_responses(ser, timeout=0.5, verbose=False)
+
+    local = None
+    if args.offload != "never":
+        local = LocalModel(local_weights(ser, fw, args.local_weights))
+        if ser is not None and not weights_match(info, local.weights):
+            print("Device runs uploaded weights the host model does not have; offloading is off "
+                  "(pass their headers with --local-weights)")
+            local = None
+        elif ser is None:
+            n_in = local.weights["w1"].shape[1]
+        elif cascade_margin(info) is not None:
+            print(f"Device runs a CASCADE build (margin {cascade_margin(info)}), which the host model does not "
+                  "reproduce; offloading is off")
+            local = None
+        elif local.weights["w1"].shape[1] != n_in:
+            print(f"Host model takes {local.weights['w1'].shape[1]} pixels, the device {n_in}; "
+                  "offloading is off (pass matching headers with --local-weights)")
+            local = None
+
+    gateway = Gateway(ser, fw, window, args.max_batch, args.batch_wait_ms / 1e3,
+                      args.queue_limit, args.client_limit, args.keepalive or None,
+                      local, args.offload, args.target_ms / 1e3, n_in)
+    try:
+        asyncio.run(serve(gateway, args))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if ser is not None:
+            ser.close()
+
+if __name__ == "__main__":
+    main()
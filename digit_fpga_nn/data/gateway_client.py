@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Client for gateway.py, and a load generator for it
+
+GatewayClient keeps one HTTP/1.1 connection to the gateway (TCP or Unix
+socket) and classifies images with it; use one per thread.
+session_client() is what one-shot tools call first: it returns a client if
+a gateway is running at $MLP_GATEWAY (host:port or a socket path, default
+127.0.0.1:8784), so they skip opening and settling the serial port. Its
+requests carry X-Backend: device, so a one-shot answer always comes from
+the board, never from the gateway's host model.
+
+The load test sends t10k images from several concurrent clients, then
+prints accuracy, which backend answered, throughput, client-side latency
+percentiles, how many requests were refused and why, and the gateway's own
+/metrics.
+
+Usage:
+    python gateway_client.py -n 200 -c 8
+    python gateway_client.py --unix /tmp/mlp.sock -n 50 --deadline-ms 2000
+    python gateway_client.py --metrics
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from gateway import DEFAULT_HTTP_PORT
+from sendToNN import load_test_set
+
+SESSION_ENV = "MLP_GATEWAY"
+
+class GatewayError(Exception):
+    def __init__(self, status, reason):
+        super().__init__(f"{status}: {reason}")
+        self.status = status
+        self.reason = reason
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=60.0):
+        super().__init__("localhost", timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+class GatewayClient:
+    """
+    Args:
+        host, port: gateway.py TCP address
+        unix: Unix socket path, used instead of host/port
+        client: X-Client name the gateway applies its per-client limit to
+        deadline_ms: X-Deadline-Ms of every request (None: the gateway default)
+        backend: X-Backend of every request: "device" to refuse host-model
+            answers, None to let the gateway offload
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_HTTP_PORT, unix=None, client=None, deadline_ms=None,
+                 timeout=60.0, backend=None):
+        if unix:
+            self.conn = UnixHTTPConnection(unix, timeout)
+        else:
+            self.conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        self.headers = {}
+        if client:
+            self.headers["X-Client"] = client
+        if deadline_ms is not None:
+            self.headers["X-Deadline-Ms"] = str(deadline_ms)
+        if backend:
+            self.headers["X-Backend"] = backend
+
+    def _request(self, method, path, body=None, headers=None):
+        self.conn.request(method, path, body=body, headers=dict(self.headers, **(headers or {})))
+        resp = self.conn.getresponse()
+        payload = json.loads(resp.read())
+        if resp.status != 200:
+            raise GatewayError(resp.status, payload.get("error", ""))
+        return payload
+
+    def classify(self, image_flat):
+        """Prediction for one 784-pixel image; raises GatewayError when the gateway refuses it"""
+        return self.classify_tagged(image_flat)[0]
+
+    def classify_tagged(self, image_flat):
+        """(prediction, backend) where backend is "device" or "host", the side that answered"""
+        body = np.asarray(image_flat, dtype=np.uint8).tobytes()
+        reply = self._request("POST", "/classify", body, {"Content-Type": "application/octet-stream"})
+        return reply["pred"], reply.get("backend", "device")
+
+    def metrics(self):
+        return self._request("GET", "/metrics")
+
+    def close(self):
+        self.conn.close()
+
+def session_client(address=None, client=None, backend="device"):
+    """
+    A GatewayClient for the running gateway, or None if there is none
+
+    address is "host:port" or a Unix socket path; default $MLP_GATEWAY,
+    then 127.0.0.1:DEFAULT_HTTP_PORT. backend as for GatewayClient.
+    """
+    address = address or os.environ.get(SESSION_ENV) or f"127.0.0.1:{DEFAULT_HTTP_PORT}"
+    if "/" in address:
+        gc = GatewayClient(unix=address, client=client, timeout=2.0, backend=backend)
+    else:
+        host, _, port = address.rpartition(":")
+        gc = GatewayClient(host or "127.0.0.1", int(port), client=client, timeout=2.0, backend=backend)
+    try:
+        gc.metrics()
+    except (OSError, http.client.HTTPException, GatewayError, ValueError):
+        # nothing listening, or not a gateway that answers: use the port directly
+        gc.close()
+        return None
+    gc.conn.timeout = 60.0  # only the probe needs to fail fast
+    gc.conn.sock.settimeout(gc.conn.timeout)
+    return gc
+
+def load_test(images, labels, indices, clients, connect):
+    """Send images[indices] from `clients` threads; returns (results, seconds)"""
+    results = {}     # index -> (prediction or None, HTTP status, seconds, backend)
+    lock = threading.Lock()
+    todo = iter(indices)
+
+    def worker(k):
+        gc = connect(f"load-{k}")
+        try:
+            while True:
+                with lock:
+                    i = next(todo, None)
+                if i is None:
+                    return
+                t0 = time.perf_counter()
+                try:
+                    (pred, backend), status = gc.classify_tagged(images[i]), 200
+                except GatewayError as e:
+                    pred, backend, status = None, None, e.status
+                results[i] = (pred, status, time.perf_counter() - t0, backend)
+        finally:
+            gc.close()
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for gateway.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument("--unix", help="gateway Unix socket path")
+    parser.add_argument("-n", "--count", type=int, default=100)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("-c", "--clients", type=int, default=4, help="concurrent clients")
+    parser.add_argument("--deadline-ms", type=float, help="per-request deadline (default: the gateway's)")
+    parser.add_argument("--metrics", action="store_true", help="only print the gateway's /metrics")
+    args = parser.parse_args()
+
+    def connect(client=None):
+        return GatewayClient(args.host, args.port, args.unix, client, args.deadline_ms)
+
+    if not args.metrics:
+        images, labels, img_path = load_test_set()
+        indices = range(args.start, min(args.start + args.count, len(images)))
+        print(f"{len(indices)} images from {img_path}, {args.clients} clients")
+        results, seconds = load_test(images, labels, indices, args.clients, connect)
+
+        answered = {i: r for i, r in results.items() if r[0] is not None}
+        refused = Counter(r[1] for r in results.values() if r[0] is None)
+        correct = sum(r[0] == labels[i] for i, r in answered.items())
+        lat = np.array([r[2] for r in answered.values()]) * 1e3
+        print(f"Answered {len(answered)}/{len(results)}   refused: "
+              + (", ".join(f"{n} x {s}" for s, n in sorted(refused.items())) or "none"))
+        if answered:
+            backends = Counter(r[3] for r in answered.values())
+            print("Answered by: " + ", ".join(f"{b} {n}" for b, n in sorted(backends.items())))
+            print(f"Accuracy: {correct}/{len(answered)} = {100.0 * correct / len(answered):.2f}%")
+            print(f"Throughput: {len(answered) / seconds:.1f} images/s")
+            print(f"Latency ms: p50 {np.percentile(lat, 50):.1f}  p95 {np.percentile(lat, 95):.1f}"
+                  f"  max {lat.max():.1f}")
+
+    gc = connect()
+    print(json.dumps(gc.metrics(), indent=2))
+    gc.close()
+
+if __name__ == "__main__":
+    main()
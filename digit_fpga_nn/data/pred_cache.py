@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Persistent prediction cache for the UART tools
+
+Classifying an image over the link takes about a second at 9600 baud, and
+evaluation sessions keep resending the same images. PredictionCache maps
+sha256(image bytes) + a firmware/weights fingerprint to the device's answer,
+evicts least-recently-used entries beyond its capacity and persists to a
+JSON file, so a repeated evaluation only sends the images it has not seen
+with this firmware and these weights.
+
+The fingerprint is whatever identifies the answering model: the firmware
+adapter key, its INFO: line and a digest of the weight artifacts the build
+used (see FirmwareAdapter.fingerprint() in sendToNN.py). Rebuilding with new
+weights changes the digest, so stale answers are never returned.
+
+Usage:
+    python pred_cache.py                 # show cache statistics
+    python pred_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CACHE = "pred_cache.json"
+DEFAULT_CAPACITY = 50000
+FORMAT_VERSION = 1
+
+def image_digest(image_flat):
+    return hashlib.sha256(np.asarray(image_flat, dtype=np.uint8).tobytes()).hexdigest()
+
+def files_digest(paths):
+    """sha256 over the names and contents of the given files (missing files count too)"""
+    h = hashlib.sha256()
+    for path in sorted(Path(p) for p in paths):
+        h.update(path.name.encode())
+        h.update(path.read_bytes() if path.exists() else b"<missing>")
+    return h.hexdigest()
+
+def fingerprint(*parts, files=()):
+    """Short digest identifying a firmware build: free-form parts plus weight files"""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode())
+        h.update(b"|")
+    if files:
+        h.update(files_digest(files).encode())
+    return h.hexdigest()[:16]
+
+class PredictionCache:
+    """
+    Bounded LRU of device answers, persisted as JSON
+
+    Args:
+        path: Cache file, or None for an in-memory cache
+        capacity: Entries kept before the least recently used is evicted
+        autosave_every: Save after this many new entries (and on close)
+    """
+
+    def __init__(self, path=DEFAULT_CACHE, capacity=DEFAULT_CAPACITY, autosave_every=20):
+        self.path = Path(path) if path is not None else None
+        self.capacity = capacity
+        self.autosave_every = autosave_every
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._dirty = 0
+        self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def key(image_flat, fp):
+        return f"{fp}:{image_digest(image_flat)}"
+
+    def get(self, image_flat, fp):
+        """The stored answer for this image and fingerprint, or None"""
+        k = self.key(image_flat, fp)
+        value = self._entries.get(k)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(k)
+        self.hits += 1
+        return value
+
+    def put(self, image_flat, fp, value):
+        """Store an answer (a JSON-serializable value, usually {"pred": d})"""
+        k = self.key(image_flat, fp)
+        self._entries[k] = value
+        self._entries.move_to_end(k)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        self._dirty += 1
+        if self._dirty >= self.autosave_every:
+            self.save()
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty += 1
+        self.save()
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            print(f"WARNING: ignoring unreadable prediction cache {self.path}: {e}")
+            return
+        if data.get("version") != FORMAT_VERSION:
+            return
+        # stored oldest first, so insertion order is the LRU order
+        for k, value in data.get("entries", [])[-self.capacity:]:
+            self._entries[k] = value
+
+    def save(self):
+        """Write the cache atomically (temp file + rename)"""
+        if self.path is None or not self._dirty:
+            return
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"version": FORMAT_VERSION, "entries": list(self._entries.items())}))
+        os.replace(tmp, self.path)
+        self._dirty = 0
+
+    def close(self):
+        self.save()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        rate = f" ({100.0 * self.hits / lookups:.0f}% hit)" if lookups else ""
+        return f"cache: {len(self)} entries, {self.hits} hits / {self.misses} misses{rate}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the prediction cache")
+    parser.add_argument("--cache", default=DEFAULT_CACHE)
+    parser.add_argument("--clear", action="store_true")
+    args = parser.parse_args()
+
+    cache = PredictionCache(args.cache)
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {args.cache}")
+        return
+    per_fp = {}
+    for k in cache._entries:
+        fp = k.split(":", 1)[0]
+        per_fp[fp] = per_fp.get(fp, 0) + 1
+    print(f"{args.cache}: {len(cache)} entries (capacity {cache.capacity})")
+    for fp, n in sorted(per_fp.items(), key=lambda kv: -kv[1]):
+        print(f"  {fp}  {n}")
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,18 @@ UART Configuration: 9600 baud, 8N1
 
 import serial
 import numpy as np
+import struct
 import sys
 import time
+import zlib
+from collections import deque
 from pathlib import Path
 
+from pred_cache import PredictionCache, DEFAULT_CACHE, REPO_ROOT, fingerprint
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "training"))
+from load_mnist import downsample, side_of  # noqa: E402
+
 def load_mnist_images(filepath):
     """Load MNIST images from IDX file format"""
     with open(filepath, 'rb') as f:
@@ -40,14 +48,82 @@ def load_mnist_labels(filepath):
         
     return labels
 
-def send_image_uart(ser, image_flat, verbose=True):
+def encode_image(image_flat, chunk_size=32):
+    """
+    Split a flattened image into the byte chunks written to the UART
+
+    Args:
+        image_flat: Flattened image (784 bytes, fewer for reduced-resolution firmware)
+        chunk_size: Bytes per write
+
+    Returns:
+        List of bytes objects
     """
-    Send a 784-byte flattened image to FPGA via UART
+    img_bytes = np.asarray(image_flat, dtype=np.uint8).tobytes()
+    return [img_bytes[i:i+chunk_size] for i in range(0, len(img_bytes), chunk_size)]
+
+def parse_prediction(line):
+    """Return the digit from a 'PRED:<d>' line, or None for any other line"""
+    if not line.startswith("PRED:"):
+        return None
+    return int(line.split(':')[1])
+
+def load_test_set():
+    """
+    Load the t10k images and labels from the usual locations
+
+    Returns:
+        (images, labels, path) or raises FileNotFoundError
+    """
+    # Try multiple possible locations
+    data_files = [
+        ('t10k-images.idx3-ubyte', 't10k-labels.idx1-ubyte'),
+        ('../data/t10k-images.idx3-ubyte', '../data/t10k-labels.idx1-ubyte'),
+        ('data/t10k-images.idx3-ubyte', 'data/t10k-labels.idx1-ubyte'),
+    ]
+    for img_path, lbl_path in data_files:
+        try:
+            return load_mnist_images(img_path), load_mnist_labels(lbl_path), img_path
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError("Could not find MNIST data files")
+
+class LatencyTracker:
+    """
+    Timeouts derived from the latencies of recent requests
+
+    Each phase ("ready": command to READY, "pred": last pixel to PRED) keeps
+    a window of observed latencies; its timeout is p99 x k, clamped between
+    floor and the fixed default, which is also used until min_samples
+    requests have been seen.
+    """
+    DEFAULTS = {"ready": 10.0, "pred": 20.0}
+
+    def __init__(self, k=3.0, window=200, min_samples=20, floor=0.5):
+        self.k = k
+        self.min_samples = min_samples
+        self.floor = floor
+        self.samples = {phase: deque(maxlen=window) for phase in self.DEFAULTS}
+
+    def record(self, phase, seconds):
+        self.samples[phase].append(seconds)
+
+    def timeout(self, phase):
+        default = self.DEFAULTS[phase]
+        samples = self.samples[phase]
+        if len(samples) < self.min_samples:
+            return default
+        return min(default, max(self.floor, self.k * float(np.percentile(samples, 99))))
+
+def send_image_uart(ser, image_flat, verbose=True, latency=None):
+    """
+    Send a flattened image to FPGA via UART
     
     Args:
         ser: Serial port object
-        image_flat: Flattened 784-byte numpy array
+        image_flat: Flattened image at the firmware's input size (fit_image())
         verbose: Print debug messages
+        latency: LatencyTracker; timeouts come from it and it records this request
     
     Returns:
         Prediction (int) or None if failed
@@ -57,7 +133,7 @@ def send_image_uart(ser, image_flat, verbose=True):
         print("Waiting for FPGA READY signal...")
     
     ready = False
-    timeout = 10  # seconds
+    timeout = latency.timeout("ready") if latency else LatencyTracker.DEFAULTS["ready"]
     start_time = time.time()
     all_data = ""
     
@@ -82,8 +158,11 @@ def send_image_uart(ser, image_flat, verbose=True):
             except Exception as e:
                 if verbose:
                     print(f"Read error: {e}")
-        time.sleep(0.05)  # Shorter sleep for faster response
+        else:
+            time.sleep(0.005)  # Only sleep while the line is idle
     
+    if ready and latency:
+        latency.record("ready", time.time() - start_time)
     if not ready:
         print("ERROR: FPGA did not send READY signal")
         print(f"Received data: {all_data}")
@@ -91,20 +170,18 @@ def send_image_uart(ser, image_flat, verbose=True):
     
     # Send image data in chunks to avoid buffer overflow
     if verbose:
-        print(f"Sending image data ({INPUT_SIZE} bytes) in chunks...")
+        print(f"Sending image data ({len(image_flat)} bytes) in chunks...")
     
     chunk_size = 32  # Send 32 bytes at a time
     bytes_sent = 0
-    img_bytes = image_flat.tobytes()
     
-    for i in range(0, INPUT_SIZE, chunk_size):
-        chunk = img_bytes[i:i+chunk_size]
+    for i, chunk in enumerate(encode_image(image_flat, chunk_size)):
         ser.write(chunk)
         ser.flush()
         bytes_sent += len(chunk)
         time.sleep(0.05)  # 50ms delay between chunks to prevent buffer overflow
-        if verbose and i % 128 == 0:
-            print(f"Sent {bytes_sent}/{INPUT_SIZE} bytes", end='\r')
+        if verbose and (i * chunk_size) % 128 == 0:
+            print(f"Sent {bytes_sent}/{len(image_flat)} bytes", end='\r')
     
     if verbose:
         print(f"\nSent {bytes_sent} bytes total")
@@ -113,7 +190,7 @@ def send_image_uart(ser, image_flat, verbose=True):
     if verbose:
         print("Waiting for prediction...")
     
-    timeout = 20  # seconds
+    timeout = latency.timeout("pred") if latency else LatencyTracker.DEFAULTS["pred"]
     start_time = time.time()
     prediction = None
     
@@ -125,20 +202,169 @@ def send_image_uart(ser, image_flat, verbose=True):
                     if verbose:
                         print(f"FPGA: {line}")
                     
-                    if line.startswith("PRED:"):
-                        pred_str = line.split(':')[1]
-                        prediction = int(pred_str)
+                    prediction = parse_prediction(line)
+                    if prediction is not None:
+                        if latency:
+                            latency.record("pred", time.time() - start_time)
                         return prediction
+                    elif line.startswith("ERROR: Received only") or line.startswith("ERR:RX"):
+                        # the firmware dropped a partial image (lost byte)
+                        print(line)
+                        return None
                     elif line.startswith("HW:") or line.startswith("SW"):
                         print(f"DEBUG: {line}")
             except Exception as e:
                 if verbose:
                     print(f"Parse error: {e}")
-        time.sleep(0.1)
+        else:
+            time.sleep(0.01)  # Only sleep while the line is idle
     
     print("ERROR: Did not receive prediction")
     return None
 
+def parse_bench(line):
+    """
+    Parse 'BENCH:K=<k>,L1=min/mean/max,...,PRED=<d>' from the benchmark command
+
+    Returns:
+        {"K": k, "PRED": d, "stages": {"L1": (min, mean, max), ...}} or None
+    """
+    if not line.startswith("BENCH:"):
+        return None
+    result = {"stages": {}}
+    for field in line[len("BENCH:"):].split(','):
+        name, _, value = field.partition('=')
+        if '/' in value:
+            result["stages"][name] = tuple(int(v) for v in value.split('/'))
+        else:
+            result[name] = int(value)
+    return result
+
+def run_device_benchmark(ser, iterations=32, timeout=30.0, verbose=False):
+    """
+    Time `iterations` inferences of the stored image on the device
+
+    Sends '5' plus K as two little-endian bytes and waits for the BENCH: line.
+
+    Returns:
+        Parsed result from parse_bench() or None if failed
+    """
+    ser.write(b'5' + int(iterations).to_bytes(2, 'little'))
+    ser.flush()
+
+    start_time = time.time()
+    while (time.time() - start_time) < timeout:
+        if ser.in_waiting > 0:
+            line = ser.readline().decode('utf-8', errors='ignore').strip()
+            if line and verbose:
+                print(f"FPGA: {line}")
+            result = parse_bench(line)
+            if result is not None:
+                return result
+            if line.startswith("ERROR"):
+                print(f"ERROR: {line}")
+                return None
+        time.sleep(0.05)
+
+    print("ERROR: Did not receive benchmark result")
+    return None
+
+def print_bench(result):
+    """Print one benchmark result as a min/mean/max table"""
+    print(f"Benchmark K={result['K']} (pred={result.get('PRED')})")
+    print(f"  {'stage':<6s} {'min':>10s} {'mean':>10s} {'max':>10s}  cycles")
+    for name, (lo, mean, hi) in result["stages"].items():
+        print(f"  {name:<6s} {lo:10d} {mean:10d} {hi:10d}")
+
+SWEEP_BASE_IMAGE = 0x01   # mlp.c 'P' flags: sweep over the last image instead of zeros
+SWEEP_LOGITS = 0x02       # mlp.c 'P' flags: also send every pixel's logits
+SWEEP_SHADES = " .:-=+*#%@"
+
+def run_pixel_sweep(ser, value=1, base=None, logits=False, idle_timeout=5.0, verbose=False):
+    """
+    Single-pixel sensitivity sweep on the device (mlp.c command 'P')
+
+    The firmware classifies, for every pixel i, the base image with
+    x[i] = value and streams back the table: one SWL: line of logit changes
+    per pixel (with logits) and one SWPRED: line with all predictions. That
+    is one exchange instead of one image round trip per pixel. The base is
+    all zeros, or base sent ahead as a framed '8' request.
+
+    Returns:
+        {"value", "pred": base prediction, "base": base logits,
+         "preds": (n,) array, "deltas": (n, 10) logit changes or None,
+         "received": bytes read} or None if failed
+    """
+    request = b''
+    flags = SWEEP_LOGITS if logits else 0
+    if base is not None:
+        request = framed_request(base)
+        flags |= SWEEP_BASE_IMAGE
+    ser.write(request + b'P' + bytes([max(0, min(255, int(value))), flags]))
+    ser.flush()
+
+    result = None
+    deltas = []
+    received = 0
+    last = time.time()
+    while time.time() - last < idle_timeout:
+        if ser.in_waiting == 0:
+            time.sleep(0.01)
+            continue
+        raw = ser.readline()
+        received += len(raw)
+        last = time.time()
+        line = raw.decode('utf-8', errors='ignore').strip()
+        if line and verbose and not line.startswith("SWL:"):
+            print(f"FPGA: {line}")
+        if line.startswith("ERR"):
+            print(f"ERROR: {line}")
+            return None
+        if line.startswith("SWEEP:N="):
+            fields = dict(f.split('=') for f in line[len("SWEEP:"):].split(','))
+            result = {"value": int(fields["V"]), "pred": int(fields["PRED"])}
+        elif result is None:
+            continue    # the base image's PRED: line and chatter
+        elif line.startswith("SWBASE:"):
+            result["base"] = np.array([int(v) for v in line[len("SWBASE:"):].split(',')])
+        elif line.startswith("SWL:"):
+            deltas.append([int(v) for v in line[len("SWL:"):].split(',')])
+        elif line.startswith("SWPRED:"):
+            result["preds"] = np.array([int(c) for c in line[len("SWPRED:"):]])
+        elif line == "SWEEP:END":
+            if "preds" not in result or (logits and len(deltas) != len(result["preds"])):
+                print(f"ERROR: Incomplete sweep ({len(deltas)} logit lines)")
+                return None
+            result["deltas"] = np.array(deltas) if logits else None
+            result["received"] = received
+            return result
+
+    print("ERROR: Did not receive the sweep")
+    return None
+
+def print_sweep(result):
+    """
+    Render a sweep as side x side maps: the prediction per pixel ('.' where
+    it is the base prediction) and, with logits, how far each pixel moves the
+    base class logit (shades scaled to the largest change, sign in the legend)
+    """
+    preds = result["preds"]
+    side = side_of(len(preds))
+    flipped = int(np.count_nonzero(preds != result["pred"]))
+    print(f"Sweep x[i]={result['value']}: base prediction {result['pred']}, "
+          f"{flipped}/{len(preds)} pixels change it")
+    grid = np.where(preds == result["pred"], '.', preds.astype(str)).reshape(side, side)
+    maps = [["".join(row) for row in grid]]
+    if result["deltas"] is not None:
+        moved = result["deltas"][:, result["pred"]]
+        scale = max(1, int(np.abs(moved).max()))
+        shade = np.array(list(SWEEP_SHADES))[np.abs(moved) * (len(SWEEP_SHADES) - 1) // scale]
+        maps.append(["".join(row) for row in shade.reshape(side, side)])
+        print(f"Base class logit change: min {moved.min()}, max {moved.max()} "
+              f"('{SWEEP_SHADES[-1]}' = {scale}, raised at {int(np.count_nonzero(moved > 0))} pixels)")
+    for rows in zip(*maps):
+        print("  " + "   ".join(rows))
+
 def send_command(ser, command):
     """Send a single character command to FPGA"""
     ser.write(command.encode())
@@ -158,6 +384,301 @@ def read_responses(ser, timeout=3.0, verbose=True):
                 pass
         time.sleep(0.05)
 
+class FirmwareAdapter:
+    """
+    Host-side view of one firmware's UART protocol
+
+    Both firmwares answer '1' with READY, take INPUT_SIZE raw bytes and reply
+    PRED:<d>; they differ in prompts, chatter and the extra commands
+    they support.
+    """
+    key = None
+    name = None
+    menu_marker = None
+    commands = ('0', '1', '4')
+    weight_files = ()       # weight artifacts the build uses, relative to the repo root
+
+    def classify(self, ser, image_flat, verbose=False, latency=None):
+        """Send one image, return the prediction or None"""
+        send_command(ser, '1')
+        return send_image_uart(ser, image_flat, verbose=verbose, latency=latency)
+
+    def supports(self, command):
+        return command in self.commands
+
+    def fingerprint(self, ser=None):
+        """Prediction cache key for this firmware: its INFO: line (if any) and weights digest"""
+        info = query_info(ser) if ser is not None and self.supports('3') else ""
+        # the RX mode and the delta and sweep commands do not change the answers
+        info = ",".join(f for f in info.split(",") if not f.startswith("RX=") and f not in ("DELTA", "SWEEP"))
+        return fingerprint(self.key, info, files=[REPO_ROOT / f for f in self.weight_files])
+
+class MlpFirmware(FirmwareAdapter):
+    """vitis/mlp/mlp.c: software inference on the MicroBlaze"""
+    key = "sw"
+    name = "mlp.c (software)"
+    menu_marker = "=== MENU ==="
+    commands = ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', 'D', 'P')
+    weight_files = tuple(f"vitis/mlp/weights_{t}.h" for t in ("w1", "b1", "w2", "b2", "rq", "cascade"))
+
+class NnCoreFirmware(FirmwareAdapter):
+    """vitis/mult/src/main.c: nn_core accelerator over AXI REG0..REG3"""
+    key = "hw"
+    name = "nn_core (hardware)"
+    menu_marker = "CMD?"
+    weight_files = tuple(f"digit_fpga_nn/hls_nn/weights/vivado_init/{f}.coe"
+                         for f in ("w1_i8", "b1_i32", "w2_i8", "b2_i32"))
+
+FIRMWARES = {fw.key: fw for fw in (MlpFirmware(), NnCoreFirmware())}
+
+def detect_firmware(ser, timeout=2.0):
+    """Send '4' (menu on both firmwares) and pick the adapter from the reply"""
+    if ser.in_waiting > 0:
+        ser.read(ser.in_waiting)
+    send_command(ser, '4')
+    text = ""
+    start_time = time.time()
+    while (time.time() - start_time) < timeout:
+        if ser.in_waiting > 0:
+            text += ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
+            for fw in FIRMWARES.values():
+                if fw.menu_marker in text:
+                    return fw
+        time.sleep(0.05)
+    return None
+
+def query_info(ser, timeout=3.0):
+    """Send '3' and return the firmware's INFO: line, or "" if none arrives"""
+    if ser.in_waiting > 0:
+        ser.read(ser.in_waiting)
+    send_command(ser, '3')
+    start_time = time.time()
+    while (time.time() - start_time) < timeout:
+        if ser.in_waiting > 0:
+            line = ser.readline().decode('utf-8', errors='ignore').strip()
+            if line.startswith("INFO:"):
+                read_responses(ser, timeout=0.3, verbose=False)
+                return line
+        else:
+            time.sleep(0.05)
+    return ""
+
+def info_input_size(info):
+    """Input size from an INFO: line ("INFO:196->32->10,..."), INPUT_SIZE if absent"""
+    head = info[len("INFO:"):].split("->")[0] if info.startswith("INFO:") else ""
+    return int(head) if head.isdigit() else INPUT_SIZE
+
+def fit_image(image, n_in):
+    """A 28x28 image (flat or not) at the firmware's input size, block-averaged as in training"""
+    image = np.asarray(image, dtype=np.uint8).reshape(-1)
+    return image if image.size == n_in else downsample(image, side_of(n_in))
+
+def set_verbosity(ser, level=None, timeout=2.0):
+    """
+    Set (level 0-2) or query (None) the firmware's UART chatter with '9'
+
+    0 = protocol lines only, 1 = plus command echo and banners,
+    2 = plus the per-image progress, prediction and logits lines.
+
+    Returns:
+        the level the firmware reports, or None if it did not answer
+    """
+    if ser.in_waiting > 0:
+        ser.read(ser.in_waiting)
+    ser.write(b'9' + (b'?' if level is None else str(level).encode()))
+    ser.flush()
+    start_time = time.time()
+    while (time.time() - start_time) < timeout:
+        if ser.in_waiting > 0:
+            line = ser.readline().decode('utf-8', errors='ignore').strip()
+            if line.startswith("VERBOSE:"):
+                read_responses(ser, timeout=0.1, verbose=False)
+                return int(line.split(":", 1)[1])
+            if line.startswith("ERROR:Verbosity"):
+                return None
+        else:
+            time.sleep(0.01)
+    return None
+
+def resync(ser, attempts=3, reply_timeout=0.5):
+    """
+    Bring the firmware back to its command prompt after a protocol error
+
+    Stays silent for longer than the firmware's RX idle timeout, so a
+    partial image is dropped, flushes whatever it printed, then sends '0'
+    and waits for SYNC. If the device was still waiting for the first pixel
+    the '0' becomes that pixel and the next attempt succeeds.
+
+    Returns:
+        True once the device answered SYNC
+    """
+    for _ in range(attempts):
+        time.sleep(RX_IDLE_TIMEOUT_S + 0.05)
+        ser.reset_input_buffer()
+        ser.write(b'0')
+        ser.flush()
+        text = ""
+        start_time = time.time()
+        while (time.time() - start_time) < reply_timeout:
+            if ser.in_waiting > 0:
+                text += ser.read(ser.in_waiting).decode('utf-8', errors='ignore')
+                if "SYNC" in text:
+                    read_responses(ser, timeout=0.05, verbose=False)
+                    return True
+            else:
+                time.sleep(0.005)
+    return False
+
+def classify_cached(ser, image_flat, cache=None, fp=None, verbose=True, latency=None):
+    """
+    Classify one image, answering from the prediction cache when this image
+    was already sent to the same firmware/weights; resyncs after a failure
+
+    Returns:
+        (prediction or None, cached)
+    """
+    if cache is not None:
+        hit = cache.get(image_flat, fp)
+        if hit is not None:
+            return hit["pred"], True
+    send_command(ser, '1')
+    prediction = send_image_uart(ser, image_flat, verbose=verbose, latency=latency)
+    if prediction is None:
+        if not resync(ser):
+            print("WARNING: no SYNC from the device")
+    elif cache is not None:
+        cache.put(image_flat, fp, {"pred": prediction})
+    return prediction, False
+
+def supports_pipeline(info):
+    """True if the INFO: line says the firmware buffers requests (mlp.c interrupt RX ring)"""
+    return "RX=IRQ" in info.split(",")
+
+def supports_delta(info):
+    """True if the INFO: line says the firmware takes 'D' pixel deltas"""
+    return "DELTA" in info.split(",")
+
+def supports_sweep(info):
+    """True if the INFO: line says the firmware runs the 'P' pixel sweep"""
+    return "SWEEP" in info.split(",")
+
+def cascade_margin(info):
+    """CASCADE_MARGIN of a CASCADE build (INFO: CASCADE=<margin>), or None"""
+    fields = [f for f in info.split(",") if f.startswith("CASCADE=")]
+    return int(fields[0][len("CASCADE="):]) if fields else None
+
+def framed_request(image):
+    """Command '8': the image and its CRC32"""
+    image = np.asarray(image, dtype=np.uint8).tobytes()
+    return b'8' + image + struct.pack('<I', zlib.crc32(image))
+
+def delta_request(base, image):
+    """Command 'D': the pixels of image that differ from base, as (u16 index, u8 value), and a CRC32"""
+    image = np.asarray(image, dtype=np.uint8).reshape(-1)
+    changed = np.flatnonzero(np.asarray(base, dtype=np.uint8).reshape(-1) != image)
+    entries = np.empty(len(changed), dtype=[('index', '<u2'), ('value', 'u1')])
+    entries['index'] = changed
+    entries['value'] = image[changed]
+    body = struct.pack('<H', len(changed)) + entries.tobytes()
+    return b'D' + body + struct.pack('<I', zlib.crc32(body))
+
+class FramedEncoder:
+    """Requests for classify_stream(): every image as a framed '8' request"""
+
+    def encode(self, image):
+        return framed_request(image)
+
+    def reset(self):
+        pass
+
+class DeltaEncoder(FramedEncoder):
+    """
+    Requests for classify_stream() on a sequence of similar frames
+
+    The firmware keeps the last image and its layer-1 sums, so a frame that
+    differs in a few pixels goes out as a 'D' request with just those pixels
+    (3 bytes each): fewer bytes on the wire and HIDDEN_SIZE MACs per pixel
+    on the device. Whichever of '8' and 'D' is shorter is sent. reset()
+    (after an error, when the device image is unknown) makes the next frame
+    a full one.
+    """
+
+    def __init__(self):
+        self.base = None
+        self.sent = {"8": 0, "D": 0}
+
+    def encode(self, image):
+        full = framed_request(image)
+        request = full
+        if self.base is not None:
+            delta = delta_request(self.base, image)
+            if len(delta) < len(full):
+                request = delta
+        self.base = np.array(image, dtype=np.uint8).reshape(-1)
+        self.sent[chr(request[0])] += 1
+        return request
+
+    def reset(self):
+        self.base = None
+
+def classify_stream(ser, images, window=None, latency=None, encoder=None):
+    """
+    Classify images back to back with up to `window` requests in flight
+    (default PIPELINE_WINDOW)
+
+    Only for firmware with the interrupt RX ring (supports_pipeline()): it
+    buffers the next request while it runs inference on the current one, so
+    requests go out without waiting for READY and the link never idles.
+    Each request is the framed command '8' + image + CRC32 (or what
+    encoder makes of the image, e.g. DeltaEncoder): a lost byte fails the
+    CRC and the device drains the line instead of reading the following
+    pixels as commands. PRED: lines come back in request order. On an
+    error line or a timeout the device is resynced, the requests in flight
+    are answered None and the encoder is reset.
+    latency only sets the timeout, per-request times are not observable here.
+
+    Yields:
+        (index into images, prediction or None)
+    """
+    window = window or PIPELINE_WINDOW
+    encoder = encoder or FramedEncoder()
+    pending = deque()
+    next_i = 0
+    n_in = np.asarray(images[0]).size if len(images) else INPUT_SIZE
+    wire_s = window * (n_in + 5) * 10.0 / ser.baudrate
+    while next_i < len(images) or pending:
+        while next_i < len(images) and len(pending) < window:
+            ser.write(encoder.encode(images[next_i]))
+            pending.append(next_i)
+            next_i += 1
+        ser.flush()
+
+        timeout = latency.timeout("pred") if latency else LatencyTracker.DEFAULTS["pred"]
+        deadline = time.time() + wire_s + timeout
+        failed = None
+        while time.time() < deadline:
+            if ser.in_waiting == 0:
+                time.sleep(0.005)  # Only sleep while the line is idle
+                continue
+            line = ser.readline().decode('utf-8', errors='ignore').strip()
+            prediction = parse_prediction(line)
+            if prediction is not None:
+                yield pending.popleft(), prediction
+                break
+            if line.startswith("ERR:"):
+                failed = line
+                break
+        else:
+            failed = "ERROR: Did not receive prediction"
+
+        if failed is not None:
+            print(failed)
+            encoder.reset()
+            if not resync(ser):
+                print("WARNING: no SYNC from the device")
+            while pending:
+                yield pending.popleft(), None
+
 def test_connection(ser):
     """Test if FPGA is responding"""
     print("\n" + "="*50)
@@ -189,21 +710,26 @@ def test_connection(ser):
         print("4. Check baud rate is 9600")
         return False
 
-def interactive_mode(ser, images, labels):
-    """Interactive mode for testing"""
+def interactive_mode(ser, images, labels, cache=None, fp=None):
+    """Interactive mode for testing (t and r answer repeats from the cache)"""
+    n_in = images[0].size  # main() has fitted the images to the firmware
     print("\n" + "="*50)
     print("Interactive Mode")
     print("="*50)
     print("Commands:")
     print("  t <index> - Test image at index")
     print("  r <n>     - Test n random images")
-    print("  z         - Send all-zero image (784 bytes of 0)")
+    print(f"  z         - Send all-zero image ({n_in} bytes of 0)")
     print("  p <i> [v] - Send image with x[i]=v, rest 0 (v=1 if omitted; e.g. p 0 255)")
+    print("  m [v] [i] - Pixel sweep on the device: x[j]=v for every j, over zeros or image i (ml: with logits)")
     print("  s         - Trigger FPGA self-test")
+    print("  b [k]     - Benchmark k inferences of the stored image (cycles per stage)")
     print("  i         - Display FPGA network info")
+    print("  v [l]     - Show / set FPGA chatter (0 quiet, 1 normal, 2 debug)")
     print("  c         - Test connection")
     print("  q         - Quit")
     print("="*50)
+    latency = LatencyTracker()
     
     while True:
         cmd = input("\nEnter command: ").strip().lower()
@@ -233,23 +759,21 @@ def interactive_mode(ser, images, labels):
                 print(f"True label: {labels[idx]}")
                 print(f"{'='*50}")
                 
-                # Send command to receive image
-                send_command(ser, '1')
-                time.sleep(0.5)
-                
-                # Send image
+                # Send image (unless the cache already has the answer)
                 image_flat = images[idx].flatten()
-                prediction = send_image_uart(ser, image_flat)
+                prediction, cached = classify_cached(ser, image_flat, cache, fp, latency=latency)
                 
                 if prediction is not None:
                     correct = "✓ CORRECT" if prediction == labels[idx] else "✗ WRONG"
-                    print(f"\nResult: Pred={prediction}, True={labels[idx]} {correct}")
+                    note = " (cached)" if cached else ""
+                    print(f"\nResult: Pred={prediction}, True={labels[idx]} {correct}{note}")
                 else:
                     print("\nFailed to get prediction")
                 
                 # Read any remaining responses
-                time.sleep(0.5)
-                read_responses(ser, timeout=1.0, verbose=False)
+                if not cached:
+                    time.sleep(0.5)
+                    read_responses(ser, timeout=1.0, verbose=False)
                 
             except ValueError:
                 print("Invalid index")
@@ -270,35 +794,37 @@ def interactive_mode(ser, images, labels):
                 
                 correct = 0
                 total = 0
+                hits = 0
                 
                 for i, idx in enumerate(indices):
                     print(f"\n--- Image {i+1}/{n} (index {idx}) ---")
                     print(f"True label: {labels[idx]}")
                     
-                    # Send command
-                    send_command(ser, '1')
-                    time.sleep(0.5)
-                    
-                    # Send image
+                    # Send image (unless the cache already has the answer)
                     image_flat = images[idx].flatten()
-                    prediction = send_image_uart(ser, image_flat, verbose=True)
+                    prediction, cached = classify_cached(ser, image_flat, cache, fp, latency=latency)
+                    hits += cached
+                    note = " (cached)" if cached else ""
                     
                     if prediction is not None:
                         total += 1
                         if prediction == labels[idx]:
                             correct += 1
-                            print(f"✓ Correct: {prediction}")
+                            print(f"✓ Correct: {prediction}{note}")
                         else:
-                            print(f"✗ Wrong: predicted {prediction}, true {labels[idx]}")
+                            print(f"✗ Wrong: predicted {prediction}, true {labels[idx]}{note}")
                     else:
                         print("✗ Failed to get prediction")
                     
-                    time.sleep(0.5)
+                    if not cached:
+                        time.sleep(0.5)
                 
                 print(f"\n{'='*50}")
                 if total > 0:
                     accuracy = 100.0 * correct / total
                     print(f"Accuracy: {correct}/{total} = {accuracy:.2f}%")
+                    if cache is not None:
+                        print(f"Sent {total - hits}, answered {hits} from the cache")
                 else:
                     print("No successful predictions")
                 print(f"{'='*50}")
@@ -310,10 +836,10 @@ def interactive_mode(ser, images, labels):
         
         elif cmd.startswith('z'):
             # Send all-zero image
-            print("\nSending all-zero image (784 bytes)...")
+            print(f"\nSending all-zero image ({n_in} bytes)...")
             send_command(ser, '1')
             time.sleep(0.5)
-            zeros = np.zeros(INPUT_SIZE, dtype=np.uint8)
+            zeros = np.zeros(n_in, dtype=np.uint8)
             prediction = send_image_uart(ser, zeros)
             if prediction is not None:
                 print(f"\nResult: Pred={prediction}")
@@ -332,13 +858,13 @@ def interactive_mode(ser, images, labels):
                 idx = int(parts[1])
                 val = int(parts[2]) if len(parts) > 2 else 1
                 val = max(0, min(255, val))
-                if idx < 0 or idx >= INPUT_SIZE:
-                    print(f"Pixel index must be 0..{INPUT_SIZE-1}")
+                if idx < 0 or idx >= n_in:
+                    print(f"Pixel index must be 0..{n_in-1}")
                     continue
                 print(f"\nSending image with x[{idx}]={val}, rest 0...")
                 send_command(ser, '1')
                 time.sleep(0.5)
-                img = np.zeros(INPUT_SIZE, dtype=np.uint8)
+                img = np.zeros(n_in, dtype=np.uint8)
                 img[idx] = val
                 prediction = send_image_uart(ser, img)
                 if prediction is not None:
@@ -348,14 +874,55 @@ def interactive_mode(ser, images, labels):
                 time.sleep(0.5)
                 read_responses(ser, timeout=1.0, verbose=False)
             except ValueError:
-                print("Usage: p <pixel_index> [value]  (index 0..783, value 0..255)")
+                print(f"Usage: p <pixel_index> [value]  (index 0..{n_in-1}, value 0..255)")
                 
+        elif cmd.startswith('m'):
+            # On-device sweep: every single-pixel variant in one exchange
+            try:
+                parts = cmd.split()
+                val = int(parts[1]) if len(parts) > 1 else 1
+                base = images[int(parts[2])].flatten() if len(parts) > 2 else None
+                print(f"\nSweeping x[j]={val} over {n_in} pixels on the device...")
+                start = time.time()
+                result = run_pixel_sweep(ser, val, base, logits=parts[0] == 'ml')
+                if result is not None:
+                    print_sweep(result)
+                    print(f"Received {result['received']} bytes in {time.time() - start:.1f} s")
+                read_responses(ser, timeout=0.5, verbose=False)
+            except (ValueError, IndexError):
+                print(f"Usage: m[l] [value] [image index]  (value 0..255, index 0..{len(images)-1})")
+
         elif cmd.startswith('s'):
             # Self-test
             print("\nTriggering FPGA self-test...")
             send_command(ser, '2')
             read_responses(ser, timeout=5.0)
             
+        elif cmd.startswith('b'):
+            # On-device cycle benchmark
+            try:
+                parts = cmd.split()
+                k = int(parts[1]) if len(parts) > 1 else 32
+                if k < 1 or k > 65535:
+                    print("k must be 1..65535")
+                    continue
+                print(f"\nBenchmarking {k} inferences on the device...")
+                result = run_device_benchmark(ser, k)
+                if result is not None:
+                    print_bench(result)
+                read_responses(ser, timeout=0.5, verbose=False)
+            except ValueError:
+                print("Usage: b [k]")
+
+        elif cmd.startswith('v'):
+            # UART chatter level
+            parts = cmd.split()
+            if len(parts) > 1 and parts[1] not in ('0', '1', '2'):
+                print("Usage: v [0|1|2]")
+                continue
+            level = set_verbosity(ser, parts[1] if len(parts) > 1 else None)
+            print("No reply (firmware without '9')" if level is None else f"Verbosity: {level}")
+
         elif cmd.startswith('i'):
             # Network info
             print("\nRequesting network info...")
@@ -367,40 +934,89 @@ def interactive_mode(ser, images, labels):
 
 # Constants
 INPUT_SIZE = 784
+RX_IDLE_TIMEOUT_S = 0.2  # firmware RX_IDLE_TIMEOUT_MS: silence that drops a partial image
+PIPELINE_WINDOW = 2      # requests in flight; 2 x 789 bytes fit the 2048-byte UART_RX_RING_SIZE
 
-def send_zeros_only(port, baudrate=9600):
-    """Open port, send one all-zero image, print prediction, exit. No MNIST needed."""
-    print("="*60)
-    print(" Send all-zero image to FPGA")
-    print("="*60)
+def open_port(port, baudrate=9600):
+    """
+    Open the board's UART (8N1, 0.5 s read timeout), give it 2 s to settle
+    and drop whatever it printed meanwhile. Raises serial.SerialException.
+    """
+    ser = serial.Serial(
+        port=port,
+        baudrate=baudrate,
+        bytesize=serial.EIGHTBITS,
+        parity=serial.PARITY_NONE,
+        stopbits=serial.STOPBITS_ONE,
+        timeout=0.5,
+        write_timeout=2.0
+    )
+    time.sleep(2)  # Wait for connection to stabilize
+    if ser.in_waiting > 0:
+        ser.read(ser.in_waiting)
+    return ser
+
+def classify_one_shot(port, baudrate, image_flat, use_session=True):
+    """
+    Classify one image for a one-shot mode
+
+    A running gateway.py session already holds the port open and in sync,
+    so it is asked first and the answer costs about one transfer plus
+    compute; it must come from the board, an answer from the gateway's host
+    model is refused. Without one the port is opened here, given its 2 s
+    to settle, used once and closed.
+
+    Returns:
+        the prediction, or None
+    """
+    if use_session:
+        from gateway_client import GatewayError, session_client
+        gc = session_client(client="sendToNN")
+        if gc is not None:
+            print("Using the running gateway session")
+            try:
+                pred, backend = gc.classify_tagged(image_flat)
+            except GatewayError as e:
+                print(f"Gateway refused the image: {e}")
+                return None
+            finally:
+                gc.close()
+            if backend != "device":
+                print(f"Gateway answered from its {backend} model, not the board; ignoring it")
+                return None
+            return pred
     print(f"\nOpening serial port {port} at {baudrate} baud...")
     try:
-        ser = serial.Serial(
-            port=port,
-            baudrate=baudrate,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=0.5,
-            write_timeout=2.0
-        )
+        ser = open_port(port, baudrate)
     except serial.SerialException as e:
         print(f"Error opening serial port: {e}")
-        return
-    time.sleep(2)
-    print("Sending 784 zero bytes...")
-    send_command(ser, '1')
-    time.sleep(0.5)
-    zeros = np.zeros(INPUT_SIZE, dtype=np.uint8)
-    pred = send_image_uart(ser, zeros)
-    ser.close()
+        return None
+    try:
+        # Reduced-resolution firmware names its input size in INFO:; nn_core has no '3'
+        n_in = info_input_size(query_info(ser, timeout=1.0))
+        send_command(ser, '1')
+        time.sleep(0.5)
+        return send_image_uart(ser, fit_image(image_flat, n_in))
+    finally:
+        ser.close()
+
+def send_zeros_only(port, baudrate=9600, use_session=True):
+    """Send one all-zero image, print prediction, exit. No MNIST needed."""
+    print("="*60)
+    print(" Send all-zero image to FPGA")
+    print("="*60)
+    print("Sending a zero image...")
+    pred = classify_one_shot(port, baudrate, np.zeros(INPUT_SIZE, dtype=np.uint8), use_session)
     if pred is not None:
         print(f"Prediction: {pred}")
     else:
         print("No prediction received")
 
-def send_single_pixel_only(port, pixel_index, value=1, baudrate=9600):
-    """Send image with x[pixel_index]=value and all others 0. No MNIST needed. value 0-255."""
+def send_single_pixel_only(port, pixel_index, value=1, baudrate=9600, use_session=True):
+    """
+    Send image with x[pixel_index]=value and all others 0. No MNIST needed. value 0-255.
+    The index is into the 28x28 image; reduced-resolution firmware gets it downsampled.
+    """
     if pixel_index < 0 or pixel_index >= INPUT_SIZE:
         print(f"Pixel index must be 0..{INPUT_SIZE-1}")
         return
@@ -408,33 +1024,58 @@ def send_single_pixel_only(port, pixel_index, value=1, baudrate=9600):
     print("="*60)
     print(f" Send single-pixel image (x[{pixel_index}]={value}, rest 0)")
     print("="*60)
-    print(f"\nOpening serial port {port} at {baudrate} baud...")
-    try:
-        ser = serial.Serial(
-            port=port,
-            baudrate=baudrate,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=0.5,
-            write_timeout=2.0
-        )
-    except serial.SerialException as e:
-        print(f"Error opening serial port: {e}")
-        return
-    time.sleep(2)
     img = np.zeros(INPUT_SIZE, dtype=np.uint8)
     img[pixel_index] = value
-    print(f"Sending 784 bytes (only x[{pixel_index}]={value})...")
-    send_command(ser, '1')
-    time.sleep(0.5)
-    pred = send_image_uart(ser, img)
-    ser.close()
+    print(f"Sending {INPUT_SIZE} bytes (only x[{pixel_index}]={value})...")
+    pred = classify_one_shot(port, baudrate, img, use_session)
     if pred is not None:
         print(f"Prediction: {pred}")
     else:
         print("No prediction received")
 
+def sweep_only(port, value=1, baudrate=9600, logits=False, base_index=None, out=None):
+    """
+    Map how every pixel moves the prediction with the on-device sweep ('P')
+    and exit. The base is all zeros, or MNIST test image base_index. The
+    gateway has no sweep request, so this opens the port itself.
+    """
+    print("="*60)
+    print(f" Pixel sweep x[i]={value} over {'zeros' if base_index is None else f'test image {base_index}'}")
+    print("="*60)
+    base = None
+    if base_index is not None:
+        images, _, _ = load_test_set()
+        base = images[base_index].flatten()
+    try:
+        ser = open_port(port, baudrate)
+    except serial.SerialException as e:
+        print(f"Error opening serial port: {e} (stop gateway.py if it holds the port)")
+        return
+    try:
+        info = query_info(ser, timeout=1.0)
+        if not supports_sweep(info):
+            print(f"The firmware does not report SWEEP ({info or 'no INFO: line'})")
+            return
+        n_in = info_input_size(info)
+        if base is not None:
+            base = fit_image(base, n_in)
+        start = time.time()
+        result = run_pixel_sweep(ser, value, base, logits)
+        if result is None:
+            return
+        print_sweep(result)
+        # what the same table costs as one '1' image round trip per pixel
+        per_pixel = n_in + len("1") + len("PRED:0\r\n")
+        print(f"\nOne exchange: {result['received']} bytes received in {time.time() - start:.1f} s; "
+              f"{n_in} image round trips would move {n_in * per_pixel} bytes "
+              f"({n_in * per_pixel * 10 / baudrate:.0f} s on the wire alone)")
+        if out:
+            np.savez(out, value=result["value"], pred=result["pred"], base=result["base"],
+                     preds=result["preds"], deltas=result["deltas"] if logits else np.zeros((0, 10)))
+            print(f"Saved the table to {out}")
+    finally:
+        ser.close()
+
 def main():
     # Configuration
     PORT = 'COM6'  # Default port
@@ -447,8 +1088,10 @@ def main():
         if a.upper().startswith('COM') or a.startswith('/dev/'):
             port = a
             break
+    # One-shot modes go through a running gateway.py unless --no-session
+    use_session = '--no-session' not in args
     if '--zeros' in args or '-z' in args:
-        send_zeros_only(port, BAUDRATE)
+        send_zeros_only(port, BAUDRATE, use_session)
         return
     if '--pixel' in args:
         pixel_idx = 0
@@ -462,13 +1105,29 @@ def main():
                 except (ValueError, IndexError):
                     pass
                 break
-        send_single_pixel_only(port, pixel_idx, pixel_val, BAUDRATE)
+        send_single_pixel_only(port, pixel_idx, pixel_val, BAUDRATE, use_session)
+        return
+    # --sweep [v] [--logits] [--base <image index>] [--sweep-out <file.npz>]
+    if '--sweep' in args:
+        j = args.index('--sweep')
+        value = int(args[j + 1]) if j + 1 < len(args) and args[j + 1].isdigit() else 1
+        base_index = int(args[args.index('--base') + 1]) if '--base' in args else None
+        out = sys.argv[args.index('--sweep-out') + 2] if '--sweep-out' in args else None
+        sweep_only(port, value, BAUDRATE, '--logits' in args, base_index, out)
         return
     
     # Check command line arguments for port
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 1 and not sys.argv[1].startswith('-'):
         PORT = sys.argv[1]
     
+    # Prediction cache: --no-cache disables it, --cache <file> moves it
+    cache_path = DEFAULT_CACHE
+    if '--cache' in args:
+        j = args.index('--cache')
+        if j + 1 < len(args):
+            cache_path = sys.argv[j + 2]
+    cache = None if '--no-cache' in args else PredictionCache(cache_path)
+    
     print("="*60)
     print(" MNIST MLP FPGA Tester")
     print(" UART: 9600 baud, 8N1")
@@ -507,28 +1166,8 @@ def main():
     # Load MNIST data
     print("\nLoading MNIST test data...")
     try:
-        # Try multiple possible locations
-        data_files = [
-            ('t10k-images.idx3-ubyte', 't10k-labels.idx1-ubyte'),
-            ('../data/t10k-images.idx3-ubyte', '../data/t10k-labels.idx1-ubyte'),
-            ('data/t10k-images.idx3-ubyte', 'data/t10k-labels.idx1-ubyte'),
-        ]
-        
-        images = None
-        labels = None
-        
-        for img_path, lbl_path in data_files:
-            try:
-                images = load_mnist_images(img_path)
-                labels = load_mnist_labels(lbl_path)
-                print(f"✓ Loaded {len(images)} test images from {img_path}")
-                break
-            except FileNotFoundError:
-                continue
-        
-        if images is None:
-            raise FileNotFoundError("Could not find MNIST data files")
-            
+        images, labels, img_path = load_test_set()
+        print(f"✓ Loaded {len(images)} test images from {img_path}")
     except FileNotFoundError:
         print("✗ Error: MNIST data files not found!")
         print("\nPlease ensure these files are in the current directory:")
@@ -547,12 +1186,29 @@ def main():
                 ser.close()
                 return
         
+        # Reduced-resolution builds (INPUT_SIDE 14 / 7) get downsampled images
+        fw = detect_firmware(ser) or FIRMWARES["sw"]
+        n_in = info_input_size(query_info(ser) if fw.supports('3') else "")
+        if n_in != INPUT_SIZE:
+            side = side_of(n_in)
+            images = downsample(images, side).reshape(len(images), n_in)
+            print(f"Firmware takes {side}x{side} images: sending {n_in} bytes per image")
+        
+        # Key cached answers to this firmware build
+        fp = None
+        if cache is not None:
+            fp = fw.fingerprint(ser)
+            print(f"Prediction cache {cache_path}: {len(cache)} entries, firmware {fw.key} [{fp}]")
+        
         # Enter interactive mode
-        interactive_mode(ser, images, labels)
+        interactive_mode(ser, images, labels, cache, fp)
         
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
     finally:
+        if cache is not None:
+            cache.close()
+            print(cache.stats())
         ser.close()
         print("\nSerial port closed")
 
@@ -0,0 +1,657 @@
+#!/usr/bin/env python3
+"""
+Simulated MicroBlaze boards speaking the firmware UART protocols
+
+SimulatedDevice speaks vitis/mlp/mlp.c; NnCoreSimulatedDevice speaks
+vitis/mult/src/main.c (the nn_core accelerator path).
+
+SimulatedDevice implements the part of the pyserial Serial API the host
+scripts use (write, flush, read, readline, in_waiting, reset_input_buffer,
+close), so send_image_uart() and friends run unchanged against it. serve_pty() puts one behind a
+pseudo-terminal, so tools that open a real port by name (gateway.py) can be
+run against it: python sim_device.py --pty
+
+Bytes in both directions are paced at the configured baud rate (10 bits per
+byte, 8N1) in real time, the firmware's debug chatter is reproduced line for
+line, and predictions come from the bit-exact integer model in
+training/int_model.py.
+"""
+
+import argparse
+import os
+import sys
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "training"))
+import int_model  # noqa: E402
+import weights_blob  # noqa: E402
+
+BENCH_DEFAULT_ITERATIONS = 32
+RX_FIRST_TIMEOUT_S = 30.0  # RX_FIRST_TIMEOUT_MS / _US: first pixel after READY
+RX_IDLE_TIMEOUT_S = 0.2    # RX_IDLE_TIMEOUT_MS / _US: gap that drops a partial image
+VERBOSITY_QUIET, VERBOSITY_NORMAL, VERBOSITY_DEBUG = 0, 1, 2  # command '9' levels
+
+class SimulatedDevice:
+    """
+    Software stand-in for the board behind a serial port
+
+    Args:
+        baudrate: Line rate used to pace both directions
+        weights: dict from int_model.load_weights(), defaults to the exported headers
+        compute_s: Seconds the device spends in mlp_inference per image
+        timeout: Read timeout in seconds, like serial.Serial(timeout=...)
+        verbosity: Power-up chatter level (VERBOSITY_DEFAULT), changed by command '9'
+    """
+
+    def __init__(self, baudrate=9600, weights=None, compute_s=0.0, timeout=0.5, verbosity=VERBOSITY_DEBUG):
+        self.baudrate = baudrate
+        self.verbosity = verbosity
+        self.timeout = timeout
+        self.compute_s = compute_s
+        self.weights = weights if weights is not None else int_model.load_weights()
+        self._builtin_weights = self.weights
+        # The firmware's INPUT_SIZE comes from the compiled-in weights (INPUT_SIDE)
+        self.input_size = int(self.weights["w1"].shape[1])
+        self._weights_crc = 0
+        self._blob = bytearray()
+        self.byte_time = 10.0 / baudrate
+        self.is_open = True
+
+        self._rx = deque()        # (arrival_time, byte) host -> device
+        self._tx = deque()        # (arrival_time, byte) device -> host
+        self._rx_free = 0.0       # when the host->device line is idle again
+        self._tx_free = 0.0       # when the device->host line is idle again
+        self._clock = time.monotonic()  # device-side time of the last event
+        self._state = "command"
+        self._image = bytearray()
+        self._input_image = np.zeros(self.input_size, dtype=np.uint8)
+        self._dot_valid = False   # process_delta()'s l1_dot
+        self._bench_count = bytearray()
+        self._sweep_args = bytearray()
+        self._after_drain = None
+        self._last_rx = self._clock
+
+        self.images_classified = 0
+        self._startup()
+
+    def _startup(self):
+        self._log(VERBOSITY_NORMAL, "\r\n\r\n"
+                  "*********************************************\r\n"
+                  "* MLP Inference System Starting...          *\r\n"
+                  "*********************************************\r\n"
+                  "UART initialized successfully at 9600 baud\r\n")
+        self._emit("\r\n*** MLP System Ready ***\r\n")
+        self._emit("Baud: 9600\r\n")
+        self._display_menu()
+
+    # ------------------------------------------------------------------
+    # pyserial-compatible surface
+    # ------------------------------------------------------------------
+    def write(self, data):
+        now = time.monotonic()
+        t = max(now, self._rx_free)
+        for b in bytes(data):
+            t += self.byte_time
+            self._rx.append((t, b))
+        self._rx_free = t
+        return len(data)
+
+    def flush(self):
+        pass
+
+    @property
+    def in_waiting(self):
+        self._pump()
+        now = time.monotonic()
+        n = 0
+        for t, _ in self._tx:
+            if t > now:
+                break
+            n += 1
+        return n
+
+    def read(self, size=1):
+        deadline = time.monotonic() + (self.timeout or 0.0)
+        out = bytearray()
+        while len(out) < size:
+            out += self._take(size - len(out))
+            if len(out) >= size or time.monotonic() >= deadline:
+                break
+            time.sleep(min(0.001, self.byte_time))
+        return bytes(out)
+
+    def readline(self):
+        deadline = time.monotonic() + (self.timeout or 0.0)
+        out = bytearray()
+        while True:
+            b = self._take(1)
+            if b:
+                out += b
+                if b == b"\n":
+                    break
+                continue
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(min(0.001, self.byte_time))
+        return bytes(out)
+
+    def reset_input_buffer(self):
+        self._pump()
+        now = time.monotonic()
+        while self._tx and self._tx[0][0] <= now:
+            self._tx.popleft()
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+    # ------------------------------------------------------------------
+    # Device side
+    # ------------------------------------------------------------------
+    def _take(self, n):
+        self._pump()
+        now = time.monotonic()
+        out = bytearray()
+        while self._tx and len(out) < n and self._tx[0][0] <= now:
+            out.append(self._tx.popleft()[1])
+        return bytes(out)
+
+    def _log(self, level, text):
+        """LOG_PRINTF(): chatter sent only at the given verbosity and above"""
+        if self.verbosity >= level:
+            self._emit(text)
+
+    def _emit(self, text):
+        data = text.encode() if isinstance(text, str) else bytes(text)
+        t = max(self._clock, self._tx_free)
+        for b in data:
+            t += self.byte_time
+            self._tx.append((t, b))
+        self._tx_free = t
+
+    def _pump(self):
+        """Let the firmware consume every byte that has reached it by now"""
+        now = time.monotonic()
+        while self._rx and self._rx[0][0] <= now:
+            t, b = self._rx.popleft()
+            if self._state in ("image", "framed", "delta", "weights", "drain") and t - self._last_rx > self._rx_timeout():
+                self._clock = self._last_rx + self._rx_timeout()
+                self._on_rx_timeout()
+            self._clock = max(self._clock, t)
+            self._last_rx = t
+            self._on_byte(b)
+        if self._state in ("image", "framed", "delta", "weights", "drain") and now - self._last_rx > self._rx_timeout():
+            self._clock = self._last_rx + self._rx_timeout()
+            self._on_rx_timeout()
+
+    def _rx_timeout(self):
+        started = self._image if self._state in ("image", "framed", "delta") else self._blob
+        return RX_IDLE_TIMEOUT_S if started or self._state == "drain" else RX_FIRST_TIMEOUT_S
+
+    def _on_rx_timeout(self):
+        if self._state == "drain":
+            self._after_drain()
+        elif self._state == "framed":
+            self._state = "command"
+            self._emit(f"ERR:RX {min(len(self._image), self.input_size)}\r\n")
+            self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+        elif self._state == "delta":
+            self._state = "command"
+            self._emit(f"ERR:RX {len(self._image)}\r\n")
+            self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+        elif self._state == "weights":
+            self._weights_failed("header" if len(self._blob) < weights_blob.HEADER.size else "short")
+        else:
+            self._receive_failed()
+
+    def _on_byte(self, b):
+        if self._state == "bench":
+            self._bench_count.append(b)
+            if len(self._bench_count) == 2:
+                self._state = "command"
+                self._run_benchmark(int.from_bytes(self._bench_count, "little"))
+                self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+            return
+        if self._state == "sweep":
+            self._sweep_args.append(b)
+            if len(self._sweep_args) == 2:
+                self._state = "command"
+                self._run_pixel_sweep(*self._sweep_args)
+                self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+            return
+        if self._state == "verbosity":
+            self._state = "command"
+            level = chr(b)
+            if level != "?" and not "0" <= level <= str(VERBOSITY_DEBUG):
+                self._emit("ERROR:Verbosity level\r\n")
+            else:
+                if level != "?":
+                    self.verbosity = int(level)
+                self._emit(f"VERBOSE:{self.verbosity}\r\n")
+            self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+            return
+        if self._state == "weights":
+            self._on_weights_byte(b)
+            return
+        if self._state == "drain":
+            return
+        if self._state == "framed":
+            self._on_framed_byte(b)
+            return
+        if self._state == "delta":
+            self._on_delta_byte(b)
+            return
+        if self._state == "image":
+            self._image.append(b)
+            if len(self._image) == self.input_size:
+                self._state = "command"
+                self._log(VERBOSITY_DEBUG, f"Received complete image ({self.input_size} bytes)\r\n")
+                self._input_image = np.frombuffer(bytes(self._image), dtype=np.uint8)
+                self._process_inference(self._input_image)
+                self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+            return
+        self._on_command(chr(b))
+
+    def _on_command(self, command):
+        if command in "\r\n":
+            return
+        self._log(VERBOSITY_NORMAL, f"{command}\r\n")
+        if command == "1":
+            self._log(VERBOSITY_NORMAL, "Command: Classify image\r\n")
+            self._log(VERBOSITY_DEBUG, f"Ready to receive image ({self.input_size} bytes)...\r\n")
+            self._emit("READY\r\n")
+            self._image = bytearray()
+            self._dot_valid = False
+            self._state = "image"
+            return
+        if command == "8":
+            self._log(VERBOSITY_NORMAL, "Command: Classify framed image\r\n")
+            self._image = bytearray()
+            self._dot_valid = False
+            self._state = "framed"
+            return
+        if command == "D":
+            self._log(VERBOSITY_NORMAL, "Command: Classify delta\r\n")
+            self._image = bytearray()
+            self._state = "delta"
+            return
+        if command == "9":
+            self._log(VERBOSITY_NORMAL, "Command: Verbosity\r\n")
+            self._state = "verbosity"
+            return
+        if command == "6":
+            self._log(VERBOSITY_NORMAL, "Command: Upload weights\r\n")
+            self._weights_crc = 0
+            self.weights = self._builtin_weights
+            self._dot_valid = False
+            self._emit("READY\r\n")
+            self._blob = bytearray()
+            self._state = "weights"
+            return
+        if command == "5":
+            self._log(VERBOSITY_NORMAL, "Command: Benchmark\r\n")
+            self._bench_count = bytearray()
+            self._state = "bench"
+            return
+        if command == "P":
+            self._log(VERBOSITY_NORMAL, "Command: Pixel sweep\r\n")
+            self._sweep_args = bytearray()
+            self._state = "sweep"
+            return
+        if command == "2":
+            self._log(VERBOSITY_NORMAL, "Command: Self-test\r\n")
+            self._run_self_test()
+        elif command == "3":
+            self._log(VERBOSITY_NORMAL, "Command: Network info\r\n")
+            self._display_network_info()
+        elif command == "4":
+            self._log(VERBOSITY_NORMAL, "Command: Show menu\r\n")
+            self._display_menu()
+        elif command == "7":
+            self._log(VERBOSITY_NORMAL, "Command: Built-in weights\r\n")
+            self._weights_crc = 0
+            self.weights = self._builtin_weights
+            self._dot_valid = False
+            self._emit("WEIGHTS:BUILTIN\r\n")
+        elif command == "0":
+            self._emit("SYNC\r\n")
+        else:
+            self._log(VERBOSITY_NORMAL, f"Unknown: {command} (0x{ord(command):02X})\r\n")
+            self._emit("ERROR:Unknown command\r\n")
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+
+    def _expected_payload(self):
+        """Bytes of the RAM copy in this build (sizeof the ram_* arrays)"""
+        w = self._builtin_weights
+        units = w["b1"].size + w["b2"].size
+        n = w["w1"].size + w["w2"].size + 4 * units
+        return n + (5 * units if w.get("QUANT_PER_CHANNEL") else 0)
+
+    def _on_weights_byte(self, b):
+        """receive_weights(): header, payload and CRC into RAM, switch on a good CRC"""
+        self._blob.append(b)
+        size = weights_blob.HEADER.size
+        if len(self._blob) == size:
+            magic, version, flags, _, _, n_in, n_hidden, n_out, payload_len = \
+                weights_blob.HEADER.unpack(bytes(self._blob))
+            per_channel = bool(flags & weights_blob.FLAG_PER_CHANNEL)
+            if (magic != weights_blob.MAGIC or version != weights_blob.VERSION
+                    or (n_in, n_hidden, n_out) != (self.input_size, *self._builtin_weights["b1"].shape,
+                                                   *self._builtin_weights["b2"].shape)
+                    or per_channel != bool(self._builtin_weights.get("QUANT_PER_CHANNEL"))
+                    or payload_len != self._expected_payload()):
+                self._drain(lambda: self._weights_failed("format"))
+            return
+        if len(self._blob) == size + self._expected_payload() + weights_blob.CRC.size:
+            try:
+                weights, crc = weights_blob.unpack_blob(bytes(self._blob))
+            except ValueError:
+                self._weights_failed("crc")
+                return
+            self.weights = weights
+            self._weights_crc = crc or 1
+            self._state = "command"
+            self._emit(f"WEIGHTS:OK,CRC={crc:08x}\r\n")
+            self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+
+    def _on_framed_byte(self, b):
+        """receive_image_framed(): image plus CRC32, no READY"""
+        self._image.append(b)
+        if len(self._image) < self.input_size + 4:
+            return
+        image = bytes(self._image[:self.input_size])
+        if zlib.crc32(image) != int.from_bytes(self._image[self.input_size:], "little"):
+            self._drain(self._crc_failed)
+            return
+        self._state = "command"
+        self._input_image = np.frombuffer(image, dtype=np.uint8)
+        self._process_inference(self._input_image)
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+
+    def _on_delta_byte(self, b):
+        """receive_delta() + process_delta(): u16 count, count x (u16 index, u8 value), CRC32"""
+        self._image.append(b)
+        if len(self._image) < 2:
+            return
+        count = int.from_bytes(self._image[:2], "little")
+        if count > self.input_size:
+            self._drain(self._delta_failed)
+            return
+        if len(self._image) < 2 + 3 * count + 4:
+            return
+        body = bytes(self._image[:2 + 3 * count])
+        if zlib.crc32(body) != int.from_bytes(self._image[-4:], "little"):
+            self._drain(self._crc_failed)
+            return
+        entries = np.frombuffer(body, dtype=[("index", "<u2"), ("value", "u1")], offset=2)
+        if np.any(entries["index"] >= self.input_size):
+            self._delta_failed()
+            return
+        self._state = "command"
+        image = self._input_image.copy()
+        image[entries["index"]] = entries["value"]
+        self._input_image = image
+        # Layer 1 costs HIDDEN_SIZE MACs per entry once the sums are kept
+        per_channel = bool(self.weights.get("QUANT_PER_CHANNEL"))
+        full = sum(int_model.estimate_cycles(per_channel, self.input_size))
+        delta = sum(int_model.estimate_delta_cycles(per_channel, count, self.input_size))
+        self._process_inference(image, self.compute_s * delta / full if self._dot_valid else None)
+        self._dot_valid = True
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+
+    def _delta_failed(self):
+        self._emit("ERR:DELTA\r\n")
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+        self._state = "command"
+
+    def _crc_failed(self):
+        self._emit("ERR:CRC\r\n")
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+        self._state = "command"
+
+    def _drain(self, after):
+        """uart_drain(): swallow bytes until the line goes idle, then run after()"""
+        self._after_drain = after
+        self._state = "drain"
+
+    def _weights_failed(self, reason):
+        self._emit(f"ERROR:WEIGHTS {reason}\r\n")
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+        self._state = "command"
+
+    def _receive_failed(self):
+        msg = f"ERROR: Received only {len(self._image)} of {self.input_size} bytes\r\n"
+        self._log(VERBOSITY_NORMAL, msg)
+        self._emit(msg)
+        self._log(VERBOSITY_NORMAL, "\r\nCommand: ")
+        self._state = "command"
+
+    def _infer(self, image, compute_s=None):
+        self._clock += self.compute_s if compute_s is None else compute_s
+        preds, logits = int_model.mlp_inference(image, self.weights, self.weights.get("SHIFT", int_model.SHIFT))
+        self.images_classified += 1
+        return int(preds[0]), logits[0]
+
+    def _logits_line(self, logits):
+        return "Logits: " + ",".join(str(int(v)) for v in logits) + "\r\n"
+
+    def _process_inference(self, image, compute_s=None):
+        self._log(VERBOSITY_DEBUG, "\r\n=== Inference Start ===\r\n")
+        pred, logits = self._infer(image, compute_s)
+        self._log(VERBOSITY_DEBUG, f"Prediction: {pred}\r\n" + self._logits_line(logits))
+        self._emit(f"PRED:{pred}\r\n")
+        self._log(VERBOSITY_DEBUG, "=== Inference Complete ===\r\n")
+
+    def _run_self_test(self):
+        self._log(VERBOSITY_NORMAL, "\r\n=== Self-Test Start ===\r\n")
+        image = np.zeros(self.input_size, dtype=np.uint8)
+        image[:100] = 128
+        self._input_image = image
+        self._dot_valid = False
+        pred, logits = self._infer(image)
+        self._log(VERBOSITY_NORMAL, f"Self-test prediction: {pred}\r\n" + self._logits_line(logits))
+        self._emit(f"SELF-TEST:PRED={pred}\r\n")
+        self._log(VERBOSITY_NORMAL, "=== Self-Test Complete ===\r\n")
+
+    def _run_benchmark(self, iterations):
+        """Answer like run_benchmark() using int_model's per-stage cycle estimate"""
+        iterations = iterations or BENCH_DEFAULT_ITERATIONS
+        self._log(VERBOSITY_NORMAL, f"\r\n=== Benchmark Start (K={iterations}) ===\r\n")
+        self._clock += iterations * self.compute_s
+        pred, _ = int_model.mlp_inference(self._input_image, self.weights,
+                                          self.weights.get("SHIFT", int_model.SHIFT))
+        l1, rq, l2, am = int_model.estimate_cycles(bool(self.weights.get("QUANT_PER_CHANNEL")), self.input_size)
+        stages = (("L1", l1 + rq), ("L2", l2), ("AM", am), ("TOT", l1 + rq + l2 + am))
+        fields = ",".join(f"{name}={c}/{c}/{c}" for name, c in stages)
+        self._emit(f"BENCH:K={iterations},{fields},PRED={int(pred[0])}\r\n")
+        self._log(VERBOSITY_NORMAL, "=== Benchmark Complete ===\r\n")
+
+    def _run_pixel_sweep(self, value, flags):
+        """run_pixel_sweep(): every single-pixel variant of zeros or the last image"""
+        base = self._input_image if flags & 0x01 else None
+        self._dot_valid |= base is not None
+        _, base_logits = int_model.mlp_inference(
+            base if base is not None else np.zeros(self.input_size, dtype=np.uint8), self.weights)
+        base_logits = base_logits[0]
+        per_channel = bool(self.weights.get("QUANT_PER_CHANNEL"))
+        self._emit(f"SWEEP:N={self.input_size},V={value},PRED={int(np.argmax(base_logits))}\r\n")
+        self._emit("SWBASE:" + ",".join(str(int(v)) for v in base_logits) + "\r\n")
+        # compute_s is one full inference; the sweep costs its estimated share
+        full = sum(int_model.estimate_cycles(per_channel, self.input_size))
+        self._clock += self.compute_s * sum(int_model.estimate_sweep_cycles(per_channel, self.input_size)) / full
+        preds, logits = int_model.pixel_sweep(self.weights, value, base)
+        self.images_classified += self.input_size
+        if flags & 0x02:
+            self._emit("".join("SWL:" + ",".join(str(int(v)) for v in row) + "\r\n"
+                               for row in logits - base_logits))
+        self._emit("SWPRED:" + "".join(str(int(p)) for p in preds) + "\r\nSWEEP:END\r\n")
+
+    def _display_menu(self):
+        self._log(VERBOSITY_NORMAL, "\r\n"
+                  "=========================================\r\n"
+                  "  MNIST MLP Inference - MicroBlaze RISC-V\r\n"
+                  "  INT8 Quantization | 9600 baud\r\n"
+                  "=========================================\r\n"
+                  "Commands:\r\n"
+                  "  1 - Receive image and classify\r\n"
+                  "  2 - Run self-test\r\n"
+                  "  3 - Display network info\r\n"
+                  "  4 - Display menu\r\n"
+                  "  5 - Benchmark (then 2 bytes: K, little-endian)\r\n"
+                  "  6 - Upload weights (then blob: header, payload, CRC32)\r\n"
+                  "  7 - Use built-in weights\r\n"
+                  f"  8 - Classify framed image (then {self.input_size} bytes + CRC32, no READY)\r\n"
+                  "  9 - Verbosity (then '0' quiet, '1' normal, '2' debug, '?' query)\r\n"
+                  "  0 - Sync (replies SYNC)\r\n"
+                  "  D - Classify delta (then count, index/value entries, CRC32; no READY)\r\n"
+                  "  P - Pixel sweep (then value, flags: 1 = over last image, 2 = logits)\r\n"
+                  "=========================================\r\n"
+                  "Command: ")
+        self._emit("\r\n=== MENU ===\r\n")
+        self._emit("1: Classify image\r\n")
+        self._emit("2: Self-test\r\n")
+        self._emit("3: Network info\r\n")
+        self._emit("4: Menu\r\n")
+        self._emit("5: Benchmark\r\n")
+        self._emit("6: Upload weights\r\n")
+        self._emit("7: Built-in weights\r\n")
+        self._emit("8: Classify framed image\r\n")
+        self._emit("9: Verbosity\r\n")
+        self._emit("0: Sync\r\n")
+        self._emit("D: Classify delta\r\n")
+        self._emit("P: Pixel sweep\r\n")
+
+    def _display_network_info(self):
+        n_params = sum(int(self.weights[k].size) for k in ("w1", "b1", "w2", "b2"))
+        self._log(VERBOSITY_NORMAL, "\r\n=== Network Info ===\r\n")
+        hidden, n_out = len(self.weights["b1"]), len(self.weights["b2"])
+        self._log(VERBOSITY_NORMAL, f"Architecture: {self.input_size}->{hidden}->{n_out}\r\n")
+        per_channel = bool(self.weights.get("QUANT_PER_CHANNEL"))
+        if per_channel:
+            self._log(VERBOSITY_NORMAL, "Quantization: INT8 per-channel, multiply-shift requant\r\n")
+        else:
+            self._log(VERBOSITY_NORMAL, "Quantization: INT8\r\n")
+            self._log(VERBOSITY_NORMAL, f"Shift bits: {self.weights.get('SHIFT', int_model.SHIFT)}\r\n")
+        self._log(VERBOSITY_NORMAL, f"Parameters: {n_params}\r\n")
+        info = f"INFO:{self.input_size}->{hidden}->{n_out},INT8" + (",PC" if per_channel else "")
+        if self._weights_crc:
+            self._log(VERBOSITY_NORMAL, f"Weights: uploaded, CRC32 {self._weights_crc:08x}\r\n")
+            info += f",W={self._weights_crc:08x}"
+        info += ",DELTA,SWEEP"
+        # RX is unbounded here, like the interrupt ring: requests may be pipelined
+        self._log(VERBOSITY_NORMAL, "UART RX: interrupt ring, 0 bytes dropped\r\n")
+        info += ",RX=IRQ"
+        self._emit(info + "\r\n")
+
+class NnCoreSimulatedDevice(SimulatedDevice):
+    """
+    Stand-in for vitis/mult/src/main.c driving the nn_core accelerator
+
+    Same serial surface as SimulatedDevice, but with the terse CMD? prompt,
+    no debug chatter and no self-test/info commands. nn_core implements the
+    per-tensor integer pipeline, so predictions use that scheme regardless
+    of weights_rq.h.
+    """
+
+    PROMPT = "\r\nCMD? (1=send image, 4=menu)\r\n"
+
+    def __init__(self, baudrate=9600, weights=None, compute_s=0.0, timeout=0.5):
+        weights = dict(weights if weights is not None else int_model.load_weights())
+        weights.pop("QUANT_PER_CHANNEL", None)
+        super().__init__(baudrate, weights, compute_s, timeout)
+
+    def _startup(self):
+        self._emit("\r\n=== NN CORE PREDICTION TEST ===\r\n")
+        self._emit(self.PROMPT)
+
+    def _receive_failed(self):
+        self._emit(f"ERR:RX {len(self._image)}\r\n")
+        self._emit(self.PROMPT)
+        self._state = "command"
+
+    def _on_byte(self, b):
+        if self._state == "image":
+            self._image.append(b)
+            if len(self._image) == self.input_size:
+                self._state = "command"
+                pred, _ = self._infer(np.frombuffer(bytes(self._image), dtype=np.uint8))
+                self._emit(f"PRED:{pred}\r\n")
+                self._emit(self.PROMPT)
+            return
+
+        command = chr(b)
+        if command == "4":
+            self._emit("Menu:\r\n")
+            self._emit("  1: Send image\r\n")
+            self._emit("  4: Show menu\r\n")
+            self._emit("  0: Sync\r\n")
+        elif command == "0":
+            self._emit("SYNC\r\n")
+        elif command == "1":
+            self._emit("READY\r\n")
+            self._image = bytearray()
+            self._state = "image"
+            return
+        else:
+            self._emit(f"Unknown cmd '{command}'\r\n")
+        self._emit(self.PROMPT)
+
+def serve_pty(dev, poll_s=0.001):
+    """
+    Bridge a simulated device to a new pseudo-terminal until interrupted
+
+    Prints the slave path; open it like a serial port (any baud setting
+    works, the pacing is the device's own). POSIX only.
+    """
+    import select
+    import tty
+
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    print(f"Simulated device on {os.ttyname(slave)}", flush=True)
+    try:
+        while True:
+            readable, _, _ = select.select([master], [], [], poll_s)
+            if readable:
+                try:
+                    dev.write(os.read(master, 4096))
+                except OSError:
+                    pass  # no client has the slave open
+            n = dev.in_waiting
+            if n:
+                os.write(master, dev.read(n))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os.close(master)
+        os.close(slave)
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulated board on a pseudo-terminal, or one test prediction")
+    parser.add_argument("--pty", action="store_true", help="serve the device on a pty until Ctrl-C")
+    parser.add_argument("--fw", choices=("sw", "hw"), default="sw", help="mlp.c or nn_core firmware")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--compute-ms", type=float, default=0.0, help="device inference time per image")
+    args = parser.parse_args()
+
+    cls = SimulatedDevice if args.fw == "sw" else NnCoreSimulatedDevice
+    dev = cls(baudrate=args.baud, compute_s=args.compute_ms / 1e3)
+    if args.pty:
+        serve_pty(dev)
+        return
+
+    from sendToNN import send_command, send_image_uart
+
+    send_command(dev, '1')
+    img = np.fromfile(Path(__file__).resolve().parent.parent / "training" / "img_28x28.bin", dtype=np.uint8)
+    print("Simulated prediction:", send_image_uart(dev, img, verbose=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Upload a weight blob to mlp.c at runtime (command '6')
+
+Streams the blob from training/weights_blob.py back to back at the line
+rate (no per-chunk pacing), waits for the firmware's CRC verdict and checks
+that INFO: now reports the blob's CRC. The prediction cache fingerprint
+includes the INFO: line, so answers cached for other weights are not reused.
+
+At 9600 baud the 25.6 KB per-tensor blob takes about 27 s on the wire,
+instead of a header re-export, Vitis rebuild and reflash.
+
+Usage:
+    python upload_weights.py COM6                       # pack ../../vitis/mlp headers and upload
+    python upload_weights.py COM6 --blob model.blob
+    python upload_weights.py COM6 --builtin             # back to the compiled-in weights
+    python upload_weights.py --sim --weights ../hls_nn/weights/vivado_init --baud 115200
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "training"))
+import int_model  # noqa: E402
+import weights_blob  # noqa: E402
+from sendToNN import FIRMWARES, detect_firmware, open_port, query_info, read_responses, send_command  # noqa: E402
+
+WRITE_CHUNK = 1024
+
+def wait_for_line(ser, pattern, timeout):
+    """Return the first line matching pattern (a regex), or None after timeout"""
+    start_time = time.time()
+    while (time.time() - start_time) < timeout:
+        if ser.in_waiting > 0:
+            line = ser.readline().decode('utf-8', errors='ignore').strip()
+            if re.search(pattern, line):
+                return line
+        else:
+            time.sleep(0.005)
+    return None
+
+def upload_blob(ser, blob, verbose=True):
+    """
+    Send '6' and stream the blob
+
+    Returns:
+        the CRC the firmware accepted, or None (the device keeps its
+        compiled-in weights on any error)
+    """
+    read_responses(ser, timeout=0.2, verbose=False)
+    send_command(ser, '6')
+    if wait_for_line(ser, r"READY", 5.0) is None:
+        print("ERROR: no READY for the weight upload")
+        return None
+
+    wire_s = len(blob) * 10.0 / ser.baudrate
+    if verbose:
+        print(f"Streaming {len(blob)} bytes (~{wire_s:.1f} s at {ser.baudrate} baud)...")
+    t0 = time.time()
+    for i in range(0, len(blob), WRITE_CHUNK):
+        ser.write(blob[i:i + WRITE_CHUNK])
+        if verbose:
+            print(f"Sent {min(i + WRITE_CHUNK, len(blob))}/{len(blob)} bytes", end='\r')
+    ser.flush()
+
+    line = wait_for_line(ser, r"^(WEIGHTS:OK|ERROR:WEIGHTS)", wire_s + 5.0)
+    dt = time.time() - t0
+    if verbose:
+        print()
+    if line is None:
+        print("ERROR: no reply to the weight upload")
+        return None
+    if not line.startswith("WEIGHTS:OK"):
+        print(f"ERROR: device rejected the blob ({line})")
+        return None
+    crc = int(line.rsplit("=", 1)[1], 16)
+    if verbose:
+        print(f"{line}  ({dt:.1f} s, {len(blob) / dt / 1024:.2f} KiB/s)")
+    return crc
+
+def main():
+    parser = argparse.ArgumentParser(description="Upload weights to mlp.c over UART")
+    parser.add_argument("port", nargs="?", default="COM6")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("--blob", help="blob written by weights_blob.py")
+    parser.add_argument("--weights", default=str(weights_blob.DEFAULT_WEIGHTS_DIR),
+                        help="directory with weights_*.h to pack (when no --blob)")
+    parser.add_argument("--shift", type=int,
+                        help="per-tensor layer-2 downshift (default: SHIFT_BITS of weights_rq.h, else 8)")
+    parser.add_argument("--builtin", action="store_true", help="switch back to the compiled-in weights")
+    parser.add_argument("--sim", action="store_true", help="use the simulated device")
+    args = parser.parse_args()
+
+    if args.sim:
+        from sim_device import SimulatedDevice
+        ser = SimulatedDevice(args.baud)
+    else:
+        ser = open_port(args.port, args.baud)
+    try:
+        fw = detect_firmware(ser)
+        if fw is not FIRMWARES["sw"]:
+            raise SystemExit("weight upload needs mlp.c (nn_core weights live in BRAM COE files)")
+
+        if args.builtin:
+            send_command(ser, '7')
+            print(wait_for_line(ser, r"^WEIGHTS:BUILTIN", 3.0) or "ERROR: no reply")
+            print(query_info(ser))
+            return
+
+        if args.blob:
+            blob = Path(args.blob).read_bytes()
+        else:
+            weights = int_model.load_weights(args.weights)
+            shift = weights.get("SHIFT", int_model.SHIFT) if args.shift is None else args.shift
+            blob = weights_blob.pack_blob(weights, shift)
+        _, expected_crc = weights_blob.unpack_blob(blob)     # refuse to send a bad blob
+
+        crc = upload_blob(ser, blob)
+        if crc is None:
+            raise SystemExit(1)
+        if crc != expected_crc:
+            raise SystemExit(f"device CRC {crc:08x} != blob CRC {expected_crc:08x}")
+        info = query_info(ser)
+        print(info)
+        if f"W={crc:08x}" not in info:
+            raise SystemExit("INFO: does not report the uploaded weights")
+    finally:
+        ser.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+"""
+Post-training calibration search for the per-tensor int8 scheme
+
+The per-tensor pipeline (mlp.c with QUANT_PER_CHANNEL 0, nn_core.v) has knobs
+that export_weights_int8.py, export_vivado_coe.py and export_memh.py fix by
+hand: max-abs weight scales s1/s2 and the bias scaling, and the layer-2
+downshift SHIFT, which they read back from quant_params.txt
+(int_model.artifact_shift(), 8 until --write picks another). This tool searches them on mlp32.pth without retraining:
+
+    SHIFT       layer-2 downshift, --shifts
+    clipping    percentile of |w| mapped to 127, per layer (100 = max-abs), --clip
+    bias mode   legacy:    b1*s1 and b2*s2*2^SHIFT, what the exporters write
+                scaled:    biases on the accumulator scale (x is raw 0..255)
+                corrected: scaled, plus the mean weight-rounding error over
+                           the calibration set folded into each bias
+
+Every candidate is scored on a calibration set with a vectorized integer
+inference that is bit-exact with int_model.py: layer 1 runs as a float64
+matmul, exact since every partial sum is an integer below 2^53. The work is
+split over a process pool, one task per layer-1 configuration (w1 clipping,
+bias mode); the SHIFT / w2 clipping variants reuse its hidden activations.
+Candidates whose worst-case layer-2 sum overflows int32 are skipped: mlp.c
+would wrap where nn_core's 64-bit accumulator does not.
+
+--write re-runs the winner through int_model.mlp_inference() as a check and
+emits it to every artifact, so the firmware and the core cannot disagree:
+    vitis/mlp/weights_{w1,b1,w2,b2,rq,w1p}.h     (weights_rq.h sets SHIFT_BITS)
+    vitis/mlp/weights_unrolled.h                 (same L1U_COUNT as before)
+    hls_nn/weights/vivado_init/weights_*.h, *.coe, quant_params.txt
+    training/vivado_init/*.coe, quant_params.txt
+    hw/ip_repo/simpleSum_1_0/src/*.mem
+    the SHIFT parameter default in hw/ip_repo/simpleSum_1_0/hdl/nn_core.v
+
+The default calibration images (train 50000..54999) are outside the 20000
+train_mlp.py fits on.
+
+Usage:
+    python calibrate.py                          # search, print the best candidates
+    python calibrate.py --write                  # and emit the winner everywhere
+    python calibrate.py --shifts 6 7 8 9 --clip 100 99.9 --bias scaled corrected -j 4
+"""
+import argparse
+import itertools
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import torch
+
+import int_model
+from export_memh import write_mem_8, write_mem_32
+from export_vivado_coe import i8_to_hex_list, i32_to_hex_list, write_coe
+from export_weights_int8 import H, write_i8_2d, write_i32_1d, write_rq_header
+from load_mnist import SIDE, downsample, load_images, load_labels, side_of
+from swar_pack import write_w1p_header
+from train_mlp import MLP
+from unroll_gen import HEADER_NAME as UNROLLED_NAME, write_header as write_unrolled_header
+
+HERE = Path(__file__).resolve().parent
+REPO_ROOT = HERE.parent.parent
+MLP_DIR = REPO_ROOT / "vitis" / "mlp"
+VIVADO_INIT_DIRS = (int_model.DEFAULT_WEIGHTS_DIR, HERE / "vivado_init")
+MEM_DIR = REPO_ROOT / "hw" / "ip_repo" / "simpleSum_1_0" / "src"
+NN_CORE_V = REPO_ROOT / "hw" / "ip_repo" / "simpleSum_1_0" / "hdl" / "nn_core.v"
+
+DEFAULT_SHIFTS = tuple(range(4, 13))
+DEFAULT_CLIPS = (100.0, 99.99, 99.9, 99.5, 99.0)
+BIAS_MODES = ("legacy", "scaled", "corrected")
+LEGACY = {"shift": int_model.SHIFT, "clip1": 100.0, "clip2": 100.0, "bias": "legacy"}
+INT32_MAX = 2**31 - 1
+
+def load_float_model(path, hidden=H):
+    state = torch.load(path, map_location="cpu")
+    model = MLP(hidden=hidden, n_in=state["fc1.weight"].shape[1])
+    model.load_state_dict(state)
+    return tuple(p.detach().numpy().astype(np.float64)
+                 for p in (model.fc1.weight, model.fc1.bias, model.fc2.weight, model.fc2.bias))
+
+def quantize_clipped(w, clip):
+    """int8 weights with the clip percentile of |w| mapped to 127 (100 = max-abs, as the exporters)"""
+    max_abs = np.percentile(np.abs(w), clip)
+    scale = 127.0 / max_abs if max_abs > 1e-12 else 1.0
+    return np.clip(np.round(w * scale), -127, 127).astype(np.int8), scale
+
+def quantize_layer1(w1, b1, clip, bias, x_mean):
+    """w1q, b1q, s1 for one layer-1 configuration"""
+    w1q, s1 = quantize_clipped(w1, clip)
+    if bias == "legacy":
+        b1q = b1 * s1
+    else:
+        b1q = b1 * s1 * 255.0
+        if bias == "corrected":
+            b1q = b1q + (w1 * s1 - w1q) @ x_mean
+    return w1q, np.round(b1q).astype(np.int64), s1
+
+def quantize_layer2(w2, b2, clip, bias, shift, s1, hs_mean):
+    """w2q, b2q, s2 for one layer-2 configuration; hs_mean is the mean of hidden >> shift"""
+    w2q, s2 = quantize_clipped(w2, clip)
+    if bias == "legacy":
+        b2q = b2 * s2 * 2**shift
+    else:
+        b2q = b2 * s2 * s1 * 255.0 / 2**shift
+        if bias == "corrected":
+            b2q = b2q + (w2 * s2 - w2q) @ hs_mean
+    return w2q, np.round(b2q).astype(np.int64), s2
+
+def fits_int32(w1q, b1q, w2q, b2q, shift):
+    """True if no uint8 image can overflow the int32 hidden values or layer-2 sums"""
+    hmax = np.maximum(255 * np.maximum(w1q.astype(np.int64), 0).sum(axis=1) + b1q, 0)
+    l2max = np.abs(w2q.astype(np.int64)) @ (hmax >> shift) + np.abs(b2q)
+    return (hmax.max() <= INT32_MAX and np.abs(b1q).max() <= INT32_MAX
+            and l2max.max() <= INT32_MAX)
+
+def quantize(cfg, w1, b1, w2, b2, x):
+    """Quantized weights and scales of one candidate: (w1q, b1q, w2q, b2q, s1, s2)"""
+    w1q, b1q, s1 = quantize_layer1(w1, b1, cfg["clip1"], cfg["bias"], x.mean(axis=0))
+    hs_mean = (int_model.layer1_forward(x, w1q, b1q).astype(np.int64) >> cfg["shift"]).mean(axis=0)
+    w2q, b2q, s2 = quantize_layer2(w2, b2, cfg["clip2"], cfg["bias"], cfg["shift"], s1, hs_mean)
+    return w1q, b1q.astype(np.int32), w2q, b2q.astype(np.int32), s1, s2
+
+# ----------------------------------------------------------------------
+# Process pool: the calibration set is handed over once per worker
+# ----------------------------------------------------------------------
+_ctx = {}
+
+def _init_worker(x, y, float_pred, params, shifts, clips):
+    _ctx.update(x=x, xf=x.astype(np.float64), y=y, float_pred=float_pred,
+                params=params, shifts=shifts, clips=clips)
+
+def _score_layer1(task):
+    """Score every SHIFT / w2 clipping variant of one (w1 clipping, bias mode)"""
+    clip1, bias = task
+    w1, b1, w2, b2 = _ctx["params"]
+    x_mean = _ctx["xf"].mean(axis=0)
+    w1q, b1q, s1 = quantize_layer1(w1, b1, clip1, bias, x_mean)
+    hidden = np.maximum(np.rint(_ctx["xf"] @ w1q.T.astype(np.float64)).astype(np.int64) + b1q, 0)
+    results = []
+    for shift, clip2 in itertools.product(_ctx["shifts"], _ctx["clips"]):
+        hs = hidden >> shift
+        w2q, b2q, s2 = quantize_layer2(w2, b2, clip2, bias, shift, s1, hs.mean(axis=0))
+        cfg = {"shift": shift, "clip1": clip1, "clip2": clip2, "bias": bias}
+        if not fits_int32(w1q, b1q, w2q, b2q, shift):
+            results.append(dict(cfg, acc=None, agree=None))
+            continue
+        pred = np.argmax(hs @ w2q.T.astype(np.int64) + b2q, axis=1)
+        results.append(dict(cfg, acc=float(np.mean(pred == _ctx["y"])),
+                            agree=float(np.mean(pred == _ctx["float_pred"]))))
+    return results
+
+def search(x, y, params, shifts, clips, biases, jobs):
+    """All candidates, best first (accuracy, then agreement with the float model)"""
+    w1, b1, w2, b2 = params
+    float_pred = np.argmax(np.maximum(x / 255.0 @ w1.T + b1, 0) @ w2.T + b2, axis=1)
+    tasks = list(itertools.product(clips, biases))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(x, y, float_pred, params, tuple(shifts), tuple(clips))) as pool:
+        results = [r for rs in pool.map(_score_layer1, tasks) for r in rs]
+    valid = sorted((r for r in results if r["acc"] is not None),
+                   key=lambda r: (-r["acc"], -r["agree"], r != dict(r, **LEGACY)))
+    return valid, len(results) - len(valid)
+
+def describe(r):
+    return f"SHIFT={r['shift']:<2d} clip w1={r['clip1']:<6g} w2={r['clip2']:<6g} bias={r['bias']:<9s}"
+
+# ----------------------------------------------------------------------
+# Artifacts
+# ----------------------------------------------------------------------
+def write_headers(out_dir, w1q, b1q, w2q, b2q, shift, w1p=False):
+    out_dir = Path(out_dir)
+    write_i8_2d(out_dir / "weights_w1.h", "w1", w1q)
+    write_i32_1d(out_dir / "weights_b1.h", "b1", b1q)
+    write_i8_2d(out_dir / "weights_w2.h", "w2", w2q)
+    write_i32_1d(out_dir / "weights_b2.h", "b2", b2q)
+    write_rq_header(out_dir / "weights_rq.h", None, shift)
+    if w1p:
+        write_w1p_header(out_dir / "weights_w1p.h", w1q)
+
+def write_vivado_init(out_dir, w1q, b1q, w2q, b2q, s1, s2, cfg):
+    """COE files and quant_params.txt as export_vivado_coe.py writes them (P = 1)"""
+    out_dir = Path(out_dir)
+    write_coe(out_dir / "w1_i8.coe", i8_to_hex_list(w1q), values_per_line=32)
+    write_coe(out_dir / "b1_i32.coe", i32_to_hex_list(b1q), values_per_line=8)
+    write_coe(out_dir / "w2_i8.coe", i8_to_hex_list(w2q), values_per_line=32)
+    write_coe(out_dir / "b2_i32.coe", i32_to_hex_list(b2q), values_per_line=8)
+    with open(out_dir / "quant_params.txt", "w") as f:
+        f.write(f"s1={s1}\n")
+        f.write(f"s2={s2}\n")
+        f.write(f"SHIFT={cfg['shift']}\n")
+        f.write(f"clip_w1={cfg['clip1']}\n")
+        f.write(f"clip_w2={cfg['clip2']}\n")
+        f.write(f"bias={cfg['bias']}\n")
+
+def set_nn_core_shift(path, shift):
+    """Rewrite the default of nn_core's SHIFT parameter; returns the old value"""
+    text = Path(path).read_text()
+    m = re.search(r'(parameter\s+integer\s+SHIFT\s*=\s*)(\d+)', text)
+    if m is None:
+        raise ValueError(f"no SHIFT parameter in {path}")
+    Path(path).write_text(text[:m.start(2)] + str(shift) + text[m.end(2):])
+    return int(m.group(2))
+
+def write_artifacts(cfg, q):
+    w1q, b1q, w2q, b2q, s1, s2 = q
+    write_headers(MLP_DIR, w1q, b1q, w2q, b2q, cfg["shift"], w1p=True)
+    unrolled = MLP_DIR / UNROLLED_NAME
+    l1_units = int_model.load_h_defines(unrolled).get("L1U_COUNT", 0) if unrolled.exists() else 0
+    write_unrolled_header(unrolled, {"w1": w1q, "b1": b1q, "w2": w2q, "b2": b2q}, cfg["shift"], l1_units)
+    print(f"  {MLP_DIR}/weights_*.h")
+    for d in VIVADO_INIT_DIRS:
+        if d == int_model.DEFAULT_WEIGHTS_DIR:
+            write_headers(d, w1q, b1q, w2q, b2q, cfg["shift"])
+        write_vivado_init(d, w1q, b1q, w2q, b2q, s1, s2, cfg)
+        print(f"  {d}/")
+    write_mem_8(MEM_DIR / "w1.mem", w1q)
+    write_mem_8(MEM_DIR / "w2.mem", w2q)
+    write_mem_32(MEM_DIR / "b1.mem", b1q)
+    write_mem_32(MEM_DIR / "b2.mem", b2q)
+    print(f"  {MEM_DIR}/*.mem")
+    old = set_nn_core_shift(NN_CORE_V, cfg["shift"])
+    print(f"  {NN_CORE_V}: SHIFT {old} -> {cfg['shift']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Search SHIFT, weight clipping and bias mode for the per-tensor scheme")
+    parser.add_argument("--model", default=str(HERE / "mlp32.pth"))
+    parser.add_argument("--calib", default="../data/train-images.idx3-ubyte")
+    parser.add_argument("--calib-labels", default="../data/train-labels.idx1-ubyte")
+    parser.add_argument("--calib-start", type=int, default=50000)
+    parser.add_argument("--calib-n", type=int, default=5000)
+    parser.add_argument("--shifts", type=int, nargs="+", default=list(DEFAULT_SHIFTS))
+    parser.add_argument("--clip", type=float, nargs="+", default=list(DEFAULT_CLIPS),
+                        help="weight clipping percentiles to try (each layer independently)")
+    parser.add_argument("--bias", nargs="+", choices=BIAS_MODES, default=list(BIAS_MODES))
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--write", action="store_true", help="emit the best candidate to every artifact")
+    args = parser.parse_args()
+
+    params = load_float_model(args.model)
+    side = side_of(params[0].shape[1])
+    if args.write and side != SIDE:
+        raise SystemExit(f"--write updates the {SIDE}x{SIDE} hardware artifacts; "
+                         f"export {side}x{side} models with export_weights_int8.py --model")
+    x_all = downsample(load_images(args.calib), side).reshape(-1, side * side)
+    y_all = load_labels(args.calib_labels)
+    start = args.calib_start if args.calib_start < len(x_all) else 0
+    x = x_all[start:start + args.calib_n]
+    y = y_all[start:start + args.calib_n]
+
+    t0 = time.time()
+    ranked, n_overflow = search(x, y, params, args.shifts, args.clip, args.bias, args.jobs)
+    dt = time.time() - t0
+    n = len(ranked) + n_overflow
+    print(f"Calibration images: {len(x)} ({args.calib} from {start})")
+    print(f"{n} candidates in {dt:.1f} s, {n_overflow} skipped (int32 overflow)")
+    if not ranked:
+        raise SystemExit("no candidate fits int32")
+
+    legacy = next((r for r in ranked if r == dict(r, **LEGACY)), None)
+    print(f"\n{'#':>3s}  {'configuration':<50s} {'accuracy':>9s} {'agree w/ float':>15s}")
+    for i, r in enumerate(ranked[:args.top], 1):
+        print(f"{i:3d}  {describe(r):<50s} {r['acc']:9.4f} {r['agree']:15.4f}")
+    if legacy is not None:
+        print(f"{'now':>3s}  {describe(legacy):<50s} {legacy['acc']:9.4f} {legacy['agree']:15.4f}")
+
+    best = ranked[0]
+    if not args.write:
+        return
+
+    w1, b1, w2, b2 = params
+    q = quantize(best, w1, b1, w2, b2, x)
+    weights = {"w1": q[0], "b1": q[1], "w2": q[2], "b2": q[3], "SHIFT": best["shift"]}
+    pred, _ = int_model.mlp_inference(x, weights)
+    if not np.isclose(np.mean(pred == y), best["acc"]):
+        raise SystemExit("int_model disagrees with the search; nothing written")
+    print(f"\nWriting {describe(best)}")
+    write_artifacts(best, q)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Two-stage cascade: a small stage-1 net, the full MLP only when it is unsure
+
+mlp_inference() spends 784*32 + 32*10 = 25408 MACs on every image. With
+CASCADE 1, mlp.c first runs a 784->8->10 net (6352 MACs) and stops there when
+its top-1 logit beats the runner-up by at least CASCADE_MARGIN; otherwise it
+runs the full network as before. Easy digits cost a quarter of the MACs, and
+the cascade pays off as long as more than 6352 / 25408 = 25% of the images
+exit early.
+
+Stage 1 is an ordinary train_mlp.MLP:
+
+    python train_mlp.py --hidden 8              # -> mlp8.pth
+
+and is quantized here with the per-tensor scheme whatever the main network
+uses (hidden int32 after ReLU, >> CASCADE_SHIFT_BITS in layer 2). Bias mode
+"corrected" and the SHIFT come from calibrate.py's search, run on the
+calibration images. The margin is in stage-1 integer logit units.
+
+For a range of margins (default: the margins at which 10..90% of the images
+exit, plus --margins) the script reports on the test set, bit-exact with the
+firmware: the early-exit rate, the average MACs per image, the accuracy of
+the cascade and of the exits. The margin for --write is --margin, or the
+smallest one whose accuracy is within --max-drop points of the full MLP.
+
+--write emits vitis/mlp/weights_cascade.h; build mlp.c with -DCASCADE=1.
+--check builds that mlp.c on the host (host_kernels.py) and compares its
+predictions with the NumPy cascade.
+
+Usage:
+    python cascade.py                                   # table
+    python cascade.py --margins 500 1000 2000 --write   # table, emit the auto-picked margin
+    python cascade.py --margin 1500 --write --check
+"""
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+import int_model
+from calibrate import MLP_DIR, fits_int32, load_float_model, quantize
+from host_kernels import WEIGHT_HEADERS, HostKernels, build
+from load_mnist import downsample, load_images, load_labels, side_of
+
+STAGE1_HIDDEN = 8
+HEADER_NAME = "weights_cascade.h"
+DEFAULT_SHIFTS = tuple(range(4, 13))
+
+def macs(n_in, hidden, n_out=10):
+    return n_in * hidden + hidden * n_out
+
+def quantize_stage1(params, x_calib, y_calib, shifts=DEFAULT_SHIFTS):
+    """Per-tensor stage-1 weights with the calibration-best SHIFT: (w1q, b1q, w2q, b2q, shift)"""
+    best = None
+    for shift in shifts:
+        cfg = {"shift": shift, "clip1": 100.0, "clip2": 100.0, "bias": "corrected"}
+        w1q, b1q, w2q, b2q, _, _ = quantize(cfg, *params, x_calib)
+        if not fits_int32(w1q, b1q, w2q, b2q, shift):
+            continue
+        logits = stage1_logits(x_calib, (w1q, b1q, w2q, b2q, shift))
+        acc = np.mean(np.argmax(logits, axis=1) == y_calib)
+        if best is None or acc > best[0]:
+            best = (acc, (w1q, b1q, w2q, b2q, shift))
+    if best is None:
+        raise SystemExit("No SHIFT keeps the stage-1 sums inside int32")
+    return best[1]
+
+def stage1_logits(x, stage1):
+    w1q, b1q, w2q, b2q, shift = stage1
+    hidden = int_model.layer1_forward(x, w1q, b1q)
+    return int_model.layer2_forward(hidden, w2q, b2q, shift)
+
+def margins_of(logits):
+    """top-1 minus top-2 logit per image, as cascade_stage1() in mlp.c computes it"""
+    top2 = np.sort(logits.astype(np.int64), axis=1)[:, -2:]
+    return top2[:, 1] - top2[:, 0]
+
+def cascade_inference(x, weights, stage1, margin):
+    """
+    The firmware's CASCADE pipeline on a batch
+
+    Returns:
+        (predictions, exited) with shapes (N,); exited marks the stage-1 answers
+    """
+    logits = stage1_logits(x, stage1)
+    exited = margins_of(logits) >= margin
+    preds = np.argmax(logits, axis=1)
+    if not exited.all():
+        full, _ = int_model.mlp_inference(x[~exited], weights)
+        preds[~exited] = full
+    return preds, exited
+
+def sweep(x, y, weights, stage1, margins):
+    """One row per margin: (margin, exit rate, mean MACs, cascade accuracy, accuracy of the exits)"""
+    n_in, hidden = weights["w1"].shape[1], weights["w1"].shape[0]
+    full_macs = macs(n_in, hidden)
+    stage1_macs = macs(n_in, stage1[0].shape[0])
+    logits = stage1_logits(x, stage1)
+    m = margins_of(logits)
+    s1_pred = np.argmax(logits, axis=1)
+    full_pred, _ = int_model.mlp_inference(x, weights)
+    rows = []
+    for margin in margins:
+        exited = m >= margin
+        preds = np.where(exited, s1_pred, full_pred)
+        rate = exited.mean()
+        rows.append((margin, rate, stage1_macs + (1 - rate) * full_macs, np.mean(preds == y),
+                     np.mean(s1_pred[exited] == y[exited]) if exited.any() else float("nan")))
+    return rows
+
+def pick_margin(rows, full_acc, max_drop):
+    """Smallest margin whose cascade accuracy is within max_drop points of the full network"""
+    ok = [r[0] for r in rows if 100.0 * (full_acc - r[3]) <= max_drop]
+    return min(ok) if ok else None
+
+def _c_array(ctype, name, arr):
+    if arr.ndim == 1:
+        return f"static const {ctype} {name}[{arr.shape[0]}] = {{" + ",".join(str(int(v)) for v in arr) + "};\n"
+    rows = ",\n".join("  {" + ",".join(str(int(v)) for v in row) + "}" for row in arr)
+    return f"static const {ctype} {name}[{arr.shape[0]}][{arr.shape[1]}] = {{\n{rows}\n}};\n"
+
+def write_header(path, stage1, margin):
+    w1q, b1q, w2q, b2q, shift = stage1
+    with open(path, "w", newline=int_model.header_newline(path)) as f:
+        f.write("#pragma once\n#include <stdint.h>\n\n")
+        f.write("// Cascade stage 1 (training/cascade.py), per-tensor scheme; see mlp.c CASCADE\n")
+        f.write(f"#define CASCADE_HIDDEN {w1q.shape[0]}\n")
+        f.write(f"#define CASCADE_SHIFT_BITS {shift}\n")
+        f.write(f"#define CASCADE_MARGIN {margin}  // exit when top-1 - top-2 stage-1 logit >= this\n\n")
+        f.write(_c_array("int8_t", "s1_w1", w1q))
+        f.write(_c_array("int32_t", "s1_b1", b1q))
+        f.write(_c_array("int8_t", "s1_w2", w2q))
+        f.write(_c_array("int32_t", "s1_b2", b2q))
+
+def run_check(weights_dir, x, weights, stage1, margin, cc):
+    """Build mlp.c with CASCADE 1 on the host; returns the number of predictions that differ"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in WEIGHT_HEADERS:
+            shutil.copy(Path(weights_dir) / name, tmp)
+        write_header(Path(tmp) / HEADER_NAME, stage1, margin)
+        lib = build("scalar", tmp, Path(tmp) / "build", cc, defines=["-DCASCADE=1"])
+        kernels = HostKernels(lib, bool(weights.get("QUANT_PER_CHANNEL")), x.shape[1])
+        preds = kernels.inference_batch(np.ascontiguousarray(x), logits=False, hidden=False)[0]
+    ref, _ = cascade_inference(x, weights, stage1, margin)
+    return int(np.sum(preds != ref))
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize and evaluate the two-stage cascade")
+    parser.add_argument("--stage1", default="mlp8.pth", help="train_mlp.py --hidden 8 state dict")
+    parser.add_argument("--hidden", type=int, default=STAGE1_HIDDEN)
+    parser.add_argument("--weights", default=str(MLP_DIR), help="weights_*.h of the full network")
+    parser.add_argument("--images", default="../data/t10k-images.idx3-ubyte")
+    parser.add_argument("--labels", default="../data/t10k-labels.idx1-ubyte")
+    parser.add_argument("--calib", default="../data/train-images.idx3-ubyte")
+    parser.add_argument("--calib-labels", default="../data/train-labels.idx1-ubyte")
+    parser.add_argument("--calib-range", type=int, nargs=2, default=(50000, 55000),
+                        help="calibration slice of --calib (default: outside train_mlp.py's 20000)")
+    parser.add_argument("--margins", type=int, nargs="+", default=[], help="margins to report besides the defaults")
+    parser.add_argument("--margin", type=int, help="margin to write (default: picked with --max-drop)")
+    parser.add_argument("--max-drop", type=float, default=0.1,
+                        help="accuracy points the picked margin may lose against the full MLP")
+    parser.add_argument("--write", action="store_true", help=f"emit <weights>/{HEADER_NAME}")
+    parser.add_argument("--check", action="store_true", help="compare a host build of mlp.c with CASCADE 1")
+    parser.add_argument("--cc", help="C compiler for --check (default: cc or gcc)")
+    args = parser.parse_args()
+
+    weights = int_model.load_weights(args.weights)
+    n_in, hidden = weights["w1"].shape[1], weights["w1"].shape[0]
+    side = side_of(n_in)
+    x = downsample(load_images(args.images), side).reshape(-1, n_in)
+    y = load_labels(args.labels)[:len(x)]
+    lo, hi = args.calib_range
+    x_calib = downsample(load_images(args.calib)[lo:hi], side).reshape(-1, n_in)
+    y_calib = load_labels(args.calib_labels)[lo:hi][:len(x_calib)]
+    if not len(x_calib):
+        raise SystemExit(f"--calib-range {lo} {hi} selects no images of {args.calib}")
+
+    params = load_float_model(args.stage1, args.hidden)
+    if params[0].shape[1] != n_in:
+        raise SystemExit(f"{args.stage1} takes {params[0].shape[1]} inputs, the full MLP {n_in}")
+    stage1 = quantize_stage1(params, x_calib, y_calib)
+    full_pred, _ = int_model.mlp_inference(x, weights)
+    full_acc = np.mean(full_pred == y)
+    print(f"{len(x)} images from {args.images}")
+    print(f"Full MLP  {n_in}->{hidden}->10: {macs(n_in, hidden)} MACs, accuracy {100.0 * full_acc:.2f}%")
+    s1_acc = np.mean(np.argmax(stage1_logits(x, stage1), axis=1) == y)
+    print(f"Stage 1   {n_in}->{stage1[0].shape[0]}->10: {macs(n_in, stage1[0].shape[0])} MACs, "
+          f"accuracy {100.0 * s1_acc:.2f}%, SHIFT {stage1[4]}")
+
+    m = margins_of(stage1_logits(x, stage1))
+    margins = {int(v) for v in np.percentile(m, np.arange(10, 100, 10))}
+    margins.update(args.margins)
+    if args.margin is not None:
+        margins.add(args.margin)
+    rows = sweep(x, y, weights, stage1, sorted(margins))
+
+    print(f"\n{'margin':>8s} {'exit':>7s} {'MACs/img':>9s} {'saved':>6s} {'accuracy':>9s} {'exits acc':>10s}")
+    for margin, rate, mean_macs, acc, exit_acc in rows:
+        print(f"{margin:8d} {100.0 * rate:6.1f}% {mean_macs:9.0f} "
+              f"{100.0 * (1 - mean_macs / macs(n_in, hidden)):5.0f}% {100.0 * acc:8.2f}% {100.0 * exit_acc:9.2f}%")
+
+    margin = args.margin if args.margin is not None else pick_margin(rows, full_acc, args.max_drop)
+    if margin is None:
+        print(f"\nNo margin in the table stays within {args.max_drop} points; pass --margin")
+    else:
+        print(f"\nMargin for --write: {margin}")
+    if args.write and margin is not None:
+        out = Path(args.weights) / HEADER_NAME
+        write_header(out, stage1, margin)
+        print(f"Wrote {out}; build mlp.c with -DCASCADE=1")
+    if args.check and margin is not None:
+        bad = run_check(args.weights, x, weights, stage1, margin, args.cc)
+        print(f"Host mlp.c with CASCADE 1: {len(x) - bad}/{len(x)} predictions match; "
+              f"Check {'PASSED' if bad == 0 else 'FAILED'}")
+        if bad:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
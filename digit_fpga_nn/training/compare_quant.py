@@ -0,0 +1,72 @@
+"""
+Compare the per-tensor and per-channel quantization schemes
+
+Exports mlp32.pth both ways in memory, runs the bit-exact integer model
+(int_model.py) over the test set and prints accuracy next to the float model,
+plus an estimate of the MicroBlaze cycles per image for each scheme.
+
+The cycle figures come from the per-operation costs in int_model.CYCLES;
+data/device_bench.py measures the real ones on the board.
+"""
+import argparse
+
+import numpy as np
+import torch
+
+import int_model
+from int_model import CYCLES, estimate_cycles
+from export_weights_int8 import H, SHIFT, quantize_per_channel, quantize_per_tensor
+from load_mnist import load_images, load_labels
+from train_mlp import MLP
+
+def weights_dict(w1q, b1q, w2q, b2q, rq):
+    w = {"w1": w1q, "b1": b1q, "w2": w2q, "b2": b2q}
+    if rq is not None:
+        w.update(rq, QUANT_PER_CHANNEL=1)
+    return w
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-tensor vs per-channel quantization")
+    parser.add_argument("--calib", default="../data/train-images.idx3-ubyte")
+    parser.add_argument("--calib-n", type=int, default=5000)
+    parser.add_argument("--images", default="../data/t10k-images.idx3-ubyte")
+    parser.add_argument("--labels", default="../data/t10k-labels.idx1-ubyte")
+    parser.add_argument("--percentile", type=float, default=99.99)
+    args = parser.parse_args()
+
+    model = MLP(hidden=H)
+    model.load_state_dict(torch.load("mlp32.pth", map_location="cpu"))
+    model.eval()
+    w1 = model.fc1.weight.detach().numpy()
+    b1 = model.fc1.bias.detach().numpy()
+    w2 = model.fc2.weight.detach().numpy()
+    b2 = model.fc2.bias.detach().numpy()
+
+    x = load_images(args.images).reshape(-1, 784)
+    y = load_labels(args.labels)
+    x_calib = load_images(args.calib)[:args.calib_n].reshape(-1, 784)
+
+    with torch.no_grad():
+        float_pred = model(torch.tensor(x.astype(np.float32) / 255.0)).argmax(dim=1).numpy()
+
+    schemes = {
+        f"per-tensor (>>{SHIFT} in layer 2)": weights_dict(*quantize_per_tensor(w1, b1, w2, b2)),
+        "per-channel (multiply-shift)": weights_dict(*quantize_per_channel(w1, b1, w2, b2, x_calib, args.percentile)),
+    }
+
+    print(f"Test images: {len(x)}")
+    print(f"{'scheme':<34s} {'accuracy':>9s} {'agree w/ float':>15s}")
+    print(f"{'float32':<34s} {np.mean(float_pred == y):9.4f} {'-':>15s}")
+    for name, w in schemes.items():
+        pred, _ = int_model.mlp_inference(x, w)
+        print(f"{name:<34s} {np.mean(pred == y):9.4f} {np.mean(pred == float_pred):15.4f}")
+
+    print()
+    print("Estimated cycles per image (costs: " + ", ".join(f"{k}={v}" for k, v in CYCLES.items()) + ")")
+    print(f"{'scheme':<34s} {'layer1':>8s} {'requant':>8s} {'layer2':>8s} {'total':>8s}")
+    for name, per_channel in (("per-tensor", False), ("per-channel", True)):
+        l1, rq, l2, _ = estimate_cycles(per_channel)
+        print(f"{name:<34s} {l1:8d} {rq:8d} {l2:8d} {l1 + rq + l2:8d}")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
+import argparse
 import os
 import numpy as np
 import torch
 
+from int_model import artifact_shift
 from train_mlp import MLP
 
 H = 32
-SHIFT = 8  # keep consistent with your teammate's script
+SHIFT = artifact_shift()  # the one nn_core.v and weights_rq.h use (calibrate.py --write)
 
 def to_int8_with_scale(w: np.ndarray):
     max_abs = np.max(np.abs(w))
@@ -40,7 +42,68 @@ def i32_to_hex_list(arr_1d: np.ndarray):
     flat = arr_1d.reshape(-1)
     return [f"{(int(x) & 0xFFFFFFFF):08x}" for x in flat]
 
+# ----------------------------------------------------------------------
+# Layouts for nn_core with P parallel hidden neurons (nn_core.v parameter P)
+# ----------------------------------------------------------------------
+def bank_w1(w1q: np.ndarray, p: int):
+    """
+    w1 (H, N_IN) -> (H/P * N_IN, P): row g*N_IN + i holds w1[g*P + lane][i]
+    for lane = 0..P-1, which is the word nn_core reads at w1_index(g, i)
+    """
+    h, n_in = w1q.shape
+    assert h % p == 0, f"P={p} does not divide H={h}"
+    return w1q.reshape(h // p, p, n_in).transpose(0, 2, 1).reshape(-1, p)
+
+def bank_b1(b1q: np.ndarray, p: int):
+    """b1 (H,) -> (H/P, P): row g holds the biases of neurons g*P .. g*P+P-1"""
+    assert b1q.size % p == 0, f"P={p} does not divide H={b1q.size}"
+    return b1q.reshape(-1, p)
+
+def wide_hex_list(banked: np.ndarray, lane_bits: int):
+    """One hex word per row, lane 0 in the least significant bits"""
+    mask = (1 << lane_bits) - 1
+    digits = lane_bits // 4
+    return ["".join(f"{(int(v) & mask):0{digits}x}" for v in row[::-1]) for row in banked]
+
+def write_parallel_coe(out_dir, w1q, b1q, p, layout="wide"):
+    """
+    Write the w1/b1 init files for nn_core with P lanes
+
+    layout="wide":   w1_i8x{P}.coe / b1_i32x{P}.coe, one BRAM with 8*P / 32*P
+                     bit words (P=1 writes the original w1_i8.coe / b1_i32.coe)
+    layout="banked": w1_i8_bank{p}.coe / b1_i32_bank{p}.coe, P BRAMs of the
+                     original width whose douts are concatenated lane 0 first
+    Returns the list of files written.
+    """
+    w1b = bank_w1(w1q, p)
+    b1b = bank_b1(b1q, p)
+    if layout == "wide":
+        w1_name = "w1_i8.coe" if p == 1 else f"w1_i8x{p}.coe"
+        b1_name = "b1_i32.coe" if p == 1 else f"b1_i32x{p}.coe"
+        write_coe(os.path.join(out_dir, w1_name), wide_hex_list(w1b, 8), values_per_line=max(1, 32 // p))
+        write_coe(os.path.join(out_dir, b1_name), wide_hex_list(b1b, 32), values_per_line=max(1, 8 // p))
+        return [w1_name, b1_name]
+    if layout == "banked":
+        files = []
+        for lane in range(p):
+            w1_name = f"w1_i8_bank{lane}.coe"
+            b1_name = f"b1_i32_bank{lane}.coe"
+            write_coe(os.path.join(out_dir, w1_name), i8_to_hex_list(w1b[:, lane]), values_per_line=32)
+            write_coe(os.path.join(out_dir, b1_name), i32_to_hex_list(b1b[:, lane]), values_per_line=8)
+            files += [w1_name, b1_name]
+        return files
+    raise ValueError(f"unknown layout '{layout}'")
+
 def main():
+    parser = argparse.ArgumentParser(description="Export Vivado COE init files for nn_core")
+    parser.add_argument("--parallel", type=int, default=1,
+                        help="hidden neurons nn_core computes per cycle (its P / NN_P parameter)")
+    parser.add_argument("--layout", choices=("wide", "banked"), default="wide",
+                        help="w1/b1 for P > 1: one wide BRAM or P banked BRAMs")
+    args = parser.parse_args()
+    if H % args.parallel:
+        parser.error(f"--parallel must divide H={H}")
+
     # Load float model
     model = MLP(hidden=H)
     sd = torch.load(r"C:\ENEL400\microBlaze\digit_fpga_nn\training\mlp32.pth", map_location="cpu")
@@ -69,9 +132,13 @@ def main():
     print("b2q NEW formula:", np.round(b2 * s2 * (2**SHIFT)).astype(np.int32)[:5])
     print("b2q actually writing:", b2q[:5])
     # Write COE files
-    write_coe(os.path.join(out_dir, "w1_i8.coe"), i8_to_hex_list(w1q), values_per_line=32)
+    if args.parallel == 1 and args.layout == "wide":
+        write_coe(os.path.join(out_dir, "w1_i8.coe"), i8_to_hex_list(w1q), values_per_line=32)
+        write_coe(os.path.join(out_dir, "b1_i32.coe"), i32_to_hex_list(b1q), values_per_line=8)
+        w1_files = ["w1_i8.coe", "b1_i32.coe"]
+    else:
+        w1_files = write_parallel_coe(out_dir, w1q, b1q, args.parallel, args.layout)
     write_coe(os.path.join(out_dir, "w2_i8.coe"), i8_to_hex_list(w2q), values_per_line=32)
-    write_coe(os.path.join(out_dir, "b1_i32.coe"), i32_to_hex_list(b1q), values_per_line=8)
     write_coe(os.path.join(out_dir, "b2_i32.coe"), i32_to_hex_list(b2q), values_per_line=8)
 
     # Save scale info (so you don't lose it)
@@ -82,10 +149,18 @@ def main():
 
     print("Wrote Vivado init files to:", out_dir)
     print("Files:")
-    print("  w1_i8.coe  (depth = 32*784 = 25088, width = 8)")
-    print("  w2_i8.coe  (depth = 10*32  = 320,   width = 8)")
-    print("  b1_i32.coe (depth = 32,     width = 32)")
-    print("  b2_i32.coe (depth = 10,     width = 32)")
+    g = H // args.parallel
+    banks = args.parallel if args.layout == "banked" else 1
+    lane = 1 if args.layout == "banked" else args.parallel
+    for name in w1_files:
+        if name.startswith("w1"):
+            print(f"  {name:<18s} (depth = {g}*784 = {g * 784}, width = {8 * lane})")
+        else:
+            print(f"  {name:<18s} (depth = {g}, width = {32 * lane})")
+    if banks > 1:
+        print(f"  (concatenate the {banks} bank douts lane 0 first into w1_dout / b1_dout)")
+    print("  w2_i8.coe          (depth = 10*32  = 320,   width = 8)")
+    print("  b2_i32.coe         (depth = 10,     width = 32)")
     print("Quant params saved to quant_params.txt")
 
 if __name__ == "__main__":
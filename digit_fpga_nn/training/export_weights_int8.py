@@ -1,8 +1,16 @@
+import argparse
+import os
 import numpy as np
 import torch
 from train_mlp import MLP
+from int_model import artifact_shift, header_newline
+from load_mnist import SIDE, downsample, load_images, side_of
+from swar_pack import write_w1p_header
 
 H = 32
+SHIFT = artifact_shift()  # 8 unless calibrate.py --write chose another
+LOGIT_FRAC_BITS = 8   # per-channel scheme: logits are emitted as float_logit * 2^8
+ACT_MAX = 127         # per-channel scheme: hidden activations are int8 in 0..127
 
 def to_int8_with_scale(w: np.ndarray):
     max_abs = np.max(np.abs(w))
@@ -13,8 +21,73 @@ def to_int8_with_scale(w: np.ndarray):
     wq = np.round(w * scale).astype(np.int8)
     return wq, scale
 
+def to_int8_per_channel(w: np.ndarray):
+    """One scale per output row: w[o] * scale[o] spans -127..127"""
+    max_abs = np.max(np.abs(w), axis=1)
+    scale = np.where(max_abs < 1e-12, 1.0, 127.0 / np.maximum(max_abs, 1e-12))
+    wq = np.round(w * scale[:, None]).astype(np.int8)
+    return wq, scale
+
+def quantize_multiplier(m):
+    """
+    Express each real multiplier as mult * 2^-shift with mult in [2^30, 2^31)
+
+    Applied in firmware as (int64)acc * mult + 2^(shift-1) >> shift.
+    """
+    m = np.asarray(m, dtype=np.float64)
+    mant, exp = np.frexp(m)                      # m = mant * 2^exp, mant in [0.5, 1)
+    mult = np.round(mant * (1 << 31)).astype(np.int64)
+    shift = 31 - exp
+    carry = mult == (1 << 31)                    # mant rounded up to 1.0
+    mult[carry] //= 2
+    shift[carry] -= 1
+    if np.any(shift < 1) or np.any(shift > 62):
+        raise ValueError(f"requantization shift out of range: {shift}")
+    return mult.astype(np.int32), shift.astype(np.int32)
+
+def calibrate_activation_scales(w1, b1, x_calib, percentile=99.99):
+    """Per-hidden-unit activation scale so the calibration percentile maps to ACT_MAX"""
+    hidden = np.maximum(x_calib.astype(np.float32) / 255.0 @ w1.T + b1, 0.0)
+    hmax = np.percentile(hidden, percentile, axis=0)
+    return np.where(hmax > 1e-6, hmax / ACT_MAX, 1.0 / ACT_MAX)
+
+def quantize_per_channel(w1, b1, w2, b2, x_calib, percentile=99.99):
+    """
+    Per-output-channel weights plus multiply-shift requantization
+
+    Layer 1: acc1[h] = w1q[h] . x + b1q[h]            (x is raw uint8 0..255)
+             a[h]    = clamp((acc1 * m1 + r) >> s1, 0, 127)   int8 activation
+    Layer 2: acc2[o] = w2q[o] . a + b2q[o]             pure int8 x int8 MAC
+             out[o]  = (acc2 * m2 + r) >> s2           logit * 2^LOGIT_FRAC_BITS
+    """
+    act_scale = calibrate_activation_scales(w1, b1, x_calib, percentile)
+
+    w1q, s1 = to_int8_per_channel(w1)
+    b1q = np.round(b1 * s1 * 255.0).astype(np.int32)
+    rq1_mult, rq1_shift = quantize_multiplier(1.0 / (255.0 * s1 * act_scale))
+
+    # Fold the activation scales into w2's columns before quantizing its rows
+    w2q, s2 = to_int8_per_channel(w2 * act_scale[None, :])
+    b2q = np.round(b2 * s2).astype(np.int32)
+    rq2_mult, rq2_shift = quantize_multiplier((1 << LOGIT_FRAC_BITS) / s2)
+
+    rq = {"rq1_mult": rq1_mult, "rq1_shift": rq1_shift,
+          "rq2_mult": rq2_mult, "rq2_shift": rq2_shift}
+    return w1q, b1q, w2q, b2q, rq
+
+def quantize_per_tensor(w1, b1, w2, b2):
+    """Original scheme: one scale per matrix, hidden >> SHIFT inside layer 2"""
+    w1q, s1 = to_int8_with_scale(w1)
+    w2q, s2 = to_int8_with_scale(w2)
+    # biases: keep as int32, scale them roughly to match math
+    # We'll treat input as centered uint8 (-128..127) so input scale ~1.
+    b1q = np.round(b1 * s1).astype(np.int32)
+    # Layer2 input is ReLU output; we will later downshift by SHIFT in HLS.
+    b2q = np.round(b2 * s2 * (2**SHIFT)).astype(np.int32)
+    return w1q, b1q, w2q, b2q, None
+
 def write_i8_2d(path, name, arr):
-    with open(path, "w") as f:
+    with open(path, "w", newline=header_newline(path)) as f:
         f.write("#pragma once\n#include <stdint.h>\n\n")
         f.write(f"static const int8_t {name}[{arr.shape[0]}][{arr.shape[1]}] = {{\n")
         for r in range(arr.shape[0]):
@@ -25,46 +98,84 @@ def write_i8_2d(path, name, arr):
         f.write("};\n")
 
 def write_i32_1d(path, name, arr):
-    with open(path, "w") as f:
+    with open(path, "w", newline=header_newline(path)) as f:
         f.write("#pragma once\n#include <stdint.h>\n\n")
         f.write(f"static const int32_t {name}[{arr.shape[0]}] = {{")
         f.write(",".join(str(int(x)) for x in arr))
         f.write("};\n")
 
+def write_rq_header(path, rq, shift=SHIFT, input_side=SIDE):
+    """
+    weights_rq.h: selects the firmware quantization scheme and holds its
+    multipliers, or the layer-2 downshift SHIFT_BITS of the per-tensor scheme.
+    Reduced-resolution models also set the firmware's INPUT_SIDE.
+    """
+    with open(path, "w", newline=header_newline(path)) as f:
+        f.write("#pragma once\n#include <stdint.h>\n\n")
+        if input_side != SIDE:
+            f.write(f"#define INPUT_SIDE {input_side}  // images are block-averaged from 28x28\n")
+        if rq is None:
+            f.write("#define QUANT_PER_CHANNEL 0\n")
+            f.write(f"#define SHIFT_BITS {shift}\n")
+            return
+        f.write("#define QUANT_PER_CHANNEL 1\n")
+        f.write(f"#define LOGIT_FRAC_BITS {LOGIT_FRAC_BITS}\n\n")
+        for name in ("rq1_mult", "rq1_shift", "rq2_mult", "rq2_shift"):
+            arr = rq[name]
+            ctype = "int32_t" if name.endswith("mult") else "uint8_t"
+            f.write(f"static const {ctype} {name}[{arr.shape[0]}] = {{")
+            f.write(",".join(str(int(x)) for x in arr))
+            f.write("};\n")
+
 def main():
-    # load float model
-    model = MLP(hidden=H)
-    sd = torch.load("mlp32.pth", map_location="cpu")
+    parser = argparse.ArgumentParser(description="Export int8 weights as C headers")
+    parser.add_argument("--scheme", choices=("per-channel", "per-tensor"), default="per-tensor")
+    parser.add_argument("--calib", default="../data/train-images.idx3-ubyte",
+                        help="IDX images used to calibrate activation scales (per-channel)")
+    parser.add_argument("--calib-n", type=int, default=5000)
+    parser.add_argument("--percentile", type=float, default=99.99)
+    parser.add_argument("--out-dir", default="../hls_nn/weights")
+    parser.add_argument("--model", default="mlp32.pth", help="train_mlp.py state dict (any --side)")
+    args = parser.parse_args()
+    if args.scheme == "per-channel" and not os.path.exists(args.calib):
+        parser.error(f"--calib {args.calib} not found (per-channel needs calibration images)")
+
+    # load float model; the input size follows the checkpoint (784, or 196 for --side 14)
+    sd = torch.load(args.model, map_location="cpu")
+    n_in = sd["fc1.weight"].shape[1]
+    side = side_of(n_in)
+    model = MLP(hidden=H, n_in=n_in)
     model.load_state_dict(sd)
     model.eval()
 
-    w1 = model.fc1.weight.detach().numpy()  # (H,784)
+    w1 = model.fc1.weight.detach().numpy()  # (H,n_in)
     b1 = model.fc1.bias.detach().numpy()    # (H,)
     w2 = model.fc2.weight.detach().numpy()  # (10,H)
     b2 = model.fc2.bias.detach().numpy()    # (10,)
 
-    # quantize weights
-    w1q, s1 = to_int8_with_scale(w1)
-    w2q, s2 = to_int8_with_scale(w2)
-
-    # biases: keep as int32, scale them roughly to match math
-    # We'll treat input as centered uint8 (-128..127) so input scale ~1.
-    b1q = np.round(b1 * s1).astype(np.int32)
-    # Layer2 input is ReLU output; we will later downshift by SHIFT in HLS.
-    SHIFT = 8
-    b2q = np.round(b2 * s2 * (2**SHIFT)).astype(np.int32)
+    if args.scheme == "per-channel":
+        x_calib = downsample(load_images(args.calib)[:args.calib_n], side).reshape(-1, n_in)
+        w1q, b1q, w2q, b2q, rq = quantize_per_channel(w1, b1, w2, b2, x_calib, args.percentile)
+    else:
+        w1q, b1q, w2q, b2q, rq = quantize_per_tensor(w1, b1, w2, b2)
 
-    out_dir = "../hls_nn/weights"
-    import os
+    out_dir = args.out_dir
     os.makedirs(out_dir, exist_ok=True)
 
     write_i8_2d(f"{out_dir}/weights_w1.h", "w1", w1q)
     write_i32_1d(f"{out_dir}/weights_b1.h", "b1", b1q)
     write_i8_2d(f"{out_dir}/weights_w2.h", "w2", w2q)
     write_i32_1d(f"{out_dir}/weights_b2.h", "b2", b2q)
+    write_rq_header(f"{out_dir}/weights_rq.h", rq, input_side=side)
+    n_chunks = write_w1p_header(f"{out_dir}/weights_w1p.h", w1q)  # packed w1 for LAYER1_SWAR builds
 
-    print("Exported int8 weights to hls_nn/weights/")
-    print("Scales:", s1, s2, "SHIFT:", SHIFT)
+    print(f"Exported int8 weights ({args.scheme}, {side}x{side} input) to {out_dir}/")
+    print(f"SWAR layer-1 schedule: {n_chunks} chunks")
+    if rq is None:
+        print("SHIFT:", SHIFT)
+    else:
+        print("rq1 shifts:", rq["rq1_shift"].min(), "..", rq["rq1_shift"].max(),
+              " rq2 shifts:", rq["rq2_shift"].min(), "..", rq["rq2_shift"].max())
 
 if __name__ == "__main__":
     main()
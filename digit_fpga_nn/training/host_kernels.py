@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Host build of the vitis/mlp/mlp.c inference kernels, loaded with ctypes
+
+mlp.c compiled with -DMLP_HOST_KERNELS=1 keeps only the weights and the
+inference functions (layer1_forward, layer2_forward, argmax, mlp_inference,
+plus mlp_inference_batch). build() turns it into a shared library for one
+firmware variant and one set of weight headers:
+
+    scalar          the default firmware build
+    swar            LAYER1_SWAR=1, layer 1 on layer1_swar.h
+    unrolled        WEIGHTS_UNROLLED=1, layer 2 from unroll_gen.py
+    swar+unrolled   both
+
+weights_w1p.h and weights_unrolled.h are regenerated from the weights in the
+build directory, so every variant runs the same network. A weights directory
+without weights_rq.h (vivado_init predates it) gets a per-tensor one with
+SHIFT_BITS from its quant_params.txt. HostKernels hands
+NumPy arrays to the C functions without copying; they must be C-contiguous
+with the firmware dtypes, which the ndpointer argtypes enforce.
+
+The script runs every variant over the t10k set, compares predictions,
+logits and hidden activations with int_model bit for bit, and times
+mlp_inference_batch(). Host times rank the variants only roughly: x86
+vectorizes the scalar loops and the board does not (device_bench.py
+measures the board).
+
+Usage:
+    python host_kernels.py                               # all variants, check + time
+    python host_kernels.py --variants scalar unrolled --repeat 5
+    python host_kernels.py --weights ../hls_nn/weights/vivado_init
+"""
+
+import argparse
+import ctypes
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import int_model
+from export_weights_int8 import write_rq_header
+from load_mnist import downsample, load_images, load_labels, side_of
+from swar_pack import DEFAULT_WEIGHTS_DIR, write_w1p_header
+from unroll_gen import HEADER_NAME, write_header
+
+MLP_DIR = DEFAULT_WEIGHTS_DIR   # vitis/mlp: mlp.c, layer1_swar.h and the compiled-in weights
+WEIGHT_HEADERS = ("weights_w1.h", "weights_b1.h", "weights_w2.h", "weights_b2.h", "weights_rq.h")
+
+VARIANTS = {
+    "scalar": [],
+    "swar": ["-DLAYER1_SWAR=1"],
+    "unrolled": ["-DWEIGHTS_UNROLLED=1"],
+    "swar+unrolled": ["-DLAYER1_SWAR=1", "-DWEIGHTS_UNROLLED=1"],
+}
+
+def build(variant, weights_dir=MLP_DIR, build_dir=None, cc=None, defines=()):
+    """
+    Compile mlp.c as a shared library for one variant
+
+    Args:
+        variant: key of VARIANTS
+        weights_dir: directory with the weights_*.h to compile in
+        build_dir: where sources and the library go (default: a new temp dir)
+        cc: C compiler (default: cc or gcc)
+        defines: extra -D flags, e.g. ["-DCASCADE=1"] (weights_cascade.h is
+            copied along when weights_dir has it)
+
+    Returns:
+        Path of the library
+    """
+    cc = cc or shutil.which("cc") or shutil.which("gcc")
+    if cc is None:
+        raise RuntimeError("No C compiler found")
+    build_dir = Path(build_dir or tempfile.mkdtemp(prefix="mlp_host_"))
+    build_dir.mkdir(parents=True, exist_ok=True)
+
+    # mlp.c includes its headers with quotes, so they are looked up next to
+    # it first: everything is copied into one directory
+    for name in ("mlp.c", "layer1_swar.h"):
+        shutil.copy(MLP_DIR / name, build_dir)
+    for name in WEIGHT_HEADERS:
+        if name == "weights_rq.h" and not (Path(weights_dir) / name).exists():
+            w1 = int_model.load_weights(weights_dir)["w1"]
+            write_rq_header(build_dir / name, None, int_model.artifact_shift(weights_dir), side_of(w1.shape[1]))
+            continue
+        shutil.copy(Path(weights_dir) / name, build_dir)
+    if (Path(weights_dir) / "weights_cascade.h").exists():
+        shutil.copy(Path(weights_dir) / "weights_cascade.h", build_dir)
+    weights = int_model.load_weights(build_dir)
+    if "-DLAYER1_SWAR=1" in VARIANTS[variant]:
+        write_w1p_header(build_dir / "weights_w1p.h", weights["w1"])
+    if "-DWEIGHTS_UNROLLED=1" in VARIANTS[variant]:
+        write_header(build_dir / HEADER_NAME, weights, weights.get("SHIFT", int_model.SHIFT))
+
+    # -fwrapv: int32 overflow wraps as on RV32 (and as int_model's casts do)
+    lib = build_dir / f"libmlp_{variant.replace('+', '_')}.so"
+    subprocess.run([cc, "-O2", "-std=c99", "-fwrapv", "-shared", "-fPIC", "-DMLP_HOST_KERNELS=1",
+                    *VARIANTS[variant], *defines, "-o", str(lib), str(build_dir / "mlp.c")], check=True)
+    return lib
+
+def _array(dtype, ndim):
+    return np.ctypeslib.ndpointer(dtype=dtype, ndim=ndim, flags="C_CONTIGUOUS")
+
+class HostKernels:
+    """
+    ctypes bindings of one library from build()
+
+    Args:
+        lib_path: the shared library
+        per_channel: QUANT_PER_CHANNEL of the weights it was built with
+            (hidden activations are int8 then, int32 otherwise)
+    """
+
+    def __init__(self, lib_path, per_channel, n_in=int_model.INPUT_SIZE, hidden=32, n_out=10):
+        self.lib = ctypes.CDLL(str(lib_path))
+        self.n_in, self.hidden, self.n_out = n_in, hidden, n_out
+        self.hidden_dtype = np.int8 if per_channel else np.int32
+        u8, i32, hid = _array(np.uint8, 1), _array(np.int32, 1), _array(self.hidden_dtype, 1)
+
+        self.lib.layer1_forward.argtypes = [u8, hid]
+        self.lib.layer1_forward.restype = None
+        self.lib.layer2_forward.argtypes = [hid, i32]
+        self.lib.layer2_forward.restype = None
+        self.lib.argmax.argtypes = [i32, ctypes.c_int]
+        self.lib.argmax.restype = ctypes.c_int
+        self.lib.mlp_inference.argtypes = [u8]
+        self.lib.mlp_inference.restype = ctypes.c_int
+        # NULL logits / hidden are allowed, so these two stay plain pointers
+        self.lib.mlp_inference_batch.argtypes = [_array(np.uint8, 2), ctypes.c_int, i32,
+                                                 ctypes.c_void_p, ctypes.c_void_p]
+        self.lib.mlp_inference_batch.restype = None
+
+    def layer1_forward(self, image):
+        out = np.empty(self.hidden, dtype=self.hidden_dtype)
+        self.lib.layer1_forward(image, out)
+        return out
+
+    def layer2_forward(self, hidden):
+        out = np.empty(self.n_out, dtype=np.int32)
+        self.lib.layer2_forward(hidden, out)
+        return out
+
+    def argmax(self, values):
+        return self.lib.argmax(values, len(values))
+
+    def mlp_inference(self, image):
+        return self.lib.mlp_inference(image)
+
+    def inference_batch(self, images, logits=True, hidden=True):
+        """
+        mlp_inference() on every row of a C-contiguous (N, n_in) uint8 array
+
+        Returns:
+            (preds, logits, hidden); logits / hidden are None when not requested
+        """
+        n = len(images)
+        preds = np.empty(n, dtype=np.int32)
+        out = np.empty((n, self.n_out), dtype=np.int32) if logits else None
+        hid = np.empty((n, self.hidden), dtype=self.hidden_dtype) if hidden else None
+        self.lib.mlp_inference_batch(images, n, preds,
+                                     None if out is None else out.ctypes.data,
+                                     None if hid is None else hid.ctypes.data)
+        return preds, out, hid
+
+def reference(images, weights):
+    """int_model predictions, logits and hidden activations for the same images"""
+    preds, logits = int_model.mlp_inference(images, weights)
+    if weights.get("QUANT_PER_CHANNEL"):
+        hidden = int_model.layer1_forward_rq(images, weights["w1"], weights["b1"],
+                                             weights["rq1_mult"], weights["rq1_shift"])
+    else:
+        hidden = int_model.layer1_forward(images, weights["w1"], weights["b1"])
+    return preds, logits, hidden
+
+def check(kernels, images, ref):
+    """Images whose prediction, logits or hidden activations differ from int_model"""
+    preds, logits, hidden = kernels.inference_batch(images)
+    bad = (preds != ref[0]) | np.any(logits != ref[1], axis=1) | np.any(hidden != ref[2], axis=1)
+    # The single-image entry points share the code; spot-check that they agree
+    k = int(np.argmax(bad)) if bad.any() else 0
+    h = kernels.layer1_forward(images[k])
+    out = kernels.layer2_forward(h)
+    if kernels.mlp_inference(images[k]) != kernels.argmax(out) or not np.array_equal(out, logits[k]):
+        bad[k] = True
+    return np.flatnonzero(bad)
+
+def bench(kernels, images, repeat):
+    """Best of `repeat` runs of mlp_inference_batch(), in microseconds per image"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        kernels.inference_batch(images, logits=False, hidden=False)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1e6 / len(images)
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the mlp.c kernels on the host")
+    parser.add_argument("--weights", default=str(MLP_DIR), help="directory with the weights_*.h")
+    parser.add_argument("--images", default="../data/t10k-images.idx3-ubyte")
+    parser.add_argument("--labels", default="../data/t10k-labels.idx1-ubyte")
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per variant (best is reported)")
+    parser.add_argument("--build-dir", help="keep sources and libraries here (default: temp dirs)")
+    parser.add_argument("--cc", help="C compiler (default: cc or gcc)")
+    args = parser.parse_args()
+
+    weights = int_model.load_weights(args.weights)
+    n_in = weights["w1"].shape[1]
+    images = downsample(load_images(args.images), side_of(n_in)).reshape(-1, n_in)
+    images = np.ascontiguousarray(images, dtype=np.uint8)
+    labels = load_labels(args.labels)[:len(images)]
+    per_channel = bool(weights.get("QUANT_PER_CHANNEL"))
+    ref = reference(images, weights)
+    print(f"{len(images)} images from {args.images}, weights {args.weights} "
+          f"({'per-channel' if per_channel else 'per-tensor'}), int_model accuracy "
+          f"{100.0 * np.mean(ref[0] == labels):.2f}%")
+
+    print(f"\n{'variant':<14s} {'bit-exact':>13s} {'accuracy':>9s} {'us/image':>9s} {'images/s':>9s}")
+    failed = 0
+    for variant in args.variants:
+        build_dir = Path(args.build_dir) / variant.replace("+", "_") if args.build_dir else None
+        kernels = HostKernels(build(variant, args.weights, build_dir, args.cc), per_channel, n_in)
+        bad = check(kernels, images, ref)
+        preds = kernels.inference_batch(images, logits=False, hidden=False)[0]
+        us = bench(kernels, images, args.repeat)
+        print(f"{variant:<14s} {len(images) - len(bad):>6d}/{len(images):<6d} "
+              f"{100.0 * np.mean(preds == labels):8.2f}% {us:9.2f} {1e6 / us:9.0f}")
+        if len(bad):
+            print(f"  first mismatches: {', '.join(str(i) for i in bad[:10])}")
+            failed += 1
+
+    print(f"\nCheck {'PASSED' if not failed else 'FAILED'}")
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Integer reference model of the firmware inference in vitis/mlp/mlp.c
+
+Reproduces layer1_forward / layer2_forward / argmax bit-for-bit with NumPy,
+batched over images, so host tools can tell what the board will answer
+without the board.
+"""
+import re
+from pathlib import Path
+
+import numpy as np
+
+INPUT_SIZE = 784
+SHIFT = 8
+
+DEFAULT_WEIGHTS_DIR = Path(__file__).resolve().parent.parent / "hls_nn" / "weights" / "vivado_init"
+
+_DTYPES = {"int8_t": np.int8, "uint8_t": np.uint8, "int16_t": np.int16,
+           "int32_t": np.int32, "uint32_t": np.uint32}
+
+# Estimated cycles per operation on MicroBlaze RISC-V (RV32IM, no hardware divider)
+CYCLES = {
+    "mac": 4,        # load weight, load operand, mul, add
+    "shift": 1,      # per-tensor hidden[h] >> act_shift: one sra, the amount in a register
+    "requant": 12,   # mul + mulh, add, 64-bit shift, clamp
+    "compare": 3,    # argmax: load, compare, branch
+    "swar_mac": 4,   # layer1_swar.h: load packed word, load pixel, mul, add (two MACs)
+    "swar_flush": 8, # split the 16-bit lanes, add to 32-bit sums, next chunk end
+    "loop": 3,       # inner-loop overhead per iteration: increment, compare, branch
+    "const_mul": 4,  # unroll_gen.py products: load operand, li weight, mul, add
+    "const_shift": 3,  # power-of-two weight: load operand, slli, add
+    "const_add": 2,  # weight +-1: load operand, add or sub
+    "delta_mac": 6,  # command 'D' column update: load weight (strided), mul, load, add, store sum
+    "delta_pixel": 10,  # per entry: load index and value, load/store the pixel, subtract, branch
+}
+
+def estimate_cycles(per_channel, n_in=INPUT_SIZE, hidden=32, n_out=10):
+    """Per-image cycle estimate: (layer 1, requantization, layer 2, argmax)"""
+    l1 = n_in * hidden * CYCLES["mac"]
+    if per_channel:
+        rq = hidden * CYCLES["requant"]
+        l2 = hidden * n_out * CYCLES["mac"] + n_out * CYCLES["requant"]
+    else:
+        rq = 0
+        l2 = hidden * n_out * (CYCLES["mac"] + CYCLES["shift"])
+    return l1, rq, l2, n_out * CYCLES["compare"]
+
+def estimate_delta_cycles(per_channel, n_changed, n_in=INPUT_SIZE, hidden=32, n_out=10):
+    """
+    Cycle estimate of command 'D' with n_changed pixels, same stages as
+    estimate_cycles(): layer 1 becomes a column update per changed pixel
+    """
+    _, rq, l2, am = estimate_cycles(per_channel, n_in, hidden, n_out)
+    return n_changed * (CYCLES["delta_pixel"] + hidden * CYCLES["delta_mac"]), rq, l2, am
+
+def estimate_sweep_cycles(per_channel, n_in=INPUT_SIZE, hidden=32, n_out=10):
+    """
+    Cycle estimate of command 'P' (all n_in single-pixel variants of one
+    base), same stages as estimate_cycles(): one column update per pixel
+    """
+    _, rq, l2, am = estimate_cycles(per_channel, n_in, hidden, n_out)
+    return n_in * hidden * CYCLES["delta_mac"], n_in * rq, n_in * l2, n_in * am
+
+def _strip_comments(text):
+    text = re.sub(r'//.*', '', text)
+    return re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+
+def load_h_arrays(path):
+    """Parse every 'static const <type> name[A][B] = {...};' in a header into {name: array}"""
+    text = _strip_comments(Path(path).read_text())
+    arrays = {}
+    for m in re.finditer(r'(\w+)\s+(\w+)((?:\[\d+\])+)\s*=\s*\{(.*?)\}\s*;', text, flags=re.S):
+        ctype, name, dims, init = m.groups()
+        shape = tuple(int(d) for d in re.findall(r'\d+', dims))
+        nums = np.array([int(x) for x in re.findall(r'-?\d+', init)], dtype=np.int64)
+        arrays[name] = nums.astype(_DTYPES.get(ctype, np.int64)).reshape(shape)
+    return arrays
+
+def load_h_array(path):
+    """Parse the first array initializer written by export_weights_int8.py"""
+    arrays = load_h_arrays(path)
+    if not arrays:
+        raise ValueError(f"Could not find initializer in {path}")
+    return next(iter(arrays.values()))
+
+def load_h_defines(path):
+    """Integer '#define NAME value' lines of a header"""
+    text = _strip_comments(Path(path).read_text())
+    return {k: int(v) for k, v in re.findall(r'#define\s+(\w+)\s+(-?\d+)\b', text)}
+
+def header_newline(path):
+    """
+    Line ending to (re)write the header at path with: the one it already
+    has, or for a new file that of the other headers in its directory
+    (vitis/mlp is CRLF, the exporter's output directories are LF)
+    """
+    path = Path(path)
+    for f in [path] + sorted(path.parent.glob("*.h")):
+        if f.is_file():
+            return "\r\n" if b"\r\n" in f.read_bytes() else "\n"
+    return "\n"
+
+def load_weights(weights_dir=DEFAULT_WEIGHTS_DIR):
+    """
+    Load w1, b1, w2, b2 from the weights_*.h headers in weights_dir
+
+    If weights_rq.h is present its defines and requantization arrays are
+    added too; QUANT_PER_CHANNEL selects the scheme mlp_inference() runs and
+    SHIFT_BITS (per-tensor) becomes "SHIFT", as in weights_blob.unpack_blob().
+    """
+    weights_dir = Path(weights_dir)
+    weights = {name: load_h_array(weights_dir / f"weights_{name}.h")
+               for name in ("w1", "b1", "w2", "b2")}
+    rq_path = weights_dir / "weights_rq.h"
+    if rq_path.exists():
+        weights.update(load_h_defines(rq_path))
+        weights.update(load_h_arrays(rq_path))
+        if "SHIFT_BITS" in weights:
+            weights["SHIFT"] = weights["SHIFT_BITS"]
+    return weights
+
+def load_quant_params(weights_dir=DEFAULT_WEIGHTS_DIR):
+    """key=value lines of quant_params.txt in weights_dir as strings, {} without the file"""
+    path = Path(weights_dir) / "quant_params.txt"
+    if not path.exists():
+        return {}
+    return dict(line.split("=", 1) for line in path.read_text().split() if "=" in line)
+
+def artifact_shift(weights_dir=DEFAULT_WEIGHTS_DIR):
+    """
+    Per-tensor layer-2 downshift of the exported artifacts: SHIFT from
+    quant_params.txt (calibrate.py --write keeps it equal to nn_core.v's
+    SHIFT), else SHIFT_BITS from weights_rq.h, else the original SHIFT
+    """
+    params = load_quant_params(weights_dir)
+    if "SHIFT" in params:
+        return int(params["SHIFT"])
+    rq_path = Path(weights_dir) / "weights_rq.h"
+    if rq_path.exists():
+        return load_h_defines(rq_path).get("SHIFT_BITS", SHIFT)
+    return SHIFT
+
+def requantize(acc, mult, shift):
+    """(int64)acc * mult + 2^(shift-1) >> shift, as in requantize() in mlp.c"""
+    prod = acc.astype(np.int64) * mult.astype(np.int64)
+    shift = shift.astype(np.int64)
+    return (prod + (np.int64(1) << (shift - 1))) >> shift
+
+def layer1_forward(x, w1, b1):
+    """hidden = ReLU(W1 * x + b1) for uint8 images x of shape (N, n_in), n_in = 784 or a downsampled size"""
+    acc = x.astype(np.int64) @ w1.astype(np.int64).T + b1.astype(np.int64)
+    return np.maximum(acc, 0).astype(np.int32)
+
+def layer2_forward(hidden, w2, b2, shift=SHIFT):
+    """logits = W2 * (hidden / 2^shift) + b2, hidden is non-negative so >> == /"""
+    hs = hidden.astype(np.int64) >> shift
+    return (hs @ w2.astype(np.int64).T + b2.astype(np.int64)).astype(np.int32)
+
+def layer1_forward_rq(x, w1, b1, rq1_mult, rq1_shift):
+    """Per-channel scheme: int8 activations a = clamp(requantize(W1 * x + b1), 0, 127)"""
+    acc = x.astype(np.int64) @ w1.astype(np.int64).T + b1.astype(np.int64)
+    return np.clip(requantize(acc, rq1_mult, rq1_shift), 0, 127).astype(np.int8)
+
+def layer2_forward_rq(hidden, w2, b2, rq2_mult, rq2_shift):
+    """Per-channel scheme: int8 x int8 MAC, then one requantize per output"""
+    acc = hidden.astype(np.int64) @ w2.astype(np.int64).T + b2.astype(np.int64)
+    return requantize(acc.astype(np.int32), rq2_mult, rq2_shift).astype(np.int32)
+
+def mlp_inference(x, weights, shift=None):
+    """
+    Run the firmware integer pipeline on a batch of images
+
+    Args:
+        x: uint8 array of shape (N, n_in) or (n_in,), n_in = w1.shape[1]
+        weights: dict from load_weights()
+        shift: per-tensor layer-2 downshift, default weights["SHIFT"] or SHIFT
+
+    Returns:
+        (predictions, logits) with shapes (N,) and (N, 10)
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=np.uint8)).reshape(-1, weights["w1"].shape[1])
+    if weights.get("QUANT_PER_CHANNEL"):
+        hidden = layer1_forward_rq(x, weights["w1"], weights["b1"],
+                                   weights["rq1_mult"], weights["rq1_shift"])
+        logits = layer2_forward_rq(hidden, weights["w2"], weights["b2"],
+                                   weights["rq2_mult"], weights["rq2_shift"])
+    else:
+        hidden = layer1_forward(x, weights["w1"], weights["b1"])
+        shift = weights.get("SHIFT", SHIFT) if shift is None else shift
+        logits = layer2_forward(hidden, weights["w2"], weights["b2"], shift)
+    # np.argmax keeps the first maximum, same as argmax() in mlp.c
+    return np.argmax(logits, axis=1), logits
+
+def pixel_sweep(weights, value, base=None):
+    """
+    Reference for mlp.c command 'P': every single-pixel variant of base
+
+    Row i of the batch is base (zeros if None) with x[i] = value.
+
+    Returns:
+        (predictions, logits) of the n_in variants, as from mlp_inference()
+    """
+    n_in = weights["w1"].shape[1]
+    base = np.zeros(n_in, dtype=np.uint8) if base is None else np.asarray(base, dtype=np.uint8).reshape(n_in)
+    x = np.repeat(base[None], n_in, axis=0)
+    x[np.arange(n_in), np.arange(n_in)] = value
+    return mlp_inference(x, weights)
+
+if __name__ == "__main__":
+    w = load_weights()
+    img = np.fromfile(Path(__file__).resolve().parent / "img_28x28.bin", dtype=np.uint8)
+    preds, logits = mlp_inference(img, w)
+    print("Integer model pred:", int(preds[0]))
+    print("Logits:", ",".join(str(int(v)) for v in logits[0]))
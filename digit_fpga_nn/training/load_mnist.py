@@ -1,5 +1,7 @@
 import numpy as np
 
+SIDE = 28   # MNIST resolution; downsample() derives the smaller input variants
+
 def load_images(path):
     with open(path, "rb") as f:
         magic = int.from_bytes(f.read(4), "big")
@@ -10,6 +12,33 @@ def load_images(path):
         data = np.frombuffer(f.read(), dtype=np.uint8)
     return data.reshape(n, r, c)
 
+def downsample(images, side):
+    """
+    Shrink uint8 digits to side x side by averaging k x k blocks (k = 28 / side)
+
+    Takes (..., 28, 28) or flattened (..., 784) and returns the same layout at
+    the new size, rounding half up. Training, export and the host senders all
+    call this, so the board gets exactly the pixels the model was trained on.
+    """
+    images = np.asarray(images, dtype=np.uint8)
+    if side == SIDE:
+        return images
+    if side <= 0 or SIDE % side:
+        raise ValueError(f"side must divide {SIDE}, got {side}")
+    k = SIDE // side
+    flat = images.shape[-2:] != (SIDE, SIDE)
+    lead = images.shape[:-1] if flat else images.shape[:-2]
+    blocks = images.reshape(lead + (side, k, side, k)).astype(np.uint32).sum(axis=(-3, -1))
+    out = ((blocks + k * k // 2) // (k * k)).astype(np.uint8)
+    return out.reshape(lead + (side * side,)) if flat else out
+
+def side_of(n_in):
+    """Image side for a flattened input size (784 -> 28, 196 -> 14)"""
+    side = int(round(n_in ** 0.5))
+    if side * side != n_in:
+        raise ValueError(f"input size {n_in} is not a square image")
+    return side
+
 def load_labels(path):
     with open(path, "rb") as f:
         magic = int.from_bytes(f.read(4), "big")
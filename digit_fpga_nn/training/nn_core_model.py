@@ -0,0 +1,139 @@
+"""
+Cycle-level reference of the nn_core.v datapath with P parallel hidden neurons
+
+Walks the nn_core FSM schedule the way the RTL issues addresses: layer 1 in
+G = H/P passes, each reading the w1 word at w1_index(g, i) = g*N_IN + i and
+splitting it into P int8 lanes, then the serial layer 2. The w1/b1 words are
+read back from the COE files export_vivado_coe.py writes (wide or banked), so
+a lane or address mix-up in the exporter shows up as a mismatch against the
+firmware integer model (int_model.py).
+
+Cycle counts follow the FSM states (IDLE, L1_WAIT, L1_MAC x N_IN, L1_FINISH
+per group, L2_PRIME0, L2_WAIT/L2_MAC per term, L2_FINISHO per output, DONE),
+counted from start to done the way the AXI slave sees them.
+
+Usage:
+    python nn_core_model.py                       # P = 1, 2, 4, 8, 32
+    python nn_core_model.py -p 4 --layout banked --images ../data/t10k-images.idx3-ubyte
+"""
+import argparse
+import re
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+import int_model
+from export_vivado_coe import write_parallel_coe
+
+N_IN = int_model.INPUT_SIZE
+H = 32
+N_OUT = 10
+DEFAULT_P = (1, 2, 4, 8, 32)
+
+def core_cycles(p, n_in=N_IN, hidden=H, n_out=N_OUT):
+    """Clock cycles from the start pulse to done for nn_core with P lanes"""
+    groups = hidden // p
+    l1 = groups * (1 + n_in + 1)            # L1_WAIT, L1_MAC per pixel, L1_FINISH
+    l2 = 1 + n_out * (2 * hidden + 1)       # L2_PRIME0, WAIT+MAC per term, FINISHO
+    # +1 for the IDLE cycle that sees the start pulse, +1 for the registered done
+    return {"l1": l1, "l2": l2, "overhead": 2, "total": l1 + l2 + 2}
+
+def read_coe(path, lane_bits=None):
+    """
+    Parse a COE file into a list of ints; with lane_bits, split each word into
+    lanes (lane 0 = least significant) and return a (depth, lanes) array
+    """
+    text = Path(path).read_text()
+    radix = int(re.search(r'memory_initialization_radix\s*=\s*(\d+)', text).group(1))
+    vector = text.split("memory_initialization_vector", 1)[1].split("=", 1)[1]
+    words = [w for w in re.split(r'[,;\s]+', vector) if w]
+    if lane_bits is None:
+        return [int(w, radix) for w in words]
+    assert radix == 16, "lane splitting needs the fixed-width hex words write_coe() emits"
+    lanes = len(words[0]) * 4 // lane_bits
+    mask = (1 << lane_bits) - 1
+    out = np.empty((len(words), lanes), dtype=np.int64)
+    for r, w in enumerate(words):
+        v = int(w, radix)
+        for lane in range(lanes):
+            out[r, lane] = (v >> (lane * lane_bits)) & mask
+    return out
+
+def _signed(u, bits):
+    return np.where(u >= 1 << (bits - 1), u - (1 << bits), u)
+
+def load_rom_words(coe_dir, p, layout):
+    """Read back the w1/b1 ROM contents for P lanes as (words, P) signed arrays"""
+    coe_dir = Path(coe_dir)
+    if layout == "banked":
+        w1 = np.stack([read_coe(coe_dir / f"w1_i8_bank{lane}.coe", 8)[:, 0] for lane in range(p)], axis=1)
+        b1 = np.stack([read_coe(coe_dir / f"b1_i32_bank{lane}.coe", 32)[:, 0] for lane in range(p)], axis=1)
+    else:
+        w1 = read_coe(coe_dir / ("w1_i8.coe" if p == 1 else f"w1_i8x{p}.coe"), 8)
+        b1 = read_coe(coe_dir / ("b1_i32.coe" if p == 1 else f"b1_i32x{p}.coe"), 32)
+    return _signed(w1, 8), _signed(b1, 32)
+
+def run_core(x, w1_words, b1_words, w2, b2, p, shift=int_model.SHIFT):
+    """
+    nn_core dataflow for a batch of images using the ROM words as addressed
+    by the FSM: hidden[g*P + lane] = ReLU(sum_i lane(w1[g*N_IN + i]) * x[i] + lane(b1[g]))
+
+    Returns (predictions, hidden)
+    """
+    x = np.atleast_2d(x).astype(np.int64)
+    groups = H // p
+    hidden = np.zeros((len(x), H), dtype=np.int64)
+    for g in range(groups):
+        words = w1_words[g * N_IN + np.arange(N_IN)]      # (N_IN, P) lanes
+        acc = x @ words + b1_words[g]                      # P accumulators
+        hidden[:, g * p:(g + 1) * p] = np.maximum(acc, 0)
+    # Layer 2 is unchanged by P: acc += w2[o][h] * (hidden[h] >>> SHIFT)
+    hidden = hidden.astype(np.int32)
+    scores = (hidden.astype(np.int64) >> shift) @ w2.astype(np.int64).T + b2.astype(np.int64)
+    return np.argmax(scores, axis=1), hidden
+
+def main():
+    parser = argparse.ArgumentParser(description="nn_core cycle-level reference for P parallel lanes")
+    parser.add_argument("-p", "--parallel", type=int, nargs="+", default=list(DEFAULT_P))
+    parser.add_argument("--layout", choices=("wide", "banked"), default="wide")
+    parser.add_argument("--weights", default=str(int_model.DEFAULT_WEIGHTS_DIR),
+                        help="directory with weights_*.h (per-tensor scheme)")
+    parser.add_argument("--images", help="IDX image file (default: 100 random images)")
+    parser.add_argument("-n", "--count", type=int, default=100)
+    parser.add_argument("--clock-mhz", type=float, default=100.0)
+    args = parser.parse_args()
+
+    w = int_model.load_weights(args.weights)
+    if args.images:
+        from load_mnist import load_images
+        x = load_images(args.images)[:args.count].reshape(-1, N_IN)
+    else:
+        x = np.random.default_rng(0).integers(0, 256, size=(args.count, N_IN), dtype=np.uint8)
+
+    ref_hidden = int_model.layer1_forward(x, w["w1"], w["b1"])
+    ref_pred, _ = int_model.mlp_inference(x, dict(w, QUANT_PER_CHANNEL=0))
+
+    base = core_cycles(1)["total"]
+    print(f"Images: {len(x)}   layout: {args.layout}   clock: {args.clock_mhz:g} MHz")
+    print(f"{'P':>3s} {'w1 ROM':>14s} {'layer1':>8s} {'layer2':>8s} {'total':>8s} {'us':>8s} {'speedup':>8s}  check")
+    failed = False
+    for p in args.parallel:
+        if H % p:
+            print(f"{p:3d}  skipped: does not divide H={H}")
+            continue
+        with tempfile.TemporaryDirectory() as d:
+            write_parallel_coe(d, w["w1"], w["b1"], p, args.layout)
+            w1_words, b1_words = load_rom_words(d, p, args.layout)
+        pred, hidden = run_core(x, w1_words, b1_words, w["w2"], w["b2"], p, w.get("SHIFT", int_model.SHIFT))
+        ok = np.array_equal(hidden, ref_hidden) and np.array_equal(pred, ref_pred)
+        failed |= not ok
+        c = core_cycles(p)
+        rom = f"{len(w1_words)}x{8 * p}b" if args.layout == "wide" else f"{p}x{len(w1_words)}x8b"
+        print(f"{p:3d} {rom:>14s} {c['l1']:8d} {c['l2']:8d} {c['total']:8d} "
+              f"{c['total'] / args.clock_mhz:8.1f} {base / c['total']:7.2f}x  {'ok' if ok else 'MISMATCH'}")
+    if failed:
+        raise SystemExit("banked layout does not reproduce the integer model")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Accuracy against throughput of the 28x28, 14x14 and 7x7 input variants
+
+At 9600 baud the board spends ~0.8 s receiving each 784-byte image and a few
+ms computing, so the link sets the frame rate. A model trained on
+block-averaged 14x14 images (train_mlp.py --side 14) needs 196 bytes on the
+wire and a quarter of the layer-1 MACs; 7x7 cuts both by 16. The firmware
+reads the size from INPUT_SIDE in weights_rq.h (export_weights_int8.py writes
+it) and reports it on the INFO: line, which the host senders use to
+downsample with load_mnist.downsample().
+
+For each --weights directory the script reports, with int_model (bit-exact
+with mlp.c): the test accuracy at that resolution, the MACs and estimated
+cycles per image, the bytes of one framed request ('8' + image + CRC32) and
+the images/s at each --baud. With the interrupt RX ring the next request is
+received while the current one computes, so throughput is
+1 / max(wire time, compute time).
+
+Usage:
+    python train_mlp.py --side 14               # -> mlp32_14.pth
+    python export_weights_int8.py --model mlp32_14.pth --out-dir weights14
+    python resolution.py --weights ../../vitis/mlp weights14
+"""
+import argparse
+
+import numpy as np
+
+import int_model
+from load_mnist import downsample, load_images, load_labels, side_of
+from swar_pack import DEFAULT_WEIGHTS_DIR
+
+FRAME_OVERHEAD = 5      # command '8' and the CRC32 of a framed request
+BITS_PER_BYTE = 10      # 8N1
+
+def evaluate(weights_dir, images, labels):
+    """(side, accuracy, MACs, cycles) of one exported model on 28x28 test images"""
+    weights = int_model.load_weights(weights_dir)
+    hidden, n_in = weights["w1"].shape
+    n_out = weights["w2"].shape[0]
+    side = side_of(n_in)
+    preds, _ = int_model.mlp_inference(downsample(images, side).reshape(-1, n_in), weights)
+    cycles = sum(int_model.estimate_cycles(bool(weights.get("QUANT_PER_CHANNEL")), n_in, hidden, n_out))
+    return side, np.mean(preds == labels), n_in * hidden + hidden * n_out, cycles
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare input resolutions: accuracy, MACs, wire bytes, images/s")
+    parser.add_argument("--weights", nargs="+", default=[str(DEFAULT_WEIGHTS_DIR)],
+                        help="weights_*.h directories, one per resolution")
+    parser.add_argument("--images", default="../data/t10k-images.idx3-ubyte")
+    parser.add_argument("--labels", default="../data/t10k-labels.idx1-ubyte")
+    parser.add_argument("--baud", type=int, nargs="+", default=[9600, 115200])
+    parser.add_argument("--clock-mhz", type=float, default=100.0, help="MicroBlaze clock for the cycle estimate")
+    args = parser.parse_args()
+
+    images = load_images(args.images)
+    labels = load_labels(args.labels)[:len(images)]
+    print(f"{len(images)} images from {args.images}, compute at {args.clock_mhz:g} MHz\n")
+
+    rate_cols = "".join(f" {f'img/s@{b}':>13s}" for b in args.baud)
+    print(f"{'weights':<28s} {'input':>6s} {'accuracy':>9s} {'MACs':>6s} {'cycles':>7s} "
+          f"{'compute':>9s} {'bytes':>6s}{rate_cols}")
+    for weights_dir in args.weights:
+        side, acc, macs, cycles = evaluate(weights_dir, images, labels)
+        compute_s = cycles / (args.clock_mhz * 1e6)
+        frame = side * side + FRAME_OVERHEAD
+        rates = "".join(f" {1.0 / max(frame * BITS_PER_BYTE / b, compute_s):13.1f}" for b in args.baud)
+        print(f"{str(weights_dir)[-28:]:<28s} {f'{side}x{side}':>6s} {100.0 * acc:8.2f}% {macs:6d} "
+              f"{cycles:7d} {compute_s * 1e3:7.2f}ms {frame:6d}{rates}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Register-level model of the simpleSum AXI-Lite slave and its pixel load path
+
+Models the register writes simpleSum_slave_lite_v1_0_S00_AXI.v decodes
+(REG0 start, REG1 single pixel at the REG2 index, REG4 four packed pixels at
+the auto-incrementing pointer, REG5 ping-pong bank control), the two pixel
+banks in nn_core and the status in REG3, and counts every bus transaction.
+The driver_* functions mirror the C driver in
+drivers/simpleSum_v1_0/src/simpleSum.c call for call, so the transaction
+counts are what the MicroBlaze issues.
+
+The model's inference completes on the first status poll after a start,
+from whatever the compute bank holds at that point; a load that lands in
+the bank being computed therefore shows up as a wrong prediction.
+
+stream_cycles() is the matching cycle model for back-to-back images: it
+walks the firmware loop with and without ping-pong loading, using
+nn_core_model.core_cycles() for the core and BUS_CYCLES for each register
+access, optionally with images arriving over the UART.
+
+Usage:
+    python simplesum_regs.py                    # 20 random images
+    python simplesum_regs.py --images ../data/t10k-images.idx3-ubyte -n 200
+    python simplesum_regs.py --write-cycles 12 --clock-mhz 100
+"""
+import argparse
+
+import numpy as np
+
+import int_model
+from nn_core_model import core_cycles
+
+N_PIXELS = int_model.INPUT_SIZE
+
+CTRL, PIX_DATA, PIX_INDEX, STATUS, PIX_PACKED, BANK = 0x00, 0x04, 0x08, 0x0C, 0x10, 0x14
+REG_NAMES = {CTRL: "CTRL", PIX_DATA: "PIX_DATA", PIX_INDEX: "PIX_INDEX",
+             STATUS: "STATUS", PIX_PACKED: "PIX_PACKED", BANK: "BANK"}
+
+STATUS_DONE, STATUS_BANK, STATUS_BUSY = 0x1, 0x100, 0x200
+BANK_SELECT, BANK_AUTO_SWAP = 0x1, 0x2
+
+# Estimated MicroBlaze cycles per AXI-Lite access to the slave (store/load
+# through the interconnect); override with --write-cycles / --read-cycles
+BUS_CYCLES = {"write": 8, "read": 10}
+
+class SimpleSumRegs:
+    """The slave's write-side state plus nn_core's two pixel banks"""
+
+    def __init__(self, weights=None):
+        self.weights = weights if weights is not None else int_model.load_weights()
+        self.x_mem = np.zeros((2, N_PIXELS), dtype=np.uint8)
+        self.ctrl = 0
+        self.status = 0
+        self.pix_addr_hold = 0
+        self.pix_ptr = 0
+        self.pix_bank = 0
+        self.auto_swap = False
+        self.compute_bank = 0
+        self.busy = False
+        self.writes = {}
+        self.reads = {}
+
+    def reset_counts(self):
+        self.writes.clear()
+        self.reads.clear()
+
+    @property
+    def transactions(self):
+        return sum(self.writes.values()) + sum(self.reads.values())
+
+    def _pixel_word(self, addr, be, data):
+        # nn_core: byte lane k writes pixel {addr[9:2], k}
+        base = addr & ~3
+        for k in range(4):
+            if be & (1 << k) and base + k < N_PIXELS:
+                self.x_mem[self.pix_bank, base + k] = (data >> (8 * k)) & 0xFF
+
+    def write(self, offset, data):
+        self.writes[offset] = self.writes.get(offset, 0) + 1
+        data &= 0xFFFFFFFF
+        if offset == CTRL:
+            rising = (data & 1) and not (self.ctrl & 1)
+            self.ctrl = data
+            if rising:
+                self._start()
+        elif offset == PIX_DATA:
+            self._pixel_word(self.pix_addr_hold, 1 << (self.pix_addr_hold & 3), (data & 0xFF) * 0x01010101)
+        elif offset == PIX_INDEX:
+            self.pix_addr_hold = data & 0x3FF
+            self.pix_ptr = data & 0x3FC
+        elif offset == PIX_PACKED:
+            self._pixel_word(self.pix_ptr, 0xF, data)
+            self.pix_ptr = 0 if self.pix_ptr >= N_PIXELS - 4 else self.pix_ptr + 4
+        elif offset == BANK:
+            self.pix_bank = data & BANK_SELECT
+            self.auto_swap = bool(data & BANK_AUTO_SWAP)
+
+    def read(self, offset):
+        self.reads[offset] = self.reads.get(offset, 0) + 1
+        if offset != STATUS:
+            return 0
+        if self.busy:
+            self._finish()
+        return self.status | (self.pix_bank * STATUS_BANK) | (STATUS_BUSY if self.busy else 0)
+
+    def _start(self):
+        # status clears on start; the core runs on the current load bank,
+        # which flips afterwards when auto-swap is on
+        self.pix_ptr = 0
+        self.status = 0
+        self.compute_bank = self.pix_bank
+        self.busy = True
+        if self.auto_swap:
+            self.pix_bank ^= 1
+
+    def _finish(self):
+        pred, _ = int_model.mlp_inference(self.x_mem[self.compute_bank],
+                                          dict(self.weights, QUANT_PER_CHANNEL=0))
+        self.status = (int(pred[0]) << 4) | STATUS_DONE
+        self.busy = False
+
+# ----------------------------------------------------------------------
+# Driver mirrors (simpleSum.c)
+# ----------------------------------------------------------------------
+def driver_write_pixel(dev, index, value):
+    dev.write(PIX_INDEX, index)
+    dev.write(PIX_DATA, value)
+
+def driver_set_pixel_index(dev, index):
+    dev.write(PIX_INDEX, index)
+
+def driver_write_pixels(dev, pixels):
+    pixels = np.asarray(pixels, dtype=np.uint8)
+    for i in range(0, len(pixels), 4):
+        chunk = pixels[i:i + 4]
+        dev.write(PIX_PACKED, sum(int(p) << (8 * n) for n, p in enumerate(chunk)))
+
+def driver_load_image(dev, pixels):
+    driver_write_pixels(dev, pixels[:N_PIXELS])
+
+def driver_load_image_legacy(dev, pixels):
+    """Two writes per pixel, the pre-packed nn_write_pixel() loop of mult/main.c"""
+    for i, p in enumerate(pixels[:N_PIXELS]):
+        driver_write_pixel(dev, i, int(p))
+
+def driver_set_load_bank(dev, bank, auto_swap):
+    dev.write(BANK, (bank & BANK_SELECT) | (BANK_AUTO_SWAP if auto_swap else 0))
+
+def driver_start(dev):
+    dev.write(CTRL, 1)
+    dev.write(CTRL, 0)
+
+def driver_wait_done(dev):
+    while True:
+        status = dev.read(STATUS)
+        if status & STATUS_DONE:
+            return status
+
+def classify(dev, image, loader):
+    """Load, start, wait; returns (prediction, {register: writes}, reads)"""
+    dev.reset_counts()
+    loader(dev, image)
+    load_writes = dict(dev.writes)
+    driver_start(dev)
+    status = driver_wait_done(dev)
+    return (status >> 4) & 0xF, load_writes, sum(dev.reads.values())
+
+def classify_stream(dev, images, ping_pong):
+    """
+    Back-to-back loop of the SIMPLESUM_SetLoadBank() example: with ping_pong
+    image k+1 is loaded between the start and the wait of image k
+    """
+    preds = []
+    if not ping_pong:
+        for image in images:
+            driver_load_image(dev, image)
+            driver_start(dev)
+            preds.append((driver_wait_done(dev) >> 4) & 0xF)
+        return preds
+    driver_set_load_bank(dev, 0, auto_swap=True)
+    driver_load_image(dev, images[0])
+    driver_start(dev)
+    for k in range(len(images)):
+        if k + 1 < len(images):
+            driver_load_image(dev, images[k + 1])
+        preds.append((driver_wait_done(dev) >> 4) & 0xF)
+        if k + 1 < len(images):
+            driver_start(dev)
+    driver_set_load_bank(dev, 0, auto_swap=False)
+    return preds
+
+def stream_cycles(n, load_writes, compute, ping_pong, bus=BUS_CYCLES, uart_image=0):
+    """
+    Cycles for n back-to-back images
+
+    Args:
+        load_writes: bus writes per image load (196 packed, 1568 legacy)
+        compute: nn_core cycles from start to done
+        uart_image: cycles for one image to arrive over the UART (0 = already
+            in memory); image k cannot finish loading before (k+1)*uart_image
+    """
+    load = load_writes * bus["write"]
+    start = 2 * bus["write"]
+    poll = bus["read"]
+
+    def loaded(t, k):
+        return max(t + load, (k + 1) * uart_image)
+
+    t = 0
+    if not ping_pong:
+        for k in range(n):
+            t = loaded(t, k) + start
+            t += compute + poll        # polls until done, last read sees it
+        return t
+    t = loaded(t, 0) + 2 * bus["write"] + start
+    done = t + compute
+    for k in range(n):
+        if k + 1 < n:
+            t = loaded(t, k + 1)
+        t = max(t, done) + poll
+        if k + 1 < n:
+            t += start
+            done = t + compute
+    return t
+
+def main():
+    parser = argparse.ArgumentParser(description="simpleSum register-level pixel load model")
+    parser.add_argument("--weights", default=str(int_model.DEFAULT_WEIGHTS_DIR))
+    parser.add_argument("--images", help="IDX image file (default: random images)")
+    parser.add_argument("-n", "--count", type=int, default=20)
+    parser.add_argument("--write-cycles", type=int, default=BUS_CYCLES["write"])
+    parser.add_argument("--read-cycles", type=int, default=BUS_CYCLES["read"])
+    parser.add_argument("--clock-mhz", type=float, default=100.0)
+    parser.add_argument("--baud", type=int, default=921600, help="UART rate for the streamed rows")
+    args = parser.parse_args()
+
+    weights = int_model.load_weights(args.weights)
+    if args.images:
+        from load_mnist import load_images
+        x = load_images(args.images)[:args.count].reshape(-1, N_PIXELS)
+    else:
+        x = np.random.default_rng(0).integers(0, 256, size=(args.count, N_PIXELS), dtype=np.uint8)
+    ref, _ = int_model.mlp_inference(x, dict(weights, QUANT_PER_CHANNEL=0))
+
+    def resync_load(dev, image):
+        # abandon a load halfway, then resume from pixel 0 via the index register
+        driver_write_pixels(dev, image[:100])
+        driver_set_pixel_index(dev, 0)
+        driver_load_image(dev, image)
+
+    paths = (("legacy (REG2 + REG1 per pixel)", driver_load_image_legacy),
+             ("packed (REG4, 4 pixels/write)", driver_load_image),
+             ("packed after partial load + resync", resync_load))
+
+    dev = SimpleSumRegs(weights)
+    print(f"Images: {len(x)}")
+    print(f"{'load path':<36s} {'load writes':>11s} {'start':>6s} {'polls':>6s}  {'by register':<28s} check")
+    failed = False
+    for name, loader in paths:
+        ok = True
+        for image, want in zip(x, ref):
+            dev.x_mem[:] = 0xA5   # stale contents from a previous image
+            pred, load_writes, reads = classify(dev, image, loader)
+            ok &= np.array_equal(dev.x_mem[dev.compute_bank], image) and pred == want
+        failed |= not ok
+        by_reg = ", ".join(f"{REG_NAMES[r]}={c}" for r, c in sorted(load_writes.items()))
+        print(f"{name:<36s} {sum(load_writes.values()):11d} {dev.writes.get(CTRL, 0):6d} {reads:6d}  "
+              f"{by_reg:<28s} {'ok' if ok else 'MISMATCH'}")
+
+    print()
+    for ping_pong in (False, True):
+        dev.x_mem[:] = 0xA5
+        dev.reset_counts()
+        preds = classify_stream(dev, x, ping_pong)
+        ok = np.array_equal(preds, ref)
+        failed |= not ok
+        print(f"{'ping-pong' if ping_pong else 'serial':<9s} stream of {len(x)}: "
+              f"{sum(dev.writes.values())} writes, {sum(dev.reads.values())} reads  {'ok' if ok else 'MISMATCH'}")
+
+    bus = {"write": args.write_cycles, "read": args.read_cycles}
+    clock = args.clock_mhz * 1e6
+    uart_image = int(N_PIXELS * 10 / args.baud * clock)   # 8N1 = 10 bits per byte
+    n = 1000
+    print()
+    print(f"Back-to-back throughput, {n} images, {args.clock_mhz:g} MHz, "
+          f"{bus['write']}/{bus['read']} cycles per write/read")
+    print(f"{'P':>3s} {'load':<7s} {'source':<12s} {'load cyc':>9s} {'core cyc':>9s} "
+          f"{'serial img/s':>13s} {'ping-pong':>10s} {'gain':>7s}")
+    for p in (1, 8, 32):
+        compute = core_cycles(p)["total"]
+        for load_name, writes in (("legacy", 2 * N_PIXELS), ("packed", N_PIXELS // 4)):
+            for source, arrival in (("memory", 0), (f"uart {args.baud}", uart_image)):
+                serial = stream_cycles(n, writes, compute, False, bus, arrival)
+                pp = stream_cycles(n, writes, compute, True, bus, arrival)
+                print(f"{p:3d} {load_name:<7s} {source:<12s} {writes * bus['write']:9d} {compute:9d} "
+                      f"{n * clock / serial:13.0f} {n * clock / pp:10.0f} {serial / pp - 1:+7.1%}")
+
+    if failed:
+        raise SystemExit("pixel buffer or prediction mismatch")
+
+if __name__ == "__main__":
+    main()
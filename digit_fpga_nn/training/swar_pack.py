@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Packed layer-1 weights for the SWAR kernel in vitis/mlp/layer1_swar.h
+
+The SWAR (SIMD within a register) kernel multiplies two hidden units at once:
+the int8 weights of units 2p and 2p+1 are packed into one 32-bit word
+
+    W[p][i] = w1[2p][i] + 65536 * w1[2p+1][i]      (mod 2^32)
+
+so W * x[i] holds both products in 16-bit lanes and one RV32 mul does two
+MACs. A lane holds -32768..32767, while int8 x uint8 products reach
++-32385; with max|w| = 127 even two pixels can overflow a lane, so no fixed
+chunk length is safe. Instead every pair gets a schedule of chunk ends,
+chosen greedily from its weights: within a chunk, for both lanes,
+
+    255 * (sum of the positive weights) <=  32767
+    255 * (sum of the negative weights) >= -32768
+
+which bounds the lane sum for any uint8 image. At each chunk end the
+firmware splits the lanes and adds them to 32-bit accumulators. The result
+is bit-exact with the scalar loop.
+
+weights_w1p.h holds the packed table and the schedule; it is derived from
+weights_w1.h, so rerun this after export_weights_int8.py.
+
+Usage:
+    python swar_pack.py                                   # ../../vitis/mlp/weights_w1.h -> weights_w1p.h
+    python swar_pack.py --check                           # + build the C kernel, compare with the scalar loop
+    python swar_pack.py --weights ../hls_nn/weights/vivado_init -o /tmp/weights_w1p.h --check -n 2000
+"""
+
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import int_model
+from int_model import CYCLES
+
+X_MAX = 255
+LANE_MAX = 32767
+LANE_MIN = -32768
+MAX_CHUNKS = 4096       # W1P_MAX_CHUNKS: room for uploaded weights, per-channel models need ~4000
+DEFAULT_WEIGHTS_DIR = Path(__file__).resolve().parent.parent.parent / "vitis" / "mlp"
+KERNEL_HEADER = DEFAULT_WEIGHTS_DIR / "layer1_swar.h"
+
+def chunk_schedule(lo, hi, x_max=X_MAX):
+    """
+    Chunk ends for one pair of weight rows (same greedy rule as swar_pack_pair() in C)
+
+    Returns:
+        list of exclusive end indices, the last one is len(lo)
+    """
+    ends = []
+    pos = [0, 0]
+    neg = [0, 0]
+    for i, (a, b) in enumerate(zip(lo.tolist(), hi.tolist())):
+        w = (a, b)
+        fits = all(x_max * (pos[l] + max(w[l], 0)) <= LANE_MAX and
+                   x_max * (neg[l] + min(w[l], 0)) >= LANE_MIN for l in range(2))
+        if not fits:
+            ends.append(i)
+            pos = [0, 0]
+            neg = [0, 0]
+        for l in range(2):
+            if w[l] > 0:
+                pos[l] += w[l]
+            else:
+                neg[l] += w[l]
+    ends.append(len(lo))
+    return ends
+
+def pack_w1(w1):
+    """
+    Pack int8 w1 (hidden, n_in) for the SWAR kernel
+
+    Returns:
+        (w1p uint32 (hidden/2, n_in), chunk_end uint16, chunk_first uint16 (hidden/2 + 1))
+    """
+    w1 = np.asarray(w1, dtype=np.int64)
+    if w1.shape[0] % 2:
+        raise ValueError("SWAR packing needs an even number of hidden units")
+    lo, hi = w1[0::2], w1[1::2]
+    w1p = ((lo + hi * 65536) & 0xFFFFFFFF).astype(np.uint32)
+    chunk_end, chunk_first = [], [0]
+    for p in range(w1p.shape[0]):
+        chunk_end += chunk_schedule(lo[p], hi[p])
+        chunk_first.append(len(chunk_end))
+    return w1p, np.array(chunk_end, dtype=np.uint16), np.array(chunk_first, dtype=np.uint16)
+
+def layer1_swar(x, w1p, chunk_end, chunk_first):
+    """
+    NumPy model of layer1_swar(): W1 * x (no bias) for uint8 images x (N, n_in),
+    with the 32-bit wraparound and lane split of the C kernel
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=np.uint8)).astype(np.uint64)
+    accum = np.zeros((x.shape[0], 2 * w1p.shape[0]), dtype=np.int64)
+    for p in range(w1p.shape[0]):
+        start = 0
+        for end in chunk_end[chunk_first[p]:chunk_first[p + 1]]:
+            acc = (x[:, start:end] @ w1p[p, start:end].astype(np.uint64)) & 0xFFFFFFFF
+            lo = acc & 0xFFFF
+            lo = lo.astype(np.int64) - (lo >= 0x8000) * 65536
+            hi = ((acc.astype(np.int64) - lo) & 0xFFFFFFFF) >> 16
+            hi = hi - (hi >= 0x8000) * 65536
+            accum[:, 2 * p] += lo
+            accum[:, 2 * p + 1] += hi
+            start = end
+    return accum
+
+def swar_cycles(n_chunks, n_in=int_model.INPUT_SIZE, hidden=32):
+    """Layer-1 cycle estimate of the SWAR kernel (the scalar loop is n_in * hidden * mac)"""
+    return (hidden // 2) * n_in * CYCLES["swar_mac"] + n_chunks * CYCLES["swar_flush"]
+
+def write_w1p_header(path, w1, max_chunks=MAX_CHUNKS):
+    """weights_w1p.h: packed w1 and its chunk schedule, writable so uploads can repack in place"""
+    w1p, chunk_end, chunk_first = pack_w1(w1)
+    if len(chunk_end) > max_chunks:
+        raise ValueError(f"{len(chunk_end)} chunks exceed W1P_MAX_CHUNKS = {max_chunks}")
+    n_pairs, n_in = w1p.shape
+    with open(path, "w", newline=int_model.header_newline(path)) as f:
+        f.write("#pragma once\n#include <stdint.h>\n\n")
+        f.write("// Generated by training/swar_pack.py from weights_w1.h; see layer1_swar.h\n")
+        f.write(f"#define W1P_MAX_CHUNKS {max_chunks}\n\n")
+        f.write(f"static uint32_t w1p[{n_pairs}][{n_in}] = {{\n")
+        for p in range(n_pairs):
+            f.write("  {" + ",".join(str(int(v)) for v in w1p[p]) + "}")
+            f.write(",\n" if p != n_pairs - 1 else "\n")
+        f.write("};\n")
+        # only the used part is initialized, the rest is zero-filled room for uploads
+        f.write(f"static uint16_t w1p_chunk_end[W1P_MAX_CHUNKS] = {{")
+        f.write(",".join(str(int(v)) for v in chunk_end))
+        f.write("};\n")
+        f.write(f"static uint16_t w1p_chunk_first[{n_pairs + 1}] = {{")
+        f.write(",".join(str(int(v)) for v in chunk_first))
+        f.write("};\n")
+    return len(chunk_end)
+
+HARNESS = r"""
+#include <stdio.h>
+#include <stdint.h>
+#include <time.h>
+#include "weights_w1.h"
+#include "weights_w1p.h"
+#include "layer1_swar.h"
+
+#define N_IN %(n_in)d
+#define HIDDEN %(hidden)d
+
+static void layer1_scalar(const uint8_t* x, int32_t* accum) {
+    for (int h = 0; h < HIDDEN; h++) {
+        int32_t acc = 0;
+        for (int i = 0; i < N_IN; i++) {
+            acc += (int32_t)w1[h][i] * (int32_t)x[i];
+        }
+        accum[h] = acc;
+    }
+}
+
+int main(int argc, char** argv) {
+    static uint8_t x[N_IN];
+    static uint32_t packed[HIDDEN / 2][N_IN];
+    static uint16_t ends[W1P_MAX_CHUNKS];
+    int32_t a[HIDDEN], b[HIDDEN];
+    long n = 0, mismatches = 0;
+    double t_scalar = 0, t_swar = 0;
+
+    /* the device-side packer must reproduce the exported table */
+    int n_chunks = 0;
+    for (int p = 0; p < HIDDEN / 2; p++) {
+        if (w1p_chunk_first[p] != n_chunks) return 2;
+        int c = swar_pack_pair(packed[p], w1[2 * p], w1[2 * p + 1], N_IN,
+                               ends + n_chunks, W1P_MAX_CHUNKS - n_chunks);
+        if (c < 0) return 2;
+        n_chunks += c;
+    }
+    for (int p = 0; p < HIDDEN / 2; p++)
+        for (int i = 0; i < N_IN; i++)
+            if (packed[p][i] != w1p[p][i]) return 3;
+    for (int c = 0; c < n_chunks; c++)
+        if (ends[c] != w1p_chunk_end[c]) return 3;
+
+    FILE* f = fopen(argv[1], "rb");
+    if (!f) return 4;
+    while (fread(x, 1, N_IN, f) == N_IN) {
+        clock_t t0 = clock();
+        for (int r = 0; r < %(repeat)d; r++) layer1_scalar(x, a);
+        clock_t t1 = clock();
+        for (int r = 0; r < %(repeat)d; r++)
+            layer1_swar(&w1p[0][0], w1p_chunk_end, w1p_chunk_first, x, N_IN, HIDDEN / 2, b);
+        clock_t t2 = clock();
+        t_scalar += (double)(t1 - t0) / CLOCKS_PER_SEC / %(repeat)d;
+        t_swar += (double)(t2 - t1) / CLOCKS_PER_SEC / %(repeat)d;
+        for (int h = 0; h < HIDDEN; h++) {
+            if (a[h] != b[h]) { mismatches++; break; }
+        }
+        n++;
+    }
+    fclose(f);
+    printf("%%ld %%ld %%d %%g %%g\n", n, mismatches, n_chunks, t_scalar, t_swar);
+    return 0;
+}
+"""
+
+def check_images(n, seed=0):
+    """Test-set images if present, plus random and all-255 images (the schedule's worst case)"""
+    rng = np.random.default_rng(seed)
+    parts = [np.full((1, 784), 255, dtype=np.uint8), np.zeros((1, 784), dtype=np.uint8),
+             rng.integers(0, 256, size=(n // 2, 784), dtype=np.uint8)]
+    test_images = Path(__file__).resolve().parent.parent / "data" / "t10k-images.idx3-ubyte"
+    if test_images.exists():
+        from load_mnist import load_images
+        parts.append(load_images(str(test_images))[:n].reshape(-1, 784).astype(np.uint8))
+    else:
+        img = Path(__file__).resolve().parent / "img_28x28.bin"
+        parts.append(np.fromfile(img, dtype=np.uint8).reshape(1, 784))
+    return np.concatenate(parts)
+
+def run_check(weights_dir, n, cc):
+    """Build layer1_swar.h on the host and compare it with the scalar loop; returns the mismatch count"""
+    w1 = int_model.load_h_array(Path(weights_dir) / "weights_w1.h")
+    x = check_images(n)
+
+    # NumPy model first, so the check says something even without a compiler
+    w1p, chunk_end, chunk_first = pack_w1(w1)
+    ref = x.astype(np.int64) @ w1.astype(np.int64).T
+    model_bad = int(np.sum(np.any(layer1_swar(x, w1p, chunk_end, chunk_first) != ref, axis=1)))
+    print(f"NumPy SWAR model: {len(x) - model_bad}/{len(x)} images bit-exact")
+
+    cc = cc or shutil.which("cc") or shutil.which("gcc")
+    if cc is None:
+        print("No C compiler found; skipped the host build of layer1_swar.h")
+        return model_bad
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        shutil.copy(Path(weights_dir) / "weights_w1.h", tmp)
+        write_w1p_header(tmp / "weights_w1p.h", w1)
+        shutil.copy(KERNEL_HEADER, tmp)
+        (tmp / "check.c").write_text(HARNESS % {"n_in": w1.shape[1], "hidden": w1.shape[0], "repeat": 20})
+        x.tofile(tmp / "images.bin")
+        subprocess.run([cc, "-O2", "-std=c99", "-o", str(tmp / "check"), str(tmp / "check.c")], check=True)
+        proc = subprocess.run([str(tmp / "check"), str(tmp / "images.bin")], capture_output=True, text=True)
+    if proc.returncode != 0:
+        what = {2: "swar_pack_pair() schedule differs", 3: "swar_pack_pair() table differs"}
+        print(f"C check failed: {what.get(proc.returncode, f'exit {proc.returncode}')}")
+        return len(x)
+    n_img, bad, _, t_scalar, t_swar = proc.stdout.split()
+    print(f"C kernel ({Path(cc).name} -O2): {int(n_img) - int(bad)}/{n_img} images bit-exact, "
+          f"swar_pack_pair() matches weights_w1p.h")
+    per_image = 1e6 / int(n_img)
+    print(f"Host time, layer 1: scalar {float(t_scalar) * per_image:.1f} us, "
+          f"SWAR {float(t_swar) * per_image:.1f} us per image (x86 vectorizes the scalar loop; "
+          f"only the RV32IM estimate and the board bench mean anything)")
+    return model_bad + int(bad)
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack weights_w1.h for the SWAR layer-1 kernel")
+    parser.add_argument("--weights", default=str(DEFAULT_WEIGHTS_DIR), help="directory with weights_w1.h")
+    parser.add_argument("-o", "--out", help="output header (default: <weights>/weights_w1p.h)")
+    parser.add_argument("--check", action="store_true",
+                        help="compare the kernel with the scalar loop (NumPy model and a host C build)")
+    parser.add_argument("-n", type=int, default=1000, help="images for --check")
+    parser.add_argument("--cc", help="C compiler for --check (default: cc or gcc)")
+    args = parser.parse_args()
+
+    w1 = int_model.load_h_array(Path(args.weights) / "weights_w1.h")
+    out = args.out or str(Path(args.weights) / "weights_w1p.h")
+    n_chunks = write_w1p_header(out, w1)
+    hidden, n_in = w1.shape
+    print(f"Wrote {out}: {hidden // 2} pairs x {n_in}, {n_chunks} chunks "
+          f"({hidden * n_in / n_chunks:.1f} MACs per flush)")
+
+    scalar = n_in * hidden * CYCLES["mac"]
+    swar = swar_cycles(n_chunks, n_in, hidden)
+    print(f"Layer 1 estimate: scalar {scalar} cycles, SWAR {swar} cycles "
+          f"({100.0 * (scalar - swar) / scalar:.0f}% fewer); device_bench.py measures the board")
+
+    if args.check:
+        t0 = time.time()
+        bad = run_check(args.weights, args.n, args.cc)
+        print(f"Check {'PASSED' if bad == 0 else 'FAILED'} ({time.time() - t0:.1f} s)")
+        if bad:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
+import argparse
 import numpy as np
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from load_mnist import load_images, load_labels
+from augment import BatchLoader
+from load_mnist import SIDE, downsample, load_images, load_labels
 
 class MLP(nn.Module):
-    def __init__(self, hidden=32):
+    def __init__(self, hidden=32, n_in=SIDE * SIDE):
         super().__init__()
-        self.fc1 = nn.Linear(784, hidden)
+        self.fc1 = nn.Linear(n_in, hidden)
         self.fc2 = nn.Linear(hidden, 10)
 
     def forward(self, x):
@@ -15,6 +17,20 @@ class MLP(nn.Module):
         return self.fc2(x)
 
 def main():
+    parser = argparse.ArgumentParser(description="Train the 784-32-10 MLP")
+    parser.add_argument("--hidden", type=int, default=32,
+                        help="hidden units (8: the cascade stage-1 net, see cascade.py)")
+    parser.add_argument("--side", type=int, default=SIDE, choices=(28, 14, 7),
+                        help="input resolution; images are block-averaged down from 28x28")
+    parser.add_argument("--out", help="saved state dict (default: mlp<hidden>.pth, mlp<hidden>_<side>.pth)")
+    parser.add_argument("--augment", action="store_true",
+                        help="affine / thickness / blur jitter for phone-photo digits (augment.py)")
+    parser.add_argument("--workers", type=int, default=2, help="batch-building threads")
+    parser.add_argument("--prefetch", type=int, default=4, help="batches prepared ahead of the optimizer")
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
     X_train = load_images("../data/train-images.idx3-ubyte")
     y_train = load_labels("../data/train-labels.idx1-ubyte")
     X_test  = load_images("../data/t10k-images.idx3-ubyte")
@@ -25,11 +41,15 @@ def main():
     X_train = X_train[:n_train]
     y_train = y_train[:n_train]
 
-    X_train = X_train.reshape(-1, 784).astype(np.float32) / 255.0
-    X_test  = X_test.reshape(-1, 784).astype(np.float32) / 255.0
+    # Training batches stay uint8 until the loader threads convert them
+    loader = BatchLoader(X_train, y_train, batch_size=128, augment=args.augment,
+                         workers=args.workers, prefetch=args.prefetch, seed=args.seed, side=args.side)
+    n_in = args.side * args.side
+    X_train = downsample(X_train, args.side).reshape(-1, n_in).astype(np.float32) / 255.0
+    X_test  = downsample(X_test, args.side).reshape(-1, n_in).astype(np.float32) / 255.0
 
     device = "cuda" if torch.cuda.is_available() else "cpu"
-    model = MLP(hidden=32).to(device)
+    model = MLP(hidden=args.hidden, n_in=n_in).to(device)
 
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=1e-3)
@@ -39,17 +59,13 @@ def main():
     X_test_t  = torch.tensor(X_test)
     y_test_t  = torch.tensor(y_test, dtype=torch.long)
 
-    batch_size = 128
-    epochs = 10
-
-    for epoch in range(1, epochs + 1):
+    for epoch in range(1, args.epochs + 1):
         model.train()
-        perm = torch.randperm(X_train_t.size(0))
+        seen, elapsed = loader.samples, loader.elapsed
 
-        for i in range(0, X_train_t.size(0), batch_size):
-            idx = perm[i:i+batch_size]
-            xb = X_train_t[idx].to(device)
-            yb = y_train_t[idx].to(device)
+        for xb, yb in loader:
+            xb = torch.from_numpy(xb).to(device)
+            yb = torch.from_numpy(yb).to(device)
 
             optimizer.zero_grad()
             logits = model(xb)
@@ -68,10 +84,12 @@ def main():
             test_pred = torch.argmax(test_logits, dim=1)
             test_acc = float((test_pred.cpu() == y_test_t).float().mean())
 
-        print(f"Epoch {epoch:02d}: train_acc={train_acc:.4f}  test_acc={test_acc:.4f}")
+        rate = (loader.samples - seen) / (loader.elapsed - elapsed)
+        print(f"Epoch {epoch:02d}: train_acc={train_acc:.4f}  test_acc={test_acc:.4f}  {rate:.0f} samples/s")
 
-    torch.save(model.state_dict(), "mlp32.pth")
-    print("Saved model: mlp32.pth")
+    out = args.out or (f"mlp{args.hidden}.pth" if args.side == SIDE else f"mlp{args.hidden}_{args.side}.pth")
+    torch.save(model.state_dict(), out)
+    print(f"Saved model: {out}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Straight-line C for layer 2 (and a slice of layer 1), specialized to the weights
+
+w2 (10x32) and b2 are compile-time constants, yet layer2_forward() in
+vitis/mlp/mlp.c reads them from memory in a generic double loop. This writes
+weights_unrolled.h with the products spelled out one by one:
+
+    weight 0            dropped, and hidden units no weight uses are never loaded
+    weight +-1          add or subtract
+    weight +-2^k        shift
+    other weights       multiply by an immediate
+    bias                the starting constant of each sum
+
+For the per-tensor scheme the hidden >> SHIFT_BITS downshift is done once
+per hidden unit instead of once per product; for the per-channel scheme the
+requantization multiplier and shift become constants too. --l1-units N
+also unrolls hidden units 0..N-1 of layer 1 (784 products each, so this is
+where code size grows); the scalar loop keeps the rest. Their b1 is still
+added by layer1_forward(), which also serves uploaded weights.
+
+mlp.c uses the header when built with WEIGHTS_UNROLLED=1, and only while the
+compiled-in weights are active: after a '6' upload it falls back to the
+loops. It is derived from weights_w1.h / weights_w2.h / weights_b2.h /
+weights_rq.h, so rerun this after export_weights_int8.py or calibrate.py.
+
+--check builds the generated code on the host next to copies of the mlp.c
+loops and compares every logit (and layer-1 sum) on test, random and
+full-range inputs. The report gives code size against estimated cycles per
+option: instruction counts and cycles are RV32IM estimates from the CYCLES
+table in int_model.py; the host object size is only a relative measure.
+
+Usage:
+    python unroll_gen.py                          # ../../vitis/mlp -> weights_unrolled.h
+    python unroll_gen.py --l1-units 4 --check
+    python unroll_gen.py --report                 # size / cycle table for several options
+"""
+
+import argparse
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+import int_model
+from int_model import CYCLES
+from swar_pack import DEFAULT_WEIGHTS_DIR, check_images
+
+HEADER_NAME = "weights_unrolled.h"
+TERMS_PER_LINE = 6
+
+# RV32IM instructions per unrolled product (the CYCLES keys they cost)
+INSTRUCTIONS = {"const_add": 2, "const_shift": 3, "const_mul": 4}
+
+def term(var, w):
+    """(operator, operand, kind) for var * w, or None for w == 0"""
+    w = int(w)
+    if w == 0:
+        return None
+    op = "+" if w > 0 else "-"
+    a = abs(w)
+    if a == 1:
+        return op, var, "const_add"
+    if a & (a - 1) == 0:
+        return op, f"({var} << {a.bit_length() - 1})", "const_shift"
+    return op, f"{var} * {a}", "const_mul"
+
+def sum_expr(terms, bias, indent):
+    """C expression bias + terms, wrapped TERMS_PER_LINE terms per line"""
+    expr = str(int(bias)) if bias or not terms else None
+    for i, (op, operand, _) in enumerate(terms):
+        if expr is None:
+            expr = operand if op == "+" else f"-{operand}"
+            continue
+        sep = f"\n{indent}" if i % TERMS_PER_LINE == 0 else " "
+        expr += f"{sep}{op} {operand}"
+    return expr
+
+class Unrolled:
+    """Generated code plus the counts the size / cycle estimates are made from"""
+
+    def __init__(self):
+        self.lines = []
+        self.kinds = {k: 0 for k in INSTRUCTIONS}
+        self.dropped = 0
+        self.fixed_instr = 0    # loads, downshifts, stores, requantization
+        self.fixed_cycles = 0
+
+    def count(self, terms, n_weights):
+        for _, _, kind in terms:
+            self.kinds[kind] += 1
+        self.dropped += n_weights - len(terms)
+
+    @property
+    def instructions(self):
+        return self.fixed_instr + sum(INSTRUCTIONS[k] * n for k, n in self.kinds.items())
+
+    @property
+    def cycles(self):
+        return self.fixed_cycles + sum(CYCLES[k] * n for k, n in self.kinds.items())
+
+def gen_layer2(weights, shift):
+    """layer2_unrolled(): output = W2 * hidden + b2 for the scheme of weights"""
+    w2, b2 = weights["w2"], weights["b2"]
+    per_channel = bool(weights.get("QUANT_PER_CHANNEL"))
+    n_out, n_hidden = w2.shape
+    g = Unrolled()
+    used = [h for h in range(n_hidden) if np.any(w2[:, h])]
+    if per_channel:
+        g.lines.append("static inline void layer2_unrolled(const int8_t* hidden, int32_t* output) {")
+        g.lines.append("    int32_t acc;")
+        var = "hidden[{}]"
+    else:
+        g.lines.append("static inline void layer2_unrolled(const int32_t* hidden, int32_t* output) {")
+        g.lines.append(f"    // hidden >= 0 after ReLU: >> {shift} is the downshift of layer2_forward()")
+        for h in used:
+            g.lines.append(f"    const int32_t h{h} = hidden[{h}] >> {shift};")
+        g.fixed_instr += 2 * len(used)
+        g.fixed_cycles += 2 * len(used)
+        var = "h{}"
+    for o in range(n_out):
+        terms = [t for t in (term(var.format(h), w2[o, h]) for h in range(n_hidden)) if t]
+        g.count(terms, n_hidden)
+        if per_channel:
+            mult, rshift = int(weights["rq2_mult"][o]), int(weights["rq2_shift"][o])
+            g.lines.append(f"    acc = {sum_expr(terms, b2[o], ' ' * 10)};")
+            g.lines.append(f"    output[{o}] = (int32_t)(((int64_t)acc * {mult} + "
+                           f"((int64_t)1 << {rshift - 1})) >> {rshift});")
+            g.fixed_instr += 8
+            g.fixed_cycles += CYCLES["requant"]
+        else:
+            g.lines.append(f"    output[{o}] = {sum_expr(terms, b2[o], ' ' * 16)};")
+        g.fixed_instr += 3      # bias constant, store
+        g.fixed_cycles += 3
+    g.lines.append("}")
+    return g
+
+def gen_layer1(w1, n_units):
+    """layer1_unrolled(): accum[h] = W1[h] * input for h < n_units, without bias"""
+    g = Unrolled()
+    g.lines.append("static inline void layer1_unrolled(const uint8_t* input, int32_t* accum) {")
+    for h in range(n_units):
+        terms = [t for t in (term(f"input[{i}]", w) for i, w in enumerate(w1[h])) if t]
+        g.count(terms, w1.shape[1])
+        g.lines.append(f"    accum[{h}] = {sum_expr(terms, 0, ' ' * 15)};")
+        g.fixed_instr += 1
+        g.fixed_cycles += 1
+    g.lines.append("}")
+    return g
+
+def loop_estimate(weights, l1_units=0):
+    """Estimated cycles of the mlp.c loops the generated code replaces"""
+    w2 = weights["w2"]
+    n_out, n_hidden = w2.shape
+    per_channel = bool(weights.get("QUANT_PER_CHANNEL"))
+    # per product: the CYCLES mac, the loop's increment / compare / branch,
+    # and for the per-tensor scheme the downshift of hidden[h]
+    per_mac = CYCLES["mac"] + CYCLES["loop"] + (0 if per_channel else CYCLES["shift"])
+    cycles = n_out * n_hidden * per_mac + n_out * (3 + (CYCLES["requant"] if per_channel else 0))
+    cycles += l1_units * weights["w1"].shape[1] * (CYCLES["mac"] + CYCLES["loop"])
+    return cycles
+
+def write_header(path, weights, shift, l1_units=0):
+    """weights_unrolled.h; returns (layer-2 Unrolled, layer-1 Unrolled or None)"""
+    per_channel = bool(weights.get("QUANT_PER_CHANNEL"))
+    l2 = gen_layer2(weights, shift)
+    l1 = gen_layer1(weights["w1"], l1_units) if l1_units else None
+    with open(path, "w", newline=int_model.header_newline(path)) as f:
+        f.write("#pragma once\n#include <stdint.h>\n\n")
+        f.write("// Generated by training/unroll_gen.py from weights_w1.h, weights_w2.h, weights_b2.h\n")
+        f.write("// and weights_rq.h; only valid for those compiled-in weights. See mlp.c WEIGHTS_UNROLLED\n")
+        f.write(f"#define UNROLLED_PER_CHANNEL {int(per_channel)}\n")
+        if not per_channel:
+            f.write(f"#define UNROLLED_SHIFT_BITS {shift}\n")
+        f.write(f"#define L1U_COUNT {l1_units}  // hidden units 0..L1U_COUNT-1 of layer 1\n\n")
+        f.write("\n".join(l2.lines) + "\n")
+        if l1 is not None:
+            f.write("\n" + "\n".join(l1.lines) + "\n")
+    return l2, l1
+
+HARNESS = r"""
+#include <stdio.h>
+#include <stdint.h>
+#include "weights_w1.h"
+#include "weights_b2.h"
+#include "weights_w2.h"
+#include "weights_rq.h"
+#include "weights_unrolled.h"
+
+#define N_IN %(n_in)d
+#define HIDDEN %(hidden)d
+#define OUT %(n_out)d
+#define SHIFT %(shift)d
+
+#if UNROLLED_PER_CHANNEL
+typedef int8_t hidden_t;
+#else
+typedef int32_t hidden_t;
+#endif
+
+/* The loops of mlp.c */
+static void layer1_loop(const uint8_t* input, int32_t* accum) {
+    for (int h = 0; h < HIDDEN; h++) {
+        int32_t acc = 0;
+        for (int i = 0; i < N_IN; i++) {
+            acc += (int32_t)w1[h][i] * (int32_t)input[i];
+        }
+        accum[h] = acc;
+    }
+}
+
+static void layer2_loop(const hidden_t* hidden, int32_t* output) {
+    for (int o = 0; o < OUT; o++) {
+        int32_t accum = 0;
+        for (int h = 0; h < HIDDEN; h++) {
+#if UNROLLED_PER_CHANNEL
+            accum += (int32_t)w2[o][h] * (int32_t)hidden[h];
+#else
+            accum += (int32_t)w2[o][h] * (hidden[h] >> SHIFT);
+#endif
+        }
+        accum += b2[o];
+#if UNROLLED_PER_CHANNEL
+        int64_t prod = (int64_t)accum * (int64_t)rq2_mult[o];
+        accum = (int32_t)((prod + ((int64_t)1 << (rq2_shift[o] - 1))) >> rq2_shift[o]);
+#endif
+        output[o] = accum;
+    }
+}
+
+int main(int argc, char** argv) {
+    static uint8_t x[N_IN];
+    static hidden_t hid[HIDDEN];
+    int32_t a[HIDDEN], b[HIDDEN], ya[OUT], yb[OUT];
+    long n = 0, bad1 = 0, bad2 = 0;
+    FILE* fx = fopen(argv[1], "rb");
+    FILE* fh = fopen(argv[2], "rb");
+    if (!fx || !fh) return 4;
+    while (fread(x, 1, N_IN, fx) == N_IN && fread(hid, sizeof(hidden_t), HIDDEN, fh) == HIDDEN) {
+        layer1_loop(x, a);
+#if L1U_COUNT
+        layer1_unrolled(x, b);
+        for (int h = 0; h < L1U_COUNT; h++) {
+            if (a[h] != b[h]) { bad1++; break; }
+        }
+#endif
+        layer2_loop(hid, ya);
+        layer2_unrolled(hid, yb);
+        for (int o = 0; o < OUT; o++) {
+            if (ya[o] != yb[o]) { bad2++; break; }
+        }
+        n++;
+    }
+    printf("%%ld %%ld %%ld\n", n, bad1, bad2);
+    return 0;
+}
+"""
+
+SIZE_UNIT = r"""
+#include <stdint.h>
+#include "weights_w1.h"
+#include "weights_b2.h"
+#include "weights_w2.h"
+#include "weights_rq.h"
+#include "weights_unrolled.h"
+
+void size_unrolled(const void* hidden, const uint8_t* input, int32_t* out, int32_t* accum) {
+    layer2_unrolled(hidden, out);
+#if L1U_COUNT
+    layer1_unrolled(input, accum);
+#endif
+}
+"""
+
+def check_hidden(weights, x, shift, seed=0):
+    """Hidden vectors for the layer-2 check: those of x, plus random full-range ones"""
+    rng = np.random.default_rng(seed)
+    if weights.get("QUANT_PER_CHANNEL"):
+        hidden = int_model.layer1_forward_rq(x, weights["w1"], weights["b1"],
+                                             weights["rq1_mult"], weights["rq1_shift"])
+        extra = rng.integers(0, 128, size=(len(x), hidden.shape[1]))
+        return np.concatenate([hidden, extra]).astype(np.int8)
+    hidden = int_model.layer1_forward(x, weights["w1"], weights["b1"])
+    # full int32 range too, so the sums wrap exactly like the loop's
+    extra = rng.integers(0, 2**31, size=(len(x), hidden.shape[1]))
+    return np.concatenate([hidden, extra]).astype(np.int32)
+
+def copy_weights(weights_dir, dst):
+    for name in ("weights_w1.h", "weights_b2.h", "weights_w2.h", "weights_rq.h"):
+        shutil.copy(Path(weights_dir) / name, dst)
+
+def host_size(weights_dir, weights, shift, l1_units, cc):
+    """Bytes of the generated code in a host -O2 object (x86: relative measure only)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        copy_weights(weights_dir, tmp)
+        write_header(tmp / HEADER_NAME, weights, shift, l1_units)
+        (tmp / "size.c").write_text(SIZE_UNIT)
+        subprocess.run([cc, "-O2", "-std=c99", "-c", "-o", str(tmp / "size.o"), str(tmp / "size.c")], check=True)
+        out = subprocess.run(["size", "-A", str(tmp / "size.o")], capture_output=True, text=True).stdout
+    m = re.search(r"^\.text\s+(\d+)", out, flags=re.M)
+    return int(m.group(1)) if m else None
+
+def run_check(weights_dir, weights, shift, l1_units, n, cc):
+    """Build the generated code next to the mlp.c loops; returns the mismatch count"""
+    x = check_images(n)
+    hidden = check_hidden(weights, x, shift)
+    x = np.concatenate([x, x])          # one image per hidden vector; layer 1 is checked twice, harmless
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        copy_weights(weights_dir, tmp)
+        write_header(tmp / HEADER_NAME, weights, shift, l1_units)
+        w2 = weights["w2"]
+        (tmp / "check.c").write_text(HARNESS % {"n_in": weights["w1"].shape[1], "hidden": w2.shape[1],
+                                                "n_out": w2.shape[0], "shift": shift})
+        x.tofile(tmp / "images.bin")
+        hidden.tofile(tmp / "hidden.bin")
+        subprocess.run([cc, "-O2", "-std=c99", "-fwrapv", "-o", str(tmp / "check"), str(tmp / "check.c")],
+                       check=True)
+        proc = subprocess.run([str(tmp / "check"), str(tmp / "images.bin"), str(tmp / "hidden.bin")],
+                              capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(f"C check failed: exit {proc.returncode}")
+        return len(x)
+    n_vec, bad1, bad2 = (int(v) for v in proc.stdout.split())
+    if l1_units:
+        print(f"Layer 1 units 0..{l1_units - 1}: {n_vec - bad1}/{n_vec} images bit-exact")
+    print(f"Layer 2: {n_vec - bad2}/{n_vec} hidden vectors bit-exact "
+          f"(half from test images, half random full-range)")
+    return bad1 + bad2
+
+def describe(l2, l1, weights, l1_units, size):
+    instr = l2.instructions + (l1.instructions if l1 else 0)
+    cycles = l2.cycles + (l1.cycles if l1 else 0)
+    loop_cycles = loop_estimate(weights, l1_units)
+    kinds = {k: l2.kinds[k] + (l1.kinds[k] if l1 else 0) for k in INSTRUCTIONS}
+    dropped = l2.dropped + (l1.dropped if l1 else 0)
+    label = "layer 2" + (f" + layer 1 units 0..{l1_units - 1}" if l1_units else "")
+    return (f"{label:<28s} {instr * 4:8d} {'' if size is None else size:>8} {cycles:8d} {loop_cycles:8d} "
+            f"{100.0 * (loop_cycles - cycles) / loop_cycles:6.0f}%   "
+            f"{kinds['const_mul']} mul, {kinds['const_shift']} shift, {kinds['const_add']} add, "
+            f"{dropped} dropped")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate weight-specialized straight-line C for mlp.c")
+    parser.add_argument("--weights", default=str(DEFAULT_WEIGHTS_DIR), help="directory with the weights_*.h")
+    parser.add_argument("-o", "--out", help=f"output header (default: <weights>/{HEADER_NAME})")
+    parser.add_argument("--l1-units", type=int, default=0, help="also unroll layer-1 hidden units 0..N-1")
+    parser.add_argument("--check", action="store_true", help="compare with the mlp.c loops in a host C build")
+    parser.add_argument("--report", action="store_true",
+                        help="code size against cycles for layer 2 with 0, 2, 8 and all layer-1 units")
+    parser.add_argument("-n", type=int, default=1000, help="images for --check")
+    parser.add_argument("--cc", help="C compiler for --check / --report (default: cc or gcc)")
+    args = parser.parse_args()
+
+    weights = int_model.load_weights(args.weights)
+    shift = weights.get("SHIFT", int_model.SHIFT)
+    hidden = weights["w1"].shape[0]
+    if not 0 <= args.l1_units <= hidden:
+        parser.error(f"--l1-units must be 0..{hidden}")
+    cc = args.cc or shutil.which("cc") or shutil.which("gcc")
+
+    out = args.out or str(Path(args.weights) / HEADER_NAME)
+    l2, l1 = write_header(out, weights, shift, args.l1_units)
+    scheme = "per-channel" if weights.get("QUANT_PER_CHANNEL") else f"per-tensor, SHIFT_BITS {shift}"
+    print(f"Wrote {out} ({scheme}, layer-1 units: {args.l1_units})")
+
+    options = sorted({0, 2, 8, hidden, args.l1_units}) if args.report else [args.l1_units]
+    print(f"\n{'option':<28s} {'est. B':>8s} {'host B':>8s} {'cycles':>8s} {'loops':>8s} {'saved':>7s}")
+    for units in options:
+        g2, g1 = (l2, l1) if units == args.l1_units else (gen_layer2(weights, shift),
+                                                           gen_layer1(weights["w1"], units) if units else None)
+        size = host_size(args.weights, weights, shift, units, cc) if cc else None
+        print(describe(g2, g1, weights, units, size))
+    print("est. B / cycles: RV32IM estimates (int_model.CYCLES); loops: the mlp.c loops they replace; "
+          "host B: .text of a host -O2 build")
+
+    if args.check:
+        if cc is None:
+            raise SystemExit("No C compiler found for --check")
+        bad = run_check(args.weights, weights, shift, args.l1_units, args.n, cc)
+        print(f"Check {'PASSED' if bad == 0 else 'FAILED'}")
+        if bad:
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Weight blob for runtime upload to mlp.c (command '6')
+
+Packs the tensors of weights_*.h into one little-endian blob the firmware
+can receive into RAM and switch inference to, so a retrained model is
+deployed without re-exporting headers, rebuilding and reflashing.
+
+Layout (all little-endian):
+    header, 16 bytes:
+        magic       4s   b"MLPW"
+        version     u8   1
+        flags       u8   bit 0: per-channel scheme (rq arrays follow b2)
+        shift       u8   layer-2 downshift of the per-tensor scheme
+        reserved    u8   0
+        n_in        u16  784
+        n_hidden    u8   32
+        n_out       u8   10
+        payload_len u32  bytes between header and CRC
+    payload:
+        w1 int8[n_hidden][n_in], b1 int32[n_hidden],
+        w2 int8[n_out][n_hidden], b2 int32[n_out],
+        per-channel only: rq1_mult int32[n_hidden], rq1_shift u8[n_hidden],
+                          rq2_mult int32[n_out], rq2_shift u8[n_out]
+    crc32 u32 (zlib/IEEE) over header + payload
+
+Usage:
+    python weights_blob.py                                   # ../../vitis/mlp headers -> weights.blob
+    python weights_blob.py --weights ../hls_nn/weights/vivado_init -o model.blob
+"""
+
+import argparse
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+import int_model
+
+MAGIC = b"MLPW"
+VERSION = 1
+FLAG_PER_CHANNEL = 0x01
+HEADER = struct.Struct("<4sBBBBHBBI")
+CRC = struct.Struct("<I")
+DEFAULT_WEIGHTS_DIR = Path(__file__).resolve().parent.parent.parent / "vitis" / "mlp"
+
+def _sections(per_channel):
+    sections = [("w1", np.int8), ("b1", "<i4"), ("w2", np.int8), ("b2", "<i4")]
+    if per_channel:
+        sections += [("rq1_mult", "<i4"), ("rq1_shift", np.uint8),
+                     ("rq2_mult", "<i4"), ("rq2_shift", np.uint8)]
+    return sections
+
+def pack_blob(weights, shift=int_model.SHIFT):
+    """Serialize a load_weights() dict into an upload blob"""
+    per_channel = bool(weights.get("QUANT_PER_CHANNEL"))
+    n_hidden, n_in = weights["w1"].shape
+    n_out = weights["w2"].shape[0]
+    payload = b"".join(np.ascontiguousarray(weights[name], dtype=dtype).tobytes()
+                       for name, dtype in _sections(per_channel))
+    header = HEADER.pack(MAGIC, VERSION, FLAG_PER_CHANNEL if per_channel else 0, shift, 0,
+                         n_in, n_hidden, n_out, len(payload))
+    return header + payload + CRC.pack(zlib.crc32(header + payload))
+
+def unpack_blob(blob):
+    """
+    Parse and check an upload blob
+
+    Returns:
+        (weights dict like load_weights() plus "SHIFT", crc32); raises
+        ValueError on a bad magic, version, length or CRC
+    """
+    if len(blob) < HEADER.size + CRC.size:
+        raise ValueError("blob shorter than header + CRC")
+    magic, version, flags, shift, _, n_in, n_hidden, n_out, payload_len = HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"bad magic/version {magic!r}/{version}")
+    end = HEADER.size + payload_len
+    if len(blob) != end + CRC.size:
+        raise ValueError(f"length {len(blob)} does not match payload_len {payload_len}")
+    (crc,) = CRC.unpack_from(blob, end)
+    if zlib.crc32(blob[:end]) != crc:
+        raise ValueError("CRC mismatch")
+
+    per_channel = bool(flags & FLAG_PER_CHANNEL)
+    shapes = {"w1": (n_hidden, n_in), "b1": (n_hidden,), "w2": (n_out, n_hidden), "b2": (n_out,),
+              "rq1_mult": (n_hidden,), "rq1_shift": (n_hidden,), "rq2_mult": (n_out,), "rq2_shift": (n_out,)}
+    weights = {"QUANT_PER_CHANNEL": int(per_channel), "SHIFT": shift}
+    offset = HEADER.size
+    for name, dtype in _sections(per_channel):
+        count = int(np.prod(shapes[name]))
+        arr = np.frombuffer(blob, dtype=dtype, count=count, offset=offset)
+        weights[name] = arr.reshape(shapes[name]).astype(np.dtype(dtype).newbyteorder("="))
+        offset += arr.nbytes
+    if offset != end:
+        raise ValueError(f"payload_len {payload_len} does not match the shapes ({offset - HEADER.size})")
+    return weights, crc
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack weights_*.h into a runtime upload blob")
+    parser.add_argument("--weights", default=str(DEFAULT_WEIGHTS_DIR), help="directory with weights_*.h")
+    parser.add_argument("--shift", type=int, default=int_model.SHIFT)
+    parser.add_argument("-o", "--out", default="weights.blob")
+    args = parser.parse_args()
+
+    weights = int_model.load_weights(args.weights)
+    blob = pack_blob(weights, args.shift)
+    Path(args.out).write_bytes(blob)
+    _, crc = unpack_blob(blob)
+    scheme = "per-channel" if weights.get("QUANT_PER_CHANNEL") else "per-tensor"
+    print(f"Wrote {args.out}: {len(blob)} bytes, {scheme}, CRC32 {crc:08x}")
+
+if __name__ == "__main__":
+    main()
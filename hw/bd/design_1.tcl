@@ -322,7 +322,10 @@ proc create_root_design { parentCell } {
     CONFIG.C_DEBUG_ENABLED {1} \
     CONFIG.C_D_AXI {1} \
     CONFIG.C_D_LMB {1} \
+    CONFIG.C_EDGE_IS_POSITIVE {1} \
+    CONFIG.C_INTERRUPT_IS_EDGE {1} \
     CONFIG.C_I_LMB {1} \
+    CONFIG.C_USE_INTERRUPT {1} \
   ] $microblaze_riscv_0
 
 
@@ -357,6 +360,8 @@ proc create_root_design { parentCell } {
   connect_bd_intf_net -intf_net microblaze_riscv_0_ilmb_1 [get_bd_intf_pins microblaze_riscv_0/ILMB] [get_bd_intf_pins microblaze_riscv_0_local_memory/ILMB]
 
   # Create port connections
+  connect_bd_net -net axi_uartlite_0_interrupt  [get_bd_pins axi_uartlite_0/interrupt] \
+  [get_bd_pins microblaze_riscv_0/Interrupt]
   connect_bd_net -net clk_wiz_0_locked  [get_bd_pins clk_wiz_0/locked] \
   [get_bd_pins rst_clk_wiz_0_100M/dcm_locked]
   connect_bd_net -net mdm_1_debug_sys_rst  [get_bd_pins mdm_1/Debug_SYS_Rst] \
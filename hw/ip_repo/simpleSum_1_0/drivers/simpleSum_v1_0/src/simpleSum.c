@@ -2,5 +2,124 @@
 
 /***************************** Include Files *******************************/
 #include "simpleSum.h"
+#include "xil_io.h"
 
 /************************** Function Definitions ***************************/
+/**
+ *
+ * Write a single pixel: two bus writes (index, then value). Kept for
+ * random access; whole images should use SIMPLESUM_LoadImage().
+ *
+ * @param   BaseAddress is the base address of the SIMPLESUM device.
+ * @param   Index is the pixel index, 0..783.
+ * @param   Value is the pixel value.
+ *
+ */
+void SIMPLESUM_WritePixel(u32 BaseAddress, u32 Index, u8 Value)
+{
+	SIMPLESUM_mWriteReg(BaseAddress, SIMPLESUM_PIX_INDEX_OFFSET, Index);
+	SIMPLESUM_mWriteReg(BaseAddress, SIMPLESUM_PIX_DATA_OFFSET, (u32)Value);
+}
+
+/**
+ *
+ * Move the packed pixel pointer. Index is rounded down to a multiple of 4.
+ * Only needed to resume a partial load; a full image leaves it at 0.
+ *
+ */
+void SIMPLESUM_SetPixelIndex(u32 BaseAddress, u32 Index)
+{
+	SIMPLESUM_mWriteReg(BaseAddress, SIMPLESUM_PIX_INDEX_OFFSET, Index);
+}
+
+/**
+ *
+ * Write Count pixels at the packed pointer, 4 per bus write. A final partial
+ * word is padded with zero pixels.
+ *
+ * @param   BaseAddress is the base address of the SIMPLESUM device.
+ * @param   Pixels points to the pixel values, no alignment required.
+ * @param   Count is the number of pixels to write.
+ *
+ */
+void SIMPLESUM_WritePixels(u32 BaseAddress, const u8 *Pixels, u32 Count)
+{
+	u32 i;
+
+	for (i = 0; i + 4 <= Count; i += 4) {
+		SIMPLESUM_WritePixelWord(BaseAddress,
+			(u32)Pixels[i] | ((u32)Pixels[i + 1] << 8) |
+			((u32)Pixels[i + 2] << 16) | ((u32)Pixels[i + 3] << 24));
+	}
+	if (i < Count) {
+		u32 word = 0;
+		u32 n;
+		for (n = 0; i + n < Count; n++)
+			word |= (u32)Pixels[i + n] << (8 * n);
+		SIMPLESUM_WritePixelWord(BaseAddress, word);
+	}
+}
+
+/**
+ *
+ * Load a full 28x28 image: 196 bus writes instead of 1568 with
+ * SIMPLESUM_WritePixel(). Assumes the packed pointer is at 0, which holds
+ * after reset, after a start and after any previous full image.
+ *
+ */
+void SIMPLESUM_LoadImage(u32 BaseAddress, const u8 *Pixels)
+{
+	SIMPLESUM_WritePixels(BaseAddress, Pixels, SIMPLESUM_N_PIXELS);
+}
+
+/**
+ *
+ * Select the pixel bank image loads go to. A start always runs on the
+ * current load bank; with AutoSwap the load bank flips on every start, so
+ * the next image can be loaded while the previous one is being classified:
+ *
+ *     SIMPLESUM_SetLoadBank(base, 0, 1);
+ *     SIMPLESUM_LoadImage(base, img[0]);
+ *     SIMPLESUM_Start(base);
+ *     for (k = 0; k < n; k++) {
+ *         if (k + 1 < n) SIMPLESUM_LoadImage(base, img[k + 1]);
+ *         pred[k] = SIMPLESUM_STATUS_PRED(SIMPLESUM_WaitDone(base));
+ *         if (k + 1 < n) SIMPLESUM_Start(base);
+ *     }
+ *
+ */
+void SIMPLESUM_SetLoadBank(u32 BaseAddress, u32 Bank, int AutoSwap)
+{
+	SIMPLESUM_mWriteReg(BaseAddress, SIMPLESUM_BANK_OFFSET,
+		(Bank & SIMPLESUM_BANK_SELECT) | (AutoSwap ? SIMPLESUM_BANK_AUTO_SWAP : 0u));
+}
+
+/**
+ *
+ * Start an inference on the loaded image. nn_core triggers on the rising
+ * edge of the start bit, so it is raised and dropped straight away.
+ *
+ */
+void SIMPLESUM_Start(u32 BaseAddress)
+{
+	SIMPLESUM_mWriteReg(BaseAddress, SIMPLESUM_CTRL_OFFSET, 1u);
+	SIMPLESUM_mWriteReg(BaseAddress, SIMPLESUM_CTRL_OFFSET, 0u);
+}
+
+/**
+ *
+ * Busy-wait for the inference started by SIMPLESUM_Start() to finish.
+ *
+ * @return  The status register; SIMPLESUM_STATUS_PRED() extracts the digit.
+ *
+ */
+u32 SIMPLESUM_WaitDone(u32 BaseAddress)
+{
+	u32 status;
+
+	do {
+		status = SIMPLESUM_mReadReg(BaseAddress, SIMPLESUM_STATUS_OFFSET);
+	} while ((status & SIMPLESUM_STATUS_DONE) == 0u);
+
+	return status;
+}
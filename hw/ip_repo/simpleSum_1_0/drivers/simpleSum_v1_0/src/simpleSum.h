@@ -13,6 +13,25 @@
 #define SIMPLESUM_S00_AXI_SLV_REG3_OFFSET 12
 #define SIMPLESUM_S00_AXI_SLV_REG4_OFFSET 16
 #define SIMPLESUM_S00_AXI_SLV_REG5_OFFSET 20
+#define SIMPLESUM_S00_AXI_SLV_REG6_OFFSET 24
+#define SIMPLESUM_S00_AXI_SLV_REG7_OFFSET 28
+
+/* nn_core register map */
+#define SIMPLESUM_CTRL_OFFSET       SIMPLESUM_S00_AXI_SLV_REG0_OFFSET  /* [0] = start */
+#define SIMPLESUM_PIX_DATA_OFFSET   SIMPLESUM_S00_AXI_SLV_REG1_OFFSET  /* one pixel at PIX_INDEX */
+#define SIMPLESUM_PIX_INDEX_OFFSET  SIMPLESUM_S00_AXI_SLV_REG2_OFFSET  /* also sets the packed pointer */
+#define SIMPLESUM_STATUS_OFFSET     SIMPLESUM_S00_AXI_SLV_REG3_OFFSET  /* [0] = done, [7:4] = pred */
+#define SIMPLESUM_PIX_PACKED_OFFSET SIMPLESUM_S00_AXI_SLV_REG4_OFFSET  /* write: 4 pixels, auto-increment */
+#define SIMPLESUM_BANK_OFFSET       SIMPLESUM_S00_AXI_SLV_REG5_OFFSET  /* write: pixel bank control */
+
+#define SIMPLESUM_N_PIXELS      784
+#define SIMPLESUM_STATUS_DONE   0x1u
+#define SIMPLESUM_STATUS_PRED(status) (((status) >> 4) & 0xFu)
+#define SIMPLESUM_STATUS_BANK   0x100u  /* bank pixel writes go to */
+#define SIMPLESUM_STATUS_BUSY   0x200u  /* inference running */
+
+#define SIMPLESUM_BANK_SELECT    0x1u   /* pixel load bank (0 or 1) */
+#define SIMPLESUM_BANK_AUTO_SWAP 0x2u   /* flip the load bank on every start */
 
 
 /**************************** Type Definitions *****************************/
@@ -78,4 +97,24 @@
  */
 XStatus SIMPLESUM_Reg_SelfTest(void * baseaddr_p);
 
+/**
+ *
+ * Write one 32-bit word of packed pixels: pixel n in bits [8n+7:8n]. The
+ * pixels land at the packed pointer, which then advances by 4.
+ *
+ * The pointer is 0 after reset, after every start and after the word
+ * holding pixel 783, so loading a whole image is 196 of these writes.
+ *
+ */
+#define SIMPLESUM_WritePixelWord(BaseAddress, Word) \
+	SIMPLESUM_mWriteReg((BaseAddress), SIMPLESUM_PIX_PACKED_OFFSET, (Word))
+
+void SIMPLESUM_WritePixel(u32 BaseAddress, u32 Index, u8 Value);
+void SIMPLESUM_SetPixelIndex(u32 BaseAddress, u32 Index);
+void SIMPLESUM_WritePixels(u32 BaseAddress, const u8 *Pixels, u32 Count);
+void SIMPLESUM_LoadImage(u32 BaseAddress, const u8 *Pixels);
+void SIMPLESUM_SetLoadBank(u32 BaseAddress, u32 Bank, int AutoSwap);
+void SIMPLESUM_Start(u32 BaseAddress);
+u32 SIMPLESUM_WaitDone(u32 BaseAddress);
+
 #endif // SIMPLESUM_H
@@ -4,25 +4,39 @@ module nn_core #(
     parameter integer N_IN  = 784,
     parameter integer H     = 32,
     parameter integer N_OUT = 10,
-    parameter integer SHIFT = 8
+    parameter integer SHIFT = 8,
+    // Hidden neurons computed in parallel (must divide H). Layer 1 runs in
+    // G = H/P passes over the image; every w1 word holds the P weights of
+    // one pixel for neurons g*P .. g*P+P-1 (lane p in bits [8p+7:8p]) at
+    // address g*N_IN + i, every b1 word the P matching biases. P=1 is the
+    // original one-byte-per-cycle layout. See export_vivado_coe.py --parallel.
+    parameter integer P     = 1,
+    parameter integer W1_AW = $clog2((H/P)*N_IN),
+    parameter integer B1_AW = (H/P > 1) ? $clog2(H/P) : 1
 )(
     input  wire        clk,
     input  wire        rst,
 
     input  wire        start,
+    input  wire        x_bank,    // pixel bank to run on, sampled with start
     output reg         done,
+    output wire        busy,      // layer 1 / layer 2 in progress
 
+    // Pixel write port, one 32-bit word (4 pixels) per cycle: byte lane k
+    // writes pixel {pix_addr[9:2], k} when pix_be[k] is set
     input  wire        pix_we,
     input  wire [9:0]  pix_addr,
-    input  wire [7:0]  pix_data,
+    input  wire [3:0]  pix_be,
+    input  wire [31:0] pix_data,
+    input  wire        pix_bank,  // pixel bank the write port targets
 
     output wire        b1_en,
-    output wire [4:0]  b1_addr,
-    input  wire [31:0] b1_dout,
+    output wire [B1_AW-1:0]  b1_addr,
+    input  wire [32*P-1:0]   b1_dout,
 
-    output wire        w1_en,
-    output wire [14:0] w1_addr,
-    input  wire [7:0]  w1_dout,
+    output wire              w1_en,
+    output wire [W1_AW-1:0]  w1_addr,
+    input  wire [8*P-1:0]    w1_dout,
 
     output wire        w2_en,
     output wire [8:0]  w2_addr,
@@ -42,22 +56,37 @@ module nn_core #(
 );
 
     // ============================================================
-    // Pixel buffer (uint8 exactly like your friend's C)
+    // Pixel buffer (uint8 exactly like your friend's C), stored as
+    // little-endian words of 4 pixels: pixel i is x_mem[i/4][8*(i%4) +: 8]
+    // Two banks (ping-pong): the write port fills bank pix_bank while
+    // layer 1 reads the bank latched at start, so the next image can be
+    // loaded during an inference. Word w of bank b is x_mem[{b, w}].
     // ============================================================
-    reg [7:0] x_mem [0:N_IN-1];
+    reg [31:0] x_mem [0:511];
+    integer k;
     always @(posedge clk) begin
         if (!rst && pix_we) begin
             if (pix_addr < N_IN)
-                x_mem[pix_addr] <= pix_data;
+                for (k = 0; k < 4; k = k + 1)
+                    if (pix_be[k])
+                        x_mem[{pix_bank, pix_addr[9:2]}][8*k +: 8] <= pix_data[8*k +: 8];
         end
     end
 
+    function [7:0] x_lane;
+        input [31:0] word;
+        input [1:0]  lane;
+        begin
+            x_lane = word[8*lane +: 8];
+        end
+    endfunction
+
     // ============================================================
     // ROM control regs
     // ============================================================
     reg        b1_en_r, w1_en_r, w2_en_r, b2_en_r;
-    reg [4:0]  b1_addr_r;
-    reg [14:0] w1_addr_r;
+    reg [B1_AW-1:0] b1_addr_r;
+    reg [W1_AW-1:0] w1_addr_r;
     reg [8:0]  w2_addr_r;
     reg [3:0]  b2_addr_r;
 
@@ -75,18 +104,19 @@ module nn_core #(
     // BRAM read latency is 1 cycle, so these regs hold "addr from prev cycle"
     // ============================================================
     reg signed [7:0]  w1_q, w2_q;
-    reg signed [31:0] b1_q, b2_q;
+    reg signed [31:0] b2_q;
+    reg [32*P-1:0]    b1_q;             // P packed biases, lane p = b1[g*P+p]
 
     always @(posedge clk) begin
         if (rst) begin
             w1_q <= 8'sd0;
             w2_q <= 8'sd0;
-            b1_q <= 32'sd0;
+            b1_q <= {32*P{1'b0}};
             b2_q <= 32'sd0;
         end else begin
-            w1_q <= $signed(w1_dout);
+            w1_q <= $signed(w1_dout[7:0]);
             w2_q <= $signed(w2_dout);
-            b1_q <= $signed(b1_dout);
+            b1_q <= b1_dout;
             b2_q <= $signed(b2_dout);
         end
     end
@@ -98,14 +128,13 @@ module nn_core #(
 
     // ============================================================
     // Address helpers (row-major matches friend's w1[h][i], w2[o][h])
+    // For P > 1 the w1 row is a group of P neurons: w1_index(g, i)
     // ============================================================
-function [14:0] w1_index;
+function [W1_AW-1:0] w1_index;
     input [5:0] hh;
     input [9:0] ii;
-    reg [14:0] tmp;
     begin
-        tmp = {{9{1'b0}}, hh} * 15'd784;
-        w1_index = tmp + {{5{1'b0}}, ii};
+        w1_index = hh * N_IN + ii;
     end
 endfunction
 
@@ -134,6 +163,7 @@ endfunction
     // Loop counters, accumulators, argmax
     // ============================================================
     reg [9:0] ii;
+    wire [9:0] ii_next = ii + 10'd1;
     reg [5:0] hh;
     reg [3:0] oo;
     
@@ -149,6 +179,7 @@ reg [5:0] hh_use_tag;
 reg [3:0] oo_use_tag;
     
     reg signed [63:0] l1_sum;
+    reg signed [63:0] l1_acc [0:P-1];  // one layer-1 accumulator per lane
 
     reg signed [63:0] acc;        // wide accumulator
     reg signed [63:0] best_val;
@@ -165,8 +196,15 @@ reg [3:0] oo_use_tag;
 
 
     // Multipliers (signed weights, unsigned x, signed hidden_scaled)
-    wire signed [7:0]  w1_now  = $signed(w1_dout);
-    wire signed [15:0] mul_w1x = w1_now * $signed({1'b0, x_q});
+    // Layer 1 has P of them, all sharing the same pixel x_q
+    wire signed [7:0]  w1_now  = $signed(w1_dout[7:0]);
+    wire [16*P-1:0]    mul_w1x;
+    genvar gp;
+    generate
+        for (gp = 0; gp < P; gp = gp + 1) begin : g_l1_lane
+            assign mul_w1x[16*gp +: 16] = $signed(w1_dout[8*gp +: 8]) * $signed({1'b0, x_q});
+        end
+    endgenerate
     wire signed [39:0] mul_w2h = w2_q * $signed(hscaled_q_d1);          // int8 * int32
     
     
@@ -201,12 +239,16 @@ reg [3:0] oo_use_tag;
                S_L2_PRIME0  = 4'd10;
 
     reg [3:0] state;
+    reg       rd_bank;     // bank layer 1 reads, latched on start
+
+    assign busy = (state != S_IDLE) && (state != S_DONE);
 
     integer t;
     always @(posedge clk) begin
         if (rst) begin
             state     <= S_IDLE;
             done      <= 1'b0;
+            rd_bank   <= 1'b0;
             predicted <= 4'd0;
             dbg_score0 <= 32'sd0;
             dbg_acc0   <= 32'sd0;
@@ -225,7 +267,7 @@ oo_use_tag <= 4'd0;
             
 
             b1_en_r <= 1'b0; w1_en_r <= 1'b0; w2_en_r <= 1'b0; b2_en_r <= 1'b0;
-            b1_addr_r <= 5'd0; w1_addr_r <= 15'd0; w2_addr_r <= 9'd0; b2_addr_r <= 4'd0;
+            b1_addr_r <= {B1_AW{1'b0}}; w1_addr_r <= {W1_AW{1'b0}}; w2_addr_r <= 9'd0; b2_addr_r <= 4'd0;
 
             ii <= 10'd0; hh <= 6'd0; oo <= 4'd0;
             acc <= 64'sd0;
@@ -238,6 +280,8 @@ oo_use_tag <= 4'd0;
 
             for (t = 0; t < H; t = t + 1)
                 hidden[t] <= 32'sd0;
+            for (t = 0; t < P; t = t + 1)
+                l1_acc[t] <= 64'sd0;
 
         end else begin
             // default behavior
@@ -256,20 +300,22 @@ oo_use_tag <= 4'd0;
                 b1_en_r <= 1'b0; w1_en_r <= 1'b0; w2_en_r <= 1'b0; b2_en_r <= 1'b0;
 
                 if (start_pulse) begin
-                    // start layer1 at hh=0, ii=0
+                    // start layer1 at hh=0 (neuron group 0), ii=0
                     hh  <= 6'd0;
                     ii  <= 10'd0;
-                    acc <= 64'sd0;
+                    for (t = 0; t < P; t = t + 1)
+                        l1_acc[t] <= 64'sd0;
 
                     // enable w1/b1 and set initial addresses
                     w1_en_r   <= 1'b1;
                     w1_addr_r <= w1_index(6'd0, 10'd0);
 
                     b1_en_r   <= 1'b1;
-                    b1_addr_r <= 5'd0;
+                    b1_addr_r <= {B1_AW{1'b0}};
 
                     // latch matching x for the address we just issued
-                    x_q <= x_mem[10'd0];
+                    rd_bank <= x_bank;
+                    x_q <= x_lane(x_mem[{x_bank, 8'd0}], 2'd0);
 
                     state <= S_L1_WAIT; // wait 1 cycle for w1_q to become valid
                 end
@@ -290,7 +336,8 @@ oo_use_tag <= 4'd0;
             // ====================================================
             S_L1_MAC: begin
                 // accumulate using the weight/data from the address issued 1 cycle ago
-                acc <= acc + $signed({{48{mul_w1x[15]}}, mul_w1x});
+                for (t = 0; t < P; t = t + 1)
+                    l1_acc[t] <= l1_acc[t] + $signed(mul_w1x[16*t +: 16]);
                 if (hh == 6'd0 && ii == 10'd0) begin
                     dbg_score0       <= {24'd0, x_q};                 // REG4: x0 used
                     dbg_partial4_o0  <= {{24{w1_now[7]}}, w1_now};    // REG6: w1_00 used
@@ -302,7 +349,7 @@ oo_use_tag <= 4'd0;
                     w1_en_r   <= 1'b1;
                     w1_addr_r <= w1_index(hh, ii + 10'd1);
 
-                    x_q <= x_mem[ii + 10'd1];
+                    x_q <= x_lane(x_mem[{rd_bank, ii_next[9:2]}], ii_next[1:0]);
 
                     // stay in MAC (pipeline continues, no extra waits)
                     state <= S_L1_MAC;
@@ -313,34 +360,37 @@ oo_use_tag <= 4'd0;
             end
 
             // ====================================================
-            // LAYER 1: FINISH (bias + ReLU, then next hidden neuron)
+            // LAYER 1: FINISH (bias + ReLU, then next hidden neuron group)
             // ====================================================
             S_L1_FINISH: begin
-                // bias is in b1_q (address set at start of this hh)
+                // biases are in b1_q (address set at start of this hh)
                 // friend does int32 accum; we clamp by truncating to 32 after ReLU
                 // ReLU
-                if (hh == 6'd0) dbg_score0 <= b1_q;   // REG4 = b1[0] used
-
-                l1_sum = acc + $signed(b1_q);
-                if (l1_sum > 0)
-                    hidden[hh] <= l1_sum[31:0];
-                else
-                    hidden[hh] <= 32'sd0;
+                if (hh == 6'd0) dbg_score0 <= b1_q[31:0];   // REG4 = b1[0] used
+
+                for (t = 0; t < P; t = t + 1) begin
+                    l1_sum = l1_acc[t] + $signed(b1_q[32*t +: 32]);
+                    if (l1_sum > 0)
+                        hidden[hh*P + t] <= l1_sum[31:0];
+                    else
+                        hidden[hh*P + t] <= 32'sd0;
+                end
 
-                if (hh < H-1) begin
-                    // next hidden neuron
+                if (hh < H/P-1) begin
+                    // next hidden neuron group
                     hh  <= hh + 6'd1;
                     ii  <= 10'd0;
-                    acc <= 64'sd0;
+                    for (t = 0; t < P; t = t + 1)
+                        l1_acc[t] <= 64'sd0;
 
                     // set next addresses
                     w1_en_r   <= 1'b1;
                     w1_addr_r <= w1_index(hh + 6'd1, 10'd0);
 
                     b1_en_r   <= 1'b1;
-                    b1_addr_r <= hh + 6'd1;
+                    b1_addr_r <= hh + 6'd1;   // truncates to B1_AW
 
-                    x_q <= x_mem[10'd0];
+                    x_q <= x_lane(x_mem[{rd_bank, 8'd0}], 2'd0);
 
                     state <= S_L1_WAIT; // prime for new hh
                 end else begin
@@ -4,6 +4,11 @@
 	module simpleSum #
 	(
 		// Users to add parameters here
+		// Hidden neurons nn_core computes in parallel (1, 2, 4, 8, 16 or 32);
+		// w1/b1 ROMs are NN_P weights / biases wide, see nn_core.v
+		parameter integer NN_P     = 1,
+		parameter integer NN_W1_AW = $clog2((32/NN_P)*784),
+		parameter integer NN_B1_AW = (32/NN_P > 1) ? $clog2(32/NN_P) : 1,
 
 		// User parameters ends
 		// Do not modify the parameters beyond this line
@@ -16,13 +21,13 @@
 	(
 		// Users to add ports here
 // b1 ROM interface (to connect in BD)
-output wire        b1_en,
-output wire [4:0]  b1_addr,
-input  wire [31:0] b1_dout,
+output wire                 b1_en,
+output wire [NN_B1_AW-1:0]  b1_addr,
+input  wire [32*NN_P-1:0]   b1_dout,
 
-output wire        w1_en,
-output wire [14:0] w1_addr,
-input  wire [7:0]  w1_dout,
+output wire                 w1_en,
+output wire [NN_W1_AW-1:0]  w1_addr,
+input  wire [8*NN_P-1:0]    w1_dout,
 
 output wire        w2_en,
 output wire [8:0]  w2_addr,
@@ -61,6 +66,9 @@ input  wire [31:0] b2_dout,
 	);
 // Instantiation of Axi Bus Interface S00_AXI
 	simpleSum_slave_lite_v1_0_S00_AXI # ( 
+		.NN_P(NN_P),
+		.NN_W1_AW(NN_W1_AW),
+		.NN_B1_AW(NN_B1_AW),
 		.C_S_AXI_DATA_WIDTH(C_S00_AXI_DATA_WIDTH),
 		.C_S_AXI_ADDR_WIDTH(C_S00_AXI_ADDR_WIDTH)
 	) simpleSum_slave_lite_v1_0_S00_AXI_inst (
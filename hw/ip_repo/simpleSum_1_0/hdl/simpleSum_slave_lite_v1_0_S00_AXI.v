@@ -4,6 +4,11 @@
 	module simpleSum_slave_lite_v1_0_S00_AXI #
 	(
 		// Users to add parameters here
+		// Hidden neurons nn_core computes in parallel (1, 2, 4, 8, 16 or 32);
+		// w1/b1 ROMs are NN_P weights / biases wide, see nn_core.v
+		parameter integer NN_P     = 1,
+		parameter integer NN_W1_AW = $clog2((32/NN_P)*784),
+		parameter integer NN_B1_AW = (32/NN_P > 1) ? $clog2(32/NN_P) : 1,
 
 		// User parameters ends
 		// Do not modify the parameters beyond this line
@@ -16,13 +21,13 @@
 	(
 		// Users to add ports here
 // b1 ROM interface (to connect in BD)
-output wire        b1_en,
-output wire [4:0]  b1_addr,
-input  wire [31:0] b1_dout,
+output wire                 b1_en,
+output wire [NN_B1_AW-1:0]  b1_addr,
+input  wire [32*NN_P-1:0]   b1_dout,
 
-output wire        w1_en,
-output wire [14:0] w1_addr,
-input  wire [7:0]  w1_dout,
+output wire                 w1_en,
+output wire [NN_W1_AW-1:0]  w1_addr,
+input  wire [8*NN_P-1:0]    w1_dout,
 
 output wire        w2_en,
 output wire [8:0]  w2_addr,
@@ -124,9 +129,9 @@ input  wire [31:0] b2_dout,
 	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg0; // control: [0]=start
 	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg1; // pixel data: [7:0]
 	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg2; // pixel index: [9:0]
-	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg3; // status/result: [0]=done, [7:4]=pred
-	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg4; // unused
-	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg5; // unused
+	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg3; // status/result: [0]=done, [7:4]=pred, [8]=load bank, [9]=busy
+	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg4; // debug capture (read), packed pixels (write)
+	reg [C_S_AXI_DATA_WIDTH-1:0]	slv_reg5; // debug capture (read), pixel bank control (write)
 	reg [C_S_AXI_DATA_WIDTH-1:0]    slv_reg6;
     reg [C_S_AXI_DATA_WIDTH-1:0]    slv_reg7;
 	integer	 byte_index;
@@ -135,8 +140,14 @@ input  wire [31:0] b2_dout,
     // slv_reg0[0] = start
     // slv_reg1 = pixel value = bits[7:0] (0..255)
     // slv_reg2    = pixel index bits[9:0] = which pixel (0..783)
-    // slv_reg3    = status/result [0]=done, [7:4]=prediction digit
-    // slv_reg4    = 
+    // slv_reg3    = status/result [0]=done, [7:4]=prediction digit,
+    //               [8]=bank pixel writes go to, [9]=nn_core busy (live)
+    // slv_reg4    = write: 4 packed pixels [7:0],[15:8],[23:16],[31:24] at the
+    //               auto-incrementing pixel pointer; read: debug capture
+    // slv_reg5    = write: [0]=pixel load bank, [1]=swap the load bank on
+    //               every start; read: debug capture
+    //               A start runs on the current load bank, so with [1] set
+    //               the next image can be written while this one computes
     // ------------------------------------------------------------
     //reg accel_busy;
 	// I/O Connections assignments
@@ -349,11 +360,13 @@ input  wire [31:0] b2_dout,
 	          end                                       
 	        end                                         
 	// Implement memory mapped register select and read logic generation
+reg  pix_bank;   // live status bits folded into REG3 reads
+wire nn_busy;
 assign S_AXI_RDATA = 
     (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h0) ? slv_reg0 :
     (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h1) ? slv_reg1 :
     (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h2) ? slv_reg2 :
-    (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h3) ? slv_reg3 :
+    (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h3) ? {slv_reg3[31:10], nn_busy, pix_bank, slv_reg3[7:0]} :
     (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h4) ? slv_reg4 :
     (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h5) ? slv_reg5 :
     (axi_araddr[ADDR_LSB+OPT_MEM_ADDR_BITS:ADDR_LSB] == 3'h6) ? slv_reg6 :
@@ -368,30 +381,81 @@ wire [2:0] wr_sel = (S_AXI_AWVALID) ?
 
 wire wr_fire = S_AXI_WVALID && S_AXI_WREADY;
 wire wr_reg1 = wr_fire && (wr_sel == 3'h1);
+wire wr_reg4 = wr_fire && (wr_sel == 3'h4);
+wire wr_reg5 = wr_fire && (wr_sel == 3'h5);
 
-// Latch pixel byte AND pixel address on the SAME cycle we assert pix_we.
+wire start_bit = slv_reg0[0];
+reg start_d;
+always @(posedge S_AXI_ACLK) begin
+  if (!S_AXI_ARESETN) start_d <= 1'b0;
+  else start_d <= start_bit;
+end
+wire start_pulse = start_bit & ~start_d;
+
+// -------------------------
+// Ping-pong pixel banks (REG5)
+// -------------------------
+reg bank_auto_swap;
+always @(posedge S_AXI_ACLK) begin
+  if (!S_AXI_ARESETN) begin
+    pix_bank       <= 1'b0;
+    bank_auto_swap <= 1'b0;
+  end else if (wr_reg5) begin
+    pix_bank       <= S_AXI_WDATA[0];
+    bank_auto_swap <= S_AXI_WDATA[1];
+  end else if (start_pulse && bank_auto_swap) begin
+    // nn_core samples the old value as its compute bank on this same edge
+    pix_bank <= ~pix_bank;
+  end
+end
+
+// Latch pixel byte(s) AND pixel address on the SAME cycle we assert pix_we.
 // This guarantees addr/data alignment even if REG2 write timing drifts.
-reg [7:0] pix_data_lat;
-reg [9:0] pix_addr_lat;
-reg       pix_we_lat;
-reg [9:0] pix_addr_hold;
+//   REG1 write: one pixel at the index last written to REG2
+//   REG4 write: 4 pixels at pix_ptr, then pix_ptr += 4. pix_ptr is set by
+//               REG2 (rounded down to a multiple of 4) and goes back to 0
+//               after pixel 783 and on every start, so a whole image is
+//               196 REG4 writes with no index writes at all.
+reg [31:0] pix_data_lat;
+reg [9:0]  pix_addr_lat;
+reg [3:0]  pix_be_lat;
+reg        pix_bank_lat;
+reg        pix_we_lat;
+reg [9:0]  pix_addr_hold;
+reg [9:0]  pix_ptr;
 
 always @(posedge S_AXI_ACLK) begin
   if (!S_AXI_ARESETN) begin
     pix_addr_hold <= 10'd0;
-    pix_data_lat  <= 8'd0;
+    pix_ptr       <= 10'd0;
+    pix_data_lat  <= 32'd0;
     pix_addr_lat  <= 10'd0;
+    pix_be_lat    <= 4'd0;
+    pix_bank_lat  <= 1'b0;
     pix_we_lat    <= 1'b0;
   end else begin
     // latch address the moment REG2 is written
-    if (wr_fire && (wr_sel == 3'h2))
+    if (wr_fire && (wr_sel == 3'h2)) begin
       pix_addr_hold <= S_AXI_WDATA[9:0];
+      pix_ptr       <= {S_AXI_WDATA[9:2], 2'b00};
+    end else if (wr_reg4) begin
+      pix_ptr <= (pix_ptr >= 10'd780) ? 10'd0 : pix_ptr + 10'd4;
+    end else if (start_pulse) begin
+      pix_ptr <= 10'd0;
+    end
 
-    // latch data+addr together when REG1 is written
-    pix_we_lat <= wr_reg1;
+    // latch data+addr together when REG1 / REG4 is written
+    pix_we_lat <= wr_reg1 | wr_reg4;
+    if (wr_reg1 | wr_reg4)
+      pix_bank_lat <= pix_bank;
     if (wr_reg1) begin
-      pix_data_lat <= S_AXI_WDATA[7:0];
+      pix_data_lat <= {4{S_AXI_WDATA[7:0]}};
       pix_addr_lat <= pix_addr_hold;  // use held address, not slv_reg2
+      pix_be_lat   <= 4'b0001 << pix_addr_hold[1:0];
+    end else if (wr_reg4) begin
+      pix_data_lat <= S_AXI_WDATA;
+      pix_addr_lat <= pix_ptr;
+      pix_be_lat   <= 4'b1111;
     end
   end
 end
@@ -399,9 +463,9 @@ end
 // -------------------------
 // Aliases to nn_core
 // -------------------------
-wire        start_bit   = slv_reg0[0];
-wire [7:0]  pix_data_w  = pix_data_lat;
+wire [31:0] pix_data_w  = pix_data_lat;
 wire [9:0]  pix_addr_w  = pix_addr_lat;
+wire [3:0]  pix_be_w    = pix_be_lat;
 wire        pix_we      = pix_we_lat;
 
 wire        nn_done;
@@ -416,17 +480,24 @@ wire signed [31:0] dbg_w2_00;
 // -------------------------
 nn_core #(
   .N_IN(784),
-  .N_OUT(10)
+  .N_OUT(10),
+  .P(NN_P),
+  .W1_AW(NN_W1_AW),
+  .B1_AW(NN_B1_AW)
 ) u_nn (
   .clk(S_AXI_ACLK),
   .rst(!S_AXI_ARESETN),
 
   .start(start_bit),
+  .x_bank(pix_bank),
   .done(nn_done),
+  .busy(nn_busy),
 
   .pix_we(pix_we),
   .pix_addr(pix_addr_w),
+  .pix_be(pix_be_w),
   .pix_data(pix_data_w),
+  .pix_bank(pix_bank_lat),
 
   .b1_en(b1_en),
   .b1_addr(b1_addr),
@@ -452,13 +523,6 @@ nn_core #(
 // -------------------------
 // HW drives slv_reg3 (CLEAR ON START, UPDATE ON DONE)
 // -------------------------
-reg start_d;
-always @(posedge S_AXI_ACLK) begin
-  if (!S_AXI_ARESETN) start_d <= 1'b0;
-  else start_d <= start_bit;
-end
-wire start_pulse = start_bit & ~start_d;
-
 always @(posedge S_AXI_ACLK) begin
   if (!S_AXI_ARESETN) begin
     slv_reg3 <= 32'd0;
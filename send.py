@@ -1,5 +1,10 @@
-import serial
+import sys
 import time
+from pathlib import Path
+
+import serial
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "digit_fpga_nn" / "data"))
 
 PORT = "COM6"
 BAUD = 9600   # make sure this matches your BSP
@@ -24,6 +29,27 @@ print("len", len(data),
       "max", max(data),
       "avg", sum(data)/len(data))
 
+# A running gateway.py session holds the port open and in sync: ask it
+# instead of opening the port (python send.py --no-session to bypass it).
+# Only the board's answer counts, not the gateway's host model
+if "--no-session" not in sys.argv:
+    from gateway_client import GatewayError, session_client
+    gc = session_client(client="send.py")
+    if gc is not None:
+        print("\nSending through the gateway session...")
+        try:
+            pred, backend = gc.classify_tagged(data)
+        except GatewayError as e:
+            print(f"Gateway refused the image: {e}")
+            sys.exit(1)
+        finally:
+            gc.close()
+        if backend != "device":
+            print(f"Gateway answered from its {backend} model, not the board")
+            sys.exit(1)
+        print("Prediction:", pred)
+        sys.exit(0)
+
 # Open serial
 ser = serial.Serial(PORT, BAUD, timeout=0.2)
 
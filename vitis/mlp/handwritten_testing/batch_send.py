@@ -1,3 +1,4 @@
+import sys
 import time
 from pathlib import Path
 
@@ -5,10 +6,18 @@ import cv2
 import numpy as np
 import serial
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "digit_fpga_nn" / "data"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "digit_fpga_nn" / "training"))
+from load_mnist import downsample, side_of  # noqa: E402
+from pred_cache import PredictionCache  # noqa: E402
+from sendToNN import FIRMWARES, info_input_size, query_info  # noqa: E402
+
 PORT = "COM3"
 BAUD = 9600
 INPUT_SIZE = 784
 CHUNK_SIZE = 32
+# answers for already-seen images come from the host cache (None disables it)
+CACHE_PATH = "pred_cache.json"
 
 
 def pad_to_square(img: np.ndarray) -> np.ndarray:
@@ -21,7 +30,7 @@ def pad_to_square(img: np.ndarray) -> np.ndarray:
     return out
 
 
-def preprocess_mnist_style(image_path: Path) -> np.ndarray:
+def preprocess_mnist_style(image_path: Path, side: int = 28) -> np.ndarray:
     img_bgr = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
     if img_bgr is None:
         raise FileNotFoundError(f"Could not read image: {image_path}")
@@ -55,7 +64,8 @@ def preprocess_mnist_style(image_path: Path) -> np.ndarray:
     out28 = np.zeros((28, 28), dtype=np.uint8)
     out28[4:24, 4:24] = resized20
 
-    return out28.flatten().astype(np.uint8)
+    # reduced-resolution firmware (INPUT_SIDE 14 / 7): block-average like training
+    return downsample(out28, side).flatten().astype(np.uint8)
 
 
 def wait_for_ready_silent(ser, timeout=10.0) -> bool:
@@ -71,14 +81,21 @@ def wait_for_ready_silent(ser, timeout=10.0) -> bool:
     return False
 
 
-def send_image(ser, image_path: Path):
+def send_image(ser, image_path: Path, cache=None, fp=None, side=28):
     print(f"\n==============================")
     print(f"Testing: {image_path.name}")
     print(f"==============================")
 
-    img_flat = preprocess_mnist_style(image_path)
+    img_flat = preprocess_mnist_style(image_path, side)
     image_bytes = img_flat.tobytes()
 
+    hit = cache.get(img_flat, fp) if cache is not None else None
+    if hit is not None:
+        print(f"Prediction: {hit['pred']} (cached)")
+        if "logits" in hit:
+            print(hit["logits"])
+        return
+
     # Clear buffer
     if ser.in_waiting:
         ser.read(ser.in_waiting)
@@ -95,12 +112,12 @@ def send_image(ser, image_path: Path):
     print("Sending image data...")
 
     sent = 0
-    for i in range(0, INPUT_SIZE, CHUNK_SIZE):
+    for i in range(0, len(image_bytes), CHUNK_SIZE):
         chunk = image_bytes[i:i + CHUNK_SIZE]
         ser.write(chunk)
         ser.flush()
         sent += len(chunk)
-        print(f"Sent {sent}/{INPUT_SIZE} bytes", end="\r", flush=True)
+        print(f"Sent {sent}/{len(image_bytes)} bytes", end="\r", flush=True)
         time.sleep(0.02)
 
     print("")
@@ -121,6 +138,9 @@ def send_image(ser, image_path: Path):
             if pred_line and logits_line:
                 print(pred_line)
                 print(logits_line)
+                if cache is not None:
+                    pred = int(pred_line.split(":", 1)[1])
+                    cache.put(img_flat, fp, {"pred": pred, "logits": logits_line})
                 return
 
         time.sleep(0.01)
@@ -137,16 +157,29 @@ def main():
     ser = serial.Serial(PORT, BAUD, timeout=0.5)
     time.sleep(2)
 
+    # the INFO: line names the input size the firmware was built for
+    side = side_of(info_input_size(query_info(ser)))
+    if side * side != INPUT_SIZE:
+        print(f"Firmware takes {side}x{side} images")
+
+    cache = fp = None
+    if CACHE_PATH:
+        cache = PredictionCache(CACHE_PATH)
+        fp = FIRMWARES["sw"].fingerprint(ser)
+
     for img_path in images:
         if not img_path.exists():
             print(f"{img_path.name} not found. Skipping.")
             continue
 
         try:
-            send_image(ser, img_path)
+            send_image(ser, img_path, cache, fp, side)
         except Exception as e:
             print(f"Error testing {img_path.name}: {e}")
 
+    if cache is not None:
+        cache.close()
+        print(cache.stats())
     ser.close()
     print("\nAll tests complete.")
 
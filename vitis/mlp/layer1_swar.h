@@ -0,0 +1,105 @@
+/**
+ * @file layer1_swar.h
+ * @brief SWAR layer-1 kernel: two hidden units per 32-bit multiply
+ *
+ * The int8 weights of hidden units 2p and 2p+1 are packed into one word
+ * W = w[2p][i] + 65536 * w[2p+1][i], so W * x[i] carries both products in
+ * 16-bit lanes and a single mul does two MACs. Full-range int8 x uint8
+ * products overflow a lane within two pixels, so each pair has its own
+ * chunk schedule, derived from its weights: inside a chunk,
+ * 255 * (sum of positive weights) <= 32767 and
+ * 255 * (sum of negative weights) >= -32768 in both lanes. That bounds the
+ * lane sums for any uint8 image. At the end of a chunk the lanes are split
+ * and added to 32-bit accumulators, so the result is bit-exact with the
+ * scalar loop.
+ *
+ * Plain C with no Xilinx headers, so the kernel also builds on the host
+ * (training/swar_pack.py --check). The packed table and schedule are in
+ * weights_w1p.h, generated by training/swar_pack.py.
+ *
+ * Relies on the usual two's complement behaviour of GCC: the int16_t
+ * cast wraps and >> on a negative int32_t is arithmetic.
+ */
+#ifndef LAYER1_SWAR_H
+#define LAYER1_SWAR_H
+
+#include <stdint.h>
+
+#define SWAR_X_MAX 255
+#define SWAR_LANE_MAX 32767
+#define SWAR_LANE_MIN (-32768)
+
+/**
+ * @brief accum[2p], accum[2p+1] = W1 * input for every pair p (no bias)
+ *
+ * @param w1p Packed weights, n_pairs rows of n_in words
+ * @param chunk_end Exclusive end index of each chunk, all pairs back to back
+ * @param chunk_first Index of the first chunk of pair p, n_pairs + 1 entries
+ */
+static inline void layer1_swar(const uint32_t* w1p, const uint16_t* chunk_end,
+                               const uint16_t* chunk_first, const uint8_t* input,
+                               int n_in, int n_pairs, int32_t* accum) {
+    for (int p = 0; p < n_pairs; p++) {
+        const uint32_t* wp = w1p + p * n_in;
+        int32_t acc_lo = 0;
+        int32_t acc_hi = 0;
+        int i = 0;
+
+        for (int c = chunk_first[p]; c < chunk_first[p + 1]; c++) {
+            uint32_t acc = 0;
+            for (int end = chunk_end[c]; i < end; i++) {
+                acc += wp[i] * input[i];
+            }
+            // Low lane is the sign-extended bottom half; removing it leaves
+            // the high lane (plus the low lane's borrow) in the top half
+            int32_t lo = (int16_t)(acc & 0xFFFFu);
+            acc_lo += lo;
+            acc_hi += (int32_t)(acc - (uint32_t)lo) >> 16;
+        }
+        accum[2 * p] = acc_lo;
+        accum[2 * p + 1] = acc_hi;
+    }
+}
+
+/**
+ * @brief Pack the weight rows of one hidden pair and write its chunk ends
+ *
+ * Same greedy rule as chunk_schedule() in swar_pack.py. dst may overlap lo
+ * as long as it does not run ahead of it: word i is written after weights
+ * i of both rows are read.
+ *
+ * @return Number of chunk ends written, or -1 if more than max_chunks are needed
+ */
+static inline int swar_pack_pair(uint32_t* dst, const int8_t* lo, const int8_t* hi, int n_in,
+                                 uint16_t* chunk_end, int max_chunks) {
+    int32_t pos_lo = 0, neg_lo = 0, pos_hi = 0, neg_hi = 0;
+    int n = 0;
+
+    for (int i = 0; i < n_in; i++) {
+        int32_t a = lo[i];
+        int32_t b = hi[i];
+        int32_t pa = (a > 0) ? a : 0, na = (a < 0) ? a : 0;
+        int32_t pb = (b > 0) ? b : 0, nb = (b < 0) ? b : 0;
+
+        if ((pos_lo + pa) * SWAR_X_MAX > SWAR_LANE_MAX || (neg_lo + na) * SWAR_X_MAX < SWAR_LANE_MIN ||
+            (pos_hi + pb) * SWAR_X_MAX > SWAR_LANE_MAX || (neg_hi + nb) * SWAR_X_MAX < SWAR_LANE_MIN) {
+            if (n == max_chunks) {
+                return -1;
+            }
+            chunk_end[n++] = (uint16_t)i;
+            pos_lo = neg_lo = pos_hi = neg_hi = 0;
+        }
+        pos_lo += pa;
+        neg_lo += na;
+        pos_hi += pb;
+        neg_hi += nb;
+        dst[i] = (uint32_t)a + ((uint32_t)b << 16);
+    }
+    if (n == max_chunks) {
+        return -1;
+    }
+    chunk_end[n++] = (uint16_t)n_in;
+    return n;
+}
+
+#endif // LAYER1_SWAR_H
@@ -7,7 +7,8 @@
  * Communication via UART using AXI4-Lite interface.
  *
  * Network Architecture:
- * - Input: 784 (28x28 MNIST image)
+ * - Input: 784 (28x28 MNIST image), or 196 / 49 for the reduced-resolution
+ *   models (weights_rq.h sets INPUT_SIDE; the host block-averages the image)
  * - Hidden Layer: 32 neurons with ReLU
  * - Output: 10 classes (digits 0-9)
  *
@@ -17,37 +18,247 @@
 #include <stdio.h>
 #include <stdint.h>
 #include <string.h>
+
+// Kernels-only build for the host: the weights and the inference functions
+// (layer1_forward, layer2_forward, argmax, mlp_inference), without the
+// UART, menu and main. training/host_kernels.py builds it as a shared
+// library to benchmark the kernel variants and check them against int_model
+#ifndef MLP_HOST_KERNELS
+#define MLP_HOST_KERNELS 0
+#endif
+
+#if !MLP_HOST_KERNELS
 #include "xil_printf.h"
 #include "xparameters.h"
 #include "xuartlite.h"
+#include "xuartlite_l.h"
+#include "xil_exception.h"
 #include "xil_types.h"
+#endif
 
 // Include the quantized weight headers
 #include "weights_w1.h"
 #include "weights_b1.h"
 #include "weights_w2.h"
 #include "weights_b2.h"
+#include "weights_rq.h"  // QUANT_PER_CHANNEL and requantization multipliers
+
+// Layer 1 on the SWAR kernel of layer1_swar.h: two hidden units per multiply,
+// bit-exact with the scalar loop (training/swar_pack.py --check). Needs the
+// packed table and schedule of weights_w1p.h, about 34 KB more local memory
+// than the scalar build, so it is opt-in
+#ifndef LAYER1_SWAR
+#define LAYER1_SWAR 0
+#endif
+#if LAYER1_SWAR
+#include "layer1_swar.h"
+#include "weights_w1p.h"  // w1p, w1p_chunk_end, w1p_chunk_first
+#endif
 
 // Network configuration
-#define INPUT_SIZE 784
+#ifndef INPUT_SIDE
+#define INPUT_SIDE 28  // weights_rq.h overrides it for 14x14 / 7x7 models
+#endif
+#define INPUT_SIZE (INPUT_SIDE * INPUT_SIDE)
 #define HIDDEN_SIZE 32
 #define OUTPUT_SIZE 10
 
-// Quantization parameters (from export_weights_int8.py)
-#define SHIFT_BITS 8  // Right shift after layer 1 for scaling
+// Quantization parameters (from export_weights_int8.py / calibrate.py)
+#ifndef SHIFT_BITS
+#define SHIFT_BITS 8  // Right shift after layer 1 for scaling (per-tensor scheme)
+#endif
+
+// Straight-line layer 2 (and optionally the first L1U_COUNT layer-1 units)
+// with the compiled-in weights folded in as constants, generated by
+// training/unroll_gen.py. Used only while act_crc == 0; uploaded weights
+// still run the loops below. Regenerate the header with the weights
+#ifndef WEIGHTS_UNROLLED
+#define WEIGHTS_UNROLLED 0
+#endif
+#if WEIGHTS_UNROLLED
+#include "weights_unrolled.h"  // layer2_unrolled, layer1_unrolled, L1U_COUNT
+#if UNROLLED_PER_CHANNEL != QUANT_PER_CHANNEL
+#error "weights_unrolled.h was generated for the other quantization scheme"
+#endif
+#if !QUANT_PER_CHANNEL && UNROLLED_SHIFT_BITS != SHIFT_BITS
+#error "weights_unrolled.h was generated for a different SHIFT_BITS"
+#endif
+#if LAYER1_SWAR && L1U_COUNT
+#error "unrolled layer-1 units need the scalar layer 1 (LAYER1_SWAR 0)"
+#endif
+#endif
+
+// Two-stage cascade: an INPUT_SIZE->8->10 net from weights_cascade.h runs first and
+// answers alone when its top-1 logit leads by CASCADE_MARGIN, otherwise the
+// full network runs (training/cascade.py trains, sweeps and writes it).
+// Only with the compiled-in weights; benchmark '5' still times the full net
+#ifndef CASCADE
+#define CASCADE 0
+#endif
+#if CASCADE
+#include "weights_cascade.h"  // s1_w1, s1_b1, s1_w2, s1_b2, CASCADE_MARGIN
+#endif
+
+#if QUANT_PER_CHANNEL
+typedef int8_t hidden_t;   // Requantized activations, 0..127
+#else
+typedef int32_t hidden_t;  // Raw ReLU outputs, downshifted inside layer 2
+#endif
+
+// Benchmark configuration
+#define BENCH_DEFAULT_ITERATIONS 32  // Used when the host sends K = 0
 
 // UART configuration
 #define UART_DEVICE_ID XPAR_UARTLITE_0_DEVICE_ID
 #define UART_BAUDRATE 9600  // Changed to 9600 for better compatibility
+#define RX_FIRST_TIMEOUT_MS 30000  // Wait for the first pixel after READY
+#define RX_IDLE_TIMEOUT_MS 200     // Abort a partial image after this long without a byte
+#define UART_RX_RING_SIZE 2048     // Power of two; holds two pipelined '8' requests
+#define DELTA_ENTRY_SIZE 3         // 'D' request entry: u16 pixel index, u8 new value
+#define SWEEP_BASE_IMAGE 0x01      // 'P' flags: sweep over input_image instead of zeros
+#define SWEEP_LOGITS 0x02          // 'P' flags: also send every pixel's logits
+#define UART_IRQ_PROBE_MS 100      // No TX-done interrupt within this = interrupt not wired
+
+// UART chatter (command '9'). xil_printf shares the UART with the protocol
+// lines: at 9600 baud every byte of debug output costs the host ~1 ms
+#define VERBOSITY_QUIET 0   // Protocol lines only: READY, PRED:, INFO:, ERROR...
+#define VERBOSITY_NORMAL 1  // Plus command echo, prompts, banners and the menu text
+#define VERBOSITY_DEBUG 2   // Plus per-image lines: progress, prediction, logits
+#ifndef VERBOSITY_DEFAULT
+#define VERBOSITY_DEFAULT VERBOSITY_DEBUG  // Power-up level, the full output as before
+#endif
+
+// xil_printf() when the runtime verbosity is at least level
+#define LOG_PRINTF(level, ...) \
+    do { if (verbosity >= (level)) xil_printf(__VA_ARGS__); } while (0)
+
+// Runtime weight upload (command '6', blob layout in training/weights_blob.py)
+#define WBLOB_MAGIC 0x57504C4Du  // "MLPW", little-endian
+#define WBLOB_VERSION 1
+#define WBLOB_FLAG_PER_CHANNEL 0x01
+#define WBLOB_HEADER_SIZE 16
 
 // Global variables
+#if !MLP_HOST_KERNELS
 XUartLite UartLite;
+#endif
 uint8_t input_image[INPUT_SIZE];
-int32_t hidden_layer[HIDDEN_SIZE];
+hidden_t hidden_layer[HIDDEN_SIZE];
 int32_t output_layer[OUTPUT_SIZE];
 
+#if !MLP_HOST_KERNELS
+// RAM copy of uploaded weights
+#if LAYER1_SWAR
+// The SWAR build has no separate w1 copy: uploaded rows are received into
+// the top half of w1p (the last pair into w1p_spill) and packed in place
+static int8_t w1p_spill[2][INPUT_SIZE];
+static int w1p_dirty = 0;  // w1p no longer holds the compiled-in weights
+#else
+static int8_t ram_w1[HIDDEN_SIZE][INPUT_SIZE];
+#endif
+static int32_t ram_b1[HIDDEN_SIZE];
+static int8_t ram_w2[OUTPUT_SIZE][HIDDEN_SIZE];
+static int32_t ram_b2[OUTPUT_SIZE];
+#if QUANT_PER_CHANNEL
+static int32_t ram_rq1_mult[HIDDEN_SIZE];
+static uint8_t ram_rq1_shift[HIDDEN_SIZE];
+static int32_t ram_rq2_mult[OUTPUT_SIZE];
+static uint8_t ram_rq2_shift[OUTPUT_SIZE];
+#endif
+#endif
+
+// Weights inference runs on: the compiled-in tables or the uploaded copy
+#if !LAYER1_SWAR
+static const int8_t (*act_w1)[INPUT_SIZE] = w1;
+#endif
+static const int32_t* act_b1 = b1;
+static const int8_t (*act_w2)[HIDDEN_SIZE] = w2;
+static const int32_t* act_b2 = b2;
+#if QUANT_PER_CHANNEL
+static const int32_t* act_rq1_mult = rq1_mult;
+static const uint8_t* act_rq1_shift = rq1_shift;
+static const int32_t* act_rq2_mult = rq2_mult;
+static const uint8_t* act_rq2_shift = rq2_shift;
+#else
+static uint8_t act_shift = SHIFT_BITS;
+#endif
+static uint32_t act_crc = 0;  // CRC32 of the uploaded blob, 0 = compiled-in
+#if CASCADE
+static uint32_t cascade_exits = 0;  // Inferences stage 1 answered alone
+#endif
+
+#if !MLP_HOST_KERNELS
+static uint8_t verbosity = VERBOSITY_DEFAULT;
+
+// RX ring filled from the UART interrupt, so bytes keep arriving while
+// inference runs. Indices run freely: only the interrupt advances rx_head
+// and only the main loop advances rx_tail, so neither side masks interrupts
+static volatile uint8_t rx_ring[UART_RX_RING_SIZE];
+static volatile uint32_t rx_head = 0;
+static volatile uint32_t rx_tail = 0;
+static volatile uint32_t rx_overruns = 0;  // Bytes dropped with the ring full
+static volatile int tx_busy = 0;
+static int uart_irq = 0;  // 1 = interrupt-driven, 0 = polled (interrupt not wired)
+
+// Incremental layer 1 (command 'D'): W1 * input_image without bias. Valid
+// while input_image has only changed through deltas since it was computed;
+// every other command that writes the image or the weights clears it
+static int32_t l1_dot[HIDDEN_SIZE];
+static int l1_dot_valid = 0;
+static uint8_t delta_buf[INPUT_SIZE * DELTA_ENTRY_SIZE];
+
+/**
+ * @brief Move everything in the RX FIFO into the ring
+ *
+ * The driver's receive callback (XUartLite_InterruptHandler, no receive
+ * buffer armed), and called directly in polled mode. The interrupt fires
+ * on the FIFO becoming non-empty, so it has to be left empty.
+ */
+static void uart_rx_drain(void* CallBackRef, unsigned int EventData) {
+    XUartLite* uart = (XUartLite*)CallBackRef;
+    (void)EventData;
+
+    while (!XUartLite_IsReceiveEmpty(uart->RegBaseAddress)) {
+        uint8_t byte = (uint8_t)XUartLite_ReadReg(uart->RegBaseAddress, XUL_RX_FIFO_OFFSET);
+        if (rx_head - rx_tail < UART_RX_RING_SIZE) {
+            rx_ring[rx_head & (UART_RX_RING_SIZE - 1)] = byte;
+            rx_head++;
+        } else {
+            rx_overruns++;
+        }
+    }
+}
+
+/**
+ * @brief Driver send callback: the interrupt finished an XUartLite_Send()
+ */
+static void uart_tx_done(void* CallBackRef, unsigned int EventData) {
+    (void)CallBackRef;
+    (void)EventData;
+    tx_busy = 0;
+}
+
+/**
+ * @brief Take up to max_bytes from the RX ring
+ * @return Number of bytes copied
+ */
+static unsigned int uart_ring_read(uint8_t* buffer, unsigned int max_bytes) {
+    unsigned int n = 0;
+
+    while (n < max_bytes && rx_tail != rx_head) {
+        buffer[n++] = rx_ring[rx_tail & (UART_RX_RING_SIZE - 1)];
+        rx_tail++;
+    }
+    return n;
+}
+
 /**
  * @brief Initialize UART peripheral
+ *
+ * RX and TX run from the driver's interrupt handler (xuartlite_intr.c),
+ * with the UART interrupt wired straight to the CPU (hw/bd/design_1.tcl).
+ * Bitstreams without that wire never deliver the TX-done interrupt of the
+ * probe below; the firmware then polls the FIFO into the same ring.
  */
 int uart_init(void) {
     int Status;
@@ -58,32 +269,69 @@ int uart_init(void) {
         return XST_FAILURE;
     }
 
-    xil_printf("UART initialized successfully at 9600 baud\r\n");
+    XUartLite_SetRecvHandler(&UartLite, uart_rx_drain, &UartLite);
+    XUartLite_SetSendHandler(&UartLite, uart_tx_done, &UartLite);
+    Xil_ExceptionInit();
+    Xil_ExceptionRegisterHandler(XIL_EXCEPTION_ID_INT,
+                                 (Xil_ExceptionHandler)XUartLite_InterruptHandler, &UartLite);
+    XUartLite_EnableInterrupt(&UartLite);
+    Xil_ExceptionEnable();
+
+    tx_busy = 1;
+    XUartLite_Send(&UartLite, (u8*)"\r\n", 2);
+    for (unsigned int t = 0; tx_busy && t < UART_IRQ_PROBE_MS * 10; t++) {
+        for (volatile int i = 0; i < 1000; i++);
+    }
+    uart_irq = !tx_busy;
+    if (!uart_irq) {
+        XUartLite_DisableInterrupt(&UartLite);
+        Xil_ExceptionDisable();
+        tx_busy = 0;
+    }
+
+    LOG_PRINTF(VERBOSITY_NORMAL, "UART initialized successfully at 9600 baud (%s)\r\n",
+               uart_irq ? "interrupt RX ring" : "polled, UART interrupt not connected");
     return XST_SUCCESS;
 }
 
 /**
- * @brief Send string via UART
+ * @brief Send bytes via UART, returns once they are in the TX FIFO
  */
-void uart_send_string(const char* str) {
-    unsigned int len = strlen(str);
-    unsigned int sent = 0;
+static void uart_send_bytes(const uint8_t* data, unsigned int len) {
+    if (uart_irq) {
+        // The interrupt refills the FIFO from data; wait, callers pass stack buffers
+        if (len == 0) {
+            return;
+        }
+        tx_busy = 1;
+        XUartLite_Send(&UartLite, (u8*)data, len);
+        while (tx_busy) {}
+        return;
+    }
 
+    unsigned int sent = 0;
     while (sent < len) {
-        unsigned int count = XUartLite_Send(&UartLite, (u8*)(str + sent), len - sent);
+        unsigned int count = XUartLite_Send(&UartLite, (u8*)(data + sent), len - sent);
         sent += count;
     }
 }
 
+/**
+ * @brief Send string via UART
+ */
+void uart_send_string(const char* str) {
+    uart_send_bytes((const uint8_t*)str, strlen(str));
+}
+
 /**
  * @brief Send a single character via UART
  */
 void uart_send_char(char c) {
-    XUartLite_Send(&UartLite, (u8*)&c, 1);
+    uart_send_bytes((const uint8_t*)&c, 1);
 }
 
 /**
- * @brief Receive bytes via UART with timeout
+ * @brief Receive bytes from the RX ring with timeout
  * @return Number of bytes received
  */
 int uart_receive_bytes(uint8_t* buffer, unsigned int num_bytes, unsigned int timeout_ms) {
@@ -92,7 +340,10 @@ int uart_receive_bytes(uint8_t* buffer, unsigned int num_bytes, unsigned int tim
     const unsigned int delay_loops = 1000;
 
     while (received < num_bytes && timeout_counter < (timeout_ms * 10)) {
-        unsigned int count = XUartLite_Recv(&UartLite, buffer + received, num_bytes - received);
+        if (!uart_irq) {
+            uart_rx_drain(&UartLite, 0);
+        }
+        unsigned int count = uart_ring_read(buffer + received, num_bytes - received);
         if (count > 0) {
             received += count;
             timeout_counter = 0;  // Reset timeout on successful receive
@@ -105,6 +356,7 @@ int uart_receive_bytes(uint8_t* buffer, unsigned int num_bytes, unsigned int tim
 
     return received;
 }
+#endif
 
 /**
  * @brief Apply ReLU activation: max(0, x)
@@ -114,36 +366,143 @@ static inline int32_t relu(int32_t x) {
 }
 
 /**
- * @brief Perform matrix-vector multiplication for layer 1
+ * @brief Layer-1 dot products: accum = W1 * input, without bias
+ */
+static void layer1_accumulate(const uint8_t* input, int32_t* accum) {
+#if LAYER1_SWAR
+    layer1_swar(&w1p[0][0], w1p_chunk_end, w1p_chunk_first, input,
+                INPUT_SIZE, HIDDEN_SIZE / 2, accum);
+#else
+    int h = 0;
+#if WEIGHTS_UNROLLED && L1U_COUNT
+    if (act_crc == 0) {
+        layer1_unrolled(input, accum);
+        h = L1U_COUNT;
+    }
+#endif
+    for (; h < HIDDEN_SIZE; h++) {
+        int32_t acc = 0;
+
+        // Matrix multiply: sum over all input features
+        for (int i = 0; i < INPUT_SIZE; i++) {
+            acc += (int32_t)act_w1[h][i] * (int32_t)input[i];
+        }
+        accum[h] = acc;
+    }
+#endif
+}
+
+#if QUANT_PER_CHANNEL
+/**
+ * @brief Fixed-point requantization: round(acc * mult / 2^shift)
  *
- * Computes: hidden = ReLU(W1 * input + b1)
- * Input is uint8 (0-255), converted to centered int8 range
+ * One 32x32->64 multiply and a shift, exported per channel by
+ * export_weights_int8.py (mult in [2^30, 2^31), shift >= 1).
  */
-void layer1_forward(const uint8_t* input, int32_t* output) {
-    // Process each hidden neuron
+static inline int32_t requantize(int32_t acc, int32_t mult, uint8_t shift) {
+    int64_t prod = (int64_t)acc * (int64_t)mult;
+    return (int32_t)((prod + ((int64_t)1 << (shift - 1))) >> shift);
+}
+
+/**
+ * @brief Layer-1 activations from the dot products W1 * input
+ *
+ * Computes: hidden = clamp(requantize(dot + b1), 0, 127)
+ * ReLU is folded into the clamp
+ */
+static void layer1_activate(const int32_t* dot, hidden_t* output) {
     for (int h = 0; h < HIDDEN_SIZE; h++) {
+        // Add bias (scaled by the per-channel weight scale and 255)
+        int32_t accum = dot[h] + act_b1[h];
+
+        // Once per hidden unit: rescale to an int8 activation
+        int32_t act = requantize(accum, act_rq1_mult[h], act_rq1_shift[h]);
+        output[h] = (hidden_t)((act < 0) ? 0 : ((act > 127) ? 127 : act));
+    }
+}
+
+/**
+ * @brief Perform matrix-vector multiplication for layer 1
+ *
+ * Computes: hidden = clamp(requantize(W1 * input + b1), 0, 127)
+ * Input is uint8 (0-255)
+ */
+void layer1_forward(const uint8_t* input, hidden_t* output) {
+    int32_t dot[HIDDEN_SIZE];
+
+    layer1_accumulate(input, dot);
+    layer1_activate(dot, output);
+}
+
+/**
+ * @brief Perform matrix-vector multiplication for layer 2
+ *
+ * Computes: output = requantize(W2 * hidden + b2)
+ * Pure int8 x int8 MAC loop; the per-output requantize brings every
+ * logit to the common scale 2^LOGIT_FRAC_BITS so argmax can compare them
+ */
+void layer2_forward(const hidden_t* hidden, int32_t* output) {
+#if WEIGHTS_UNROLLED
+    if (act_crc == 0) {
+        layer2_unrolled(hidden, output);
+        return;
+    }
+#endif
+    for (int o = 0; o < OUTPUT_SIZE; o++) {
         int32_t accum = 0;
 
-        // Matrix multiply: sum over all input features
-        for (int i = 0; i < INPUT_SIZE; i++) {
-            // Direct multiplication - scaling happens in layer 2
-            accum += (int32_t)w1[h][i] * (int32_t)input[i];
+        for (int h = 0; h < HIDDEN_SIZE; h++) {
+            accum += (int32_t)act_w2[o][h] * (int32_t)hidden[h];
         }
 
+        accum += act_b2[o];
+
+        output[o] = requantize(accum, act_rq2_mult[o], act_rq2_shift[o]);
+    }
+}
+#else
+/**
+ * @brief Layer-1 activations from the dot products W1 * input
+ *
+ * Computes: hidden = ReLU(dot + b1)
+ */
+static void layer1_activate(const int32_t* dot, hidden_t* output) {
+    // Process each hidden neuron
+    for (int h = 0; h < HIDDEN_SIZE; h++) {
         // Add bias (already scaled during quantization)
-        accum += b1[h];
+        int32_t accum = dot[h] + act_b1[h];
 
         // Apply ReLU activation
         output[h] = relu(accum);
     }
 }
+
+/**
+ * @brief Perform matrix-vector multiplication for layer 1
+ *
+ * Computes: hidden = ReLU(W1 * input + b1)
+ * Input is uint8 (0-255), converted to centered int8 range
+ */
+void layer1_forward(const uint8_t* input, hidden_t* output) {
+    int32_t dot[HIDDEN_SIZE];
+
+    // Matrix multiply - scaling happens in layer 2
+    layer1_accumulate(input, dot);
+    layer1_activate(dot, output);
+}
 /**
  * @brief Perform matrix-vector multiplication for layer 2
  *
  * Computes: output = W2 * hidden + b2
  * Hidden layer values are downshifted before multiplication
  */
-void layer2_forward(const int32_t* hidden, int32_t* output) {
+void layer2_forward(const hidden_t* hidden, int32_t* output) {
+#if WEIGHTS_UNROLLED
+    if (act_crc == 0) {
+        layer2_unrolled(hidden, output);
+        return;
+    }
+#endif
     // Process each output neuron
     for (int o = 0; o < OUTPUT_SIZE; o++) {
         int32_t accum = 0;
@@ -151,17 +510,19 @@ void layer2_forward(const int32_t* hidden, int32_t* output) {
         // Matrix multiply with downshifted hidden values
         for (int h = 0; h < HIDDEN_SIZE; h++) {
             // Downshift hidden layer to prevent overflow
-            // Divide by 256 (SHIFT_BITS = 8 means divide by 2^8 = 256)
-            int32_t hidden_scaled = hidden[h] / 256;
-            accum += (int32_t)w2[o][h] * hidden_scaled;
+            // hidden >= 0 after ReLU, so >> act_shift (SHIFT_BITS = 8 unless
+            // an uploaded blob says otherwise) equals the division by 2^shift
+            int32_t hidden_scaled = hidden[h] >> act_shift;
+            accum += (int32_t)act_w2[o][h] * hidden_scaled;
         }
 
         // Add bias (already scaled during quantization)
-        accum += b2[o];
+        accum += act_b2[o];
 
         output[o] = accum;
     }
 }
+#endif
 
 /**
  * @brief Find the index of maximum value (argmax)
@@ -180,11 +541,62 @@ int argmax(const int32_t* array, int length) {
     return max_idx;
 }
 
+#if CASCADE
+/**
+ * @brief Cascade stage 1: the per-tensor INPUT_SIZE->CASCADE_HIDDEN->10 net
+ * @return Its prediction if the top-1 logit leads the runner-up by at
+ *         least CASCADE_MARGIN (logits left in output_layer), else -1
+ */
+static int cascade_stage1(const uint8_t* input) {
+    int32_t hidden[CASCADE_HIDDEN];
+    int32_t logits[OUTPUT_SIZE];
+
+    for (int h = 0; h < CASCADE_HIDDEN; h++) {
+        int32_t acc = 0;
+        for (int i = 0; i < INPUT_SIZE; i++) {
+            acc += (int32_t)s1_w1[h][i] * (int32_t)input[i];
+        }
+        hidden[h] = relu(acc + s1_b1[h]) >> CASCADE_SHIFT_BITS;
+    }
+    for (int o = 0; o < OUTPUT_SIZE; o++) {
+        int32_t acc = 0;
+        for (int h = 0; h < CASCADE_HIDDEN; h++) {
+            acc += (int32_t)s1_w2[o][h] * hidden[h];
+        }
+        logits[o] = acc + s1_b2[o];
+    }
+
+    int best = argmax(logits, OUTPUT_SIZE);
+    int32_t second = INT32_MIN;
+    for (int o = 0; o < OUTPUT_SIZE; o++) {
+        if (o != best && logits[o] > second) {
+            second = logits[o];
+        }
+    }
+    if ((int64_t)logits[best] - second < CASCADE_MARGIN) {
+        return -1;
+    }
+    memcpy(output_layer, logits, sizeof(logits));
+    return best;
+}
+#endif
+
 /**
  * @brief Perform complete MLP inference
  * @return Predicted digit (0-9)
  */
 int mlp_inference(const uint8_t* input_image) {
+#if CASCADE
+    if (act_crc == 0) {  // stage 1 was chosen against the compiled-in network
+        int early = cascade_stage1(input_image);
+        if (early >= 0) {
+            cascade_exits++;
+            // No full-net activations for this image; never leave the last one's
+            memset(hidden_layer, 0, sizeof(hidden_layer));
+            return early;
+        }
+    }
+#endif
     // Forward pass through layer 1
     layer1_forward(input_image, hidden_layer);
 
@@ -197,6 +609,28 @@ int mlp_inference(const uint8_t* input_image) {
     return prediction;
 }
 
+#if MLP_HOST_KERNELS
+/**
+ * @brief Run mlp_inference() on n images (host library only)
+ * @param images n x INPUT_SIZE pixels
+ * @param preds n predictions
+ * @param logits n x OUTPUT_SIZE logits, or NULL
+ * @param hidden n x HIDDEN_SIZE hidden activations (zeros where CASCADE stage 1
+ *               answered), or NULL
+ */
+void mlp_inference_batch(const uint8_t* images, int n, int32_t* preds,
+                         int32_t* logits, hidden_t* hidden) {
+    for (int k = 0; k < n; k++) {
+        preds[k] = mlp_inference(images + (size_t)k * INPUT_SIZE);
+        if (logits) {
+            memcpy(logits + (size_t)k * OUTPUT_SIZE, output_layer, sizeof(output_layer));
+        }
+        if (hidden) {
+            memcpy(hidden + (size_t)k * HIDDEN_SIZE, hidden_layer, sizeof(hidden_layer));
+        }
+    }
+}
+#else
 /**
  * @brief Print the output logits for debugging
  */
@@ -217,59 +651,297 @@ void print_logits(void) {
 void process_inference(void) {
     char result_buffer[64];
 
-    xil_printf("\r\n=== Inference Start ===\r\n");
+    LOG_PRINTF(VERBOSITY_DEBUG, "\r\n=== Inference Start ===\r\n");
 
     // Run inference
     int prediction = mlp_inference(input_image);
 
     // Print results locally
-    xil_printf("Prediction: %d\r\n", prediction);
-    print_logits();
+    LOG_PRINTF(VERBOSITY_DEBUG, "Prediction: %d\r\n", prediction);
+    if (verbosity >= VERBOSITY_DEBUG) {
+        print_logits();
+    }
 
     // Send result via UART in simple format
     sprintf(result_buffer, "PRED:%d\r\n", prediction);
     uart_send_string(result_buffer);
 
-    xil_printf("=== Inference Complete ===\r\n");
+    LOG_PRINTF(VERBOSITY_DEBUG, "=== Inference Complete ===\r\n");
 }
 
 /**
  * @brief Wait for and receive MNIST image via UART
  *
  * Protocol:
- * - Expects 784 bytes of grayscale pixel data (28x28 image)
+ * - Expects INPUT_SIZE bytes of grayscale pixel data (INPUT_SIDE x INPUT_SIDE image)
  * - Values should be in range 0-255
  */
 int receive_image(void) {
     char msg[128];
 
-    xil_printf("Ready to receive image (784 bytes)...\r\n");
+    LOG_PRINTF(VERBOSITY_DEBUG, "Ready to receive image (%d bytes)...\r\n", INPUT_SIZE);
+    l1_dot_valid = 0;
 
     // Send READY signal
     uart_send_string("READY\r\n");
 
-    // Receive image data with 30 second timeout (slower at 9600 baud)
-    int received = uart_receive_bytes(input_image, INPUT_SIZE, 30000);
+    // Generous wait for the first pixel (slower at 9600 baud), then a short
+    // idle timeout: it restarts on every byte and the host paces 32-byte
+    // chunks every ~50 ms, so 200 ms of silence mid-image means a lost byte
+    // or a host that gave up, and the partial image is dropped
+    int received = uart_receive_bytes(input_image, 1, RX_FIRST_TIMEOUT_MS);
+    if (received == 1) {
+        received += uart_receive_bytes(input_image + 1, INPUT_SIZE - 1, RX_IDLE_TIMEOUT_MS);
+    }
 
     if (received == INPUT_SIZE) {
-        xil_printf("Received complete image (%d bytes)\r\n", received);
+        LOG_PRINTF(VERBOSITY_DEBUG, "Received complete image (%d bytes)\r\n", received);
         return XST_SUCCESS;
     } else {
         sprintf(msg, "ERROR: Received only %d of %d bytes\r\n", received, INPUT_SIZE);
-        xil_printf("%s", msg);
+        LOG_PRINTF(VERBOSITY_NORMAL, "%s", msg);
         uart_send_string(msg);
         return XST_FAILURE;
     }
 }
 
+/**
+ * @brief CRC-32 (IEEE 802.3, same as zlib.crc32), chainable over buffers
+ */
+static uint32_t crc32_update(uint32_t crc, const uint8_t* data, uint32_t len) {
+    crc = ~crc;
+    while (len--) {
+        crc ^= *data++;
+        for (int k = 0; k < 8; k++) {
+            crc = (crc >> 1) ^ (0xEDB88320u & (0u - (crc & 1u)));
+        }
+    }
+    return ~crc;
+}
+
+/**
+ * @brief Discard incoming bytes until the line goes idle
+ */
+static void uart_drain(void) {
+    uint8_t scratch[16];
+    while (uart_receive_bytes(scratch, sizeof(scratch), RX_IDLE_TIMEOUT_MS) == sizeof(scratch)) {}
+}
+
+#if LAYER1_SWAR
+/**
+ * @brief Pack int8 w1 rows into w1p and rebuild the chunk schedule
+ *
+ * rows holds hidden units 0..HIDDEN_SIZE-3 back to back and last_pair the
+ * final two, so rows may be the top half of w1p itself: packing runs
+ * forward and word i of a pair is written after weight i of both rows is
+ * read, which stays behind the unread rows for every pair but the last
+ * @return XST_SUCCESS, or XST_FAILURE if more than W1P_MAX_CHUNKS chunks are needed
+ */
+static int w1p_pack(const int8_t* rows, const int8_t* last_pair) {
+    int n_chunks = 0;
+    for (int p = 0; p < HIDDEN_SIZE / 2; p++) {
+        const int8_t* lo = (p < HIDDEN_SIZE / 2 - 1) ? rows + 2 * p * INPUT_SIZE : last_pair;
+        int n = swar_pack_pair(w1p[p], lo, lo + INPUT_SIZE, INPUT_SIZE,
+                               w1p_chunk_end + n_chunks, W1P_MAX_CHUNKS - n_chunks);
+        if (n < 0) {
+            return XST_FAILURE;
+        }
+        w1p_chunk_first[p] = (uint16_t)n_chunks;
+        n_chunks += n;
+    }
+    w1p_chunk_first[HIDDEN_SIZE / 2] = (uint16_t)n_chunks;
+    return XST_SUCCESS;
+}
+#endif
+
+/**
+ * @brief Receive an image followed by its CRC32 (command '8')
+ *
+ * The framed form of '1' for pipelining hosts: no READY, so the host can
+ * send the next request while this one is classified. A lost byte shifts
+ * the frame and fails the CRC; the rest of the stream is then discarded
+ * until the line goes idle, so pixels are never taken as commands.
+ */
+int receive_image_framed(void) {
+    uint8_t crc_bytes[4];
+    char msg[32];
+
+    l1_dot_valid = 0;
+    int received = uart_receive_bytes(input_image, 1, RX_FIRST_TIMEOUT_MS);
+    if (received == 1) {
+        received += uart_receive_bytes(input_image + 1, INPUT_SIZE - 1, RX_IDLE_TIMEOUT_MS);
+    }
+    if (received != INPUT_SIZE || uart_receive_bytes(crc_bytes, 4, RX_IDLE_TIMEOUT_MS) != 4) {
+        sprintf(msg, "ERR:RX %d\r\n", received);
+        uart_send_string(msg);
+        return XST_FAILURE;
+    }
+
+    uint32_t crc_rx = crc_bytes[0] | (crc_bytes[1] << 8) | (crc_bytes[2] << 16) | ((uint32_t)crc_bytes[3] << 24);
+    if (crc32_update(0, input_image, INPUT_SIZE) != crc_rx) {
+        uart_drain();
+        uart_send_string("ERR:CRC\r\n");
+        return XST_FAILURE;
+    }
+    return XST_SUCCESS;
+}
+
+/**
+ * @brief Switch inference back to the compiled-in weight tables
+ */
+void use_builtin_weights(void) {
+#if LAYER1_SWAR
+    if (w1p_dirty) {
+        // Cannot fail: swar_pack.py checked the compiled-in schedule
+        w1p_pack(&w1[0][0], w1[HIDDEN_SIZE - 2]);
+        w1p_dirty = 0;
+    }
+#else
+    act_w1 = w1;
+#endif
+    act_b1 = b1;
+    act_w2 = w2;
+    act_b2 = b2;
+#if QUANT_PER_CHANNEL
+    act_rq1_mult = rq1_mult;
+    act_rq1_shift = rq1_shift;
+    act_rq2_mult = rq2_mult;
+    act_rq2_shift = rq2_shift;
+#else
+    act_shift = SHIFT_BITS;
+#endif
+    act_crc = 0;
+    l1_dot_valid = 0;
+}
+
+/**
+ * @brief Report a failed upload and go back to the compiled-in weights
+ */
+static int weights_failed(const char* msg) {
+    uart_send_string(msg);
+    use_builtin_weights();
+    return XST_FAILURE;
+}
+
+/**
+ * @brief Receive a weight blob into RAM and switch inference to it
+ *
+ * Protocol:
+ * - Replies READY, then expects the 16-byte header, the payload and a
+ *   CRC32 over header + payload (layout in training/weights_blob.py)
+ * - Shapes and scheme must match this build; the RAM copy is only
+ *   activated once the CRC checks out, the compiled-in weights are used
+ *   while it is being overwritten
+ * - SWAR build: w1 is received into w1p and packed once the CRC checks
+ *   out; any failure repacks the compiled-in w1
+ */
+int receive_weights(void) {
+    uint8_t header[WBLOB_HEADER_SIZE];
+    uint8_t crc_bytes[4];
+    char msg[64];
+    struct { void* dst; uint32_t len; } sections[] = {
+#if LAYER1_SWAR
+        { (uint8_t*)w1p + sizeof(w1p) - sizeof(w1), sizeof(w1) - sizeof(w1p_spill) },
+        { w1p_spill, sizeof(w1p_spill) },
+#else
+        { ram_w1, sizeof(ram_w1) },
+#endif
+        { ram_b1, sizeof(ram_b1) },
+        { ram_w2, sizeof(ram_w2) }, { ram_b2, sizeof(ram_b2) },
+#if QUANT_PER_CHANNEL
+        { ram_rq1_mult, sizeof(ram_rq1_mult) }, { ram_rq1_shift, sizeof(ram_rq1_shift) },
+        { ram_rq2_mult, sizeof(ram_rq2_mult) }, { ram_rq2_shift, sizeof(ram_rq2_shift) },
+#endif
+    };
+    const int n_sections = sizeof(sections) / sizeof(sections[0]);
+    uint32_t payload_len = 0;
+    for (int s = 0; s < n_sections; s++) {
+        payload_len += sections[s].len;
+    }
+
+    use_builtin_weights();
+    uart_send_string("READY\r\n");
+
+    if (uart_receive_bytes(header, 1, RX_FIRST_TIMEOUT_MS) != 1 ||
+        uart_receive_bytes(header + 1, WBLOB_HEADER_SIZE - 1, RX_IDLE_TIMEOUT_MS) != WBLOB_HEADER_SIZE - 1) {
+        uart_send_string("ERROR:WEIGHTS header\r\n");
+        return XST_FAILURE;
+    }
+
+    uint32_t magic = header[0] | (header[1] << 8) | (header[2] << 16) | ((uint32_t)header[3] << 24);
+    uint8_t flags = header[5];
+    uint8_t shift = header[6];
+    uint32_t n_in = header[8] | (header[9] << 8);
+    uint32_t blob_len = header[12] | (header[13] << 8) | (header[14] << 16) | ((uint32_t)header[15] << 24);
+    int per_channel = (flags & WBLOB_FLAG_PER_CHANNEL) != 0;
+
+    if (magic != WBLOB_MAGIC || header[4] != WBLOB_VERSION || n_in != INPUT_SIZE ||
+        header[10] != HIDDEN_SIZE || header[11] != OUTPUT_SIZE ||
+        per_channel != QUANT_PER_CHANNEL || blob_len != payload_len) {
+        uart_drain();
+        uart_send_string("ERROR:WEIGHTS format\r\n");
+        return XST_FAILURE;
+    }
+
+    // Receive everything first: computing the CRC between sections would
+    // let the 16-byte RX FIFO overflow while the host keeps streaming
+#if LAYER1_SWAR
+    w1p_dirty = 1;
+#endif
+    for (int s = 0; s < n_sections; s++) {
+        if ((uint32_t)uart_receive_bytes(sections[s].dst, sections[s].len, RX_IDLE_TIMEOUT_MS) != sections[s].len) {
+            return weights_failed("ERROR:WEIGHTS short\r\n");
+        }
+    }
+    if (uart_receive_bytes(crc_bytes, 4, RX_IDLE_TIMEOUT_MS) != 4) {
+        return weights_failed("ERROR:WEIGHTS short\r\n");
+    }
+
+    uint32_t crc = crc32_update(0, header, WBLOB_HEADER_SIZE);
+    for (int s = 0; s < n_sections; s++) {
+        crc = crc32_update(crc, (const uint8_t*)sections[s].dst, sections[s].len);
+    }
+    uint32_t crc_rx = crc_bytes[0] | (crc_bytes[1] << 8) | (crc_bytes[2] << 16) | ((uint32_t)crc_bytes[3] << 24);
+    if (crc != crc_rx) {
+        return weights_failed("ERROR:WEIGHTS crc\r\n");
+    }
+
+#if LAYER1_SWAR
+    if (w1p_pack((const int8_t*)sections[0].dst, w1p_spill[0]) != XST_SUCCESS) {
+        return weights_failed("ERROR:WEIGHTS range\r\n");
+    }
+#else
+    act_w1 = (const int8_t (*)[INPUT_SIZE])ram_w1;
+#endif
+    act_b1 = ram_b1;
+    act_w2 = (const int8_t (*)[HIDDEN_SIZE])ram_w2;
+    act_b2 = ram_b2;
+#if QUANT_PER_CHANNEL
+    act_rq1_mult = ram_rq1_mult;
+    act_rq1_shift = ram_rq1_shift;
+    act_rq2_mult = ram_rq2_mult;
+    act_rq2_shift = ram_rq2_shift;
+    (void)shift;
+#else
+    act_shift = shift;
+#endif
+    act_crc = crc ? crc : 1u;
+    l1_dot_valid = 0;
+
+    sprintf(msg, "WEIGHTS:OK,CRC=%08lx\r\n", (unsigned long)crc);
+    uart_send_string(msg);
+    return XST_SUCCESS;
+}
+
 /**
  * @brief Run self-test with a simple test pattern
  */
 void run_self_test(void) {
-    xil_printf("\r\n=== Self-Test Start ===\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "\r\n=== Self-Test Start ===\r\n");
 
     // Create a simple test pattern (all zeros)
     memset(input_image, 0, INPUT_SIZE);
+    l1_dot_valid = 0;
 
     // Add some non-zero values to test the network
     for (int i = 0; i < 100; i++) {
@@ -279,33 +951,334 @@ void run_self_test(void) {
     // Run inference
     int prediction = mlp_inference(input_image);
 
-    xil_printf("Self-test prediction: %d\r\n", prediction);
-    print_logits();
+    LOG_PRINTF(VERBOSITY_NORMAL, "Self-test prediction: %d\r\n", prediction);
+    if (verbosity >= VERBOSITY_NORMAL) {
+        print_logits();
+    }
 
     // Send via UART
     char buffer[64];
     sprintf(buffer, "SELF-TEST:PRED=%d\r\n", prediction);
     uart_send_string(buffer);
 
-    xil_printf("=== Self-Test Complete ===\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "=== Self-Test Complete ===\r\n");
+}
+
+/**
+ * @brief Read the low 32 bits of the RISC-V cycle counter
+ */
+static inline uint32_t read_cycles(void) {
+    uint32_t cycles;
+    __asm__ volatile ("rdcycle %0" : "=r"(cycles));
+    return cycles;
+}
+
+/**
+ * @brief Min/mean/max accumulator for one benchmarked stage
+ */
+typedef struct {
+    uint32_t min;
+    uint32_t max;
+    uint64_t sum;
+} bench_stat_t;
+
+static void bench_stat_reset(bench_stat_t* stat) {
+    stat->min = 0xFFFFFFFFu;
+    stat->max = 0;
+    stat->sum = 0;
+}
+
+static void bench_stat_add(bench_stat_t* stat, uint32_t cycles) {
+    if (cycles < stat->min) stat->min = cycles;
+    if (cycles > stat->max) stat->max = cycles;
+    stat->sum += cycles;
+}
+
+static int bench_stat_format(char* buf, const char* name, const bench_stat_t* stat,
+                             uint32_t iterations) {
+    return sprintf(buf, "%s=%lu/%lu/%lu", name, (unsigned long)stat->min,
+                   (unsigned long)(stat->sum / iterations), (unsigned long)stat->max);
+}
+
+/**
+ * @brief Time K inferences on the stored image with the cycle counter
+ *
+ * Uses whatever is in input_image (the last received image, or the
+ * self-test pattern). Reports min/mean/max cycles per stage in one line:
+ * BENCH:K=<k>,L1=min/mean/max,L2=...,AM=...,TOT=...
+ */
+void run_benchmark(uint32_t iterations) {
+    bench_stat_t l1, l2, am, tot;
+    char buffer[160];
+    int len;
+    int prediction = 0;
+
+    if (iterations == 0) {
+        iterations = BENCH_DEFAULT_ITERATIONS;
+    }
+
+    bench_stat_reset(&l1);
+    bench_stat_reset(&l2);
+    bench_stat_reset(&am);
+    bench_stat_reset(&tot);
+
+    LOG_PRINTF(VERBOSITY_NORMAL, "\r\n=== Benchmark Start (K=%d) ===\r\n", iterations);
+
+    for (uint32_t k = 0; k < iterations; k++) {
+        uint32_t t0 = read_cycles();
+        layer1_forward(input_image, hidden_layer);
+        uint32_t t1 = read_cycles();
+        layer2_forward(hidden_layer, output_layer);
+        uint32_t t2 = read_cycles();
+        prediction = argmax(output_layer, OUTPUT_SIZE);
+        uint32_t t3 = read_cycles();
+
+        bench_stat_add(&l1, t1 - t0);
+        bench_stat_add(&l2, t2 - t1);
+        bench_stat_add(&am, t3 - t2);
+        bench_stat_add(&tot, t3 - t0);
+    }
+
+    len = sprintf(buffer, "BENCH:K=%lu,", (unsigned long)iterations);
+    len += bench_stat_format(buffer + len, "L1", &l1, iterations);
+    buffer[len++] = ',';
+    len += bench_stat_format(buffer + len, "L2", &l2, iterations);
+    buffer[len++] = ',';
+    len += bench_stat_format(buffer + len, "AM", &am, iterations);
+    buffer[len++] = ',';
+    len += bench_stat_format(buffer + len, "TOT", &tot, iterations);
+    sprintf(buffer + len, ",PRED=%d\r\n", prediction);
+    uart_send_string(buffer);
+
+    LOG_PRINTF(VERBOSITY_NORMAL, "=== Benchmark Complete ===\r\n");
+}
+
+/**
+ * @brief Receive a pixel delta against input_image (command 'D')
+ *
+ * Protocol (no READY, pipelined like '8'):
+ * - u16 count, then count entries of u16 pixel index + u8 new value,
+ *   little-endian, then a CRC32 over count and entries
+ * - Nothing is applied before the CRC checks out; an index outside the
+ *   image fails the whole request with ERR:DELTA
+ * @return Number of entries in delta_buf, or -1 (error already sent)
+ */
+static int receive_delta(void) {
+    uint8_t head[2];
+    uint8_t crc_bytes[4];
+    char msg[32];
+
+    int received = uart_receive_bytes(head, 1, RX_FIRST_TIMEOUT_MS);
+    if (received == 1) {
+        received += uart_receive_bytes(head + 1, 1, RX_IDLE_TIMEOUT_MS);
+    }
+    if (received != 2) {
+        sprintf(msg, "ERR:RX %d\r\n", received);
+        uart_send_string(msg);
+        return -1;
+    }
+    uint32_t count = head[0] | (head[1] << 8);
+    if (count > INPUT_SIZE) {
+        uart_drain();
+        uart_send_string("ERR:DELTA\r\n");
+        return -1;
+    }
+
+    uint32_t len = count * DELTA_ENTRY_SIZE;
+    received = uart_receive_bytes(delta_buf, len, RX_IDLE_TIMEOUT_MS);
+    if ((uint32_t)received != len || uart_receive_bytes(crc_bytes, 4, RX_IDLE_TIMEOUT_MS) != 4) {
+        sprintf(msg, "ERR:RX %d\r\n", received + 2);
+        uart_send_string(msg);
+        return -1;
+    }
+
+    uint32_t crc_rx = crc_bytes[0] | (crc_bytes[1] << 8) | (crc_bytes[2] << 16) | ((uint32_t)crc_bytes[3] << 24);
+    if (crc32_update(crc32_update(0, head, 2), delta_buf, len) != crc_rx) {
+        uart_drain();
+        uart_send_string("ERR:CRC\r\n");
+        return -1;
+    }
+    for (uint32_t k = 0; k < count; k++) {
+        if ((delta_buf[k * DELTA_ENTRY_SIZE] | (delta_buf[k * DELTA_ENTRY_SIZE + 1] << 8)) >= INPUT_SIZE) {
+            uart_send_string("ERR:DELTA\r\n");
+            return -1;
+        }
+    }
+    return (int)count;
+}
+
+/**
+ * @brief Apply the received delta to input_image and classify it
+ *
+ * Layer 1 is linear in the input, so a pixel going from old to new moves
+ * the dot products by w1[h][i] * (new - old): HIDDEN_SIZE MACs per changed
+ * pixel instead of INPUT_SIZE * HIDDEN_SIZE for the image. Bias, activation,
+ * layer 2 and argmax then run as usual, so the answer is the one a full
+ * pass gives (without the CASCADE early exit). When l1_dot is not valid
+ * (first delta after '1', '8', '2' or a weight change) it is recomputed.
+ */
+static void process_delta(int count) {
+    char result_buffer[64];
+
+#if LAYER1_SWAR
+    // Uploaded weights only exist packed into w1p, with no column access
+    const int8_t (*cols)[INPUT_SIZE] = (act_crc == 0) ? w1 : NULL;
+#else
+    const int8_t (*cols)[INPUT_SIZE] = act_w1;
+#endif
+    int incremental = l1_dot_valid && cols != NULL;
+
+    uint32_t t0 = read_cycles();
+    for (int k = 0; k < count; k++) {
+        const uint8_t* entry = delta_buf + k * DELTA_ENTRY_SIZE;
+        int i = entry[0] | (entry[1] << 8);
+        int32_t diff = (int32_t)entry[2] - (int32_t)input_image[i];
+        input_image[i] = entry[2];
+        if (incremental && diff != 0) {
+            for (int h = 0; h < HIDDEN_SIZE; h++) {
+                l1_dot[h] += (int32_t)cols[h][i] * diff;
+            }
+        }
+    }
+    if (!incremental) {
+        layer1_accumulate(input_image, l1_dot);
+        l1_dot_valid = 1;
+    }
+    layer1_activate(l1_dot, hidden_layer);
+    layer2_forward(hidden_layer, output_layer);
+    int prediction = argmax(output_layer, OUTPUT_SIZE);
+    uint32_t t1 = read_cycles();
+
+    LOG_PRINTF(VERBOSITY_DEBUG, "Delta: %d pixels, %s, %lu cycles\r\n", count,
+               incremental ? "incremental" : "full layer 1", (unsigned long)(t1 - t0));
+    LOG_PRINTF(VERBOSITY_DEBUG, "Prediction: %d\r\n", prediction);
+    if (verbosity >= VERBOSITY_DEBUG) {
+        print_logits();
+    }
+
+    sprintf(result_buffer, "PRED:%d\r\n", prediction);
+    uart_send_string(result_buffer);
+}
+
+/**
+ * @brief Format prefix followed by the OUTPUT_SIZE logits, minus base if given
+ */
+static void send_logits_line(const char* prefix, const int32_t* logits, const int32_t* base) {
+    char buffer[160];
+    int len = sprintf(buffer, "%s", prefix);
+    for (int o = 0; o < OUTPUT_SIZE; o++) {
+        len += sprintf(buffer + len, o ? ",%ld" : "%ld", (long)(logits[o] - (base ? base[o] : 0)));
+    }
+    strcpy(buffer + len, "\r\n");
+    uart_send_string(buffer);
+}
+
+/**
+ * @brief Single-pixel sensitivity sweep (command 'P')
+ *
+ * Classifies, for every pixel i, the base image (zeros, or input_image with
+ * SWEEP_BASE_IMAGE) with x[i] set to value, in one exchange instead of
+ * INPUT_SIZE '1' round trips. As for 'D', layer 1 of each variant is the
+ * base dot products plus one column w1[:][i] * (value - base[i]); layer 2
+ * runs in full (no CASCADE early exit). input_image is not modified.
+ *
+ * Replies:
+ * - SWEEP:N=<INPUT_SIZE>,V=<value>,PRED=<base prediction>
+ * - SWBASE:<base logits>
+ * - SWL:<logits - base logits>, one line per pixel in order (SWEEP_LOGITS)
+ * - SWPRED:<INPUT_SIZE prediction digits>
+ * - SWEEP:END
+ */
+static void run_pixel_sweep(uint8_t value, uint8_t flags) {
+    static char preds[INPUT_SIZE + 1];
+    int32_t base_dot[HIDDEN_SIZE];
+    int32_t dot[HIDDEN_SIZE];
+    int32_t base_logits[OUTPUT_SIZE];
+    char buffer[64];
+    int use_image = (flags & SWEEP_BASE_IMAGE) != 0;
+
+#if LAYER1_SWAR
+    const int8_t (*cols)[INPUT_SIZE] = (act_crc == 0) ? w1 : NULL;
+#else
+    const int8_t (*cols)[INPUT_SIZE] = act_w1;
+#endif
+
+    if (use_image) {
+        if (!l1_dot_valid) {
+            layer1_accumulate(input_image, l1_dot);
+            l1_dot_valid = 1;
+        }
+        memcpy(base_dot, l1_dot, sizeof(base_dot));
+    } else {
+        memset(base_dot, 0, sizeof(base_dot));
+    }
+    layer1_activate(base_dot, hidden_layer);
+    layer2_forward(hidden_layer, base_logits);
+    sprintf(buffer, "SWEEP:N=%d,V=%d,PRED=%d\r\n", INPUT_SIZE, value, argmax(base_logits, OUTPUT_SIZE));
+    uart_send_string(buffer);
+    send_logits_line("SWBASE:", base_logits, NULL);
+
+    uint32_t t0 = read_cycles();
+    for (int i = 0; i < INPUT_SIZE; i++) {
+        int32_t base_px = use_image ? input_image[i] : 0;
+        if (cols != NULL) {
+            int32_t diff = (int32_t)value - base_px;
+            for (int h = 0; h < HIDDEN_SIZE; h++) {
+                dot[h] = base_dot[h] + (int32_t)cols[h][i] * diff;
+            }
+        } else {
+            // SWAR build with uploaded weights: full layer 1 on a scratch image
+            static uint8_t scratch[INPUT_SIZE];
+            if (use_image) {
+                memcpy(scratch, input_image, INPUT_SIZE);
+            } else {
+                memset(scratch, 0, INPUT_SIZE);
+            }
+            scratch[i] = value;
+            layer1_accumulate(scratch, dot);
+        }
+        layer1_activate(dot, hidden_layer);
+        layer2_forward(hidden_layer, output_layer);
+        preds[i] = (char)('0' + argmax(output_layer, OUTPUT_SIZE));
+        if (flags & SWEEP_LOGITS) {
+            send_logits_line("SWL:", output_layer, base_logits);
+        }
+    }
+    uint32_t t1 = read_cycles();
+    preds[INPUT_SIZE] = '\0';
+
+    uart_send_string("SWPRED:");
+    uart_send_string(preds);
+    uart_send_string("\r\nSWEEP:END\r\n");
+    LOG_PRINTF(VERBOSITY_DEBUG, "Sweep: %d pixels, %lu cycles\r\n", INPUT_SIZE, (unsigned long)(t1 - t0));
 }
 
 /**
  * @brief Display menu
  */
 void display_menu(void) {
-    xil_printf("\r\n");
-    xil_printf("=========================================\r\n");
-    xil_printf("  MNIST MLP Inference - MicroBlaze RISC-V\r\n");
-    xil_printf("  INT8 Quantization | 9600 baud\r\n");
-    xil_printf("=========================================\r\n");
-    xil_printf("Commands:\r\n");
-    xil_printf("  1 - Receive image and classify\r\n");
-    xil_printf("  2 - Run self-test\r\n");
-    xil_printf("  3 - Display network info\r\n");
-    xil_printf("  4 - Display menu\r\n");
-    xil_printf("=========================================\r\n");
-    xil_printf("Command: ");
+    if (verbosity >= VERBOSITY_NORMAL) {
+        xil_printf("\r\n");
+        xil_printf("=========================================\r\n");
+        xil_printf("  MNIST MLP Inference - MicroBlaze RISC-V\r\n");
+        xil_printf("  INT8 Quantization | 9600 baud\r\n");
+        xil_printf("=========================================\r\n");
+        xil_printf("Commands:\r\n");
+        xil_printf("  1 - Receive image and classify\r\n");
+        xil_printf("  2 - Run self-test\r\n");
+        xil_printf("  3 - Display network info\r\n");
+        xil_printf("  4 - Display menu\r\n");
+        xil_printf("  5 - Benchmark (then 2 bytes: K, little-endian)\r\n");
+        xil_printf("  6 - Upload weights (then blob: header, payload, CRC32)\r\n");
+        xil_printf("  7 - Use built-in weights\r\n");
+        xil_printf("  8 - Classify framed image (then %d bytes + CRC32, no READY)\r\n", INPUT_SIZE);
+        xil_printf("  9 - Verbosity (then '0' quiet, '1' normal, '2' debug, '?' query)\r\n");
+        xil_printf("  0 - Sync (replies SYNC)\r\n");
+        xil_printf("  D - Classify delta (then count, index/value entries, CRC32; no READY)\r\n");
+        xil_printf("  P - Pixel sweep (then value, flags: 1 = over last image, 2 = logits)\r\n");
+        xil_printf("=========================================\r\n");
+        xil_printf("Command: ");
+    }
 
     // Also send via UART
     uart_send_string("\r\n=== MENU ===\r\n");
@@ -313,22 +1286,69 @@ void display_menu(void) {
     uart_send_string("2: Self-test\r\n");
     uart_send_string("3: Network info\r\n");
     uart_send_string("4: Menu\r\n");
+    uart_send_string("5: Benchmark\r\n");
+    uart_send_string("6: Upload weights\r\n");
+    uart_send_string("7: Built-in weights\r\n");
+    uart_send_string("8: Classify framed image\r\n");
+    uart_send_string("9: Verbosity\r\n");
+    uart_send_string("0: Sync\r\n");
+    uart_send_string("D: Classify delta\r\n");
+    uart_send_string("P: Pixel sweep\r\n");
 }
 
 /**
  * @brief Display network information
  */
 void display_network_info(void) {
-    xil_printf("\r\n=== Network Info ===\r\n");
-    xil_printf("Architecture: 784->32->10\r\n");
-    xil_printf("Quantization: INT8\r\n");
-    xil_printf("Shift bits: %d\r\n", SHIFT_BITS);
-    xil_printf("Parameters: %d\r\n",
+    LOG_PRINTF(VERBOSITY_NORMAL, "\r\n=== Network Info ===\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "Architecture: %d->%d->%d (%dx%d input)\r\n",
+               INPUT_SIZE, HIDDEN_SIZE, OUTPUT_SIZE, INPUT_SIDE, INPUT_SIDE);
+#if QUANT_PER_CHANNEL
+    LOG_PRINTF(VERBOSITY_NORMAL, "Quantization: INT8 per-channel, multiply-shift requant\r\n");
+#else
+    LOG_PRINTF(VERBOSITY_NORMAL, "Quantization: INT8\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "Shift bits: %d\r\n", act_shift);
+#endif
+#if LAYER1_SWAR
+    LOG_PRINTF(VERBOSITY_NORMAL, "Layer 1: SWAR, %d chunks\r\n", w1p_chunk_first[HIDDEN_SIZE / 2]);
+#endif
+#if WEIGHTS_UNROLLED
+    LOG_PRINTF(VERBOSITY_NORMAL, "Unrolled: layer 2, %d layer-1 units (built-in weights)\r\n", L1U_COUNT);
+#endif
+#if CASCADE
+    LOG_PRINTF(VERBOSITY_NORMAL, "Cascade: %d->%d->10 first, margin %d, %lu early exits\r\n",
+               INPUT_SIZE, CASCADE_HIDDEN, CASCADE_MARGIN, (unsigned long)cascade_exits);
+#endif
+    LOG_PRINTF(VERBOSITY_NORMAL, "Parameters: %d\r\n",
                (INPUT_SIZE * HIDDEN_SIZE + HIDDEN_SIZE +
                 HIDDEN_SIZE * OUTPUT_SIZE + OUTPUT_SIZE));
 
-    // Send via UART
-    uart_send_string("INFO:784->32->10,INT8\r\n");
+    // Send via UART; uploaded weights are identified by their blob CRC.
+    // The host reads the input size from here and downsamples to match.
+    char buffer[96];
+    sprintf(buffer, "INFO:%d->%d->%d,INT8", INPUT_SIZE, HIDDEN_SIZE, OUTPUT_SIZE);
+#if QUANT_PER_CHANNEL
+    strcat(buffer, ",PC");
+#endif
+#if CASCADE
+    // CASCADE: stage 1 may answer alone, so the 32-unit net alone can disagree
+    sprintf(buffer + strlen(buffer), ",CASCADE=%d", (int)CASCADE_MARGIN);
+#endif
+    if (act_crc != 0) {
+        LOG_PRINTF(VERBOSITY_NORMAL, "Weights: uploaded, CRC32 %08x\r\n", act_crc);
+        sprintf(buffer + strlen(buffer), ",W=%08lx", (unsigned long)act_crc);
+    }
+    // RX=IRQ: requests may be pipelined, the ring buffers the next one
+    LOG_PRINTF(VERBOSITY_NORMAL, "UART RX: %s, %lu bytes dropped\r\n", uart_irq ? "interrupt ring" : "polled",
+               (unsigned long)rx_overruns);
+    // DELTA: command 'D' updates the last image by its changed pixels,
+    // SWEEP: command 'P' runs the single-pixel sweep
+    strcat(buffer, ",DELTA,SWEEP");
+    if (uart_irq) {
+        strcat(buffer, ",RX=IRQ");
+    }
+    strcat(buffer, "\r\n");
+    uart_send_string(buffer);
 }
 
 /**
@@ -339,10 +1359,10 @@ int main(void) {
     uint8_t command;
 
     // Startup message
-    xil_printf("\r\n\r\n");
-    xil_printf("*********************************************\r\n");
-    xil_printf("* MLP Inference System Starting...          *\r\n");
-    xil_printf("*********************************************\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "\r\n\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "*********************************************\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "* MLP Inference System Starting...          *\r\n");
+    LOG_PRINTF(VERBOSITY_NORMAL, "*********************************************\r\n");
 
     // Initialize UART
     Status = uart_init();
@@ -364,11 +1384,11 @@ int main(void) {
         if (uart_receive_bytes(&command, 1, 60000) == 1) {
 
             // Echo command
-            xil_printf("%c\r\n", command);
+            LOG_PRINTF(VERBOSITY_NORMAL, "%c\r\n", command);
 
             switch (command) {
                 case '1':
-                    xil_printf("Command: Classify image\r\n");
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Classify image\r\n");
                     Status = receive_image();
                     if (Status == XST_SUCCESS) {
                         process_inference();
@@ -376,34 +1396,107 @@ int main(void) {
                     break;
 
                 case '2':
-                    xil_printf("Command: Self-test\r\n");
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Self-test\r\n");
                     run_self_test();
                     break;
 
                 case '3':
-                    xil_printf("Command: Network info\r\n");
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Network info\r\n");
                     display_network_info();
                     break;
 
                 case '4':
-                    xil_printf("Command: Show menu\r\n");
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Show menu\r\n");
                     display_menu();
                     break;
 
+                case '5': {
+                    uint8_t count[2];
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Benchmark\r\n");
+                    if (uart_receive_bytes(count, 2, 5000) == 2) {
+                        run_benchmark((uint32_t)count[0] | ((uint32_t)count[1] << 8));
+                    } else {
+                        uart_send_string("ERROR:Benchmark count\r\n");
+                    }
+                    break;
+                }
+
+                case '6':
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Upload weights\r\n");
+                    receive_weights();
+                    break;
+
+                case '7':
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Built-in weights\r\n");
+                    use_builtin_weights();
+                    uart_send_string("WEIGHTS:BUILTIN\r\n");
+                    break;
+
+                case '8':
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Classify framed image\r\n");
+                    if (receive_image_framed() == XST_SUCCESS) {
+                        process_inference();
+                    }
+                    break;
+
+                case '9': {
+                    // Level as an ASCII digit so it can be typed in a terminal
+                    uint8_t level;
+                    char reply[16];
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Verbosity\r\n");
+                    if (uart_receive_bytes(&level, 1, 5000) != 1 ||
+                        (level != '?' && (level < '0' || level > '0' + VERBOSITY_DEBUG))) {
+                        uart_send_string("ERROR:Verbosity level\r\n");
+                        break;
+                    }
+                    if (level != '?') {
+                        verbosity = level - '0';
+                    }
+                    sprintf(reply, "VERBOSE:%d\r\n", verbosity);
+                    uart_send_string(reply);
+                    break;
+                }
+
+                case 'D': {
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Classify delta\r\n");
+                    int count = receive_delta();
+                    if (count >= 0) {
+                        process_delta(count);
+                    }
+                    break;
+                }
+
+                case 'P': {
+                    uint8_t args[2];
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Command: Pixel sweep\r\n");
+                    if (uart_receive_bytes(args, 2, 5000) == 2) {
+                        run_pixel_sweep(args[0], args[1]);
+                    } else {
+                        uart_send_string("ERROR:Sweep arguments\r\n");
+                    }
+                    break;
+                }
+
+                case '0':
+                    // Resync marker: the host flushes until it sees this line
+                    uart_send_string("SYNC\r\n");
+                    break;
+
                 case '\r':
                 case '\n':
                     // Ignore newlines
                     break;
 
                 default:
-                    xil_printf("Unknown: %c (0x%02X)\r\n", command, command);
+                    LOG_PRINTF(VERBOSITY_NORMAL, "Unknown: %c (0x%02X)\r\n", command, command);
                     uart_send_string("ERROR:Unknown command\r\n");
                     break;
             }
 
-            xil_printf("\r\nCommand: ");
+            LOG_PRINTF(VERBOSITY_NORMAL, "\r\nCommand: ");
         }
     }
 
     return 0;
 }
+#endif  // !MLP_HOST_KERNELS
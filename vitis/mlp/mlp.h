@@ -9,14 +9,26 @@
 #define MLP_H
 
 #include <stdint.h>
+#include "weights_rq.h"
 
 // Network configuration
-#define INPUT_SIZE 784
+#ifndef INPUT_SIDE  // weights_rq.h sets it for reduced-resolution models
+#define INPUT_SIDE 28
+#endif
+#define INPUT_SIZE (INPUT_SIDE * INPUT_SIDE)
 #define HIDDEN_SIZE 32
 #define OUTPUT_SIZE 10
 
 // Quantization parameters
+#ifndef SHIFT_BITS  // weights_rq.h sets it for calibrated per-tensor weights
 #define SHIFT_BITS 8
+#endif
+
+#if QUANT_PER_CHANNEL
+typedef int8_t hidden_t;
+#else
+typedef int32_t hidden_t;
+#endif
 
 // UART configuration
 #define UART_BAUDRATE 9600
@@ -59,17 +71,17 @@ static inline int32_t relu(int32_t x);
 
 /**
  * @brief Forward pass through layer 1
- * @param input Input image (784 uint8 values)
- * @param output Hidden layer activations (32 int32 values)
+ * @param input Input image (INPUT_SIZE uint8 values)
+ * @param output Hidden layer activations (32 values, int8 when QUANT_PER_CHANNEL)
  */
-void layer1_forward(const uint8_t* input, int32_t* output);
+void layer1_forward(const uint8_t* input, hidden_t* output);
 
 /**
  * @brief Forward pass through layer 2
  * @param hidden Hidden layer activations
  * @param output Output logits (10 int32 values)
  */
-void layer2_forward(const int32_t* hidden, int32_t* output);
+void layer2_forward(const hidden_t* hidden, int32_t* output);
 
 /**
  * @brief Find index of maximum value in array
@@ -81,11 +93,22 @@ int argmax(const int32_t* array, int length);
 
 /**
  * @brief Perform complete MLP inference
- * @param input_image Input image (784 bytes)
+ * @param input_image Input image (INPUT_SIZE bytes)
  * @return Predicted digit (0-9)
  */
 int mlp_inference(const uint8_t* input_image);
 
+/**
+ * @brief Run mlp_inference() on n images (MLP_HOST_KERNELS builds only)
+ * @param images n x INPUT_SIZE input pixels
+ * @param preds n predictions
+ * @param logits n x 10 output logits, or NULL
+ * @param hidden n x 32 hidden activations (zeros where CASCADE stage 1 answered),
+ *               or NULL
+ */
+void mlp_inference_batch(const uint8_t* images, int n, int32_t* preds,
+                         int32_t* logits, hidden_t* hidden);
+
 /**
  * @brief Print output logits for debugging
  */
@@ -102,11 +125,34 @@ void process_inference(void);
  */
 int receive_image(void);
 
+/**
+ * @brief Receive an image and its CRC32 without READY (pipelined requests)
+ * @return XST_SUCCESS if the CRC matched, XST_FAILURE otherwise
+ */
+int receive_image_framed(void);
+
+/**
+ * @brief Receive a weight blob via UART and switch inference to it
+ * @return XST_SUCCESS if the blob was accepted, XST_FAILURE otherwise
+ */
+int receive_weights(void);
+
+/**
+ * @brief Switch inference back to the compiled-in weights
+ */
+void use_builtin_weights(void);
+
 /**
  * @brief Run self-test with test pattern
  */
 void run_self_test(void);
 
+/**
+ * @brief Time K inferences on the stored image with the cycle counter
+ * @param iterations Number of inferences K (0 selects the default)
+ */
+void run_benchmark(uint32_t iterations);
+
 /**
  * @brief Display menu to user
  */
@@ -0,0 +1,4 @@
+#pragma once
+#include <stdint.h>
+
+#define QUANT_PER_CHANNEL 0
@@ -0,0 +1,114 @@
+#pragma once
+#include <stdint.h>
+
+// Generated by training/unroll_gen.py from weights_w1.h, weights_w2.h, weights_b2.h
+// and weights_rq.h; only valid for those compiled-in weights. See mlp.c WEIGHTS_UNROLLED
+#define UNROLLED_PER_CHANNEL 0
+#define UNROLLED_SHIFT_BITS 8
+#define L1U_COUNT 0  // hidden units 0..L1U_COUNT-1 of layer 1
+
+static inline void layer2_unrolled(const int32_t* hidden, int32_t* output) {
+    // hidden >= 0 after ReLU: >> 8 is the downshift of layer2_forward()
+    const int32_t h0 = hidden[0] >> 8;
+    const int32_t h1 = hidden[1] >> 8;
+    const int32_t h2 = hidden[2] >> 8;
+    const int32_t h3 = hidden[3] >> 8;
+    const int32_t h4 = hidden[4] >> 8;
+    const int32_t h5 = hidden[5] >> 8;
+    const int32_t h6 = hidden[6] >> 8;
+    const int32_t h7 = hidden[7] >> 8;
+    const int32_t h8 = hidden[8] >> 8;
+    const int32_t h9 = hidden[9] >> 8;
+    const int32_t h10 = hidden[10] >> 8;
+    const int32_t h11 = hidden[11] >> 8;
+    const int32_t h12 = hidden[12] >> 8;
+    const int32_t h13 = hidden[13] >> 8;
+    const int32_t h14 = hidden[14] >> 8;
+    const int32_t h15 = hidden[15] >> 8;
+    const int32_t h16 = hidden[16] >> 8;
+    const int32_t h17 = hidden[17] >> 8;
+    const int32_t h18 = hidden[18] >> 8;
+    const int32_t h19 = hidden[19] >> 8;
+    const int32_t h20 = hidden[20] >> 8;
+    const int32_t h21 = hidden[21] >> 8;
+    const int32_t h22 = hidden[22] >> 8;
+    const int32_t h23 = hidden[23] >> 8;
+    const int32_t h24 = hidden[24] >> 8;
+    const int32_t h25 = hidden[25] >> 8;
+    const int32_t h26 = hidden[26] >> 8;
+    const int32_t h27 = hidden[27] >> 8;
+    const int32_t h28 = hidden[28] >> 8;
+    const int32_t h29 = hidden[29] >> 8;
+    const int32_t h30 = hidden[30] >> 8;
+    const int32_t h31 = hidden[31] >> 8;
+    output[0] = 3138
+                - h0 * 6 - h1 * 40 - h2 * 39 + h3 * 62 - h4 * 101 - h5 * 115
+                - h6 * 45 + h7 * 49 - (h8 << 2) - h9 * 25 - h10 * 51 - h11 * 40
+                - h12 * 52 + h13 * 51 + h14 * 37 - h15 * 21 + h16 * 39 - h17 * 51
+                - (h18 << 2) - h19 * 59 - h20 * 51 - h21 * 54 - h22 * 11 + h23 * 46
+                - (h24 << 5) + h25 * 27 - h26 * 45 + h27 * 43 + h28 * 47 - (h29 << 3)
+                - h30 * 30 - h31;
+    output[1] = 8519
+                + h0 * 20 - h1 * 71 - (h2 << 6) - h3 * 24 + h4 * 27 + h5 * 57
+                - h6 * 88 - h7 * 45 - (h8 << 5) + h9 * 39 - h10 * 59 + h11 * 35
+                - h12 * 66 - h13 * 48 - h14 * 59 - h15 * 29 - h16 * 48 + h17 * 40
+                + (h18 << 5) + h19 * 53 + h20 * 51 + h21 * 31 + h22 * 31 - h23 * 33
+                + h24 * 36 + (h25 << 1) + h26 - h27 * 45 + h28 * 43 + h29 * 60
+                - h30 * 5 - h31 * 82;
+    output[2] = -904
+                + h0 * 19 + h1 * 45 + h2 * 15 + h3 * 37 - h4 * 42 + h5 * 42
+                + h6 * 60 + h7 * 24 - h8 * 22 - h9 * 39 - (h10 << 2) + h11 * 37
+                - h12 * 28 + h13 * 25 + h14 * 47 - h16 * 21 - h17 * 68 + h18 * 67
+                + h19 * 74 - h20 * 13 + h21 * 26 + h22 * 17 - h23 * 24 - h24 * 5
+                + h25 * 46 - h26 * 80 - h27 * 47 - h28 * 14 - h29 * 127 - h30 * 6
+                - h31 * 26;
+    output[3] = -6643
+                + h0 * 33 + h1 * 18 - h2 * 15 - h3 * 9 + h4 * 45 + (h5 << 2)
+                - h6 * 49 + h7 - h8 * 37 - h9 * 43 - h10 * 45 - h11 * 19
+                + h12 * 52 - h13 * 23 + h14 * 35 - h15 * 6 + h16 * 25 - h17 * 69
+                - h18 * 35 - h19 * 31 + h20 * 65 + (h21 << 5) + h22 * 49 - h23 * 56
+                + h24 * 35 - h25 * 59 - h26 * 62 + h27 * 27 + h28 * 5 - h29 * 82
+                + h30 * 56 - h31 * 13;
+    output[4] = 982
+                - (h0 << 5) + h1 * 33 - h2 * 40 - h3 * 46 + h4 * 36 + (h5 << 1)
+                + h6 * 59 + h7 * 12 + h8 * 50 + h9 * 55 + h10 * 56 + h11 * 43
+                - h12 * 35 + h13 * 44 - h14 * 75 - h15 * 12 - h16 * 74 + h17 * 26
+                - h18 * 89 - h19 * 66 - (h20 << 1) - h21 * 24 - h22 * 67 - h23 * 9
+                + h24 * 34 - (h25 << 6) - h26 * 21 + h27 * 37 - h28 * 35 + h29 * 10
+                - h30 * 80 - h31 * 68;
+    output[5] = 5414
+                - h0 * 73 - h1 * 39 + h2 * 45 - (h3 << 1) + h4 * 50 + h5 * 49
+                - h6 * 45 + h7 * 36 - h8 * 3 - h9 * 88 + h10 * 38 - h11 * 60
+                - h12 * 29 - h13 * 25 - h14 * 60 - h15 * 21 + h16 * 56 + h17 * 23
+                - h18 * 74 + h19 * 36 - h20 * 54 + h21 * 36 + h22 * 73 + h23 * 10
+                - h24 * 56 + (h25 << 1) + h26 * 7 - h27 * 3 + h28 * 25 + (h29 << 3)
+                - h30 * 42 + h31 * 111;
+    output[6] = 6994
+                + h0 * 49 + h1 * 10 + h2 * 54 - h3 * 40 - h4 * 50 - h5 * 38
+                + h6 * 63 + h7 * 26 + h8 * 53 - h9 * 20 - h10 * 84 - h11 * 28
+                - h12 * 85 - h13 * 15 - h14 * 18 + h15 * 9 - h16 * 3 + h17 * 12
+                - h18 * 79 - h19 * 42 + h20 * 53 - h21 * 5 - h22 * 81 + h23 * 26
+                - h24 * 76 + h25 * 59 + h26 * 35 - h27 * 23 + h28 * 7 - h30 * 49
+                - h31 * 106;
+    output[7] = 1655
+                - h0 * 34 - h1 * 34 - h2 * 68 + h3 * 66 + h4 * 36 + h5 * 23
+                + h6 * 34 + h7 * 10 + h8 * 3 + h9 * 56 + h10 * 31 - h11 * 57
+                + h12 * 31 - h13 * 38 + h14 * 51 + (h15 << 3) - h16 * 75 + h17 * 9
+                + h18 * 61 + h19 * 19 - h20 * 48 + h21 * 15 - h22 * 68 + h23 * 59
+                - (h24 << 4) - h25 * 46 - h26 * 43 - h27 * 14 - h28 * 86 + h29 * 33
+                + h30 * 54 + h31 * 56;
+    output[8] = -9703
+                + h0 * 3 - h1 * 3 + h2 * 34 - h3 * 12 - (h4 << 5) - h5 * 13
+                - h6 * 54 - h7 * 25 - h8 * 86 - h9 * 73 + h10 * 35 + h11 * 47
+                + h12 * 11 + h13 * 42 - h14 * 58 - h15 * 5 + h16 * 14 + h17 * 19
+                + h18 * 20 - h19 * 98 - h20 * 20 + h21 * 54 - h22 * 24 - h23 * 26
+                + h24 * 41 + h25 * 22 - h26 * 14 + h27 * 30 - h28 * 11 - h29 * 38
+                + h30 * 11 - h31 * 91;
+    output[9] = 4257
+                + h0 * 51 - h1 * 11 - h2 * 6 - h3 * 68 - h4 * 42 - h5 * 57
+                - h6 * 107 + h7 * 21 + h8 * 19 + h9 * 48 + h10 * 39 - h11 * 7
+                + h12 * 46 + h13 * 40 - h14 * 23 + h15 * 20 - h16 * 31 - h17
+                - h18 * 43 - h19 * 66 - h20 * 30 - h21 * 93 + h22 * 10 + h23 * 28
+                + h24 * 50 - h25 * 63 + h26 * 53 - h27 * 36 - h28 * 30 - (h29 << 2)
+                + h30 * 36 + h31 * 31;
+}
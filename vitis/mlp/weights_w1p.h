@@ -0,0 +1,26 @@
+#pragma once
+#include <stdint.h>
+
+// Generated by training/swar_pack.py from weights_w1.h; see layer1_swar.h
+#define W1P_MAX_CHUNKS 4096
+
+static uint32_t w1p[16][784] = {
+  {4294770686,4294574084,4294836223,4294705161,131074,327675,655356,4294443013,4,327684,4294967292,4294836218,4293197850,4294377484,4294705159,4294836222,65530,131072,4294508542,458752,4294574083,65532,589832,458757,393212,131079,4294901758,327678,393213,4294443015,4294508540,4294508539,196607,4293001230,4291625005,4290510916,4292018227,4293853224,4294311946,4293394444,4293132327,4294246431,4293984309,4293918764,4294508548,4292804601,4292739105,4292149296,4292280370,4293984282,4292870167,4293066783,9,4294967293,4294836229,131068,4294770684,262149,65542,4294574083,262159,4292345879,4290641975,4289921087,4293394517,262223,86,720967,393289,1703993,1310793,1507391,1376276,3276839,1376313,983076,2883616,2490406,1441817,4294901787,262161,65540,4294508544,4294443003,4294770688,262149,4294574083,1638418,786437,2424872,1376309,1769510,3342386,3342403,2490439,1900614,1114158,1835056,589861,262173,2359310,3014685,2097176,655390,1245196,2097170,131060,4293853173,4293722108,786451,4294574085,4294836222,262143,65527,327680,4294246429,458794,3473471,2228267,1703963,131124,2424899,1114176,327708,720910,4294508557,4294574105,4294639629,720910,1769484,655358,720900,1114113,4293984245,4294180839,4294377437,4293066700,4293066703,851937,4294443008,6,589828,393232,1835053,4390973,3670043,2162712,393242,1048591,4294705152,917515,655373,196625,7,131093,655380,1572858,2293735,1769457,1114108,1441781,65523,4294442976,4294836196,4294442982,2097121,2555917,786459,196613,393218,4294246385,3735604,3145762,1572851,1179644,1245169,1572843,786427,458749,4294115320,4294311935,1048594,589849,1048608,655384,4294705164,720901,327671,4294901738,983032,393179,851936,655321,262100,4294901755,2359336,4294770691,655357,393205,2555938,4784168,3276777,2490352,851949,1114081,4294639598,786432,4294836209,4294377469,1048611,131100,45,4294311973,4294574091,4294049790,4294246375,4293853169,524274,1572843,4294967246,4294311877,4294049728,524281,2490408,4294967284,4293066723,4294508498,3473435,3997722,4063221,1638387,1441770,4294115304,327662,786438,655336,4293918707,589846,4294443048,393273,327710,4294508559,4293132271,327661,1441782,1179626,2162659,131023,4292673476,4293001155,1048548,4294443017,4294115326,4293132269,4293853153,2162681,1638417,3014661,4294967282,196612,4294705139,393209,262132,4293328867,4293001210,4293001225,4292673586,4293394498,262171,327668,4294311937,917501,1507340,786417,1245161,4294377428,4290576319,4290641825,4292607939,4292542417,4294508551,4293328866,4292607956,4292214750,4294246392,4293984274,4294246388,4293853186,4294049785,4293263356,4293197784,4292214745,4293066718,4292345837,4291559448,4292739095,4293722115,393202,524288,1048578,1441800,458755,327673,4293722074,4291428269,4289331093,4291559360,4292476899,524262,4294115302,4292870109,4294639582,393210,4294574101,4293459964,4293984257,4293066734,4293525483,4293394397,4292542423,4293918692,4292083697,4291428389,4291166230,4294180880,720912,4294508555,1376267,1507382,4294246444,4294836236,327684,4293525457,4291297183,4290772934,4292542455,458744,4293853164,4293853128,4294442999,458772,4293197847,4292083710,4292345838,4293787640,4293918703,4294377453,4294377436,4294377445,4292542466,4292280354,4292214810,262175,35,65562,1179674,262184,262187,4294508588,4294377543,262188,2228162,4294442947,4293787631,4294443014,4294705119,4292673494,1245197,4292411394,4293001216,4292870151,4294574064,196592,65526,196579,1310671,1769459,458787,4293787695,524339,1441833,786466,1507346,1441792,983063,4294443042,4294705210,4294770732,131124,3866603,2686935,589819,589832,4294770682,4293263337,3276812,327657,4293722098,4294508555,917510,4294836213,524263,458735,1966073,1507334,589858,196674,2097203,2555930,2752523,2424831,1245182,14,4293787671,4292673554,4292673528,4293918715,1835011,1507324,524282,4294901769,4293525516,2490341,3014653,393207,458752,1703929,589840,4294377471,1179639,393233,2293785,2097177,1638450,983092,3342377,3473426,2686980,131079,1376258,4294770697,4294508553,4293984274,4293263344,2424843,4259882,3735595,917474,4294639622,458771,1048607,1638401,393216,1769485,851977,1048584,4294180857,131098,2031659,1900603,4128825,3014698,2228262,2949131,3997704,3080186,2228236,2293770,4294901742,4294639614,917506,1310715,2949146,4456538,5242952,1769485,4294443018,589857,1638443,458748,720897,1572858,327657,458769,458770,4294574120,393270,2097222,2555956,3407906,2424856,2293772,3473401,2883584,2293770,524305,458747,1114089,1048576,4293984221,1114082,2359354,2359320,1900575,4293656598,1245200,4294377482,1048586,2293749,3014637,1769449,1310726,1114148,1048628,917563,1376295,3670055,2621464,2097155,3145731,4128772,2424845,786451,786448,589839,262138,2097165,1441789,1572852,1441842,393188,4293591066,458758,4293656562,4292214750,983055,3145734,3801073,2359273,1966086,1572879,720934,4294836254,196645,1507361,1048606,1835040,2490383,1441828,655386,4294311945,4294705176,4294901783,1966101,1900551,4294246371,4293459960,4294836276,2424823,4293853212,196603,4294770697,4294508519,2031651,2555908,2293742,2621467,983042,655362,4294705174,4293918745,4294443039,786457,131114,1048615,393229,4294180888,4293918722,4294508569,917544,1376291,1638419,4294311912,4293787628,4292739088,68,1900550,4292542461,4294508541,983056,3014695,1900589,4294836226,655357,65528,327678,4294901768,196617,4293787656,4294574072,1114134,24,4294574102,4293656603,4294770711,393237,1245211,1572886,1179636,196558,196597,4293984256,4292935732,4293656617,4293656534,4294574086,4294836229,4294836226,3342369,3014732,4294901763,4293394434,196614,393216,262152,1179667,524291,720883,1245170,458737,4293787649,4294639617,4294377454,4294639624,851967,1310703,2424811,2162665,1114101,4294574080,4293656628,4293263409,4293722097,262144,4294901765,589833,3538982,3014717,655358,4294508534,65532,524300,917494,851970,4294705147,917485,4294115304,4294705141,4294574068,4294180836,4294049769,4294442989,1835000,1507329,2031597,2949112,1703971,2031670,786500,589862,1114115,4294508547,393209,393210,3473420,1638427,983055,4293525502,655361,1376276,1179665,786427,4294836209,655338,4294836197,1507303,327650,1179631,1441772,1769454,3145724,4294836238,851963,2424844,2293831,1245278,2490412,2555880,1900536,524297,4294639615,589815,4294770693,4292870121,4292804605,4294705185,1966131,393245,655396,4294049810,65569,4294311952,4294377492,983054,1245209,2031611,4294770688,4293525510,4293853215,4291100710,4292608049,4294180897,458791,1376255,655390,1769447,1507312,262135,4294311926,524285,4294508536,1769488,524319,589830,917535,131102,4294311950,4292804637,4292280358,4294246431,4293722142,4292739093,4292476952,4292476933,4290904063,4290314255,4291952659,4289986557,4292214812,4294377496,4293918727,65541,4294639609,589826,589815,4294639609,4294574074,458746,4294901751,262141,4294049768,4293394424,4293722095,4293197792,4291887068,4293459946,4293722092,4293132256,4292476876,4291887061,4292804651,4292476960,4293197802,4293525490,4292804618,4293197830,589823,4294967289,4294115319,65503,196609,2,65534,1},
+  {4294442999,4294901765,4294901756,65544,4294639623,4294508542,327678,458752,327677,4294443011,4294770687,4294574079,655389,393233,4294770696,262147,4294639625,4294311936,4294705159,327680,4294967290,327688,196617,4294574076,8,131067,4294508544,4294574077,4294901764,65532,327681,4294836216,4294508543,4294377493,4294115376,4294311993,4293525550,4294705176,4293853204,131080,4294246431,4294639639,4294508550,393230,524297,1441804,4294508579,4294311975,4293787690,4294377490,4294574107,4294508575,131068,131063,4294967287,4294443006,6,589817,131063,4294311933,65554,4293984274,65574,4294770743,4293722195,4292280396,4293001291,4293591078,23,4294836264,4293328911,4292870160,4291821576,4292608027,4293197863,4292411422,4293459993,4293787663,4293656582,4294574118,4294770703,4294836220,393226,4294967291,4294508546,4294639615,4294311940,4294246428,327695,4292608023,4291887139,4292804629,4293787681,4294246455,61,4294443067,4294574100,4293918758,4294901791,4294705179,4293722124,4293394460,4291690549,4289921073,4290445362,4291166275,4291625032,4293722173,4294180909,4294180884,4294705148,4294377463,131068,4294574072,4294967291,4294639577,4293459915,4291690442,4292673524,4294770698,4294967286,393219,4294574103,851983,1114115,393203,393215,1638408,4294508577,4294639655,4294049830,4293591080,4292280352,4293001235,4293591045,4293328913,4294639620,655376,4294574061,589815,196616,7,4293656565,4293853134,4293853134,4293066705,4293263345,4294836209,1900548,393215,4293984271,4294443024,4294836251,1048580,1835014,983046,1048613,327715,4294901786,4294770722,4293853230,4294836241,720887,4293656572,4293328911,4291821615,4292739130,983053,589818,4294311936,589836,196554,4294442976,1114077,1310682,2949098,3407861,4294246425,1245199,786459,1376274,196620,4294901791,44,851991,196636,983047,1507343,524301,1376237,2228210,4293722108,4294049831,4291362893,4292739131,4293394465,262146,1376219,2621455,3604426,3014601,3473352,2752472,3211233,1769503,1572889,2359311,2097170,2687004,917527,589840,720932,655395,1703933,2097139,2097135,1703911,1703932,2555901,2097158,393255,4292083783,4292149278,4293722147,851963,1376232,1966057,2031566,2097083,1900518,1703915,2293759,786445,2752534,2293774,3538958,3604493,2555934,3080196,2293747,1441779,2555871,2752465,2228185,1048558,1310725,1179642,2031649,4294901826,4291821624,4293263385,23,65540,1572835,1769423,2162641,1834939,1310698,131088,4294770709,851991,1048615,1310743,1441821,2097181,3276800,3669990,2555868,4063162,3997634,3473356,1900506,1179641,1310723,1114122,1310746,917583,4291035217,4293722130,4294049769,196598,1507310,2818003,2490301,1638366,131068,196620,4294836254,65571,4294508582,655401,1310759,1769490,4784140,3211246,3145654,4390850,3866565,3276762,2293721,1114094,1245178,1835010,917524,393285,4292280411,458780,4294180854,524282,1900530,2097131,2686929,393223,4293722127,4294508580,4294377484,4294770702,327708,4294705166,589847,524306,1245208,4294115305,4294836171,589780,1638356,982992,917474,131044,1179625,524272,4294443021,4294508614,4290904177,720943,4293591054,4294705146,851948,1900530,1048564,4293394412,4292870166,4292739107,4293328898,4294246374,4294639619,4293918742,4293066757,4292083742,4289724453,4288151557,4290379759,4292673533,4293525495,4294836215,4293853181,4294705135,4294180844,4294967260,4294836245,4294574116,4294377521,1441835,655377,262135,1245181,2228199,4294115343,4292476901,4292935655,4292804610,4292345848,4293591017,4293132284,4293132297,4291690515,4289855543,4289134639,4289200136,4290576407,4291821586,4293722098,4293328894,4292870148,4293066750,4293263348,4293787645,4294901774,1441812,851967,851948,4294901755,4294836220,131047,1638375,4292280348,4291297266,4294901722,4294246384,4294180835,4293591009,4293591026,4294246419,4293066786,4291100720,4290969648,4291493918,4290379805,4292214812,4293459956,4293787638,4294770677,4294311931,4293722108,4293853169,1310712,2097147,2162684,1900533,4294443013,655337,4294180849,4294705131,4293394459,4293591028,458720,4293853165,4294574041,4294639569,4294115322,4294246428,4293853219,4292608053,4292476971,4291035156,4292673548,4292149256,4293656582,4294770691,196586,131056,131060,4294705127,1179642,1638430,2359324,3211257,65530,1310713,4293787632,262139,4292739091,589822,327652,4294180837,4294967251,196543,262133,4294770711,4293263405,4293197876,4291887124,4291821565,4294180868,4292870149,4294443015,655358,720877,786414,1114094,655338,1507342,262185,2228304,3211311,524321,262144,4293525471,131058,4293853179,1572850,655349,4293918710,4293197811,4294770670,589828,4294901774,4293460003,4293394464,4292870146,4293853167,4294377461,4293656593,4294443022,4294049802,4294115325,4294770685,1769457,1376253,1310732,720911,2097181,2424846,1310767,4294049817,4294311913,131066,4293132273,1507306,327673,4293197837,4293460001,4293459984,4293525518,262184,4294639653,4294770723,4294705171,4293787659,4294180883,4293722135,4294049805,4294639641,4293591038,4294180867,655352,458776,131118,1769497,2228225,1966052,524257,524294,1376243,917522,4293394423,1114106,196612,4293984281,42,4294377521,4293722157,262181,655404,2097185,262162,393244,25,4293984272,4294049791,4294311940,4292739088,4293459974,327699,4294115387,4293918750,131076,524273,2686975,4293263338,4294705162,655355,1310754,524302,851983,1441803,4294574107,458786,1376292,4294770733,720923,1703951,2097178,1638438,852000,786465,4294246416,4294705162,4293001225,4292476941,4294246421,4293722140,4294705191,4294049803,4293328874,4293590998,1703939,720905,589824,655356,2031656,262143,589816,1179629,4294770689,196627,589841,1179674,720926,1703972,1638445,852028,1114155,1114143,851993,589850,4292935694,4293132314,4293459991,4294115363,4293918747,4293394448,4293591022,4294442981,2621405,720889,4294705144,131077,1966114,4293853200,4293787673,2949094,1900523,2293772,1376264,1769480,1835020,1376306,983085,1572900,1835054,2031641,1179663,524286,4294770698,4294377495,4294180890,4294377489,4294180887,4293132289,4292280300,4294508530,2097142,458743,196616,196605,4294377449,4292739072,4293132317,458741,3342295,3866592,2490371,2097144,2424833,2752513,2162699,2424852,1572891,1835032,2097146,983026,4294443013,4293197844,4293197878,4293394491,4293132345,4291428407,4292476959,1179689,1966063,4294901764,4294443014,4294311928,1245173,4294836182,1310681,1179609,1834965,655328,131076,65551,458777,1114140,1310755,2293779,3014679,1966099,1310763,1376300,4293722167,4293394485,4293853249,4293001248,4291297328,4292083743,35,786454,327698,4294377472,262153,458754,4294377476,1507300,1834943,4294901714,4293918687,4294836187,4294377446,917498,393246,65560,917512,1638414,1376284,1245224,1572925,1114172,4294246443,4294508583,4293656612,4294901735,4294508521,4294770653,4292607974,196633,458772,4294311938,4294508546,4294836231,65531,4293591068,4293591062,1245180,4294443017,4294705146,917475,589831,655387,196665,4294115387,131114,524347,1703955,1835035,2162682,1245190,2949114,720890,4294574056,1310726,1966106,65546,4294901764,4294705144,262151,4294508541,589822,393208,4294311937,917491,983018,1572832,2097114,2031597,1900507,1900526,1638366,3342265,2621392,4294705162,196631,1310698,2031606,1769453,2883568,1310707,851937,327669,2686984,589830,4294574089,65543,458745},
+  {327683,4294901762,65530,1,458755,4294901768,393225,131073,589814,524280,131078,458752,4293853155,4294377449,4294901752,4294574083,327686,4294574072,458751,655366,4294901754,196602,4294508537,131070,4294967290,4294443004,524281,4294442999,262146,4294574078,65531,4294639620,4294508542,4294574059,4291821505,4292411331,4292214745,4293066710,4294049769,4293591007,4292804568,4292411344,1114127,983012,524239,4293328844,4293722073,4292870097,4292476875,4294246381,4293197798,4293066732,7,196616,524291,4294508536,262135,393215,65529,4294705149,4293853183,4293525485,4292280260,4291231662,4291690417,4293656493,4292673480,4291493816,524202,655251,1376188,983037,1179669,4293132295,4292607998,4292411395,4293525457,4293591034,4293263361,4293656540,4294115295,4294115325,524281,458749,4294574084,196605,4294508546,4293853166,4293853157,1900574,1441807,1245191,1572871,1245155,327636,196571,2293776,2883586,1441807,4294836255,1179697,4294770750,131145,262237,4294508632,4293525556,4294443029,4294180876,4294574095,4293132260,196604,4294705155,4294508545,393222,65541,4292739105,4293460003,917548,1769508,1179654,65561,4294705144,655347,786449,1900550,1769477,2228238,1966100,1966126,1441822,1310746,393241,327713,655394,4294508565,4293853186,1179679,3342389,1769507,4294639613,655363,655353,4294901760,4293787677,524294,3145769,1572882,1114142,589835,2162701,589842,655358,655345,851947,524267,1376244,2031630,1769488,1179665,4294770685,589817,720909,1310727,1835041,1310754,2293806,65555,4293001185,327677,4294705161,4293984294,4292214824,524311,2949180,196652,655402,65563,1376291,1376277,131085,458750,196603,196589,1769449,196592,2,1114109,1179645,1507347,524290,458773,524310,2293820,2687055,458812,4292345858,524283,458796,1769478,4293525549,1572905,458805,4294836257,4294508576,1376299,4294115362,262152,196613,1114121,1638385,1572841,4294574052,393170,4294967276,1245178,3145735,1572882,851983,655369,4294836254,1966136,4194398,524341,4292280322,851964,2424865,2031627,4294049814,4294639639,1114121,4293918728,327714,720937,327717,1048592,1703962,1572876,1703929,2228205,1310674,4294705115,1638378,1114096,1376252,1245204,1,4293918725,4293525510,655395,4259933,1769517,4294836214,655373,2097179,131112,4291821613,4293918736,1179654,4294836217,1114129,327706,1048581,65532,2162696,1179639,1507317,4294836202,1966075,720887,65528,917491,4294508523,4293132290,4292607996,4291887095,4292411392,4294377503,3539044,3342396,2097177,4294705148,1114141,4293984283,4290314298,4292280317,4293984231,4293853178,4294443000,4294901747,4294311942,458752,4294836220,262153,4294311973,1179673,1638423,851977,4294246408,4293459964,4291887090,4292018150,4290314227,4290379744,4290838502,4294705158,4522070,3080244,1703948,327685,1507366,4294180922,4291231805,4292739082,4294246371,4293001199,4292280302,4292673538,4293001220,4293197835,4294836243,4293328938,4292018202,4294443031,25,786472,4292280344,4291887103,4291624928,4290838489,4288479182,4289069005,4290379713,4291821515,3145803,2621490,131081,4294836218,589844,1376307,4293001247,4291559437,4292149225,4290838523,4291559448,4291100695,4291690525,4292345888,4293066798,4290838565,4292476954,4294443027,28,4293459994,4291821601,4292673540,4292870124,4291821536,4290379722,4289789887,4289658789,4290772907,1114153,2228254,4294639611,5,196638,65573,4294443017,4291231787,4289921040,4289069052,4290248712,4291559438,4292018192,4291756056,4292018225,4291887119,4294115331,1966084,4294901765,4293918750,4293722155,4293394462,4293853195,4293591030,4293197791,4291100606,4291100606,4291755972,131069,2818071,65531,524280,4294115350,4294443050,262161,4292608059,4290248730,4291624943,4292214770,4292542480,4292935711,4292870179,4291887109,4293394429,1769472,2359300,1835035,4294246430,4293787697,65582,4294377505,4294049804,4293328909,4293591036,4291756008,4292673538,131072,2424820,327676,262152,4293263370,4294311976,1507357,4294180900,4293132283,4294246389,4292673503,4293722106,4294836227,4293001201,4294442995,917490,2490368,3801114,1507370,4294705175,4294639659,393252,589857,131100,720926,4293459999,4293263387,1114129,3211234,3538904,786445,327695,4293853197,4294574079,1441834,852005,917493,4294639598,4293001187,4293263331,4293263298,4292476864,4293918652,1966059,3670005,2687006,1179681,4294770703,524322,983079,1310749,2752547,2883622,655372,393225,3276812,5242806,5832628,2162654,4294705145,4294705181,65532,1310777,2293797,1245180,720880,4294246373,4294311903,4292476853,4292149149,4292411285,4294770600,2752481,3014683,1835054,2555939,917533,1114143,524320,1966110,3407887,1048585,1310744,3080211,3145688,2883555,2949083,4293394404,4294901774,4294705166,1638461,3276839,1572870,1048579,65510,4294180834,4293590981,4291624863,4293132184,4294770601,3014640,2621476,3145795,1835059,1900573,1179673,1310760,1966107,1179651,1572872,2162721,4259839,2949072,2686978,2293811,4294377481,2162707,2555953,2424888,2555935,720907,786459,1310695,917485,1114082,4294311883,4294901689,4294246331,2097154,2359320,3342384,2293803,3407915,2949143,1835023,1048583,1114119,1310736,2686990,3735550,3866594,2883578,983073,4294705150,4294770700,2359299,3866663,2883629,1048583,1638410,1900541,3014665,1900539,327651,131036,393195,393220,4294836247,1507371,3145757,2424873,3080224,1769474,1441789,851976,262169,1966101,3080169,4980720,2228212,983062,4294639625,720890,1572842,4456456,3473432,983061,1966073,2490359,2424821,2686957,1048560,262130,4294705139,393222,65538,11,1310750,2293792,2162708,2359326,1376288,2228254,4294901770,1310706,3735511,3997656,4293525499,4294115317,524293,4294705151,1245181,2424823,4587529,1441772,2097139,2490347,1245150,1572840,786413,655350,262125,4293984258,4294377480,4294574097,1310761,983084,2293802,1900574,1376267,851966,196613,65513,1769438,2818019,4294377470,4293787644,4294770680,458760,1638439,4294311952,3407941,1441801,2752517,1048555,655325,458752,4294443007,4294508545,4294180855,4293197816,4293525525,4294705182,65562,1769506,262182,1048587,4294967282,4293853160,655304,1114041,4294967257,2162651,2621478,4294639624,131079,196605,1376292,852038,1048665,196672,1114176,131116,4294246437,458797,327709,65575,65557,4294639642,131113,4292935708,4292673563,4294049800,4294705162,1048552,1114110,4294639615,4292804551,4292542386,1834959,2752531,2359291,262136,589824,4294639613,4294508549,4294311959,4293328934,4291690537,4291362870,4291952689,4293132358,4294836302,4293460032,4294901815,655420,4293328954,4290707480,4291821608,4291035164,4291100679,4289724421,4289396732,4291100650,4293001192,4292542468,4293984268,4294574108,1834999,2359302,458746,4294442999,4294836233,65537,4293591033,4293525484,4292280349,4292673514,4293066745,4292476938,4292149254,4291297282,4292280300,4289921010,4290379773,4289986554,4291297303,4291559434,4290117637,4287758342,4289134611,4290183180,4291035124,4291100677,4293132280,458755,393219,4294901757,131064,393223,4294705144,8,4294574085,4294639613,4294901781,19,4294770728,65575,458771,1245208,1769502,1638440,1114151,4294049759,458726,2359314,4293525530,4293722106,4293591038,4292673540,4292345865,4293263384,458795,655364,327670,4294443005,262145},
+  {4294574073,4294311935,4294705147,4294508537,4294770680,458760,327671,4294770679,4294377467,4294770693,393218,4294443012,1114116,1114125,262145,4294901771,458754,196601,4294311938,4294770679,4294639619,2,327686,4294705160,4294508546,4294901752,458749,4294836225,589821,458759,589817,589834,458742,786426,3080190,2818043,2818051,1638404,851969,327678,1114130,720910,4294508529,196586,1835001,2818056,1507347,1638424,2424858,851989,1703944,720898,589826,65540,4294377468,327674,393221,4294574074,262150,196599,65532,1179648,2359295,3932174,4128819,4390982,3342394,2228283,65556,655402,458782,4294180873,327699,917531,720910,2424865,1703985,1114157,327723,2031632,327687,327680,65527,4294443013,4294377469,4294836217,4294377469,4294443017,851991,4293459985,4293525527,327721,2097212,4063289,3473450,1966119,4294836238,1179681,1638408,983033,327699,1441804,458759,1179676,917539,852004,262165,4294311931,2686984,4294836247,131078,65538,524283,4294443015,4294705154,4293459939,4292476926,4292083755,4294901788,786469,4293918739,131102,262165,1900556,65545,262140,262143,655323,786409,1638380,786423,65538,262158,786441,1114109,196619,4294770642,720858,1048589,196601,655368,4294377465,4293656556,4294180851,4294705196,4294049833,34,196629,2228260,32,2752534,1703922,851956,1441764,524276,1179648,1638381,1834984,1834969,2359272,2359291,1310711,2359296,1900579,458769,4294311942,196634,4293197805,4294508549,393225,2555866,4293591018,4294574118,1638454,786482,3145772,1376283,1441809,1966080,2818027,3145708,1900500,2686934,3473366,3145674,3276750,2097090,2490308,2097106,1310699,1048589,4294836268,1376299,1114132,2490375,196639,458750,393236,3211271,4292673514,4294639683,327755,2097198,1245222,1179661,1966075,2359280,2031600,2097112,3473377,3932127,3407814,3276752,3342287,1966024,982970,2752467,786420,4294836220,4293132299,65558,720889,131087,327697,131081,196633,720921,4290773013,4292018228,1507389,131098,4294049825,4294246399,524300,851952,1179623,1114072,1769437,2424791,2686930,1114076,2293730,720838,1638357,589792,131062,4293132294,4293918716,4294180846,4294836207,4293918717,4294639602,4294574084,4294901777,4294311931,4291100687,4292149263,4294705182,4293722110,4293853175,4293394415,4294311907,4294967279,4294770648,65499,4294836178,4294770635,4294901735,4294377467,589812,1638346,917472,4294443000,4292214782,4291624952,4293197805,4294377420,655315,4294770680,393244,4294967295,4294705158,917477,4292542449,4292214782,4294574032,4294180814,458721,393170,4294508506,4294639573,4294508500,4294442979,4293394396,4291887066,4292149254,4293001235,4294443011,4294836198,4294049766,4294311918,4292411376,4291493863,4292149220,4293394406,4294311864,4294180832,1572879,4294770680,4293787652,4293656583,4291166246,4291952653,4294508499,982984,458715,196580,4294180830,4293066741,4294639598,4292739075,4290969576,4290314230,4290838541,4293132311,4293328903,4292018153,4293132273,4292542456,4293263371,4291297293,4292083716,4291624930,4291559362,4294442939,1441791,458745,4293787675,4292673563,4294180901,4293263340,4294311866,131024,720872,262149,4293656570,4294377478,4294115356,4292739112,4291559445,4290838533,4291624977,4293001255,4293001220,4292739059,4293787639,4294443004,4293918736,4293591050,4292607988,4293394474,4291035146,4293132248,4294901755,4294574088,4293918732,4293722123,393241,4294377447,720861,393191,2424854,1572881,983049,1572894,262206,4293263419,4292542472,4292739078,4291690530,4292280348,4293197835,4294705156,4294901766,65565,524322,4294443023,4294311964,45,4293525543,4294770705,262145,196604,4293787656,4294574096,524320,131081,2359309,3211291,3276833,1835035,196639,2031649,4294639679,4294049849,4293722124,4292673557,4291625006,4292608051,4294377509,327706,1310755,786480,131111,1572912,1245230,786475,4294901847,4294311937,4294901754,4294770680,4293525492,4293001256,4294377520,1048579,3735606,3276847,2621480,1310754,851995,2424862,1114144,4294180898,4294049811,4291821604,4291887147,4292739127,917555,2097177,2031660,2818086,852007,917551,1441849,1310749,196706,196626,131091,4294574089,4293263358,4294246419,4294442999,1769476,2818097,1048632,4294574140,4294770731,1376274,1572876,1441812,4294115354,4293591080,4292280355,4292608054,4293656640,1900602,3080244,2687041,2293817,2097211,1966119,589865,131094,1507411,2752562,1507366,262140,4293853169,4294901771,65511,196610,1179681,786479,4293853228,4294639638,131088,524286,4294180857,4294115355,4292673584,4293197881,4293918768,1900596,2687019,3211314,1310755,1048613,1441826,1179678,1114139,524332,1441872,2621477,2752541,196581,4293066746,4294115329,1376254,1769501,917543,786435,720896,4294115335,4293656561,4294508527,262152,4293394477,4292935726,4294246438,983078,3080228,2424866,2097191,1507358,1114143,65541,4294770714,32,393257,4294770728,327708,4292870143,262139,4294180866,2162651,1245184,3407909,2031654,327684,720883,1310698,4294377451,720873,1310714,786455,4294639628,589841,1507365,1769491,983055,262158,393207,327679,4294901766,524286,4294901758,4294901748,4293197833,786460,4292083702,65544,5,2359278,2293766,3932180,3145739,458733,262115,983006,4294705133,393195,2097139,524294,983044,1507347,1769497,2097168,131068,4294508546,4294770684,4294705132,262135,1179621,196578,4292804584,4293066765,2490383,1114108,4294639616,4294443005,3473400,1507330,2883574,2686961,4294967253,4294639600,327665,1310718,1376248,2228231,2162700,1900558,1638405,524288,1245175,655362,4294705133,393200,917482,458741,589788,262087,4294115284,4293394441,2555922,262135,4294639608,655358,2883588,1441811,851960,1638349,524219,1834994,2097149,2752519,1966087,2162703,1900550,2293747,720859,1376230,1179609,4294574045,196561,1179605,851934,1703924,982998,1376201,4294115277,4293722088,2293776,4294508543,4294574087,196615,4292149232,1835003,1048559,2359252,2162620,2097104,1834997,2686956,2293743,2031613,1703918,1245166,1769448,1310685,1114063,4294705099,4294705099,4293853141,786410,1834994,3997653,2621389,786394,2555888,4294115348,196615,65527,4294705154,4291887099,1376240,3276788,3276795,1638368,4294705116,4294901725,4294901734,983015,1376239,1179636,458745,1114091,262115,4294901750,4294442978,4293591006,4293918663,1114086,3211238,4390867,5439424,4063245,2359345,1703960,4294443005,4294967289,4294705150,262136,786440,1966060,1245165,131041,4294246361,4293066711,4294967248,4294836186,720850,4294508512,4293984232,4293853151,131050,851914,1834960,458680,720810,720834,4294311901,65514,2359298,2686965,1376295,2031653,65541,524285,4294377466,4294639614,458745,1376238,4294049767,131026,589773,4294901728,4294901700,1114037,982964,1310626,1179567,1703839,3276732,3211198,2621364,2883528,1900485,1179588,393160,65481,458704,393210,4294443007,4294639615,4294443007,131071,196603,4294705142,3,4294311939,4293197822,4294443035,4293525528,4293722138,65537,4294770686,131079,4294180874,4293722094,1703862,982999,4294836226,4293132280,4294442974,4294377440,4294311940,4293066763,4293918712,4292673537,524298,589820,589815,589814},
+  {4294901758,4294574086,327685,262142,2,458755,4294705146,262152,327686,131079,4294639619,4294705156,4293197840,4293459980,196597,196607,589818,4294836232,458752,196605,524279,524287,4294901758,4294574070,4294967295,4294574079,65527,131072,4294442999,4294639608,65541,4294508554,327680,4292804627,4291624966,4291493897,4291690518,4293197832,131082,4293132295,4292476934,4293066766,4292935660,4290772961,4291624909,4291756021,4293525530,4292476964,4292608027,4294180881,4293787668,4293525520,65544,4294508548,524280,262149,458742,4294574085,327679,4294836222,458756,4293787661,4291493897,4290379801,4290641961,4291100709,4291231786,4290117668,4291297297,4290183174,4289200141,4290707448,4291166206,4292280345,4290707475,4292608039,4294246419,4293984292,458799,4292804622,4292739085,851969,4294705146,327683,65544,262144,4294443015,524310,1048580,4293984267,4291362829,4291035159,4290904077,4291166214,4289265662,4288610321,4290117626,4288020477,4287561728,4287627259,4289396725,4290707445,4290576393,4291100699,4291362853,4294115363,4294836227,4293853186,4294508552,196626,4294574076,196617,4294639616,4294311935,4294639626,1048599,327710,4294836227,4293001228,4293394421,4294246368,262123,4294770671,4293984219,4293197794,4292345820,4291428318,4290576357,4291362821,4291756040,4293001196,4293394431,4294180876,655369,1966101,2359294,786384,4293853158,983065,393208,4294836226,327671,589820,4294967257,4293459983,196617,4293984249,458715,393178,1310713,65539,655347,4294180838,4292804578,4291887092,4294180860,4293001189,4292607998,4293591039,4292673547,4292870163,786444,1245217,1966118,1835026,4293459974,4292673545,4294180843,196600,65533,4292739075,4293984219,4294443023,851998,589823,1376236,1769452,393222,131052,589824,4293918702,4292870132,4292280313,4293656573,4294639608,327670,4294901750,4293656552,4294770683,720893,458761,524335,4294246445,4291690518,4293263380,4293853187,1114102,786420,65516,1966045,1769480,720911,1507331,1572831,4294836206,4294705134,1114111,1179642,4293853167,4294049784,4293459973,4294115327,4294574080,1507338,262122,4294639588,4294770674,4294508541,4293066745,4293197838,4293328938,4292476961,4294115356,4294049816,458747,1900522,2097130,458693,786420,786417,524266,4294836171,851940,4294705135,1048569,4294442995,4294180865,393213,4294180861,196585,4294705131,589795,4294639565,4294049756,4293984228,4293394423,4293525487,4292804578,4291952617,4292673548,4294901751,4293132257,196598,1310701,65492,589767,1179613,393188,4294246360,4294705102,327641,4294639598,4294967291,524306,65561,720898,4294836204,1048555,1376220,1507275,1179605,4294967271,4293853149,4293459919,4292345812,4291100607,4291493849,4291231732,4292739043,327682,524281,1507311,131013,1179576,65484,982994,4294574042,4293918704,4294770669,4294836233,458762,1114147,196641,4294443001,131032,4653033,4325348,3145714,851935,4294705123,4294115283,4293394375,4291952582,4290445243,4290445254,4290314196,4292411337,4293722119,720904,983029,1114066,2031558,4294705112,4294311893,65516,983039,21,786436,1835039,1179677,917535,4294246385,1900498,5308397,4980760,3735555,2818020,524269,851944,262112,4294115302,4290772947,4289331128,4289986489,4292149191,4294115317,589822,1114090,851938,2424795,720877,4294574043,4294901770,2228252,2490388,1245210,1835051,1245230,196635,4294049787,3407832,3866634,4390939,3080220,1966078,983032,1966064,917486,458740,4290838511,4291100656,4291952589,4291559374,4294049774,262135,1310711,2490334,1834985,2621435,327692,262164,983077,1703953,1048606,2031649,65577,4294311955,4294508518,3276769,3342351,3014686,3866660,2359325,1441783,2228219,2097163,4294377471,4291100656,4291100653,4293394395,4294639602,196605,4294901770,786446,1507333,2490386,3145755,2097204,524328,917537,524316,262172,4294836257,4294311966,4293066755,720860,2752475,2686986,2818094,3342384,2293805,3538961,2097179,458781,4294705182,4292607995,4291559412,786416,4294377449,4294508549,720897,1179671,327702,1310716,1441783,4294311953,1048605,917531,589865,4293918743,4294508585,4294049825,4294049812,196587,2031595,2424847,3473456,2752567,2359329,3211296,1245209,1114129,4294836250,4292935683,4289724388,4293066713,4292411341,851985,524285,4294836224,4293525484,4294574053,4294508483,4293787620,589855,983075,1703977,4294770726,4294246439,131130,196615,393196,3276810,2621482,1769515,1900596,983091,1179674,196631,4293263360,4292542470,4290838503,4289658840,4289658825,4291231674,4293787625,4294836215,458724,4293591021,4292804583,4293590976,4292870104,4292345856,4294180887,4293853216,4293984307,4293853221,4294639643,4294311941,1376251,3276839,3014713,1769530,589882,4294443054,4294311965,4293001234,4291428350,4290969596,4291821555,4292018156,4292542436,4293722064,4292804592,1114123,4294574068,4294574060,4293328883,4293001175,4290379729,4290117594,4290379783,4292345877,4292542506,4292280345,4293459982,4294508553,917510,1114147,720952,589885,4293394464,4292214816,4292083728,4293132302,4291035126,4289134564,4289069032,4290969565,4292542427,720861,1048578,4294770684,589819,65497,4293525491,4291493878,4290904041,4290772940,4291493842,4291035106,4291035116,4292476923,4292542483,4292411402,4294377490,262193,4294639661,720939,4293328907,4291297265,4291100669,4291428358,4291100671,4289855462,4289134539,4290052068,4293001181,4293984219,1769486,4294377468,851954,4294442988,4292476902,4292083691,4291362790,4292214743,4291755963,4290314166,4291821516,4293394401,4292345866,4292804624,4293132288,4293722142,4293918756,262178,4293394442,4292542477,4291166206,4290641905,4291821558,4292345843,4291493839,4293787613,786414,4294574076,4293984265,327685,65523,4294377442,4293394404,4293066750,4293722109,4293328835,4292870089,4294311908,4294836198,4294639587,4293459970,4292739079,4293066763,4293525507,4293853182,4293197829,4294246399,4293066761,4292411392,4291624963,4292804596,4293853161,4292214732,4294574049,983022,4292083680,327672,4294639610,4294901751,4292870133,4294311910,4294246399,262122,393161,262108,1179642,1114107,4294574078,4292607978,4292739051,4292870123,4293722085,4293918699,4294836203,262127,65513,4293918707,4292804611,4293066750,4292739045,4294180866,1179649,1572832,4291952609,65529,4294705155,4294901751,4291952593,4293525498,4294377461,1441782,1900532,2949126,1376264,393231,4294443030,4293853176,4293787645,4292935657,4293263337,4294508524,393176,851940,65526,4294836196,4294311955,4293591063,4294508556,4294901780,4294967294,4292542428,4293328862,196603,4294901766,393219,4292607956,4294770694,65514,3342349,2228212,1507316,720887,4294443018,655388,4293722120,4293001195,4292280289,4293459937,4293853153,4293066743,4293984237,4293853182,4294115314,4293853180,852002,786492,1179699,4294705152,4293197815,4293722099,458755,393214,524283,4294574075,1114087,3801061,2097128,131059,655328,65523,327677,1376265,1179660,786429,262130,4294770683,4293722109,4293066723,4294180843,4294639628,4293853137,196598,2883593,4915241,3539001,2883633,4292935656,4293656550,131066,4294508547,4294901751,589832,1114118,1572891,589820,1048583,1572870,3080202,2949126,1376260,4294770657,4294377457,4294442988,4294836202,262138,393178,1703921,1114106,262122,196588,3604458,1769460,851960,4294770680,589822,589820,4294574075,4294770697,196608,196609,589822,4294705144,131061,720874,2228191,720877,917483,393198,589798,1900523,1703911,1245168,1638377,1507318,1310677,2949098,2031590,1638402,3276767,1834980,1834985,4294443006,4294574081,4294770697,4294770695},
+  {131070,524296,327682,524288,589816,4294443008,4294574086,393218,589816,4294574072,4294836218,4294508537,4294115305,4294049780,65544,589819,4294508541,196613,393212,4294901760,131081,131069,589831,4294836227,4294836216,131065,458745,4294443013,524296,4294770686,589829,65535,589831,4293853168,4291362762,4291231682,4291624909,4293066715,4294442991,4294311924,4293328865,4293263340,262092,4294377404,4294574042,4292149201,4292935661,4292476889,4291952595,4294049767,4293591007,4292935662,4294508535,524288,4294377477,65529,65540,196615,196608,1,4294246403,4293525474,4291428301,4290314164,4290379709,4291624890,4292345784,4292149185,65479,524232,4294508498,65516,4294180844,4292935662,4293853158,4292935626,4294115313,4293722095,4294377463,4292476899,4293984243,6,4294508545,4294377478,458743,4294901755,4294639619,4294442994,131050,4293263340,4293525475,4294967266,4294967267,262077,4294836126,4294573987,4294705068,65438,4293394347,4293197766,4293001185,4293197797,4291821555,4291559426,4291428347,4293918708,4294180850,4294836206,4291428320,65522,4294836216,262143,4294639617,4294311943,393215,4293656550,4293066718,4294311891,4294508511,4294901738,131037,1310682,1114031,655309,1966046,1507278,786386,4294639561,1048536,393179,720866,1048552,1114084,1114075,589786,1245173,4294770698,4293525546,393235,4294377479,131069,4294574087,524271,4294180835,1179597,1310700,0,4294442992,4294705135,327681,262144,524290,1179648,1114091,2031589,1966046,1638369,1834988,1310687,1048531,1179607,1638365,1572846,1114107,196618,983070,262160,2031632,589826,4294836223,4292804612,4294049744,393183,4294377472,4294311926,4294115344,4293918728,4293853194,4293722107,4294508538,4293787653,4294508525,4294311928,524285,4294246416,4294639642,851976,393203,1245160,983045,1966093,2228240,4293394463,4293722167,4293001206,655342,4294770693,4293263347,4294836245,4294442985,4294901705,262119,4293591046,4294311949,4294246433,4293525525,4293787656,4294049802,4292935689,4293984270,4293197821,4293263372,4293001254,4294311975,589862,1769502,786445,2293771,2031632,1769511,4294901825,4293656644,9,4294311911,4294574089,4292411386,4294246408,1900519,589774,327668,24,4294770733,4293722152,4293328931,4294770699,4294377476,4294639602,4294377465,4293853168,4293591055,4294836247,4294901786,2031649,2490414,1900587,2293780,1966113,917570,4293787735,4294180964,524350,1966110,4294574086,4293197823,4291952619,4294574067,4293066730,4294377494,4294770720,4294574109,4294705191,851994,1114133,589846,262153,4293853170,4293984217,4294574054,1900544,2293793,2031636,2097193,1900563,917530,786456,196663,4292280396,4290904174,4293001304,4292345864,4294901761,4293984242,4291362793,4291952629,4294246403,4293853213,4294836272,4293787672,4294705202,4294901800,196648,4294508585,786448,4293984235,4293787612,4294967275,1310727,2228244,655373,2293790,786430,786445,131090,4294574112,4292870207,4289855554,4293132356,4291952642,4294377493,4293263355,4292542456,4293656569,524316,1245230,4294377514,4294049840,4294639663,720962,1310781,524333,655396,4293787641,655337,1900535,131103,393247,4294574084,1769476,1310712,1310715,720894,4294311926,4294705175,4294901836,655429,4294115342,4294311945,4293656570,4292280313,4294705171,131102,327707,4293394470,4293984294,4293918777,4294639670,4294115388,49,655379,1572861,3604464,2424834,983070,4294508552,786425,2031635,1376270,1572880,196598,4294311896,1703902,1900591,983086,65535,4294705162,4293918719,4292607983,983057,4292411413,4293001214,4293263374,65583,1245216,4294574107,4293460011,4294443060,262172,3211273,2424809,2228229,1245191,1245201,1245203,1769504,1179670,655373,393213,4294574041,4294377422,2949147,2228252,262151,524288,4294639616,8,1769486,4294115366,4292935662,4293787658,1245199,4294836234,4293984276,4293525519,589857,3211302,3080200,2359286,2818059,2883606,2097188,655377,458777,4293918723,4292804604,4291624966,4291624928,4293001183,7,1507308,4294770684,4293787654,4293787640,851983,3407902,4294508563,4293853165,524299,262128,524290,786441,4294443002,1114109,1835024,2752514,2949120,3801106,3407899,983087,4294049802,4293722116,4291428321,4290576362,4292149236,4292411369,655349,2621456,3014648,458763,4294377471,4293656560,4294770690,196601,4293328866,589787,327681,1310718,1572877,2228219,1966073,393211,1835020,2949141,2883599,2424858,3342384,1048610,4294574085,4293394401,4292214776,4292149229,4292149226,4294246395,786422,2097119,4194282,2424799,262148,4293328870,4294967289,4292214744,4294377439,4294836190,131076,1441809,2949128,3538951,2752510,1966090,2228249,3080216,3407907,1966103,983068,196622,4293656578,4292935655,4293132282,4293918709,4294049778,4293066751,262161,1507303,458744,2097140,327692,4294180843,4293263345,4292935644,4294705096,393178,327702,1769478,1507316,2883558,1703917,1376255,2752524,2555920,1441820,1048598,393223,4294574069,4293525478,4292935655,131051,4294770667,983006,589800,786441,2359274,524318,1114099,4294705145,4293918728,4291166161,4294049742,655315,851932,524271,1769452,524247,1834964,851927,720870,1376250,1441784,4294508517,131052,4294639600,4294115319,327653,327658,851940,1114080,1179608,786436,4294705160,3145699,2097176,131047,4294639618,4294574077,1114092,4294639568,4294246341,4294049735,1769436,2031593,393161,327629,4293853125,4293525459,65500,4293918679,4293853149,4294115277,4294967266,4294836198,1441764,1572848,917483,1900523,4294770686,393228,2097165,4063205,1310713,4293656573,393222,4294770684,1834989,1179599,4293984205,262090,2555884,2031600,131028,1114073,4294901706,4293787599,4293328877,4293722090,4293918697,4294049762,4294836192,1441774,917470,2097141,1048593,1638423,1179656,1245218,1310724,3014637,4292935648,262143,131066,524287,786419,2424797,196561,4294639567,1572830,2424821,1507320,1048553,1179629,4294508551,16,4294115334,4293328892,4293853174,4293787656,851970,2686980,2359295,1638430,2228255,2228253,262194,393243,1114088,4294311898,131070,458746,4294639612,4293787622,4294770646,4292607958,4293459931,4294836177,655343,1310734,4294901738,4294377461,4294770687,4294836240,4294574107,4294049806,458763,917525,1703945,2097158,3080201,2555935,2621507,1835064,2752564,917507,4294377451,4294770657,4294901767,4294836226,4294705143,4294246364,4291231701,4289527757,4289593316,4292345822,4292870123,4293263370,4293591054,4293197857,4293918749,4293853186,4294574086,4294311946,458761,1441811,917539,3473447,2228267,720943,655416,2097203,983082,1572868,2162664,1048555,524287,655358,4294574083,6,4292673561,4290314241,4290379758,4293132249,4291297258,4291690477,4291297274,4292804631,4291297291,4292739075,4293001227,4294180881,4294377497,4292608023,4292608024,4293656612,4291821558,4292607993,4293459998,196643,983094,4294049826,1179612,1179614,196609,4294639607,4294705155,524281,1376264,65559,4294574086,4294705161,4294574092,4293918746,4293591065,4292935696,4293591067,262152,4294639635,4292870169,4290969623,4290248717,4291166219,4290510860,4289331185,4291821551,4292083709,4291952640,4293984264,65530,4294901762,4294377479,4294836217,4294377467,262150,4294508543,327676,4293197821,4293853185,4294443017,4293394422,4293328892,4293787658,4294246414,4293591040,4293132292,4292214789,4292935689,4293591046,4294246402,4292411387,4293525505,4293066756,4293722132,4292411378,4293001210,4292935678,131081,4294770688,4294311933,393214},
+  {262142,4294377466,589821,4294705148,4294705153,3,4294377478,4294770684,393220,458762,393217,4294770687,4294508531,4294115300,786430,4294574071,4294639623,4294770682,327674,65533,4294377474,131067,4294901753,4294770696,4294705155,589823,4294770694,4294639622,4294836227,4294311934,655358,4294508548,4294901765,4293328873,4292018132,4291362776,4291755981,4292673499,4294574071,4294246386,4293394408,4293787634,4292411366,4292607952,983005,4294246351,4292870135,4292083703,4292018142,4293787624,4293001187,4294049758,262149,262148,4294705155,1,4294508545,4294508552,65537,65531,65531,4293263347,4292018144,4291887042,4290576308,4291755976,4291362782,4292345830,4292345801,4293459897,4291231674,4291428301,4292739020,4292870095,4292149187,4292411363,4294901750,4294246391,4293328872,4293263333,4293722099,4294836232,4294836229,393206,4294639614,4294574084,4294574083,4294180871,4294180836,4292214818,4292608015,4293328890,4293722091,4294246394,4294639594,4292804596,4292214778,4291821554,4291624948,4291624942,4292542466,4292476925,4291428316,4289265609,4290969580,4293722098,4294705123,65509,4291690517,4294770684,524297,4294508552,589815,4294443008,4294377465,4293525525,4293001241,4292542509,4293459980,196611,4294180883,1114143,4294311942,524298,917512,983021,65518,4294311916,196589,196593,65522,4294508519,4294836201,4293722081,131038,655316,1179659,4293787648,458762,65529,131066,4294377466,4294901771,4293263382,4293918724,4294377492,262138,4294115348,393232,4294836236,12,2883607,2818075,3801109,3211262,3145706,3276785,4128759,2752498,1900515,851928,131027,4294639534,4294180780,4294574035,589825,4294377488,1245210,65535,393209,4292214801,4293591081,4294377477,4294508545,4293001218,4293984262,4294836245,4294639636,30,1310751,1900575,2228270,2359344,2359333,2555954,2883630,2293768,1835013,786423,65520,524249,4294901698,4292673477,4292870130,4291624964,4294705171,4294246403,4292870165,4294311916,4292018225,4292673563,4294180867,4293722132,4294115343,4294115352,4294115368,983060,983070,4294901812,2097199,1572916,3080264,2621496,2752563,1638418,1179661,589827,851948,1376257,262130,4294115290,4293722090,4293591040,4293591054,327683,4292476937,4293591035,4293984301,4292083737,4294901761,720910,4293984284,4293525538,4294705177,917532,4294836244,327713,1245226,458794,1441846,1900591,2752530,2621450,2359312,2031637,1835011,1376259,2031603,131062,4293984236,4294639611,4294836246,4294574087,4293394447,4292214807,4292345910,4291231779,4293853208,851994,4294639650,4293918757,262163,1114129,720902,1376278,851987,4294443051,4293853209,4294836254,2424854,3604485,3801083,1835028,2162712,1769492,2031626,4293984239,4291362805,4291231767,4292673564,4294836229,4293591044,4292935710,4291231812,4292870170,4294508580,655394,720911,851980,655365,655354,1376247,1179630,4292542469,4291035138,4291559430,4293591065,524300,1638422,2424851,1048601,1441826,1114139,1245214,4293132277,4288806888,4292280348,4292804614,196606,4293656580,4291952673,4291625011,4293591061,786460,524308,1638420,1310716,720898,655354,917496,655354,4293722134,4292018209,4292280351,4292804625,65571,4294246428,1966099,2555945,2686996,2490381,1769494,1245192,4291887129,65545,4294049786,4294901755,4292542494,4292214803,4292673577,4292870190,1572900,917517,524273,1114099,655353,2228219,1376243,1114117,4294311944,4293132302,4292280353,4294311975,4294639662,4294705180,2621472,3342373,3211268,3211284,3014667,3932130,458800,4294901779,14,131080,4293328899,4291756063,4294639651,4292280364,4294705161,655352,1900509,1638370,2031600,2031615,2293756,2752523,524320,4293263383,43,1048628,1245207,1835034,3276818,2752523,2555926,3014661,3276775,1900517,1966100,1834996,4294639613,4294508535,11,4293722121,1114128,4293918737,4294049773,1376221,2359256,1179624,720868,1310702,3145714,3997694,2359314,4294508571,131112,1310763,2490395,786476,1507347,524296,917529,327687,4294115310,4293263331,4294311959,1572892,4294377463,4293722113,4294246423,458735,851963,589816,1310679,917451,1966043,1703894,2097130,1834996,1245188,2228243,655379,4294508545,262173,3080226,1638430,524324,65554,4293591043,4291887128,4294115354,4293722119,327684,131091,2031663,1179636,4294443011,4293787668,4294836234,4294049819,4293591070,1834967,2097128,3211221,2686930,2555872,2818027,3080178,1310744,851966,524267,1769491,4390947,2555933,262167,4294770695,4294311926,4293918717,4294246395,327677,589822,4294508541,1441815,2752469,4294705146,4293132307,4294639626,4292083739,4294574111,393190,1966052,2490352,3604445,5177305,4718561,3407858,2359283,983028,851933,1769485,3014686,1900568,262161,4294180876,196591,4294705148,1376244,4294901759,196593,4293328861,4294639635,3538898,327689,4293918737,4291952658,4292214809,131086,1638403,2818056,3538917,3801079,4063209,4653017,2424798,1572826,4294574037,4294705127,917511,1179652,917514,196614,524284,720887,1310715,458747,4294508532,1179622,262105,524304,4293263313,4294639617,4293984253,4290445299,4292411418,393214,2162697,3211274,3342320,2883589,2293740,1966046,458707,786388,4294639571,4294115309,196595,851957,65534,262147,917500,1245169,1900529,65525,4293853168,4293525476,4293984220,2031593,4293001173,4294836217,4294311945,589805,4293459976,4294574082,983065,2228255,2162701,524280,524273,4293853154,4293459920,4294311896,4294639598,4293722106,4294246388,4293066734,4293918706,4294377465,917500,327667,196592,4294115310,4294967293,4294442979,4293918647,1572826,4294508524,4294836217,131079,2228211,4294115323,4293001210,327675,1376254,1900532,4294967291,786415,4293722079,4293722084,65509,4294180851,4294574071,4294836219,4293263353,4294574075,4293722088,4294639603,1245166,589782,2228226,1966085,1114092,4293984197,1900496,65533,4294574071,327688,1245179,65534,4293132256,4294967264,983021,327676,917499,1900542,1769470,1441801,2555917,2097154,1114127,4293918726,4294311934,4294770664,4294574046,589797,2293722,2097135,3342323,4718595,2752536,4294246398,327650,4294443003,4294377482,589818,4292018204,4293918757,4290183191,4293328902,4292280303,4294311954,851970,1310725,1572889,2490370,2490369,1835027,786453,4294770696,4294770688,393206,1638379,1048573,3932149,4587521,6160390,5767176,3473463,1441795,4293197841,131068,4294770694,4294705146,4293001244,4290773042,4289396788,4290773052,4290904122,4292280367,4294180920,4293656604,4294246432,458775,655382,4293853214,4294836258,655375,983068,786445,2359284,1835017,2031619,2228234,5439516,5767217,1835000,4294639574,4293394397,4294705156,4294705150,4294836229,524280,4292411426,4291690557,4291362896,4292083796,4292018272,4291362904,4291690577,4292739143,4292673596,4292214849,4292673605,4294115377,4292804642,4293394469,4293984300,4294574120,4293001282,4294377540,589871,1441833,2031613,2818069,4293459943,4293591016,4294705154,4294836217,327688,393212,1048592,1245194,4292673568,458810,262201,4293066798,4293918780,4293918797,4294574130,720951,4294246442,4294639672,4293263400,4292870202,4292542510,4293197867,4292018208,4293787705,4294115384,4293853231,4294115359,4294836216,4294377472,4294705149,458761,131076,4294442998,4294836217,4294508540,4294574073,4294049795,4293525503,4293328901,4292476942,4293525509,4293591058,4293001225,4292149254,4291952666,60,4294311980,4293263384,4293197841,4294705200,4293525548,4293853212,4292476969,4293460007,4292411401,262135,5,327686,262138},
+  {131069,4294836217,4294377476,196599,458743,4294639616,4294639607,4294508535,393218,4294901759,4294836220,589822,589834,196614,131070,4294377482,131063,4294574078,4294639609,4294639617,4294377465,524281,4294836220,4294443004,131077,6,65538,4294967291,4294901758,458760,327685,4294574085,327689,4294574108,327727,458806,4294377514,524294,4294967289,4294443041,37,393242,327688,196638,65608,524344,4294770716,4294574125,4294574119,4294705164,458763,655365,524289,65540,4294443016,131068,4294639622,4294770685,589834,4294377470,4294639609,524315,4294508610,393278,327722,524305,4294574116,589866,196653,720962,720954,4294836263,393258,4294836254,65564,589847,4294377503,65557,393213,131107,4294508572,4294901760,524286,4294377467,65531,393208,4294443015,262161,393251,655365,4294639635,4294508566,196640,327741,4294836279,524348,4294639656,65595,4294443064,458797,524347,655427,4294639640,4294967287,65524,393184,4294442965,458726,4294770675,4294836251,4294836228,327673,4294377479,65535,65536,196626,196624,4294705167,4294770697,458781,4294311976,4294836277,4294574121,393248,589851,4294574104,327710,196632,131103,262176,65563,4294377477,4294377457,262120,4294442972,4294639573,4294770647,65520,4294901752,327672,4294508535,4294770685,393215,4294705183,4294705187,65544,4294311914,4294705167,196646,4294443020,4294770714,4294639630,4294901775,4294246441,131115,23,4294836244,4294639627,4294180882,4294901768,458733,4294639587,262105,262104,65502,4294508506,4294442968,327678,4294639619,4294705159,4294639619,131118,589843,458756,4294901745,4294770701,4294639646,393243,4294246424,4294574103,4294574103,4294508580,4294180904,4294311981,4294639673,196635,31,131097,458763,4294246412,4294901750,4294901731,4294311891,130989,655315,4294836212,458763,65579,589841,131131,4294901811,262178,4294901766,131092,4294180888,4294180879,28,4294377497,65568,4294508574,4294311968,393263,131122,4294770727,4294901795,4294639635,4294574097,8,327665,4294508501,4294705104,327620,4294442974,327649,65546,327718,4294705183,4294377517,4294705212,393250,524307,4294770689,4294508548,262162,20,458768,4294639627,9,4294770724,196660,4294901819,4294639662,4294180905,4294508577,4294836237,4294574077,131066,131041,65458,4294770616,393168,524277,4294770697,65572,720925,4294770733,4294574119,196616,4294901751,4294770659,196581,393199,4294442976,4294836185,4294180829,4294442991,196639,327723,4294836290,262198,65590,4294639660,4294377506,65546,196612,131048,4294836157,4294770598,196554,4294508536,4294705148,4294901777,524348,524333,65531,458730,4294770661,4294705111,4294967244,393154,4294377392,4294901689,65459,4294639581,327663,4294836244,4294180918,196661,4294443055,393249,4294639671,327721,458765,131057,131009,393118,4294639557,393201,327686,655389,720951,65568,4294442987,458704,393161,4294442955,4294508486,393160,4294639559,4294901699,4294901698,393147,4294770636,4294508512,4294770695,393250,262171,131101,262186,131111,196627,262133,4294442946,4294180753,327620,327654,4294836215,196617,38,458758,4294574038,65478,4294836135,4294705080,4294967249,4294836176,4294967260,131017,524237,4294639546,4294770620,4294770626,4294574053,4294836225,4294901772,327679,4294377485,393216,4294311949,4294967291,4294639607,4294639559,4294770639,4294901749,4294770695,4294901772,327724,524286,4294574038,196552,4294246334,4294246342,4294574044,196598,4294443009,4294377439,196555,4294574026,131036,4294508491,458732,4294574073,196627,4294967291,4294574075,4294246404,458747,327674,4294836248,589808,4294639601,262137,458743,4294508545,4294836235,4294967266,65482,327666,4294246397,458745,458756,4294574082,4294639602,4294508519,393178,262116,4294442979,4294901743,4294639599,4294508535,393234,4294705161,524291,327686,4294639603,4294770701,4294901793,4294574093,4294705189,4294574084,4294639630,262144,262141,4294967263,4294311937,4294901794,4294705178,4294705163,4294377471,4294180857,4294508551,4294377468,4294508530,4294967266,4294639586,131066,4294508536,5,393238,4294901767,4294311939,4294180877,4294508537,458746,4294311950,196624,4294901827,524288,4294377477,4294377489,4294639659,131073,4294639660,4294508596,196631,2,327665,4294508523,4294246405,393199,4294705135,4294967272,4294377441,4294705148,4294705161,4294508567,4294574108,262167,4294246393,196598,262152,4294574081,4294967287,50,327727,65542,4294377482,524309,655389,4294705160,57,4294770741,262149,131059,4294770672,196582,327654,393172,4294508512,4294246375,131051,4294836219,4294180876,4294836246,21,4294901764,4294180851,4294770669,327687,393204,4294901750,4294574114,4294770715,4294901772,458747,4294836238,393244,131077,4294508602,4294574123,131070,4294180862,4294705148,4294442991,196604,65526,4294377474,4294901740,4294508538,196624,458777,4294901781,4294246403,262132,4294574048,131050,4294705146,4294705140,4294246394,4294377491,196640,4294836205,327689,4294770707,4294377474,458785,4294901796,131107,4294705158,4294705171,4294180876,4294836236,4294705171,262159,458785,4294770716,4294311974,4294705182,4294508564,4294639617,65521,131036,4294574057,4294967291,4294443005,4294967268,393204,4294574086,4294377511,262135,4294574083,65553,4294705144,262177,131095,327718,4294443024,4294639629,4294311955,4294836239,262173,4294705182,196652,4294311969,4294377506,4294574108,458763,4294705131,4294377447,131055,4294901754,4294705144,4294770673,4294574062,4294705134,589817,393232,4294311935,4294574087,4294770701,58,4294836262,4294639627,4294311947,131057,4294574084,65555,4294901780,4294901782,4294246436,393240,4294901788,393239,458769,4294311940,4294901754,458749,262124,262127,4294901731,393187,4294377436,196597,4294508549,4294901799,4294967295,655358,4294639607,131134,4294770709,4294574082,4294246402,4294508560,131084,4294180881,4294443037,4294705187,4294311958,4294246411,4294901758,4294574092,458759,65541,11,65529,4294639600,131055,4294967284,4294836209,4294705103,393193,4294770697,25,393222,393211,262147,4294639651,458779,458751,262166,262179,131109,4294705171,4294377494,131098,4294443028,19,4294967291,4294508535,393206,4294377462,393208,4294574057,4294311913,4294311903,4294246355,4294442990,458726,4294574068,196645,4294901793,4294770697,458746,524286,196649,4294508590,4294377533,4294901821,589889,393259,4294639636,4294836227,262157,4294639629,4294705169,131103,4294246408,4294639613,4294311926,655339,196577,4294508497,4294639562,4294508504,131033,4294705125,524304,327695,4294770698,3,4294705149,4294442999,458753,4294705176,4294770748,4294705212,4294705200,458796,524332,4294508603,4294770729,4294639660,131119,4294836273,4294311958,65553,4294901760,4294705149,4294770669,524278,4294705132,196592,4294574051,524269,327662,524312,196622,4294901764,524283,393223,196607,4294836209,4294901732,4294508567,655361,4294836244,524318,4294836259,4294705181,4294574095,4294836221,14,22,4294770724,4294311968,720932,4294901777,589851,131076,4294377457,327669,4294836220,524297,4294705150,589831,655365,4294574082,131067,4294508537,327689,4294377476,196617,4294705165,4294901807,393244,4294377481,4294639636,131097,65576,33,4294443030,4294377498,4294901775,262174,524314,327706,393211,262131,65532,524299,458748,524294,4294770684,4294901763},
+  {589831,4294705149,458754,327679,65530,131067,458747,458757,4294574080,4294836230,4294639615,65545,4294049812,4294115341,4294705154,8,4294639613,327689,524294,4294705152,196599,524288,4294836233,262138,65537,4294705147,4294443001,4294967293,327689,4,4294508549,589828,393210,4294115336,4292673555,4292476952,4294377488,1507339,917518,4294639627,720915,786455,4294770666,4293197809,4290904064,4292935690,917531,2031654,3538975,1900560,4294311942,4294049792,4294443010,4294443011,4294836221,4294836231,65532,4294770680,589827,4294377473,65540,655375,4293525516,4293722152,327713,1638412,655360,4294508548,4294901730,4294639582,4294442965,4294639579,4294508533,4294574114,524336,1507369,4294639625,1572868,2162693,4293984258,4294639618,720906,524296,131069,65546,4294901751,4294967295,1376237,196596,458766,655375,393195,327633,4294246377,4293591036,4293132273,4292804582,4292018167,4293591048,4292345900,4291821608,4290183222,131135,1441849,2293820,1769510,4128800,2555941,720930,4294180854,4294705149,4294508546,4294901764,4294901762,4294967292,4293459999,4294180872,4291821560,4293722099,4293918710,4293394436,4293787646,4293591031,4293656598,4293328894,4293722122,4294508551,4293328940,4293263404,4293132335,4294246452,393248,1245210,2162701,2228243,3276804,2949168,2621474,786435,4294901760,458750,4294377472,4294705148,4292542457,4292280278,4292804578,4293459963,4293656580,4292673551,131068,4294836228,11,4294639630,4293525507,4293459978,4294639640,4293525550,4293263397,4294180902,4293984298,196652,1376290,1966093,2818050,3407883,3538962,2359312,4294180842,458759,4294901767,262149,4291362805,4293328883,4294311932,4293918715,4293197827,4293459966,4294770684,655359,4294574083,4294049811,4293591054,4292608020,4293132321,4293197863,4293591082,4293001260,131115,4294836260,917522,2097170,3342339,3342372,4456490,1638428,327667,1179639,4293722132,327666,4292280317,4291362786,4292607991,4292542466,4294639616,720896,851985,65530,4294836216,4294574090,4293394429,4293066764,4292149279,4293328943,4294115379,4294180893,393249,1245218,1441809,1310752,3276818,3866665,5374006,2490374,327660,589816,4294836213,720868,4292607978,4291559405,4292018155,4294246402,720893,1900544,1507327,196593,524284,131071,4293394444,4292673538,4292149259,4293066773,4293722146,4294639648,720922,2228245,2293799,1310744,3014684,5242934,5046323,3735572,1376283,1245182,65529,4294836223,4293394429,4292345845,4293001195,524302,1310721,1376259,1376245,1245171,2293761,196620,4293656592,4293525505,4293328883,4292739055,4293722117,4294443026,4294770707,4294639638,1703960,1638421,2293808,5701693,7143487,4194328,4294115307,4294770689,589806,4292870157,4293918714,4294770680,4294246386,655377,1245192,2097138,3145737,3801080,2686976,2949141,1245209,655379,4294901720,4294311903,4294377446,4293197815,4293525504,4294443020,983045,983065,1441836,4718667,7667806,2949165,720892,1310721,327679,4293656576,4293787632,262122,4294180844,1835019,2162670,4390903,4128772,3604477,3604497,3014676,3211304,2424852,2949081,1834980,4294770659,4294836189,4293001187,4293459943,4294246375,1048550,1703940,3801152,5111890,3473473,786448,4294901760,4294770680,458726,4294115276,4294770651,1179653,4194301,5046249,3866607,4128759,3211264,2490378,1310761,2621488,3145749,3473386,2490352,1441765,393181,4293394401,4293132240,393178,4294508501,1114095,655366,4294049823,4293656631,1245191,4294836228,4294508530,4294180847,4292673500,1507311,2228233,4718584,4063212,2621439,2752514,1900558,1638418,655404,1048633,1769493,2097140,917479,393177,4293263325,65512,4294836193,1310675,65501,4294246386,4293459953,4293263353,4293132288,196609,4294639616,393227,589804,4294377475,655352,983018,2293727,1376213,1310703,1835011,1835035,1769494,1441848,1507369,2555902,1507300,2031571,720850,4293722084,4294901706,4294049750,393203,1179635,458739,4292739086,4294246347,4293853170,4294836220,65526,4294311942,851966,4294443007,4292280349,4291821540,4294049742,4294115290,1376229,720902,4294377496,4294574120,786489,786452,2818026,2162644,1572824,1507299,4294508531,4292673502,4293394416,4293918704,4294311917,4294705164,4291297307,4292083668,4290183144,1179631,131067,4294901778,4293853172,4293656604,4290117668,4290838503,4293394396,4294180820,4294901727,4293853167,4293722110,4294049800,4294770691,589808,3145696,3080147,2293718,196578,4292280318,4292083703,4293459964,4292739083,4292870156,4292083733,4291493919,4289920990,4289789933,4293853167,4294836220,4294508566,4293328895,4293132349,4290838564,4291362829,4292411396,4293591015,4294901733,4294967258,4294901742,524281,524248,2031566,3145674,1966046,655335,4293525515,4293328895,4294049792,4293525497,4293066763,4292411420,4292804649,4292214771,4291362736,4291887065,4293328882,458751,4293984257,4294246405,4292739131,4290117659,4290183211,4292411437,4293132305,4294377470,655344,262142,2031581,1572818,2883541,3145692,1834998,4294574080,4293918723,4294246411,4294311954,4293394426,4291887118,4291166231,4291952662,4291690470,4292476857,4293328850,196571,458761,589791,4293591081,4291559474,4290445339,4291362857,4292214828,4291952666,4292804651,4294311959,65565,1572867,917499,1572845,1769466,262139,4294836221,4294246420,4294443030,4294770691,4294180866,4292476951,4292476965,4292542488,4293656575,4293066688,4292476899,1638373,65538,4,4293066772,4291166232,4291100708,4291952688,4291428377,4292804634,4292411428,4294311958,983067,131096,1245198,1245215,1638420,720923,589838,524295,4294770684,4294115321,4293525507,4294705165,4294115364,4294574095,4294639561,4293590947,4294705123,851989,4294443011,4294377474,4292083698,4293066727,4293918754,4292870172,4294377497,4294574095,4294377486,4294049800,4294574096,4294574105,131111,589860,1179676,1376275,524305,524285,4294639612,4293722121,4294115340,524314,524328,4294770690,65477,589772,4293132280,262144,393215,524287,4292411384,4292607976,524289,11,4292935683,4293787660,4293853186,4293525524,4293984277,4294705192,524321,786460,1048607,786456,1769507,1114115,131069,4294639625,4293918736,4293525511,4293001255,4294836238,589779,4294442966,4293525506,393213,524284,327674,4292870186,4291362854,589846,458762,4293656573,4293132273,4293525521,4293656604,4293197860,4293722166,393255,983088,327731,1310768,1507357,917509,524297,65534,65555,4294049802,4292804632,4293394428,4292673510,4291035131,4293197852,262146,4294901766,4294967293,4292476973,4291428414,4292411420,4294049799,4292804617,4292476940,4293787676,262186,1245234,131114,4294639675,4294312000,131124,458807,1048621,917526,1179662,1507341,589832,4294508560,4294639602,4294311916,4293328873,4293263324,4292607991,4294967292,4294574074,4294443001,4294508540,1507309,196571,4291690484,4291690517,4292018175,4291297290,4292870161,4294115343,4294508556,4294377485,4293197828,4294443008,4294639636,4293460012,393245,983047,4293263390,4293132292,1310681,851918,2555860,1048531,4293591027,4293591030,262136,524295,4294639615,262144,65525,458752,4294311912,4293459955,4293591024,4294508501,458710,4294508539,4293525517,4294574102,917515,4294246423,4294180867,262142,4294705135,393206,4293853196,4293525501,4293853160,65526,131065,131077,524283,458751,262145,4294574078,65545,589830,4294443008,4294770688,851953,983038,917493,1179629,1114096,1048564,983022,1834970,1114074,4293197806,4294508535,1048553,327663,4294508521,4294115310,720881,4293394418,4294639607,851965,196600,4294836227,4294639612,131068},
+  {262143,9,4294377480,7,4294443017,4294836224,393218,4294639608,4294443005,4294770679,655360,4294377478,262150,589815,196616,65538,4294377465,4294443004,458756,262150,327689,4294901765,327683,4294770687,65542,393210,4294705159,4294705145,4294443016,4294639617,131077,458759,4294508542,589820,262140,4294115323,4294180852,4293459976,4294508550,327688,4294574072,4294574065,2490378,3407908,2818087,4294705194,4294246390,4292870137,4293132273,4293853184,262151,786425,4294443004,4294377470,4294377482,4294443013,458761,4294770679,4294311939,458756,4294443011,4293787638,4294442999,4293853172,4294901747,1310690,4294901737,4294967269,2621460,3342324,3145717,2293723,1114070,4293656543,4292608012,4293001171,65500,4293656545,4291952624,4294705151,851989,4294180862,4294705151,4294311932,262145,65544,393208,4294115320,4294770683,4293197789,4294311907,917476,2490367,2359288,1703914,1834987,3014649,3407846,2424769,458694,458706,4294705117,4291756009,4293132243,4292739020,4292673504,4293066735,4293525506,4293656570,4293197817,393210,4294967288,4294508536,4294574080,589816,4293328865,4294049768,4294639592,4294770649,524273,4293525502,655372,1703935,1310713,2031625,1835008,1376242,4294967252,4293787601,4294508475,458711,4294180850,4294574057,131048,4293853173,393213,4293853191,1835003,4294770684,4294967292,589818,262148,1114122,4293918701,1048591,917497,4294770679,4294508568,262158,917535,1310735,983061,458771,786454,1179671,262151,786425,4294574042,393187,4294508503,131030,1834979,1900537,3276780,786413,4294508523,4293787640,262173,4294574073,4294443017,4292542424,4294246377,4294770696,4294246409,4293591066,131115,65587,4294049804,4294115347,4294639634,4294443014,4294705160,720914,1114121,851977,4294836229,851958,4294311925,65509,1507301,327656,589799,1310695,4292345827,4293787606,4292411389,524291,4294180874,4294574105,4293918758,131119,4294836278,4293722164,4293132340,4293656618,4292542490,4294377488,4293984289,4294180892,393234,983054,720918,4294377487,4294967293,589837,720897,4294639586,458741,589807,4294508528,4294508503,4294115290,4294639583,4292214773,4294508557,1507336,196647,4294115369,4294377527,720969,4292673596,4292149292,4293656621,4294115367,655399,4294246436,4293066801,852005,1376293,1310749,4294377499,983056,458782,851979,4294049776,327660,720885,1114101,4292804575,786390,4294246388,589845,458765,851982,4294508555,4293984291,4293525578,4294443083,4293197869,4292804643,4293328945,720932,4294377510,4293787694,4293525556,4293460008,983077,2818075,2097186,2359320,1048600,262155,4294311932,524288,4293787650,4294705146,4293656532,4294705105,262151,1769490,327684,458759,4293853206,4291559458,4292542528,4293394495,4292608051,4292608032,4293853235,4293197875,4292870180,4292673584,4291297315,4291821628,786502,3342376,2555934,1179671,393236,4293787657,4294246400,4293459962,4291887098,4294049774,1376214,2555860,196602,1835024,4,65549,4293918733,4290904087,4292542517,4293591083,4291821618,4291690533,4290773005,4290314265,4289593356,4291297281,4289331197,4289200141,4294377501,1638425,589831,4294311946,4293656601,4294377480,4293197821,4291362798,4291362803,4292673506,4293722079,1245156,4292018137,4294508531,327683,4293984256,4294246425,4292345856,4292673539,4291756050,4289855503,4288544754,4290183150,4289724386,4288872395,4290117560,4289134502,4290772919,65519,131063,4293394413,4292411392,4294574105,4293328905,4293787620,4293394401,4291231704,4291297236,4291690466,1245162,3080145,4294901770,4294770682,4294311944,4293328935,4294180842,4292018157,4290772960,4289396711,4290510783,4290772951,4290510801,4291887023,4293197738,4292870036,589742,1310680,4294639605,4294770678,327677,131079,4294246379,4293525472,4292607948,4292542423,4294377439,131055,1638363,2818014,131072,4294770688,4293263358,4293853211,4294967245,4293263308,4291755991,4293590973,4293984185,4293525436,4294311866,393149,1245097,786364,3342299,2686979,589826,4294901762,196614,524298,4293984243,4293591002,4292018118,4293066701,4292476904,4294639609,196593,2228210,131071,458769,4294442999,327669,1441743,4294246349,1114040,2293672,851886,1507263,2424768,2097089,2162637,2097105,3211280,2228245,1572875,4293459966,4294705156,4294049800,4294180860,4293001181,4292739057,4291821549,4292083695,393197,1834999,2752533,393203,4294770708,4293328876,786411,589775,1245136,4259762,3080086,2359212,327619,2686911,3014617,1834962,2031616,3670036,2490401,393228,4293525516,4293132294,4293853171,4293656563,4293853183,720890,4294770682,131047,1245153,4980760,4194333,1245189,4294377470,4293853167,393195,4294246352,1310661,3080101,3932053,2031525,1703868,1834978,1245196,1114133,2687015,2949158,2228251,262165,4293394430,4292870129,4292411376,4292083692,4294180847,1507315,917491,655339,2097159,3735594,2949164,1703964,4294443005,4294311925,4293591033,4294049733,1310679,720807,2359191,2686904,1834955,917497,1572905,1507379,3407925,3539004,1441820,4293853184,4292739052,4293132262,4292673526,4292935650,4294377434,262122,1507313,1572850,2228219,4259873,1572901,1966108,65532,4294639620,1441804,4294311913,1048542,4294705052,1834926,2293707,2555884,3473454,1769535,2031664,3145773,3211311,1245215,4293918732,4293132286,4294508552,4294639609,4294967277,1310705,1376240,393198,1376255,1900560,4128822,3080231,1179665,4294508547,4294311935,2490382,1376240,1114061,589720,1179577,2228181,2621428,2162710,2752569,3276846,1441839,983075,4294836249,4293787666,196609,524284,1114109,1835009,2293761,262128,1441768,1507331,2687007,3932215,1179673,4294836213,4294836224,786446,1507354,2555915,720849,982959,982980,851937,655339,2031644,2359318,917542,131097,4294180885,4293591067,4293656604,4294705157,786436,1703953,1703943,1900538,1769469,983030,786441,4456483,2228274,4294377508,4294901749,4294508553,262138,1441805,3473380,2359271,1769460,589818,524290,4294508534,4294574075,4294770707,4293853191,4293394438,4293394439,4293459992,4294377499,4293918748,524313,3145742,2228249,1179661,2162715,1638404,262129,1507359,2228264,65565,524291,196610,524290,4294115298,851906,851935,786417,2424832,65555,4293853183,4293066739,4292935677,4293263368,4293591056,4293918740,4293787671,4293656602,4294049814,4294770705,458773,1245225,196620,4294639630,2228203,1900546,2162677,1769478,1114122,524280,458762,524282,4294246374,4293263307,4293853148,4293722087,4293459957,4293525487,4291100658,4290117619,4291624946,4291887097,4294311953,4294377498,4294639637,4293984263,4293853169,1769486,2424867,1114151,1114131,1376233,2752467,1310683,2424863,2359321,2293787,4294836226,4294639608,196603,4294836231,4294180898,4293328910,4292542458,4290576369,4291297259,4290641914,4291035130,4291428354,4292935680,4294377481,4293656577,4294639608,4294246402,720909,1507347,4292018182,4291166223,4293853179,4294770687,393188,4294115287,458723,2031644,1638428,262149,4294836229,262138,4294967287,4294705129,4294508511,4294770698,4293066739,4293263348,4294770703,4294049815,4294443028,4293722122,4293263361,4293197830,4292870157,4291100687,4291952667,4294705185,4294901789,983079,4294639613,4294049773,4294770680,983023,262148,589831,393217,4294705158,8,8,4294705155,4294836233,5,262155,589851,36,4294443032,4294246426,393242,4294705189,4294443044,327707,131074,131076,4294443024,131100,131098,65575,4294639632,4294246397,4294246392,458761,262141,4294705153,393210,589819},
+  {4294639606,589823,4294377479,4294836220,4294967290,196613,393218,4294574086,4294639624,4294508537,4294574087,327676,4294770713,131081,4294508546,4294901755,4294574080,4294508544,4294705144,4294836217,1,4294377464,4294574076,4294901766,524285,524287,196601,4294574072,524283,196610,524293,4294705154,10,4294311952,589863,4294770745,4294705193,4294246435,4293918736,393219,4294311952,4294901776,1703964,3145738,3014619,4294574069,4293984279,4294770720,4294574113,4294377501,131093,1966111,655361,589831,196613,65543,4294770681,4294705158,262144,4294836221,4294574083,4293656601,4294049835,4293918767,4294246468,4292804650,4293132345,4292870205,4294836271,30,983089,1114150,1441818,196658,4294377520,4293984294,4293656602,4294246430,4293132325,4294443032,4294246425,262145,524294,4294901768,393225,4294443007,4294574081,327692,4294246416,2228256,1376305,65592,196646,4294443041,393257,589872,2228284,2949174,2228261,1769512,2424876,1703985,1114162,917563,1638444,589848,983037,1900543,262152,4294311965,393214,4294705158,4294836232,9,393220,196630,4294770730,1441866,1441824,327712,655409,458803,917554,720913,1245204,1114133,1114128,2293788,2686988,2097170,3211292,2359335,1572892,1572883,196614,1441769,2162625,3604430,4293656562,4294574079,524283,196602,393229,4293656617,4293328968,1376312,1638445,655398,4294180891,196629,4294508552,4294574087,131065,196605,589828,786442,2031605,720876,786425,1114119,3014663,2359293,2228215,1638400,1441789,3604466,3145735,1441792,4294901760,4294836223,983047,4294443076,1507384,1441814,720924,393207,4294836230,4294836234,524288,327673,4294574066,393200,4294639601,4294115323,4293984222,4294377446,4294836224,1179627,1900539,983031,2097132,2228200,2686951,4063203,524297,4294639644,131056,2686997,2097135,1572912,1048628,2097175,131081,1048580,2424836,589816,1048571,1507299,262113,720875,4293984258,4292149232,4293394397,4293525480,589810,1703912,1245155,1834987,2490350,2490337,3997642,4915137,2097159,4294311958,327653,1245179,1114094,2949164,3342405,1245204,1310722,2490356,2883578,1507305,917499,1900508,2162674,4294705134,4293853199,4293132304,4294246407,327668,720875,1114089,2031594,2621408,2293720,2752436,4390818,5177249,1966062,1572843,524269,1900539,1245189,2949142,1900576,851969,1966066,2555897,2752497,1245166,1114082,196569,4294705128,4293853181,4294115354,4293263401,4294705179,1048579,327669,262126,1310717,1703914,2162664,2293704,4063136,5373847,3407820,4293197786,4294836228,1310722,1966057,2162684,1638397,524259,1048541,1507320,524253,327637,4294115293,4292345809,4293853158,131069,2228249,4294246436,4294901790,65550,4294377482,4294770680,262126,655319,1310671,1769418,4456388,5767072,3276744,4294967262,655355,589819,1179644,1572859,1179633,4294705129,458716,4293525492,4294115301,4293525472,4292149211,4291756003,4294508538,1114141,1900590,4294901789,4294443024,4293263374,4294311943,4294377463,4293394402,4292476883,4293984232,1441815,4128760,6488011,3932101,1245169,4294377471,786409,720867,4294246364,4293722104,4294311914,4292870137,4292739067,4292214769,4291297279,4290445299,4291690484,4294639636,1507373,2031661,1310748,4294574106,4293787677,4293525524,4294574058,4294049758,4293263311,4291690483,4294115373,4294705208,4849640,2883519,458737,4294967286,589813,1507302,4294246363,4292542445,4291493892,4291821589,4290510842,4291428348,4291624971,4290052099,4291231752,4294574095,2097176,2162735,524315,4293984285,4292608020,4293656582,4294836205,4294508516,4292476898,4292149224,4294377504,4294115370,393221,720862,458760,524284,4294180877,327679,4293591039,4291690486,4288741398,4289593358,4289986570,4291362831,4292083739,4291690511,4293787648,1638403,3014672,4128817,2228267,4294246427,4292149259,4293263361,4292870121,4292607986,4291887124,4292214793,4292345869,4293656584,4294377490,851941,10,393215,4294377497,4294901788,4294508521,4292673557,4289593362,4289527816,4290445328,4291952650,4293853195,4293591040,1900569,4194319,4849707,4784184,1966131,4293656585,4292804604,4293984246,4292739068,4292542483,4292870157,4291690544,4293722139,1441826,851983,1703917,589814,4294574069,917523,1376278,1572889,262146,4291821579,4290707453,4291297289,4293656569,4294508554,4294508535,2097162,4915223,5505065,3538989,1114123,4294574045,4294311907,4294574093,4294836234,4293459975,4293459989,4292476959,786456,2949152,2359304,2949056,851986,65530,1638426,589827,3407908,1376261,4293459969,4292870110,4293984253,4294574061,458733,131048,3211252,4063240,3735585,2752546,4294770681,131046,524274,4293853183,4294705170,4294311947,4294377487,4294443047,1572863,2818020,1769461,2555848,2097145,4294574048,1572892,1048591,4128813,2097181,786431,1376237,851942,458742,2162682,2621416,2818038,3538967,4325414,917526,983056,720907,4294770709,262167,4293918737,4293722128,4294770715,852015,2097168,3014621,3342336,2097109,589840,131075,1638397,3407842,4784172,2883610,1966102,2686965,2686965,3145728,3080190,2555921,1572872,2097172,1572891,1179689,1572913,196640,1441823,1441809,4294836248,4294049834,1835040,1441818,2818050,2031597,2621449,1245130,4294508554,131063,393228,2490345,4390936,2228243,2293771,3473431,4325367,3866619,3145742,1769503,131094,1769505,1179682,589873,786484,4294836269,917550,1703983,589867,1114163,1310760,1441788,2686951,327676,2031653,4294442976,4294574084,393224,4294770680,458747,2621465,1507351,196609,3211254,3670007,3014658,1048575,458772,655374,1179655,983059,1114129,1114136,458792,1769512,4294901815,1245215,1769488,917476,4294901740,589782,131043,4293525520,4294770645,196603,4294705159,393219,4294639608,196642,1966073,327677,2097142,2949101,327667,4294508541,4294770681,1703921,917486,983022,1441793,1441808,851975,31,1179673,786455,458743,786407,4294574051,4293853119,4294115283,4293525515,393206,4294443001,4294705160,4294705154,3211318,4293656636,3145733,4294639613,851983,4294967285,4294967273,262147,4294770677,1376230,1638383,1179631,2031602,1245178,1048564,262145,131112,327697,4294901736,4294049752,4293787611,4293918668,4294574077,1376241,3014692,131077,4294901754,589817,3670063,1245228,65579,4293853209,720926,4294705197,4294311945,655354,196600,1441769,2949109,3211270,2359288,2228234,1572864,1048571,524294,655349,4294639592,4293197811,4292411379,4291821558,4294442997,1769498,1507348,4294574078,4294836222,4294901760,3,327667,4292870134,4292870177,4293787705,4294443045,4294311985,4294770738,262160,786446,655387,393246,4293984281,4294705177,131088,4294836207,4293066761,4294115339,4293263362,4293328902,4293918754,4292739115,4292804646,1572897,1638421,4294901764,4294770689,393220,4294836216,4293722101,4293001217,786420,4292804607,4293132287,4293001205,4292083716,4292673534,4293722121,4293394425,4293001213,4293263343,4292345843,4294049766,4292411371,4291428334,4291297252,4293132299,4293001225,4293066744,4294639614,4294508541,4294770695,589828,327677,65527,327679,393222,196616,327688,4294836215,851956,1114108,1507308,262116,1900512,1638353,2162659,655336,131064,524276,917493,851959,1441778,1703924,4294311942,4293001214,4292870128,4294574081,196611,65535,4294574083,4294901767},
+  {327681,4294574086,393223,262140,4294508538,4294967293,4294443012,4294443012,4294574071,4294377469,4294443017,4294901755,1376242,655351,4294246392,4294574070,4294639620,131067,4294967286,393218,327671,393220,2,4294508547,4294705151,131073,4294574071,4294443007,589823,393218,4294639619,458753,4294836221,1572862,2686970,3538942,2883544,2228205,655363,917497,1179635,2752496,4293984259,4294246404,1114131,3407880,1835003,2228227,1966075,1834993,2031612,1900535,327688,4294836221,4294836214,4294508546,4294377466,4294442999,4294574079,4294311934,1179651,1507305,4521971,4849652,4194260,3735564,3080190,720887,4294377467,262138,4293853165,4293853181,4294311945,65525,4294770655,1769453,131049,327668,1048562,1507319,1245182,393208,458746,65531,4294639618,4294901754,4294508538,917493,851953,4293132311,4293984273,4293656600,4294574121,786491,393272,4293656623,4292018239,4292673593,4293394462,4293263393,4293328933,4293328906,4292870143,4294377485,4294377484,524288,1114097,655355,1900566,2162664,65542,262148,9,131081,262135,4294508558,4293656596,4290904096,4293459997,4293656600,4292870193,4292935741,4293460024,4294115411,4293263435,4293787698,4293984305,4293722153,4293001232,4293918731,4293394455,4294180862,851961,393226,983043,786421,720938,1179691,4293984297,4294836224,4294443009,524278,4294443010,4292542489,4292083710,4291493920,4292608042,4293197885,4294836261,786462,983084,1310771,720953,589883,327704,262156,4293853209,4294639644,4294180897,4294443015,262140,589833,1245191,4294705145,4294836236,4293263392,4293722123,4293984224,65541,4294770683,1441809,4291690536,4293328914,4294115343,4294770705,983062,917513,1179678,1572903,2687019,2687028,1703977,655409,786487,1572906,2424857,720918,917508,1048589,327694,4294639605,4294967274,1441814,4294377518,852007,4294574070,524273,4293787665,1900536,4293525523,4293591039,4294246394,786450,1572861,1441802,1966105,2686999,3604513,2359339,1376329,983111,2359354,2424872,3211288,2097168,655377,983073,4294443018,4294115323,4293394421,458760,4293984317,4294705171,327670,4294770690,1310705,1966034,4292476923,4292608008,4294836236,1310721,262154,2752531,2752539,2424862,1769500,917540,524337,720949,1376284,1048589,1835012,983044,196606,65540,4293853189,4292607980,4293984235,4294770706,4293984315,4294049820,4293722119,458753,1966060,196607,4294574065,917487,655375,1835020,720909,1769489,983068,2162695,2752534,1310742,655356,4294901760,4294508548,524272,4294967268,196594,917468,4294639588,4294508507,4293263328,4293591009,1114115,458791,1769494,1835014,3,1441767,2555895,917507,1638376,2949151,1835032,1572885,3014669,3211267,3080184,2031618,786409,1114074,4294836206,4294639595,1310678,655307,720855,1441746,524256,1179592,4294508473,196535,262114,458780,917533,2686990,786423,655344,786416,983027,2228214,1966100,3604493,3473399,3276793,3473373,2424805,2293747,4294574041,4293984243,4292214784,4294639610,917479,1769436,1376234,1376248,2162662,3669948,3211173,786336,4294573989,4291821598,4293853216,4293984264,524294,2359271,2555862,2686948,3342327,2752531,4784113,4653028,3604458,2621410,1048562,4294770671,4292345855,4290969618,4291756069,4293918719,131059,1572865,1310736,655373,2228226,3342280,4849581,2817946,262050,4291035138,4292739089,4294115312,131066,1245158,3276764,1114121,3604471,4259805,4718548,3538929,2686971,1703925,786424,4293066746,4292083733,4291297324,4291493915,4292804602,4294115316,196625,31,1114131,2424847,3014629,4128691,2490295,2031574,4292607994,4292608019,589818,4294836223,4294508535,393190,4292083744,1638401,5439430,5636052,3866587,1966070,393216,589830,4292870124,4292476932,4290904097,4291624975,4292476906,4294049765,4294442993,65526,2686981,3080200,2949113,4784090,5636056,1769469,196593,4293328934,4294639610,458745,4294246420,4292935687,4292018198,4294115353,3538903,5373906,4063170,2424785,196597,524290,4293591046,4292149273,4291231770,4290052109,4291624941,4293263338,1179623,1900521,1638407,3670029,2883589,3014621,2359280,4293263406,4292608029,4291821624,4293591033,458733,4293459994,4294049803,4290904130,4294246446,1900527,2752446,3080086,2817970,2162642,327641,4294049776,4291493885,4291035140,4291624940,4293787604,393186,1572840,1507338,2359314,2097168,1900573,1376281,4293656601,4291297353,4291035193,4290707529,4291952650,4294639615,4293722133,4292935704,4292477013,4292739143,589834,1834979,1376161,2359181,2293641,2686881,65435,4292804526,4292280261,4293394391,131050,1441780,1310721,1572906,1572895,1900559,1376285,14,1507368,4293984305,131099,4294639645,4291493905,1376278,4293263373,4294705173,4292149314,4293001276,4293591081,4293263370,524248,1179561,917395,2293645,1245075,4294115210,4293394370,458738,131078,327697,65571,1179695,1376299,1441822,4294377510,4294180905,4293918777,4294377540,4294049820,4294049823,4292411420,4294574084,1900522,1900594,4292214841,4293918764,4292804658,4292673571,4294180860,4294246386,4294442962,655282,1966010,851900,4294311922,196600,4294443026,4294115356,196656,458807,65577,41,4294115355,4293460014,4294312006,4294901844,4293132308,4293328925,4293328915,65536,4294049800,1966108,4293394503,4293853258,4293197881,4292476980,4292870187,4293656614,4293525515,1048562,1834992,589808,917514,589820,3,393249,720934,4294574123,4294443033,4293984289,4293918751,4294639688,4293984339,4294770754,4292149266,4294770690,983062,196603,4294639614,327670,4292739117,4294574159,4294574143,4293197872,4294049831,196641,524320,2162719,2097169,2490380,1376255,720911,1638409,1179643,4294311941,4293918739,4294049827,4293591079,327732,4294836288,4294574167,983097,4292411377,2424835,4294967289,589815,196615,1179653,4293001257,4294115400,1310768,4294115378,458788,851991,1507374,1703952,1441819,1245196,2293773,2097182,917503,1376257,4294836229,4293656605,4294639648,4293591083,4293656625,4293460032,1638491,1114172,4294508557,589843,786426,327685,4294639618,4292411429,4290510921,4294115405,458793,4294115366,327704,1179680,1441845,983093,852022,1114133,786457,786455,1900557,1703948,524320,4293132302,4294377497,4294705171,393258,262212,73,4294901820,4294574114,4292411433,4294639617,4294901754,4294836217,4292542499,4292018232,4293656621,917546,4293525552,4293853243,4294639676,4294508598,1310772,983088,720947,4293984301,4294639656,458785,4294377485,131093,4293197855,4294705184,1572903,458795,1179716,1114180,65554,4292608028,4293591064,458745,524285,524296,4294770688,1638365,2424795,4294705163,4292411441,4293132341,4293853229,4293918754,4294508562,786449,4294311971,4294574104,131080,4294311956,1048624,1376295,720946,1441864,1376294,2228216,851971,1310718,1507330,4293263390,4293394450,589822,524284,196616,4294443011,11,1638416,131055,65538,8,983018,2097138,2097139,196600,786451,1900552,2031608,2555883,2424848,3276807,3211258,3932174,1835039,2818063,3801113,1900586,458754,589827,4294639607,4294443013,4294836230,4294836215,655352,589828,4294639619,1048570,1310711,2686962,1114107,262119,655351,1179622,2293732,2359270,2490359,1966046,1572836,1638374,2752501,2949118,2228223,3211271,3014663,2031618,4294901756,458744,4294770693,458754},
+  {262141,655369,4294770687,4294705157,458762,196611,4294639613,4294443014,4294574080,196609,4294967295,655368,1441779,655342,4294508557,4294574080,393208,4294705146,458744,458742,4294705160,458748,4294508551,327684,4294639619,131074,4294705146,4294508543,196618,4294574074,65530,4294901768,4294770679,1835009,3211246,4194294,3342325,2162686,655359,1179642,2424818,1834980,2359304,3342325,3997662,2949090,2097141,2359287,2686955,1572851,1572854,1310706,262142,4294508537,196607,4294705159,458756,4294836220,4294442998,4294443009,327674,1245172,3932145,4194299,5308385,6094790,3801023,2359252,3866592,4521955,3473373,1834974,1900512,1376214,1310698,1966029,1900506,1376201,458728,2621418,1310723,393209,458761,524288,4294574085,4294574071,589816,2031613,720893,4293722104,4293722099,917477,1572832,3080155,4063186,3342284,1507314,2097126,1834953,1966038,524275,4294836211,327671,589787,4294967247,196558,1834990,917495,917489,1900531,262154,4294901758,4294443010,589830,327688,4293263391,4293132300,4292083715,4294049766,851952,4294508561,131099,1310721,1376270,1310742,1507359,917514,917504,1048576,589828,327690,393219,589817,1179619,4294836207,720886,4293001219,4292673516,4293591050,589824,655363,327674,4294246413,4293722137,4294377471,4293197833,4294901772,4294246401,4294443004,196625,589828,393255,1048616,1114152,1114136,2162715,1048601,1638415,589836,1769467,1310704,1179621,1114078,917453,655322,65514,1638405,1310737,4294443001,196615,4293525497,4292411442,9,4294377451,4294770677,65518,4293918730,4294246406,589835,655376,589841,196625,196630,1835019,1179650,393229,131070,786435,4294508532,4294639594,4294246351,4294377422,2424769,1834978,2162661,2555901,262137,4293853171,458717,4292018213,4293656584,4293984258,4293525506,4293722125,4294508544,4294443005,589818,1245174,1245173,262151,4294901767,589849,4294901766,4294377480,4294901773,4294836225,4293722094,4294180841,4294574048,4294836181,1310676,1638361,983027,2228201,589828,4294311900,1245154,4293132337,4292870174,393219,65538,4293328906,4294639610,393217,1835008,1769446,720879,1245192,327684,917537,327707,4294574104,4293722142,4294049809,4293787644,4293984234,4293722079,1376210,3276755,1572840,458763,1310739,4294442999,4293525471,4292476915,4292935695,4293722109,4294770673,4294901760,65538,1376247,1703926,2555898,1572853,1834996,1835011,1900550,65561,4293525543,4294377516,4293591085,20,4293787660,4294836212,524270,1310675,4718530,1572814,65516,4292542430,196604,4293787614,4292083671,4291887086,4294115325,4293918717,4294639614,1114104,2162663,2293740,1834994,2097131,1572858,2162672,917528,4293722162,4292280375,4293853220,4293591075,4294311954,327679,4294836211,262136,1376210,3145680,1441715,4294246387,4294246362,4294246389,4294311912,4292607966,4290641893,4294770672,4294705169,720886,1114094,786408,1179642,4293984256,4294639613,65551,65550,4294377528,4291100735,4292280368,4292214823,4292542497,4292870167,4294311952,458746,720870,3211237,6488070,1310715,4293263369,1376248,131079,4293656551,4294442959,4292739053,4292476933,4293525511,4293591034,4293328881,4294246376,4292739075,4293001225,4293197827,4293525522,4294639666,4293656636,4292083779,4292804666,4292411439,4293525539,4293459990,4294508543,1769456,1114090,3670011,5570571,1638426,1638403,196623,196605,4294442997,655310,4294574077,4290772976,4293001186,4293197803,4293328884,4293328891,4293918732,4294049787,4294115324,983069,1245239,720950,131141,4293132358,4292673585,4293001259,4293656583,4294574064,4294770667,2686963,4915189,5373930,2031632,851963,131062,262147,4294508559,4294311927,4292608034,4290772989,4293394399,4294377416,4294836203,4293853167,4293984255,917480,1900544,2031649,2621495,1441853,4294901820,4293197889,4292542510,4292214792,4293656554,4294705113,4294115316,983008,4128727,4325344,2490371,1572873,4294574080,4294180850,4294049813,4294311958,4293656599,4292673540,589770,4294574026,4294705120,65524,1376250,1834979,1507326,2031637,2424872,1179704,4293918779,4293722181,4293918733,4294049754,4294180807,4294508498,4294377440,131057,2686948,3997701,4522025,3014665,4294836217,4293656571,4293656592,4294311963,4293525521,4294836213,1441746,65485,327664,983041,1900542,2228214,2883579,1048602,1507362,1441838,131111,4293787697,4293656561,4294180818,4294770620,4294377427,524265,1179620,2490369,3538972,7602177,4784119,1900539,458747,4293591070,4294311965,4292804625,4294246399,1114074,1507276,720880,1376264,3801076,4849654,3538930,2555917,1048608,196635,4293263379,4293787645,4294180840,4293590980,4294639582,4294967252,1703924,2359280,1376241,1769448,4587491,3342299,2162684,4294311954,4294443025,4293918741,4292804609,65527,917473,327645,1966049,1310710,2228216,3014620,3014616,2883555,2228228,720888,4294770677,4294705134,327639,655310,4293591011,589813,1310720,1835009,1900540,1638375,3211283,1245186,983049,4294901767,851953,1441766,4293132300,4294377465,4294049773,262118,2752480,2555877,2359289,2424790,2883515,2949056,2883558,2097135,1310692,131048,1048552,655344,65543,1310727,1376261,3342343,1376249,524270,1900594,1245198,589836,4294443001,4294311935,1900530,4293918728,4294705132,4294508534,4294705173,1703934,1900517,2424811,2162652,2424788,3080149,3342314,2097133,1638364,720886,327675,589829,1114115,1179655,2555927,1703936,4294836229,589849,1114155,1048552,196584,4294574082,327682,720899,327701,4294639612,4294377469,196620,2424838,1835005,2555888,2097134,2752460,2621417,2883568,2686970,2490368,1507318,1769493,1638411,262146,786436,1769463,4294836231,4294508546,18,983078,2162647,458754,4294901751,3,131070,524321,1245154,131053,1507340,1572865,1048579,1245177,1966085,1966075,1966080,2621432,2490368,2490360,851965,655372,983040,589815,851966,1376258,4294574089,4293525497,4292018208,327726,2359253,4294901761,4294311941,4294901760,4292804645,4293132330,4293918703,4293984228,4294705125,4293787653,4294115328,4294639612,4294574067,4294508545,786436,4294901764,262148,1507326,1310723,196630,4294311960,196623,1179649,196613,196623,4294508573,4292018225,2031612,4294901750,458743,4294770683,4294770683,4294049823,4292542477,4291100668,4289396722,4290641918,4290248713,4291035148,4292476923,4293525499,4293853176,4294639611,4293918712,4293787649,4294705154,4294770700,196621,1114138,851980,65542,4292476945,4292935721,4292542530,1048554,1638360,1114081,4294508535,4294443006,458746,196605,4293001186,4290248685,4289658901,4288348196,4288544799,4288544801,4289986566,4290904066,4291821576,4290445339,4291493893,4290707480,4293591032,4294508552,4294639605,4292542487,4292673536,4293132317,4292411434,4291428401,4291756068,4292739097,1769439,2359267,4294443016,4294901768,4294639624,4294639623,4293722142,4293591064,4293525502,4291624998,4292149283,4292739081,4292018176,4292018194,17,327711,1048568,4294770684,4292739060,4294049776,65525,4294115335,4294770658,4293197826,4292608027,4293066763,851986,4294443010,196600,131070,4294639622,196613,4294836227,4294770679,4294443010,524284,196586,4294901734,655327,131035,4294180841,196583,4294049762,262096,4294311903,4292804626,4291821582,4294705145,4293984228,4293197833,4293132290,4293984257,589813,4294639621,4294442987,4294901753,4294639615,196613,4294705144},
+  {4294705144,393225,458759,4294705144,9,4294377466,4294967287,655358,4294508554,65529,4294377479,4294443005,4293787664,4293328908,4294836226,4294574068,4294967290,4294443012,327676,4294705160,4294967289,4294770680,393216,7,262145,589818,4294377463,393214,65544,4294377463,4294967291,196605,4294770682,4293459970,4291035191,4290904113,4291952678,4293001245,4294901765,4293525513,4292804633,4293197870,4291559431,4292280286,4293984201,1114091,4292542493,4291625003,4292411445,4293066773,4293132315,4293394466,4294311944,655351,4294705148,4294443009,4294901760,327683,65532,4294574080,65539,4293066776,4291493931,4291952687,4291100720,4290510853,4291952645,4292739082,4289658899,4288479233,4289724441,4291231757,4292870161,4293984303,4294574131,4293001265,4292018194,4293394478,4294574130,4292411421,4293197843,4294901758,4294377476,655353,196611,4294901754,4294901753,4293918737,4294508550,1114111,4294705167,4294574096,4293132283,4291428307,4292214758,4292149228,4291952624,4291952625,4293591050,4294115337,4293722115,4294508542,786485,4294705218,720959,262203,4294836282,786453,4293459975,4293132309,4294705157,589828,4294770685,393210,4294574086,1835003,1114075,2097105,131025,262115,1703888,786356,262088,4294770643,786404,1376250,655372,720896,983066,1179667,1441801,1835035,1703975,917544,1900579,2031638,4653046,1507321,917492,4294639618,4294705153,589824,4294639617,1179613,393149,1441718,2490287,1245120,917429,1179603,1179634,851978,983074,393243,1703953,1507354,1900541,1703927,2293762,1966085,1245196,1114108,983032,4294115314,786439,1376256,4294508565,1966057,4294705142,4294443000,917515,1310671,1703863,2752416,3014552,2162590,2555822,851965,1179648,589847,1114148,1638440,4294836269,4294377510,65570,131102,4294770701,1048588,4294639619,1507308,2555869,2424818,2686955,2228229,4293132318,4294574085,4294705158,589782,4293394419,2228174,589730,3145624,2424742,2686900,2228201,1900538,917522,4294311962,4293656618,4293394477,4292214828,4292345902,4294574127,327707,327674,1376247,655354,1245165,2490336,4456404,3932126,3670011,262140,4293656571,4294705156,196583,4292673501,1441734,851876,1245093,1638333,2359239,327684,1179657,4293656602,23,4293853213,4293591076,4292804630,4293394439,1245177,589800,2949080,1966032,2293735,2818022,3669952,4390855,5439455,4390895,2097133,720899,262137,4294901729,393180,1245113,1048486,4293525435,524234,1048550,655370,25,4294311957,4293525543,131091,4294836237,4294180872,4294049763,2359224,2817957,3538873,3080133,3014613,2228174,4325302,3669937,4849651,1966105,786426,4293197793,458746,589789,1310665,851882,1376177,4292804568,4294574050,720901,4293656600,4293591071,4294836255,4294377508,2686990,2752522,524275,4294836169,1965994,3538872,3473339,2359252,1834979,1769440,3473356,3932096,1900521,4293394443,393187,4293066733,393214,458730,4294967235,458679,4294311860,4293591024,4294705154,4294443046,720928,851994,1310759,1703965,2949138,3538958,983050,720896,720875,1900524,2031604,1245160,720894,1245179,2162662,1441774,3342303,4294246354,2686947,131101,458750,4293132251,4293787602,4292739026,4292476894,4294311923,917548,1245224,1179666,1507352,2031647,3473424,4849685,3997723,458796,589864,851995,1048608,1572881,1376260,262159,655384,1703955,2752523,4194268,196517,4294049715,589826,655358,4294705135,4293853134,4291231706,4293525474,1572851,1572891,1376290,1769495,2949144,2752527,4128783,3538959,524318,4294311971,131107,393255,917529,2359296,1507339,983067,4293787684,524298,1179627,982990,130985,4294901685,4294639613,458758,983032,393190,4294508534,1703930,1376241,131090,1048576,1638400,2097152,2686985,3080207,2818067,4294770697,4293525520,4294049817,786461,1572883,1769477,1572881,4294705163,655372,4294574081,458721,4294770638,4293722059,4291624943,4294901760,4294442988,851959,2359256,131051,1900520,4294901729,4294639607,983027,1310720,1376238,1245188,983058,1048590,4294049802,4293525509,4294443025,917532,1507345,1179643,393220,327684,131060,1114096,1834967,4294574016,4290576337,4290248657,196595,4294836215,786419,4294901729,917474,131037,4294377438,262128,1900524,3014653,2293761,1048587,4294901798,4294377463,4294115309,4293984264,983042,1572885,1179652,589825,851940,983018,262125,720857,1834952,4294705095,4288282568,4290314174,4293197798,327674,720885,65505,2228216,1310671,458725,4294639604,1245173,2424821,2621440,655377,786447,327673,4293984232,4293984271,393223,1572865,2686975,1507344,1048587,1376246,917453,1245144,655323,4293918655,4288937926,4292214742,4293328861,4294180880,458734,655345,2818030,720845,2359251,1638400,458754,1245174,2752499,1638415,65531,4294311913,4294639609,4293525511,393229,1245185,983048,131083,1900559,2162679,1900495,917448,4294246354,4292411328,4290183131,4292804568,4293394435,4294508542,4294770663,4292739083,1572850,1048553,3211246,2621423,917487,1114093,4294967287,851966,4294377461,131056,4294705146,4294377466,524289,1179662,655364,720913,655378,1179644,1048530,4294311893,4293132248,4292804566,4290904033,4293328862,4293197863,327678,458735,4293787667,524275,65544,1638389,1507319,327667,983010,524256,655341,4294377459,1572855,2,917511,1769474,589837,851989,393232,4294836236,720883,4294770669,4294508552,4294377461,4290838541,4289200112,4293197810,4293591057,131065,4294836220,4293591004,4293525490,4294508560,4294836236,4294901758,65529,4294311940,4294115318,4293918722,983028,262151,983067,851987,1769503,327693,327709,4294836239,131069,458746,4294377454,458767,4293459996,4290117670,4291756022,2031569,458759,4294639614,4294639609,4294049748,4292608002,4292018213,4294705148,4294377448,4294049764,4293918713,4294967281,4294836225,589807,1441793,1835026,458767,983045,1638416,917513,4294311933,589837,589820,393211,720887,4294180893,4290838567,4291493910,917468,524284,327675,393224,1900496,1114117,4294311941,4294180857,4293197778,4294246354,4294180851,327650,1245161,2031590,2031602,2359302,2818050,2228241,1376276,589835,1310731,4294836240,458779,196619,4293001233,4291756066,4292214802,4292083723,1179605,4294574078,4294705159,655353,1900503,3080137,2097126,458729,196549,1179598,1048556,1638393,1966085,2752512,3538916,4587492,3080166,1835002,2228233,524301,4294377487,4292804654,4293132314,4293394453,4291756080,4290707493,4291690474,4294901729,4292870111,4294443011,196604,4294639610,589821,917480,4294639611,131072,1966052,1966071,1310716,196605,720901,655364,131066,393204,4294705154,851963,4294180878,4292935706,4293066798,4293460002,4293132321,4292935703,4294311949,131089,4293984282,4293001185,4293591013,524283,4294639616,262144,4294443010,4294639636,4294115364,4294115314,4292083734,4292476947,4292739092,4290510874,4292214814,4293722143,4293197865,4292935723,4291624995,4293066770,4292411403,4291887116,4291821597,4293001216,4292280336,4291559430,4292476946,4293001246,4294836224,4294836223,458753,4294508543,589826,4294508539,327675,458750,4294639611,4294574062,196588,786400,720861,131051,4293722079,4293591009,4293853130,4294049755,4290183188,4291166228,4293001194,4292673494,4291362821,4293132302,4292607999,4292739047,4292083688,1245168,458760,458759,262142,4294639611},
+  {65531,262147,327673,196618,65528,65531,4294574072,4294639607,4294705145,4294770685,4294377466,4294508538,4294574089,4293656596,4293656576,4294705152,131072,524291,4294901765,4294705147,4294639607,655355,4294770690,262146,65541,4294377471,4294901762,4294377464,4294705160,65536,655355,4294705157,524297,4294639626,4294377489,262165,655387,4294574108,4294180887,196632,327714,65567,1048621,786484,4290838551,4291559471,393238,2293799,1966123,1769493,2162703,262150,589831,4294574071,4294770691,4294508545,4294967294,4294967295,393212,4294901764,4294901760,65544,131090,524333,4292804639,4292804616,4291821589,4291887111,4289724426,4289593342,851985,1507343,4294770711,4291559440,4292280350,65571,4293722101,1179655,1835001,4294115346,4294443038,1179644,4294967289,4294901766,4294901757,4294443000,589823,458735,1507336,4293984230,4293918701,4293591008,4289986529,4289789912,4290510845,4291100666,4291166224,4289200138,4291362853,4292214831,4291428371,4290248709,4292411386,4294901781,4294443012,4293722082,4293525473,4294508552,4294639648,458745,327671,4294377475,4294377465,196604,327672,25,327671,4293853145,4293132270,4292345845,4288741379,4287561721,4290314245,4291231767,4291559450,4293525536,262193,131134,4293460002,4293328910,4293984279,4294705164,524288,2031619,1376271,1114116,4294770704,4293984276,2818042,524293,458749,4294639614,327687,4294639618,4293525471,4293328854,4292149239,4291166216,4289331202,4292083698,4290969596,4290445313,4291952633,4292739088,4294770703,131087,4293656592,4293918741,4294639639,4294836245,393229,1835036,2031654,2949158,1835038,4292804590,4292935663,4293001193,196606,524291,2359309,4294836199,917484,4293787636,4292607976,4292214765,4291428309,4291166180,4291821542,4292083687,4294049775,4293656565,4294508542,851975,458762,851961,1769481,917534,2228253,2031642,2228256,1966099,4294574106,4292411417,4294049823,4294967266,524281,4294836228,1769469,2883571,3801045,4294508494,4292935636,4294705108,4293328848,4292018141,4292280292,4293984218,589814,1638400,2293780,786437,1179668,2293774,2097185,2949151,3145757,1179674,720908,720900,4293984262,4291100687,4293001225,4294967278,4294443017,1179631,2424815,4063197,3211217,4293328846,4293459921,4294246351,4293853166,4293066730,4291297260,4292739049,851965,3014671,3932183,2359310,1900571,1835045,3407915,2097178,393213,4294705159,4294770703,4293853180,4292214801,4293328918,4293328883,4294967289,4294508542,655347,458737,655327,2949072,4293459928,4293066730,4293197809,4293001193,4291035115,4291297287,4291624958,655379,5242914,4718610,3866662,2293781,2031625,1572891,4294443007,4294377461,4294574071,11,4293197829,4291756067,4294508591,2031616,2686946,4294901757,1179640,65539,131036,3669972,4294770656,4290641897,4289593338,4291166188,4289527809,4289134578,4290576395,4294901788,5242903,5439532,4718631,3342351,720885,4294574067,4293591026,4294115324,4294049776,4293459958,4293066752,4293591078,2818103,2228227,2555901,393215,4294639612,4294901756,327649,851917,4291887075,4289462266,4289986548,4290838518,4288413664,4289069031,4291297301,524297,4456474,4259879,3014676,2490363,4294836197,65519,4293525484,4293132263,4294377448,4293525466,4293394421,4292804629,65558,4294770705,4294443012,4294443015,4294377454,1769443,1441741,4294049717,4291362800,4290707452,4292214786,4291166196,4288806898,4291428360,4294180875,131120,3276866,3604527,2818055,1572824,4294770669,4294639599,4293263336,4292935646,4292214762,4291952624,4290641910,4290314240,4290183142,4291231749,4294639612,196615,4294705125,1507303,4294901703,4292542408,4291887082,4292149237,4292542484,4290248730,4290707462,4292280337,131119,65584,1638455,3145759,3014642,1834971,1114082,4292018158,4292673500,4292411362,4291100633,4289200112,4288675849,4289921036,4289527769,4291624925,65540,65527,4294443012,1245166,4294442984,4291166170,4292935676,4293132284,4290445313,4291166210,4291428382,4294639661,720927,1310756,2097176,2621452,2490336,2817999,786410,4293394407,4293853154,4293525480,4292214775,4290510845,4292345848,4292018180,851936,524274,458744,4294901743,458765,4294770684,4292542445,4291690514,4289462281,4290904057,4291297280,4294180877,4292935718,786470,655376,2162713,2490387,3211267,3342308,1441751,1769427,1638373,4294836189,393212,4293722105,4291624946,4291624966,4289527837,4292345824,4292083674,0,458738,4293525520,4294639611,4294639627,983048,4293328916,4293984254,4292804594,4293656575,28,262156,1966094,1834983,2686950,3866619,3211222,655330,131037,1114104,786431,655354,4292804613,4290314248,4288086048,4287692843,4289331182,4290641896,4292476915,131071,4294508574,4293722106,1572927,983055,4294508572,4292935692,4293591049,4293132292,4294115332,65535,1245160,2621384,3080158,3932130,1966052,4293918705,4292935661,4293918709,4294639608,131077,4294311958,4293132327,4293394463,4292870156,4292935652,4293722072,4291493876,4293918715,4294443019,4294311939,65590,4294574111,4292870182,4292804631,4293001231,4292739069,4294115326,458746,2555884,2949070,3473388,3145722,4294901757,4290969600,4291493889,4293525512,4292608006,4293722118,4292345886,4289724445,4290445348,4291690487,4294508518,1638356,589848,327688,1179622,4293394461,4289265711,4293787689,4293066786,4293525530,4292214806,4293001243,4294574104,1638419,2097181,2555906,3145745,2162717,196632,4292870163,4291952663,4293525531,4292673539,4291428393,4289462310,4289134639,4291821603,4293066779,1310731,4293525465,1441810,327679,1572862,4291297277,4290904088,4292739112,4293263402,4294901763,4294443015,4294836261,1048608,2621499,1835064,2162739,1638454,1703965,327716,4293984293,4292542504,4293197849,4290314266,4290183207,4290117666,4292739116,4291756070,327694,1179667,4294705137,2097158,262145,4292214785,4291624920,196633,1310795,852018,2293794,1179666,2293787,2293778,2097192,983065,851999,4294836251,262177,327728,4293394471,4291559443,4289855520,4288938009,4289134630,4291625007,4291625003,4292345858,524293,1114122,4294311966,655357,589832,4294770697,4292542439,4294049832,2752539,2293811,2687021,1114123,2490372,1572870,786443,4294639636,131075,4294836240,4294115352,4293853215,4293918738,4291821582,4290641947,4289462307,4288544785,4289265675,4290510870,4291166212,4293525474,4294508555,4292214819,131079,2,4294770679,4291559480,4289331254,1114129,2359319,3538974,2359297,1114108,2031649,262185,33,327709,196640,4293918738,4294049812,1048579,4294574102,4290576407,4288872457,4288937977,4289134576,4291493893,4292673508,4292804586,4293394415,4292673567,4294836231,262144,65543,4292542508,4292083755,4293525520,1638393,786421,4294770680,4294836209,720905,327696,4293918735,4294574093,4292804596,4294377461,4294115332,4290904038,4291821556,4290314237,4290248691,4289921002,4291362792,4293066722,65503,4294311912,4294443030,131091,4294705157,4294901763,4294836229,4294770681,2555880,2555860,4294180830,4292935671,4293787617,4293656558,4293066739,4292411351,4292542445,4294836191,4293394383,4292804550,4293132262,4290772962,4291428318,4292411359,4294180861,4294705151,524240,1245153,2097107,2359265,26,589850,4294377473,458754,458754,4294770683,4292935689,4293328894,1048549,393204,4294705128,720858,4294115282,4292870120,4291428351,4292149234,4293591029,4294377464,4294901738,4294442980,4293328868,4293984241,4294311947,196593,4293525455,4293394402,4293853175,4294901757,4294770682,589820,4294443006,65534,131063,4294770687,589830,131072,4294836228,983037,1376245,1703906,655342,4294836213,1310709,1703909,1179612,4294311925,4294639632,1114099,4294377446,131046,327656,4294639591,589780,4294836181,262133,4294311943,4294967291,196613,655351},
+  {393208,4294770690,4294574090,4294639625,131071,262141,262150,4294311933,131063,196607,458760,4294705158,983045,1048585,524296,720902,131063,458755,196602,4294574078,524298,4294311943,4294901751,196613,4294443007,4294836218,5,196608,4294901762,4294770696,393213,4294639621,4294574074,131100,4294574114,4293328929,4294311955,4294377458,524280,6,4294180876,4293525493,4292935694,4292542471,4294836218,4293722077,4291624956,4292018170,4291231711,4292542429,4293394457,4294443041,4294377468,327687,131062,262139,393226,655357,4294639611,4294639622,65523,16,4294770725,4291821599,4293394429,4292935636,4292804591,4293984252,655387,655374,4293132308,4292870168,4292804603,4292280295,4289986546,4287823825,4286906332,4288085992,4290445304,4292018185,4292935679,131059,2,65528,4294901758,4294967293,327684,4293132298,4293001173,4293066777,4294639645,4290510871,4293001225,4293722108,458758,18,4294639646,30,1048604,4294901800,4294836244,1507368,4291821569,4292214778,4293001223,4291231730,4292739034,4294574066,4294049793,4293001217,262144,131069,4294705150,4294901766,4294639611,4293853222,4291821595,4291887155,4290773008,4290052112,4289265695,4290576416,4290510867,4291166227,4291493911,4292542467,4293459989,4292673548,4290248706,4290838505,4291690495,4292149234,4291559398,4293066730,4290707421,4293197786,458754,2752526,4294377464,4294377465,4294508546,524280,4292739091,4293066781,4291493895,4290248709,4289396726,4293984280,4293525517,4292280312,4291690500,4291690512,4292345863,4291624967,4291100677,4288544766,4287692777,4286644179,4287823850,4287758300,4289920993,4290510810,4291755968,4292804542,1114085,4294639618,4292739073,4293001240,4294836225,4294770690,2359292,131121,4291100674,4292083700,4292214781,4294705158,13,4294377488,4294115343,4294508549,4294639639,4294049830,4293656615,4293263393,4293328936,4292280339,4291362826,4291952638,4292870153,4293394426,4293656535,4293722042,262075,196567,983017,4291559431,65530,1507359,2293751,2949183,4293001249,4292476928,4292804626,4293984279,1114134,720907,27,1441816,1638450,1507369,1179695,2359357,3080246,2031654,4294836241,4294508554,2555911,1245170,1376241,1048542,851913,2097112,4293984233,4293263345,262156,2752541,1900563,458800,4292804651,4292018187,4292280330,4294115355,393240,4294574102,393246,524315,852009,1769521,2752558,3145781,2883623,4259870,4259855,3342347,3932188,3014654,2686967,2490340,2097094,1703878,4294311916,4293197835,8,3211297,1245220,1310775,4294049848,4291362845,4293197843,4292739107,4293787674,4292542485,4294836234,1507330,2555931,3407897,5439558,5767220,4063270,4980757,5111814,3866631,3014681,3276830,3342366,1441783,4718542,6094783,4259833,2162719,589821,1835042,2687026,2949196,4293001251,4294049848,4294770715,4293591055,4293197838,4293984239,196587,2359277,3407842,6357023,5832764,5046307,4980770,4325388,4128802,3407897,2949152,3145771,2097194,3014682,5177298,7077841,3735555,2949139,327685,1376284,3473452,1376305,4292542494,4294115356,524300,524298,4294836217,4294901753,327669,2752491,2686966,4390949,3604555,3080235,2490397,2949164,1441848,589861,4293853241,4294901805,4294049829,4293853190,327649,4980709,3735536,1114091,4294639607,1966112,3276835,1245225,4294377527,4293263382,1376246,2162670,4294770665,4294377456,4294246375,196569,917477,458758,4294377512,4293853226,4293591073,4294443049,4294115371,4292214814,4291887150,4288938003,4289986595,4289462283,4289003464,4294967291,3080195,4294508546,589815,917528,2752553,2097182,1048635,196627,786414,1376210,589781,4294967274,65503,4294508492,4293394391,4293656589,4293722157,4292804656,4293263390,4293263382,4292739101,4292149263,4291493901,4288413698,4287889426,4287102946,4287627232,4292673503,851941,655366,65536,4293591048,1572883,1179636,1114128,524289,1441771,4294246366,4294705129,1048558,917464,4294377407,4293525460,4293853198,4293853227,4294705187,393239,720890,4294836241,4293328924,4292608005,4290838549,4290772993,4291035143,4291559412,1310715,1114133,4294770685,458756,4293263375,4292804581,327663,655361,1376241,2359275,327666,4294377437,196568,2621402,327647,4293787640,4293722120,4292739080,4294770707,1179645,2686997,1179675,4293066785,4293853209,4293853211,4292608033,4292870133,131081,1179648,4194346,4293984236,786444,4294049805,4294836253,1900564,3670048,2097143,3604464,1179625,4294705127,1048543,1703918,4294836209,4294901775,4293394436,4293459967,786438,2097154,3276803,1048602,4294115343,4294639635,4293001221,4292542475,4292280322,4293132279,3735609,3801124,4291493852,458760,4292476957,4293525520,786456,3997735,3211277,5046263,3342316,2162668,458731,196595,4294574066,4294836233,589814,262136,3866643,3932168,2162705,983068,4294836247,4294508553,4293459958,4294705153,1179655,196611,2162735,2883636,4292935650,720927,4292804631,1703964,4294508560,1507341,2949121,4653054,3866607,2818042,458749,2097129,1572848,720863,1834986,3342339,3276802,2424829,1376266,720907,12,4294246402,4294115341,4293722117,4292345841,4293525490,524334,2687016,4293263319,0,983041,2686964,4294639633,4294049792,1441801,2686977,2097156,2097166,983047,2162667,2621398,1834991,1376249,2293767,262136,4294574083,4294180867,4294311936,4293525519,4294639616,4293918702,4293132280,4291493880,4293263356,4294574125,1966105,4292149222,589834,589837,4294967277,851984,917512,983050,4294311971,4293787671,4294443034,131086,786420,983018,4294901750,983055,4294311950,4292214779,4292870136,4292935655,4293263352,4293918726,4293984249,4293132281,4293591027,4291100668,4293787655,4293787659,4293066720,131059,4294639619,4293394426,4294377458,4294967293,2293761,4293328896,4292411402,4292280334,4293525519,4294180870,4293394433,4294377462,4294705147,4292739085,4292935682,4291231739,4292214776,4292542441,4291362797,4292018165,4294311895,4292411351,4291428339,4292411397,4293001235,4293591026,4292673490,4294901761,589826,4294377479,589809,4294311942,2359272,4294115325,4291166203,4291035137,4292870163,4292542487,4292280337,4293328891,4292804612,4292542475,4292345865,4291821569,4292476911,4292345833,4291821525,4293394400,4294246367,4293722062,4293722088,4294574083,1048628,262153,4293132245,393207,524295,524288,4291624984,4293656608,3604490,2162703,393230,4294508568,4294311948,4291952642,4292542481,4290969604,4290445320,4290773001,4291100686,4291166202,4292083707,4292935664,4292673507,4293787631,4294377417,4294770626,131045,917501,589860,4293132283,65545,4294443004,327686,4294443006,4291559450,4293984295,3145793,3801139,1769524,66,983096,4294770722,4294443040,4292870156,4291297300,4291362840,4292411425,4292280336,4293591054,65523,4293591011,786409,393188,917481,262131,2097158,458748,4291624913,4292673506,524297,4294705156,4294443013,262142,1835042,4128829,3407967,1179736,1572948,983125,2359379,2031671,2293820,1966163,2293820,1507385,1769500,3866662,5111847,2555947,4259908,2621507,2555932,1507350,458732,2293754,4292673517,4292673515,131071,4294574086,4294442999,458750,720898,1114123,1507366,1048625,1703988,2424876,3276874,3866686,2162726,1638440,2424880,4390974,6881330,6619206,6029377,5701675,6946869,3866676,4259896,4522036,2162729,393215,4294639622,7,4294967292,4294508541,131063,131068,4294574079,851968,1572873,1769474,1507357,2359325,1900545,3014666,4194328,3014677,3145758,3932220,2818084,2818064,3538985,2359335,2228258,1114133,2162705,2162701,1966103,131076,262151,4294770688,4294508538}
+};
+static uint16_t w1p_chunk_end[W1P_MAX_CHUNKS] = {33,35,37,41,44,48,51,62,63,64,65,66,67,68,69,70,71,74,77,87,91,93,94,95,97,101,105,117,119,121,122,126,137,144,146,154,160,165,171,173,182,192,200,202,212,220,222,228,230,240,247,249,254,266,268,276,277,278,281,285,291,294,304,305,306,309,317,321,323,328,333,334,338,343,349,354,357,359,363,369,376,379,382,386,388,395,404,407,410,422,427,433,435,437,445,447,458,460,462,464,466,472,474,478,486,488,491,493,500,504,510,514,516,519,521,528,537,540,544,548,553,563,566,572,576,581,590,600,605,613,619,634,645,652,660,666,668,675,685,690,694,695,696,706,709,717,720,724,734,738,742,744,745,747,750,764,768,771,775,784,33,36,40,46,49,62,64,65,66,68,73,77,88,92,94,96,101,103,104,106,107,117,129,132,142,145,157,160,166,174,178,183,188,193,194,200,202,205,208,212,217,222,228,232,235,237,240,243,249,256,263,266,268,269,271,277,283,290,293,295,296,298,302,305,313,319,325,328,333,334,343,348,350,351,354,362,371,375,377,378,379,381,385,396,401,405,407,409,422,428,433,435,446,455,461,464,473,475,488,495,502,511,515,520,527,533,540,542,545,553,562,567,570,574,580,590,598,601,603,608,618,623,627,629,634,646,652,655,658,664,666,668,677,685,688,690,692,694,697,705,708,715,717,719,729,739,741,744,748,762,766,769,775,780,784,26,35,37,40,44,46,48,56,63,64,65,66,68,69,70,77,88,95,101,102,103,104,105,115,118,126,130,134,138,146,154,162,166,172,175,179,192,193,194,199,201,204,213,220,221,222,228,233,238,242,249,250,255,265,275,277,278,282,285,299,301,302,303,306,310,312,316,321,325,327,329,330,331,335,342,344,346,348,352,355,357,358,359,360,366,369,370,371,373,375,381,386,387,389,396,398,400,403,410,416,427,435,438,442,447,457,459,463,467,472,473,474,479,485,486,487,488,492,496,500,502,508,514,515,516,519,521,526,529,533,536,543,544,548,550,555,557,562,564,568,576,578,583,585,589,592,595,598,607,612,618,621,625,634,640,648,651,662,667,669,675,676,677,679,682,686,695,698,706,708,709,710,712,714,716,718,719,720,723,734,737,739,741,742,743,745,746,747,748,749,751,764,768,777,784,33,36,44,48,61,64,65,67,70,75,78,90,93,95,102,108,119,131,143,147,153,158,162,172,174,177,180,183,185,187,193,200,201,203,207,210,212,214,216,227,229,233,238,241,243,251,258,264,266,270,276,282,286,289,292,296,302,305,312,315,321,322,323,326,329,332,334,341,343,350,352,357,361,366,375,377,380,387,390,399,403,405,408,411,414,416,417,423,426,429,433,436,438,441,443,445,447,454,456,461,463,465,467,469,471,473,474,481,484,490,492,494,497,500,502,508,516,518,521,524,528,536,542,550,564,568,576,590,593,600,607,611,620,623,626,630,633,636,639,641,650,653,656,660,662,665,667,675,678,681,687,691,694,695,696,703,708,711,714,717,719,720,724,732,735,737,738,739,740,741,742,743,744,745,746,748,750,761,771,779,784,33,35,37,42,44,47,53,63,64,66,67,68,69,70,71,73,75,78,89,91,93,94,95,96,97,98,99,100,101,102,104,115,124,127,129,137,147,153,157,164,178,187,194,203,215,221,229,233,242,246,249,255,258,260,268,270,273,275,277,283,285,294,296,300,302,304,305,307,312,322,324,325,330,332,333,335,341,347,351,353,357,361,365,369,374,379,381,384,389,397,400,407,409,411,421,428,431,437,440,445,451,457,459,464,466,472,473,474,477,480,485,490,492,494,498,500,503,509,510,511,513,518,520,523,525,526,527,528,534,537,539,541,543,547,551,553,554,555,556,560,565,567,568,570,574,579,581,583,590,595,598,603,608,611,614,622,628,634,642,650,660,669,676,682,687,695,705,716,723,732,737,744,750,764,769,774,777,784,33,35,37,42,44,47,50,62,64,65,66,67,69,72,76,88,92,94,95,96,97,98,99,102,104,108,117,120,122,123,125,127,129,133,143,148,156,159,162,178,193,201,209,214,219,221,231,234,243,246,248,249,250,258,262,271,275,276,277,278,282,285,288,290,298,304,305,306,310,315,317,319,325,333,334,340,343,345,347,352,360,368,373,376,380,389,398,404,406,409,415,425,434,436,441,443,453,460,463,470,475,480,486,489,491,499,508,513,516,526,534,536,540,543,550,554,562,565,568,570,572,575,578,585,591,593,596,598,601,606,612,619,621,626,636,639,647,650,663,666,675,676,677,679,684,691,693,695,705,707,709,711,714,719,724,737,743,744,745,747,748,750,761,768,772,777,784,33,36,40,44,48,60,64,65,67,69,70,72,74,78,89,93,97,99,102,103,104,108,116,121,131,135,150,153,155,157,159,162,163,164,175,180,183,185,192,196,200,205,208,210,212,215,226,232,236,239,242,245,255,258,262,267,271,274,279,283,285,295,301,306,310,313,323,327,330,338,341,348,353,356,358,360,367,375,380,384,387,390,400,404,409,414,426,428,432,437,442,450,456,459,464,474,483,485,486,488,492,503,510,512,514,516,526,531,535,539,541,544,548,557,568,572,580,585,587,599,607,613,620,628,636,639,648,650,656,664,665,666,667,668,675,676,677,679,681,685,691,694,695,704,705,706,707,708,709,710,711,713,715,718,720,722,732,735,737,738,740,742,744,746,748,750,763,767,771,774,777,784,34,36,41,44,46,50,62,64,67,69,71,74,79,90,93,95,97,99,101,108,120,122,126,130,136,149,154,164,174,180,183,185,193,195,199,201,207,211,213,221,228,233,239,241,244,249,251,256,263,268,270,272,277,278,287,289,290,291,292,294,298,300,305,306,313,315,317,319,321,323,328,333,334,340,342,343,345,347,349,350,351,361,368,370,372,376,378,386,396,404,408,418,430,446,450,453,463,473,477,481,488,500,508,520,534,539,545,558,565,570,573,585,591,599,604,611,620,627,640,650,654,665,675,677,679,685,692,694,704,706,708,710,712,715,724,737,743,747,763,767,771,779,784,34,41,48,63,71,76,92,97,100,102,104,106,115,120,126,129,131,135,137,146,154,158,161,164,166,175,182,185,187,192,194,201,210,213,216,220,221,224,229,239,244,247,249,250,260,271,275,277,278,288,290,292,303,305,306,315,317,319,321,323,326,330,333,334,342,343,344,346,349,351,355,358,368,370,371,373,377,383,386,398,402,405,410,413,425,428,433,437,444,446,452,453,456,463,468,471,473,474,478,481,488,490,498,501,503,508,509,511,517,526,528,530,536,538,541,554,558,564,566,569,574,583,585,590,594,600,604,618,624,629,635,646,651,655,657,659,666,669,675,678,682,684,686,688,702,707,709,717,723,731,737,759,768,773,784,37,44,57,67,70,75,79,93,96,98,100,103,105,109,118,126,129,132,150,160,165,176,182,192,199,201,203,206,211,221,228,230,232,235,238,242,249,256,257,259,262,264,266,270,283,285,287,289,291,293,294,296,307,313,315,317,318,319,320,321,327,330,334,340,342,343,344,345,346,347,348,349,354,358,360,368,370,371,372,373,375,376,377,379,385,388,395,397,399,400,401,402,403,404,412,414,422,425,426,427,428,429,431,434,442,451,453,454,455,456,458,461,472,474,480,481,482,483,484,488,495,501,508,509,510,511,513,516,518,523,529,534,537,538,539,542,544,547,557,562,565,566,570,572,581,585,591,594,601,610,613,620,632,637,642,649,657,662,669,676,680,681,683,691,696,704,706,708,710,715,720,731,740,743,747,763,767,773,784,34,36,42,49,61,64,66,68,71,74,77,83,91,94,96,98,101,103,108,117,119,121,124,128,131,136,140,145,147,160,163,166,172,187,192,197,201,207,212,217,220,221,225,228,232,236,245,247,248,249,251,256,260,265,275,276,277,278,283,289,292,302,304,305,306,312,317,324,330,333,334,339,344,346,351,358,365,370,372,374,375,380,386,396,397,398,399,400,402,406,409,412,415,425,426,427,429,433,434,440,443,451,455,461,462,470,474,479,487,489,498,502,507,511,515,517,522,526,529,534,536,539,541,544,547,550,554,557,563,565,567,569,573,575,577,579,581,590,595,599,605,608,614,624,634,640,647,657,666,674,676,679,685,688,699,707,709,713,722,725,736,740,744,747,750,766,769,784,34,36,41,46,50,62,63,64,66,76,93,95,97,100,115,119,121,123,124,126,130,138,145,147,150,152,154,159,171,177,180,182,184,192,199,206,208,210,211,214,221,232,235,238,248,258,263,273,282,286,289,292,296,298,301,303,310,314,316,318,325,329,330,331,332,338,340,342,343,345,350,357,358,359,360,365,368,370,372,377,379,386,387,393,398,399,405,407,413,415,424,426,427,434,436,441,446,451,455,456,458,462,469,472,473,474,477,479,480,484,485,486,487,488,489,492,497,500,504,508,513,514,515,516,517,523,526,528,531,535,537,542,543,544,550,552,555,556,558,563,564,565,567,576,579,582,583,584,591,593,595,598,602,609,611,612,620,622,625,630,636,638,639,640,646,648,650,653,655,659,665,667,668,670,675,677,679,681,683,685,688,692,694,695,698,707,709,714,718,720,729,741,744,746,748,750,761,768,771,775,778,784,33,35,37,42,44,46,49,62,64,65,66,68,70,73,76,79,88,94,96,99,104,108,123,132,145,153,157,163,173,190,192,195,203,219,222,235,243,248,257,264,270,276,278,282,290,294,296,299,305,308,313,323,325,332,335,342,347,350,352,354,360,362,370,378,380,382,388,392,397,402,406,408,412,416,425,427,433,435,437,440,445,453,459,463,467,469,473,474,482,486,488,496,501,503,513,516,522,529,539,542,544,547,554,559,569,572,574,581,591,598,601,604,613,623,628,631,642,652,668,676,677,678,679,680,683,694,703,705,706,707,708,709,710,712,714,718,721,723,732,735,738,748,764,768,774,784,33,35,37,42,46,49,61,64,66,68,69,70,71,75,78,90,94,96,100,104,106,118,121,122,124,131,134,136,143,145,146,147,148,150,156,160,171,173,174,175,176,182,185,192,200,201,202,203,209,211,219,221,227,228,229,230,238,244,246,248,249,255,256,257,259,266,269,270,271,273,275,276,281,283,284,286,292,296,297,298,300,303,307,311,312,318,321,326,331,337,339,346,348,349,352,358,360,362,366,369,373,375,379,384,389,390,397,402,404,411,417,422,427,437,444,446,451,455,463,471,473,474,478,483,491,496,499,501,502,508,513,523,527,529,531,538,550,555,558,568,580,585,587,603,611,613,620,635,648,653,658,664,669,675,678,680,684,686,693,695,698,711,720,726,735,737,739,742,745,748,750,765,768,771,774,777,784,33,39,42,45,48,63,67,69,73,80,92,93,94,96,97,98,100,102,117,120,121,122,124,127,130,140,147,148,149,151,153,160,164,174,176,178,182,189,194,200,202,204,207,213,216,226,228,230,233,239,242,249,256,260,262,266,267,270,284,287,288,289,290,291,294,295,297,308,314,315,316,317,318,319,322,324,330,339,341,343,345,346,349,351,356,359,360,361,362,368,371,373,377,380,384,386,387,388,389,390,397,400,404,407,411,414,416,424,425,426,428,432,435,438,444,446,455,462,466,471,472,473,474,478,484,490,499,503,509,512,517,522,526,527,534,536,540,545,550,553,554,555,562,564,568,571,573,576,579,580,581,583,590,593,596,600,603,606,607,608,609,611,620,623,632,634,635,636,637,638,640,647,651,656,662,663,664,665,666,669,675,686,689,691,692,693,703,707,711,714,717,722,733,737,740,747,757,768,774,778,784,33,40,46,48,52,66,72,74,75,76,77,78,80,91,98,102,105,109,117,119,120,121,122,124,127,129,131,134,142,145,146,149,151,153,155,156,157,158,159,160,161,163,172,174,182,185,187,191,192,194,200,206,209,211,213,220,223,228,231,235,238,240,242,244,246,249,255,257,260,266,267,268,269,270,271,273,276,277,278,281,283,285,293,294,295,296,297,298,300,303,305,306,310,313,321,323,325,327,329,334,338,340,347,353,356,357,358,359,360,367,373,376,380,383,385,386,387,388,389,400,403,410,414,416,428,431,440,446,452,454,459,470,475,481,483,491,493,501,504,510,511,514,518,520,530,538,542,546,555,566,577,582,586,594,598,603,605,607,610,613,622,624,627,630,633,636,642,652,655,656,657,659,661,665,676,678,680,683,685,687,694,704,705,706,707,708,709,710,712,713,715,717,719,720,724,735,737,738,740,742,743,744,745,746,747,748,750,761,765,767,769,771,773,776,784};
+static uint16_t w1p_chunk_first[17] = {0,160,315,510,691,869,1036,1208,1351,1506,1685,1853,2055,2201,2378,2579,2794};
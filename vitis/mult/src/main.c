@@ -4,6 +4,7 @@
 #include "xuartlite_l.h"
 #include "xparameters.h"
 #include "xil_types.h"
+#include "simpleSum.h"
 
 #define BASE 0x44A00000
 
@@ -16,16 +17,31 @@
 #define UART_BASE XPAR_UARTLITE_0_BASEADDR
 #endif
 
+// wait for the first pixel after READY, then give up on a partial image
+// after RX_IDLE_TIMEOUT_US without a byte
+#define RX_FIRST_TIMEOUT_US 30000000u
+#define RX_IDLE_TIMEOUT_US 200000u
+#define RX_POLL_US 10u
+
 static inline u8 uart_getc_blocking(void)
 {
     while (XUartLite_IsReceiveEmpty(UART_BASE)) {}
     return Xil_In8(UART_BASE + XUL_RX_FIFO_OFFSET);
 }
 
-static inline void nn_write_pixel(u32 idx, u8 px)
+// returns 1 and the byte, or 0 if the line stayed idle for timeout_us
+static int uart_getc_timeout(u8 *c, u32 timeout_us)
 {
-    Xil_Out32(REG2, idx);
-    Xil_Out32(REG1, (u32)px);
+    u32 waited = 0u;
+    while (XUartLite_IsReceiveEmpty(UART_BASE)) {
+        if (waited >= timeout_us) {
+            return 0;
+        }
+        usleep(RX_POLL_US);
+        waited += RX_POLL_US;
+    }
+    *c = Xil_In8(UART_BASE + XUL_RX_FIFO_OFFSET);
+    return 1;
 }
 
 static inline void nn_start_pulse(void)
@@ -64,6 +80,13 @@ int main(void)
             xil_printf("Menu:\r\n");
             xil_printf("  1: Send image\r\n");
             xil_printf("  4: Show menu\r\n");
+            xil_printf("  0: Sync\r\n");
+            continue;
+        }
+
+        if (cmd == '0') {
+            // resync marker: the host flushes until it sees this line
+            xil_printf("SYNC\r\n");
             continue;
         }
 
@@ -79,9 +102,28 @@ int main(void)
 
         xil_printf("READY\r\n");
 
-        for (u32 idx = 0; idx < 784u; idx++) {
-            u8 px = uart_getc_blocking();
-            nn_write_pixel(idx, px);
+        // pack 4 pixels per bus write into the auto-incrementing pixel
+        // register: 196 writes per image instead of 1568 (index + value)
+        u32 word = 0u;
+        u32 idx;
+        for (idx = 0; idx < 784u; idx++) {
+            u8 px;
+            if (!uart_getc_timeout(&px, idx ? RX_IDLE_TIMEOUT_US : RX_FIRST_TIMEOUT_US)) {
+                break;
+            }
+            word |= (u32)px << (8u * (idx & 3u));
+            if ((idx & 3u) == 3u) {
+                SIMPLESUM_WritePixelWord(BASE, word);
+                word = 0u;
+            }
+        }
+
+        if (idx < 784u) {
+            // line went idle mid-image: drop the partial image and rewind
+            // the pixel pointer so the next image starts at pixel 0
+            SIMPLESUM_SetPixelIndex(BASE, 0u);
+            xil_printf("ERR:RX %u\r\n", (unsigned int)idx);
+            continue;
         }
 
         nn_start_pulse();